@@ -3,28 +3,57 @@
     =================================
     Syncs ammo type state between client and server
     Ensures other players see correct visual effects
+
+    One replication channel: the client requests a type with
+    ammo:setAmmoType, sv_damage.lua validates it and writes the replicated
+    ammo_<weaponHash> key on the player's StateBag. The client never writes
+    replicated keys itself, and every write (network or local) is change-only.
 ]]
 
-local cachedAmmoTypes = {}  -- { [weaponHash] = ammoType }
+local cachedAmmoTypes = {}     -- { [weaponHash] = ammoType }
+local requestedAmmoTypes = {}  -- { [weaponHash] = ammoType } last type sent to the server
+local watchedKeys = {}         -- { [weaponHash] = true } ammo keys with a change handler
+
+local WEAPON_POLL_INTERVAL = 250  -- ms between weapon / current ammo checks
+
+-- =============================================================================
+-- STATEBAG CHANGE HANDLERS
+-- =============================================================================
+
+local ownBagName = ('player:%d'):format(GetPlayerServerId(PlayerId()))
+
+--- Follow the server's writes of one weapon's ammo key on our own StateBag.
+-- Filtered by key and bag name, so other keys and players never reach Lua.
+-- @param weaponHash number The weapon hash
+local function WatchAmmoKey(weaponHash)
+    if watchedKeys[weaponHash] then return end
+    watchedKeys[weaponHash] = true
+
+    AddStateBagChangeHandler(('ammo_%s'):format(weaponHash), ownBagName, function(bagName, key, value)
+        cachedAmmoTypes[weaponHash] = value
+    end)
+end
 
 -- =============================================================================
 -- LOCAL STATE MANAGEMENT
 -- =============================================================================
 
---- Set the current ammo type for a weapon locally and sync to server
+--- Set the current ammo type for a weapon locally and request it from the server
 -- @param weaponHash number The weapon hash
 -- @param ammoType string The ammo type (fmj, hp, ap, etc.)
 local function SetAmmoType(weaponHash, ammoType)
     if not weaponHash or not ammoType then return end
 
     cachedAmmoTypes[weaponHash] = ammoType
-
-    -- Update local StateBag
-    local key = ('ammo_%s'):format(weaponHash)
-    LocalPlayer.state:set(key, ammoType, true)  -- Replicated to server
-
-    -- Notify server
-    TriggerServerEvent('ammo:setAmmoType', weaponHash, ammoType)
+    WatchAmmoKey(weaponHash)
+
+    -- The server validates and replicates it (only when it changed; the bag
+    -- check re-sends once the server has cleared the key)
+    if requestedAmmoTypes[weaponHash] ~= ammoType
+        or LocalPlayer.state[('ammo_%s'):format(weaponHash)] ~= ammoType then
+        requestedAmmoTypes[weaponHash] = ammoType
+        TriggerServerEvent('ammo:setAmmoType', weaponHash, ammoType)
+    end
 end
 
 --- Get the current ammo type for a weapon
@@ -44,6 +73,7 @@ local function GetAmmoType(weaponHash)
 
     if ammoType then
         cachedAmmoTypes[weaponHash] = ammoType
+        WatchAmmoKey(weaponHash)
         return ammoType
     end
 
@@ -56,30 +86,6 @@ local function GetAmmoType(weaponHash)
     return 'fmj'
 end
 
--- =============================================================================
--- STATEBAG CHANGE HANDLERS
--- =============================================================================
-
--- Listen for ammo type changes from server
-AddStateBagChangeHandler(nil, 'player', function(bagName, key, value, reserved, replicated)
-    -- Only handle ammo_ prefixed keys
-    if not key:match('^ammo_') then return end
-
-    local playerId = GetPlayerFromStateBagName(bagName)
-    if playerId == 0 then return end
-
-    local weaponHash = tonumber(key:gsub('ammo_', ''))
-    if not weaponHash then return end
-
-    -- Update local cache if this is our state
-    if playerId == PlayerId() then
-        cachedAmmoTypes[weaponHash] = value
-    end
-
-    -- Other players can now see our ammo type for visual effect sync
-    -- This is used by cl_effects.lua to render correct tracers/effects
-end)
-
 -- =============================================================================
 -- MAGAZINE EQUIP INTEGRATION
 -- =============================================================================
@@ -101,28 +107,48 @@ end)
 -- =============================================================================
 
 local lastEquippedWeapon = nil
+local currentCaliber = nil
+local currentAmmoType = nil
+
+--- Publish currentCaliber/currentAmmoType for the effects system (local keys, change-only)
+-- @param caliber string|nil The caliber
+-- @param ammoType string|nil The ammo type
+local function SetCurrentAmmo(caliber, ammoType)
+    if caliber ~= currentCaliber then
+        currentCaliber = caliber
+        LocalPlayer.state:set('currentCaliber', caliber, false)
+    end
+    if ammoType ~= currentAmmoType then
+        currentAmmoType = ammoType
+        LocalPlayer.state:set('currentAmmoType', ammoType, false)
+    end
+end
 
 CreateThread(function()
     while true do
         local ped = PlayerPedId()
         local weapon = GetSelectedPedWeapon(ped)
 
-        if weapon ~= `WEAPON_UNARMED` and weapon ~= lastEquippedWeapon then
-            lastEquippedWeapon = weapon
+        if weapon ~= `WEAPON_UNARMED` then
+            local weaponInfo = Config.Weapons and Config.Weapons[weapon]
+
+            if weaponInfo then
+                local ammoType = GetAmmoType(weapon)
 
-            -- Check if we have a cached ammo type
-            local ammoType = GetAmmoType(weapon)
+                -- First equip: make sure the server has a type (defaults are never requested)
+                if weapon ~= lastEquippedWeapon and LocalPlayer.state[('ammo_%s'):format(weapon)] == nil then
+                    SetAmmoType(weapon, ammoType)
+                end
 
-            -- Ensure state is synced
-            local key = ('ammo_%s'):format(weapon)
-            if LocalPlayer.state[key] ~= ammoType then
-                LocalPlayer.state:set(key, ammoType, true)
+                SetCurrentAmmo(weaponInfo.caliber, ammoType)
             end
-        elseif weapon == `WEAPON_UNARMED` then
+            lastEquippedWeapon = weapon
+        else
             lastEquippedWeapon = nil
+            SetCurrentAmmo(nil, nil)
         end
 
-        Wait(500)
+        Wait(WEAPON_POLL_INTERVAL)
     end
 end)
 
@@ -182,18 +208,26 @@ end)
 -- CLEANUP
 -- =============================================================================
 
+--- Forget local ammo types; the next equip requests them from the server again
+local function ResetAmmoState()
+    cachedAmmoTypes = {}
+    requestedAmmoTypes = {}
+    lastEquippedWeapon = nil
+end
+
 AddEventHandler('onResourceStop', function(resourceName)
     if GetCurrentResourceName() ~= resourceName then return end
 
-    -- Clear all state bags
-    for weaponHash, _ in pairs(cachedAmmoTypes) do
-        local key = ('ammo_%s'):format(weaponHash)
-        LocalPlayer.state:set(key, nil, true)
-    end
-
-    cachedAmmoTypes = {}
+    -- Replicated ammo_ keys belong to the server (cleared by sv_damage.lua)
+    ResetAmmoState()
 end)
 
+-- Character switch: the server clears the ammo_ keys on unload
+RegisterNetEvent('QBCore:Client:OnPlayerUnload', ResetAmmoState)
+RegisterNetEvent('QBCore:Client:OnPlayerLoaded', ResetAmmoState)
+RegisterNetEvent('ox:playerLogout', ResetAmmoState)
+RegisterNetEvent('ox:playerLoaded', ResetAmmoState)
+
 -- =============================================================================
 -- ADMIN COMMAND HANDLERS
 -- =============================================================================
@@ -258,27 +292,6 @@ RegisterNetEvent('ammo:forceSetAmmoType', function(ammoType)
     end
 end)
 
--- Update current caliber state for effects system
-CreateThread(function()
-    while true do
-        local ped = PlayerPedId()
-        local weapon = GetSelectedPedWeapon(ped)
-
-        if weapon ~= `WEAPON_UNARMED` then
-            local weaponInfo = Config.Weapons and Config.Weapons[weapon]
-            if weaponInfo then
-                LocalPlayer.state:set('currentCaliber', weaponInfo.caliber, false)
-                LocalPlayer.state:set('currentAmmoType', GetAmmoType(weapon), false)
-            end
-        else
-            LocalPlayer.state:set('currentCaliber', nil, false)
-            LocalPlayer.state:set('currentAmmoType', nil, false)
-        end
-
-        Wait(250)
-    end
-end)
-
 -- =============================================================================
 -- EXPORTS
 -- =============================================================================
@@ -61,6 +61,7 @@ shared_scripts {
     'shared/config.lua',
     'shared/weapons.lua',
     'shared/magazines.lua',
+    'shared/magazine_index.lua',  -- Compatibility index (generated)
     'shared/modifiers.lua',  -- Ammo damage modifiers
 }
 
@@ -80,6 +81,7 @@ client_scripts {
 server_scripts {
     'server/sv_ammo.lua',
     'server/magazine_server.lua',
+    'server/sv_damage_table.lua', -- Precomputed damage lookup (generated)
     'server/sv_damage.lua',      -- Damage modifier handler
     'server/sv_penetration.lua', -- Bullet penetration system
     'server/sv_environment.lua', -- Environmental interactions
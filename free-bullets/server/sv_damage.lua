@@ -14,6 +14,8 @@
     Dependencies:
     - shared/modifiers.lua (Config.AmmoModifiers)
     - shared/config.lua (Config.Weapons)
+    - server/sv_damage_table.lua (DamageTable, generated by
+      scripts/damage_table_gen.py - optional, falls back to live lookups)
 ]]
 
 -- =============================================================================
@@ -75,9 +77,10 @@ local function SetPlayerAmmoType(source, weaponHash, ammoType)
     if not playerAmmoState[source] then
         playerAmmoState[source] = {}
     end
+    if playerAmmoState[source][weaponHash] == ammoType then return end
     playerAmmoState[source][weaponHash] = ammoType
 
-    -- Sync to client via StateBag for other systems
+    -- Sync to clients via StateBag (the only replicated copy; cl_sync.lua never writes it)
     local stateKey = ('ammo_%s'):format(weaponHash)
     Player(source).state:set(stateKey, ammoType, true)
 
@@ -86,10 +89,18 @@ local function SetPlayerAmmoType(source, weaponHash, ammoType)
     end
 end
 
---- Clear all ammo state for a player
+--- Clear all ammo state for a player, including the replicated ammo_ keys
+-- (a new character must not inherit the previous one's ammo types)
 -- @param source number Player server ID
 local function ClearPlayerState(source)
+    local weapons = playerAmmoState[source]
+    if not weapons then return end
     playerAmmoState[source] = nil
+
+    local state = Player(source).state
+    for weaponHash, _ in pairs(weapons) do
+        state:set(('ammo_%s'):format(weaponHash), nil, true)
+    end
 end
 
 -- =============================================================================
@@ -139,12 +150,12 @@ local function SetArmorIntegrity(source, integrity)
     Player(source).state:set('armorIntegrity', playerArmorIntegrity[source], true)
 end
 
-local function DegradeArmor(source, caliber, ammoType)
+local function DegradeArmor(source, caliber, ammoType, precomputed)
     if not Config.ArmorDegradation or not Config.ArmorDegradation.enabled then
         return
     end
 
-    local degradation = CalculateArmorDegradation(caliber, ammoType)
+    local degradation = precomputed or CalculateArmorDegradation(caliber, ammoType)
     local currentIntegrity = GetArmorIntegrity(source)
     local newIntegrity = currentIntegrity - degradation
 
@@ -163,6 +174,83 @@ local function DegradeArmor(source, caliber, ammoType)
     })
 end
 
+-- =============================================================================
+-- PRECOMPUTED DAMAGE TABLE
+-- =============================================================================
+
+-- Link each generated entry to its live modifier (effects, penetration)
+if DamageTable then
+    for caliber, ammoTypes in pairs(DamageTable.ammo) do
+        for ammoType, entry in pairs(ammoTypes) do
+            entry.modifier = GetAmmoModifier(ammoType, caliber)
+        end
+    end
+end
+
+--- Get the precomputed damage entry for a weapon/ammo pair
+-- @param weaponHash number Weapon hash
+-- @param ammoType string The ammo type
+-- @return table|nil DamageTable entry, nil if not generated
+local function GetResolvedDamage(weaponHash, ammoType)
+    local weaponEntries = DamageTable and DamageTable.weapons[weaponHash]
+    return weaponEntries and weaponEntries[ammoType]
+end
+
+--- CalculateRangeFalloff from a precomputed (quantized) curve
+-- @param curve table|nil DamageTable.falloff entry
+-- @param distance number Distance in meters
+-- @return number Damage multiplier
+local function ResolvedRangeFalloff(curve, distance)
+    if not curve or distance <= curve.effectiveRange then
+        return 1.0
+    end
+
+    if distance >= curve.maxRange then
+        return curve.minDamage
+    end
+
+    local index = math.floor((distance - curve.effectiveRange) / DamageTable.falloffStep + 0.5) + 1
+    return curve.samples[index] or curve.minDamage
+end
+
+--- CalculateDamage using a precomputed entry (same order of operations)
+local function CalculateResolvedDamage(resolved, baseDamage, ammoType, caliber, hasArmor, armorAmount, distance, boneIndex, hasSuppressor, victimSource)
+    local damage = baseDamage * resolved.damageMult
+    local limbEffects = nil
+
+    if distance and distance > 0 then
+        damage = damage * ResolvedRangeFalloff(resolved.falloff, distance)
+    end
+
+    -- Limb effects are per-hit data for the med script, so still built here
+    if boneIndex and boneIndex > 0 then
+        local limbMult, effects = CalculateLimbDamage(boneIndex, caliber, ammoType)
+        damage = damage * limbMult
+        limbEffects = effects
+    end
+
+    if hasSuppressor then
+        damage = damage * resolved.suppressedMult
+    end
+
+    if hasArmor and armorAmount > 0 then
+        if not resolved.armorBypass then
+            local armorIntegrity = victimSource and GetArmorIntegrity(victimSource) or 100
+            -- Table only holds whole integrities; fractional ones (caliber-scaled degradation)
+            -- go through the live tier check so 79.5 falls between tiers exactly as it does there
+            local armorEffectiveness = (armorIntegrity % 1 == 0 and DamageTable.armorEffectiveness[armorIntegrity + 1])
+                or GetArmorEffectiveness(armorIntegrity)
+            damage = damage * (1.0 - ((1.0 - resolved.armorMult) * armorEffectiveness))
+        end
+
+        if victimSource then
+            DegradeArmor(victimSource, caliber, ammoType, resolved.degradation)
+        end
+    end
+
+    return math.floor(damage + 0.5), limbEffects
+end
+
 -- =============================================================================
 -- DAMAGE CALCULATION (ENHANCED)
 -- =============================================================================
@@ -177,8 +265,14 @@ end
 -- @param boneIndex number Hit bone for limb damage
 -- @param hasSuppressor boolean Whether weapon has suppressor
 -- @param victimSource number Victim's server ID (for armor degradation)
+-- @param resolved table|nil Precomputed DamageTable entry (skips per-hit lookups)
 -- @return number, table Modified damage value and limb effect data
-local function CalculateDamage(baseDamage, ammoType, caliber, hasArmor, armorAmount, distance, boneIndex, hasSuppressor, victimSource)
+local function CalculateDamage(baseDamage, ammoType, caliber, hasArmor, armorAmount, distance, boneIndex, hasSuppressor, victimSource, resolved)
+    -- Fast path; debug mode keeps the verbose live calculation
+    if resolved and not DamageConfig.Debug then
+        return CalculateResolvedDamage(resolved, baseDamage, ammoType, caliber, hasArmor, armorAmount, distance, boneIndex, hasSuppressor, victimSource)
+    end
+
     local modifier = GetAmmoModifier(ammoType, caliber)
     local limbEffects = nil
 
@@ -397,7 +491,8 @@ AddEventHandler('weaponDamageEvent', function(attackerSource, data)
 
     local caliber = weaponInfo.caliber
     local ammoType = GetPlayerAmmoType(attackerSource, weaponHash)
-    local modifier = GetAmmoModifier(ammoType, caliber)
+    local resolved = GetResolvedDamage(weaponHash, ammoType)
+    local modifier = resolved and resolved.modifier or GetAmmoModifier(ammoType, caliber)
 
     -- Get additional data for enhanced damage calculation
     local boneIndex = data.hitComponent or 0
@@ -458,7 +553,8 @@ AddEventHandler('weaponDamageEvent', function(attackerSource, data)
         distance,
         boneIndex,
         hasSuppressor,
-        victimSource
+        victimSource,
+        resolved
     )
 
     -- Apply the modified damage
@@ -604,6 +700,15 @@ RegisterNetEvent('ox:playerLogout', function(src)
     ClearPlayerState(src)
 end)
 
+-- The replicated ammo_ keys are owned here; clear them with the resource
+AddEventHandler('onResourceStop', function(resourceName)
+    if GetCurrentResourceName() ~= resourceName then return end
+
+    for src, _ in pairs(playerAmmoState) do
+        ClearPlayerState(src)
+    end
+end)
+
 -- =============================================================================
 -- ARMOR SYNC (from client)
 -- =============================================================================
@@ -0,0 +1,1616 @@
+--[[
+    AUTO-GENERATED by scripts/damage_table_gen.py - DO NOT EDIT
+    =============================================================
+
+    Precomputed per-(weapon, ammo) damage modifiers for sv_damage.lua.
+    Regenerate after changing free-bullets/shared/*.lua:
+
+        python scripts/damage_table_gen.py
+
+    Source hash: 550dfe71ed5a042a023b5adc50a200c9062e8406
+]]
+
+DamageTable = {}
+
+DamageTable.falloffStep = 0.5
+
+-- Range falloff: samples[i] = multiplier at effectiveRange + (i - 1) * falloffStep
+DamageTable.falloff = {
+    ['.22lr'] = {
+        effectiveRange = 25,
+        maxRange = 75,
+        minDamage = 0.2,
+        samples = {
+            1.0, 0.9992, 0.9977, 0.9958, 0.9936, 0.9911, 0.9882, 0.9852, 0.9819, 0.9784, 0.9747,
+            0.9708, 0.9667, 0.9625, 0.9581, 0.9535, 0.9488, 0.9439, 0.9389, 0.9337, 0.9284, 0.923,
+            0.9174, 0.9118, 0.9059, 0.9, 0.8939, 0.8878, 0.8815, 0.8751, 0.8685, 0.8619, 0.8552,
+            0.8483, 0.8414, 0.8343, 0.8272, 0.82, 0.8126, 0.8052, 0.7976, 0.79, 0.7822, 0.7744,
+            0.7665, 0.7585, 0.7504, 0.7422, 0.734, 0.7256, 0.7172, 0.7086, 0.7, 0.6913, 0.6825,
+            0.6737, 0.6647, 0.6557, 0.6466, 0.6374, 0.6282, 0.6189, 0.6094, 0.6, 0.5904, 0.5808,
+            0.5711, 0.5613, 0.5514, 0.5415, 0.5315, 0.5214, 0.5112, 0.501, 0.4907, 0.4804, 0.47,
+            0.4595, 0.4489, 0.4383, 0.4276, 0.4168, 0.406, 0.3951, 0.3841, 0.3731, 0.362, 0.3508,
+            0.3396, 0.3283, 0.3169, 0.3055, 0.2941, 0.2825, 0.2709, 0.2592, 0.2475, 0.2357, 0.2239,
+            0.212, 0.2,
+        },
+    },
+    ['.38spl'] = {
+        effectiveRange = 35,
+        maxRange = 100,
+        minDamage = 0.25,
+        samples = {
+            1.0, 0.9987, 0.9967, 0.9944, 0.9919, 0.9891, 0.9862, 0.9832, 0.98, 0.9767, 0.9733,
+            0.9697, 0.9661, 0.9624, 0.9586, 0.9547, 0.9508, 0.9467, 0.9426, 0.9384, 0.9342, 0.9299,
+            0.9255, 0.9211, 0.9166, 0.912, 0.9074, 0.9028, 0.8981, 0.8933, 0.8885, 0.8837, 0.8788,
+            0.8738, 0.8688, 0.8638, 0.8587, 0.8536, 0.8484, 0.8432, 0.838, 0.8327, 0.8274, 0.822,
+            0.8166, 0.8112, 0.8057, 0.8002, 0.7946, 0.789, 0.7834, 0.7778, 0.7721, 0.7664, 0.7606,
+            0.7549, 0.7491, 0.7432, 0.7373, 0.7314, 0.7255, 0.7195, 0.7136, 0.7075, 0.7015, 0.6954,
+            0.6893, 0.6832, 0.677, 0.6708, 0.6646, 0.6584, 0.6521, 0.6458, 0.6395, 0.6331, 0.6268,
+            0.6204, 0.6139, 0.6075, 0.601, 0.5945, 0.588, 0.5815, 0.5749, 0.5683, 0.5617, 0.5551,
+            0.5484, 0.5417, 0.535, 0.5283, 0.5215, 0.5148, 0.508, 0.5011, 0.4943, 0.4874, 0.4806,
+            0.4737, 0.4667, 0.4598, 0.4528, 0.4459, 0.4389, 0.4318, 0.4248, 0.4177, 0.4106, 0.4035,
+            0.3964, 0.3893, 0.3821, 0.3749, 0.3677, 0.3605, 0.3533, 0.346, 0.3387, 0.3314, 0.3241,
+            0.3168, 0.3094, 0.3021, 0.2947, 0.2873, 0.2799, 0.2724, 0.265, 0.2575, 0.25,
+        },
+    },
+    ['9mm'] = {
+        effectiveRange = 50,
+        maxRange = 150,
+        minDamage = 0.3,
+        samples = {
+            1.0, 0.9988, 0.9972, 0.9955, 0.9936, 0.9916, 0.9896, 0.9875, 0.9853, 0.9831, 0.9808,
+            0.9784, 0.9761, 0.9737, 0.9712, 0.9687, 0.9662, 0.9637, 0.9611, 0.9585, 0.9558, 0.9532,
+            0.9505, 0.9478, 0.945, 0.9423, 0.9395, 0.9367, 0.9339, 0.931, 0.9282, 0.9253, 0.9224,
+            0.9194, 0.9165, 0.9136, 0.9106, 0.9076, 0.9046, 0.9016, 0.8985, 0.8955, 0.8924, 0.8893,
+            0.8862, 0.8831, 0.88, 0.8769, 0.8737, 0.8706, 0.8674, 0.8642, 0.861, 0.8578, 0.8545,
+            0.8513, 0.8481, 0.8448, 0.8415, 0.8382, 0.8349, 0.8316, 0.8283, 0.825, 0.8216, 0.8183,
+            0.8149, 0.8116, 0.8082, 0.8048, 0.8014, 0.798, 0.7946, 0.7911, 0.7877, 0.7843, 0.7808,
+            0.7773, 0.7739, 0.7704, 0.7669, 0.7634, 0.7599, 0.7564, 0.7528, 0.7493, 0.7458, 0.7422,
+            0.7386, 0.7351, 0.7315, 0.7279, 0.7243, 0.7207, 0.7171, 0.7135, 0.7099, 0.7062, 0.7026,
+            0.699, 0.6953, 0.6916, 0.688, 0.6843, 0.6806, 0.6769, 0.6732, 0.6695, 0.6658, 0.6621,
+            0.6584, 0.6547, 0.6509, 0.6472, 0.6434, 0.6397, 0.6359, 0.6321, 0.6284, 0.6246, 0.6208,
+            0.617, 0.6132, 0.6094, 0.6056, 0.6018, 0.5979, 0.5941, 0.5903, 0.5864, 0.5826, 0.5787,
+            0.5748, 0.571, 0.5671, 0.5632, 0.5593, 0.5554, 0.5515, 0.5476, 0.5437, 0.5398, 0.5359,
+            0.532, 0.528, 0.5241, 0.5202, 0.5162, 0.5123, 0.5083, 0.5044, 0.5004, 0.4964, 0.4924,
+            0.4885, 0.4845, 0.4805, 0.4765, 0.4725, 0.4685, 0.4644, 0.4604, 0.4564, 0.4524, 0.4483,
+            0.4443, 0.4403, 0.4362, 0.4322, 0.4281, 0.424, 0.42, 0.4159, 0.4118, 0.4077, 0.4036,
+            0.3995, 0.3955, 0.3914, 0.3872, 0.3831, 0.379, 0.3749, 0.3708, 0.3667, 0.3625, 0.3584,
+            0.3542, 0.3501, 0.3459, 0.3418, 0.3376, 0.3335, 0.3293, 0.3251, 0.3209, 0.3168, 0.3126,
+            0.3084, 0.3042, 0.3,
+        },
+    },
+    ['.40sw'] = {
+        effectiveRange = 50,
+        maxRange = 150,
+        minDamage = 0.3,
+        samples = {
+            1.0, 0.9988, 0.9972, 0.9955, 0.9936, 0.9916, 0.9896, 0.9875, 0.9853, 0.9831, 0.9808,
+            0.9784, 0.9761, 0.9737, 0.9712, 0.9687, 0.9662, 0.9637, 0.9611, 0.9585, 0.9558, 0.9532,
+            0.9505, 0.9478, 0.945, 0.9423, 0.9395, 0.9367, 0.9339, 0.931, 0.9282, 0.9253, 0.9224,
+            0.9194, 0.9165, 0.9136, 0.9106, 0.9076, 0.9046, 0.9016, 0.8985, 0.8955, 0.8924, 0.8893,
+            0.8862, 0.8831, 0.88, 0.8769, 0.8737, 0.8706, 0.8674, 0.8642, 0.861, 0.8578, 0.8545,
+            0.8513, 0.8481, 0.8448, 0.8415, 0.8382, 0.8349, 0.8316, 0.8283, 0.825, 0.8216, 0.8183,
+            0.8149, 0.8116, 0.8082, 0.8048, 0.8014, 0.798, 0.7946, 0.7911, 0.7877, 0.7843, 0.7808,
+            0.7773, 0.7739, 0.7704, 0.7669, 0.7634, 0.7599, 0.7564, 0.7528, 0.7493, 0.7458, 0.7422,
+            0.7386, 0.7351, 0.7315, 0.7279, 0.7243, 0.7207, 0.7171, 0.7135, 0.7099, 0.7062, 0.7026,
+            0.699, 0.6953, 0.6916, 0.688, 0.6843, 0.6806, 0.6769, 0.6732, 0.6695, 0.6658, 0.6621,
+            0.6584, 0.6547, 0.6509, 0.6472, 0.6434, 0.6397, 0.6359, 0.6321, 0.6284, 0.6246, 0.6208,
+            0.617, 0.6132, 0.6094, 0.6056, 0.6018, 0.5979, 0.5941, 0.5903, 0.5864, 0.5826, 0.5787,
+            0.5748, 0.571, 0.5671, 0.5632, 0.5593, 0.5554, 0.5515, 0.5476, 0.5437, 0.5398, 0.5359,
+            0.532, 0.528, 0.5241, 0.5202, 0.5162, 0.5123, 0.5083, 0.5044, 0.5004, 0.4964, 0.4924,
+            0.4885, 0.4845, 0.4805, 0.4765, 0.4725, 0.4685, 0.4644, 0.4604, 0.4564, 0.4524, 0.4483,
+            0.4443, 0.4403, 0.4362, 0.4322, 0.4281, 0.424, 0.42, 0.4159, 0.4118, 0.4077, 0.4036,
+            0.3995, 0.3955, 0.3914, 0.3872, 0.3831, 0.379, 0.3749, 0.3708, 0.3667, 0.3625, 0.3584,
+            0.3542, 0.3501, 0.3459, 0.3418, 0.3376, 0.3335, 0.3293, 0.3251, 0.3209, 0.3168, 0.3126,
+            0.3084, 0.3042, 0.3,
+        },
+    },
+    ['.45acp'] = {
+        effectiveRange = 45,
+        maxRange = 125,
+        minDamage = 0.28,
+        samples = {
+            1.0, 0.999, 0.9976, 0.9959, 0.994, 0.992, 0.9899, 0.9877, 0.9853, 0.9829, 0.9804, 0.9778,
+            0.9752, 0.9725, 0.9697, 0.9668, 0.9639, 0.961, 0.9579, 0.9549, 0.9518, 0.9486, 0.9454,
+            0.9422, 0.9389, 0.9355, 0.9322, 0.9288, 0.9253, 0.9218, 0.9183, 0.9147, 0.9111, 0.9075,
+            0.9039, 0.9002, 0.8964, 0.8927, 0.8889, 0.8851, 0.8812, 0.8774, 0.8735, 0.8695, 0.8656,
+            0.8616, 0.8576, 0.8535, 0.8495, 0.8454, 0.8413, 0.8371, 0.833, 0.8288, 0.8246, 0.8203,
+            0.8161, 0.8118, 0.8075, 0.8032, 0.7988, 0.7945, 0.7901, 0.7857, 0.7812, 0.7768, 0.7723,
+            0.7678, 0.7633, 0.7587, 0.7542, 0.7496, 0.745, 0.7404, 0.7358, 0.7311, 0.7265, 0.7218,
+            0.7171, 0.7123, 0.7076, 0.7028, 0.6981, 0.6933, 0.6884, 0.6836, 0.6788, 0.6739, 0.669,
+            0.6641, 0.6592, 0.6543, 0.6493, 0.6444, 0.6394, 0.6344, 0.6294, 0.6244, 0.6193, 0.6143,
+            0.6092, 0.6041, 0.599, 0.5939, 0.5887, 0.5836, 0.5784, 0.5732, 0.5681, 0.5628, 0.5576,
+            0.5524, 0.5471, 0.5419, 0.5366, 0.5313, 0.526, 0.5207, 0.5154, 0.51, 0.5047, 0.4993,
+            0.4939, 0.4885, 0.4831, 0.4777, 0.4722, 0.4668, 0.4613, 0.4558, 0.4503, 0.4448, 0.4393,
+            0.4338, 0.4282, 0.4227, 0.4171, 0.4115, 0.406, 0.4004, 0.3947, 0.3891, 0.3835, 0.3778,
+            0.3722, 0.3665, 0.3608, 0.3551, 0.3494, 0.3437, 0.3379, 0.3322, 0.3264, 0.3207, 0.3149,
+            0.3091, 0.3033, 0.2975, 0.2917, 0.2858, 0.28,
+        },
+    },
+    ['5.7x28'] = {
+        effectiveRange = 75,
+        maxRange = 200,
+        minDamage = 0.35,
+        samples = {
+            1.0, 0.9974, 0.9948, 0.9922, 0.9896, 0.987, 0.9844, 0.9818, 0.9792, 0.9766, 0.974,
+            0.9714, 0.9688, 0.9662, 0.9636, 0.961, 0.9584, 0.9558, 0.9532, 0.9506, 0.948, 0.9454,
+            0.9428, 0.9402, 0.9376, 0.935, 0.9324, 0.9298, 0.9272, 0.9246, 0.922, 0.9194, 0.9168,
+            0.9142, 0.9116, 0.909, 0.9064, 0.9038, 0.9012, 0.8986, 0.896, 0.8934, 0.8908, 0.8882,
+            0.8856, 0.883, 0.8804, 0.8778, 0.8752, 0.8726, 0.87, 0.8674, 0.8648, 0.8622, 0.8596,
+            0.857, 0.8544, 0.8518, 0.8492, 0.8466, 0.844, 0.8414, 0.8388, 0.8362, 0.8336, 0.831,
+            0.8284, 0.8258, 0.8232, 0.8206, 0.818, 0.8154, 0.8128, 0.8102, 0.8076, 0.805, 0.8024,
+            0.7998, 0.7972, 0.7946, 0.792, 0.7894, 0.7868, 0.7842, 0.7816, 0.779, 0.7764, 0.7738,
+            0.7712, 0.7686, 0.766, 0.7634, 0.7608, 0.7582, 0.7556, 0.753, 0.7504, 0.7478, 0.7452,
+            0.7426, 0.74, 0.7374, 0.7348, 0.7322, 0.7296, 0.727, 0.7244, 0.7218, 0.7192, 0.7166,
+            0.714, 0.7114, 0.7088, 0.7062, 0.7036, 0.701, 0.6984, 0.6958, 0.6932, 0.6906, 0.688,
+            0.6854, 0.6828, 0.6802, 0.6776, 0.675, 0.6724, 0.6698, 0.6672, 0.6646, 0.662, 0.6594,
+            0.6568, 0.6542, 0.6516, 0.649, 0.6464, 0.6438, 0.6412, 0.6386, 0.636, 0.6334, 0.6308,
+            0.6282, 0.6256, 0.623, 0.6204, 0.6178, 0.6152, 0.6126, 0.61, 0.6074, 0.6048, 0.6022,
+            0.5996, 0.597, 0.5944, 0.5918, 0.5892, 0.5866, 0.584, 0.5814, 0.5788, 0.5762, 0.5736,
+            0.571, 0.5684, 0.5658, 0.5632, 0.5606, 0.558, 0.5554, 0.5528, 0.5502, 0.5476, 0.545,
+            0.5424, 0.5398, 0.5372, 0.5346, 0.532, 0.5294, 0.5268, 0.5242, 0.5216, 0.519, 0.5164,
+            0.5138, 0.5112, 0.5086, 0.506, 0.5034, 0.5008, 0.4982, 0.4956, 0.493, 0.4904, 0.4878,
+            0.4852, 0.4826, 0.48, 0.4774, 0.4748, 0.4722, 0.4696, 0.467, 0.4644, 0.4618, 0.4592,
+            0.4566, 0.454, 0.4514, 0.4488, 0.4462, 0.4436, 0.441, 0.4384, 0.4358, 0.4332, 0.4306,
+            0.428, 0.4254, 0.4228, 0.4202, 0.4176, 0.415, 0.4124, 0.4098, 0.4072, 0.4046, 0.402,
+            0.3994, 0.3968, 0.3942, 0.3916, 0.389, 0.3864, 0.3838, 0.3812, 0.3786, 0.376, 0.3734,
+            0.3708, 0.3682, 0.3656, 0.363, 0.3604, 0.3578, 0.3552, 0.3526, 0.35,
+        },
+    },
+    ['10mm'] = {
+        effectiveRange = 60,
+        maxRange = 175,
+        minDamage = 0.32,
+        samples = {
+            1.0, 0.9983, 0.9963, 0.9943, 0.9921, 0.9899, 0.9877, 0.9854, 0.9831, 0.9808, 0.9784,
+            0.976, 0.9736, 0.9712, 0.9687, 0.9662, 0.9638, 0.9613, 0.9588, 0.9562, 0.9537, 0.9511,
+            0.9486, 0.946, 0.9434, 0.9408, 0.9382, 0.9356, 0.9329, 0.9303, 0.9276, 0.925, 0.9223,
+            0.9197, 0.917, 0.9143, 0.9116, 0.9089, 0.9062, 0.9034, 0.9007, 0.898, 0.8952, 0.8925,
+            0.8897, 0.887, 0.8842, 0.8814, 0.8787, 0.8759, 0.8731, 0.8703, 0.8675, 0.8647, 0.8619,
+            0.8591, 0.8562, 0.8534, 0.8506, 0.8478, 0.8449, 0.8421, 0.8392, 0.8364, 0.8335, 0.8306,
+            0.8278, 0.8249, 0.822, 0.8191, 0.8163, 0.8134, 0.8105, 0.8076, 0.8047, 0.8018, 0.7989,
+            0.7959, 0.793, 0.7901, 0.7872, 0.7843, 0.7813, 0.7784, 0.7754, 0.7725, 0.7696, 0.7666,
+            0.7637, 0.7607, 0.7577, 0.7548, 0.7518, 0.7488, 0.7459, 0.7429, 0.7399, 0.7369, 0.734,
+            0.731, 0.728, 0.725, 0.722, 0.719, 0.716, 0.713, 0.71, 0.707, 0.7039, 0.7009, 0.6979,
+            0.6949, 0.6919, 0.6888, 0.6858, 0.6828, 0.6797, 0.6767, 0.6737, 0.6706, 0.6676, 0.6645,
+            0.6615, 0.6584, 0.6554, 0.6523, 0.6492, 0.6462, 0.6431, 0.64, 0.637, 0.6339, 0.6308,
+            0.6277, 0.6247, 0.6216, 0.6185, 0.6154, 0.6123, 0.6092, 0.6061, 0.603, 0.5999, 0.5968,
+            0.5937, 0.5906, 0.5875, 0.5844, 0.5813, 0.5782, 0.5751, 0.572, 0.5688, 0.5657, 0.5626,
+            0.5595, 0.5563, 0.5532, 0.5501, 0.547, 0.5438, 0.5407, 0.5375, 0.5344, 0.5313, 0.5281,
+            0.525, 0.5218, 0.5187, 0.5155, 0.5124, 0.5092, 0.506, 0.5029, 0.4997, 0.4966, 0.4934,
+            0.4902, 0.4871, 0.4839, 0.4807, 0.4775, 0.4744, 0.4712, 0.468, 0.4648, 0.4616, 0.4585,
+            0.4553, 0.4521, 0.4489, 0.4457, 0.4425, 0.4393, 0.4361, 0.4329, 0.4297, 0.4265, 0.4233,
+            0.4201, 0.4169, 0.4137, 0.4105, 0.4073, 0.4041, 0.4008, 0.3976, 0.3944, 0.3912, 0.388,
+            0.3848, 0.3815, 0.3783, 0.3751, 0.3718, 0.3686, 0.3654, 0.3622, 0.3589, 0.3557, 0.3525,
+            0.3492, 0.346, 0.3427, 0.3395, 0.3362, 0.333, 0.3298, 0.3265, 0.3233, 0.32,
+        },
+    },
+    ['.357mag'] = {
+        effectiveRange = 75,
+        maxRange = 200,
+        minDamage = 0.35,
+        samples = {
+            1.0, 0.9974, 0.9948, 0.9922, 0.9896, 0.987, 0.9844, 0.9818, 0.9792, 0.9766, 0.974,
+            0.9714, 0.9688, 0.9662, 0.9636, 0.961, 0.9584, 0.9558, 0.9532, 0.9506, 0.948, 0.9454,
+            0.9428, 0.9402, 0.9376, 0.935, 0.9324, 0.9298, 0.9272, 0.9246, 0.922, 0.9194, 0.9168,
+            0.9142, 0.9116, 0.909, 0.9064, 0.9038, 0.9012, 0.8986, 0.896, 0.8934, 0.8908, 0.8882,
+            0.8856, 0.883, 0.8804, 0.8778, 0.8752, 0.8726, 0.87, 0.8674, 0.8648, 0.8622, 0.8596,
+            0.857, 0.8544, 0.8518, 0.8492, 0.8466, 0.844, 0.8414, 0.8388, 0.8362, 0.8336, 0.831,
+            0.8284, 0.8258, 0.8232, 0.8206, 0.818, 0.8154, 0.8128, 0.8102, 0.8076, 0.805, 0.8024,
+            0.7998, 0.7972, 0.7946, 0.792, 0.7894, 0.7868, 0.7842, 0.7816, 0.779, 0.7764, 0.7738,
+            0.7712, 0.7686, 0.766, 0.7634, 0.7608, 0.7582, 0.7556, 0.753, 0.7504, 0.7478, 0.7452,
+            0.7426, 0.74, 0.7374, 0.7348, 0.7322, 0.7296, 0.727, 0.7244, 0.7218, 0.7192, 0.7166,
+            0.714, 0.7114, 0.7088, 0.7062, 0.7036, 0.701, 0.6984, 0.6958, 0.6932, 0.6906, 0.688,
+            0.6854, 0.6828, 0.6802, 0.6776, 0.675, 0.6724, 0.6698, 0.6672, 0.6646, 0.662, 0.6594,
+            0.6568, 0.6542, 0.6516, 0.649, 0.6464, 0.6438, 0.6412, 0.6386, 0.636, 0.6334, 0.6308,
+            0.6282, 0.6256, 0.623, 0.6204, 0.6178, 0.6152, 0.6126, 0.61, 0.6074, 0.6048, 0.6022,
+            0.5996, 0.597, 0.5944, 0.5918, 0.5892, 0.5866, 0.584, 0.5814, 0.5788, 0.5762, 0.5736,
+            0.571, 0.5684, 0.5658, 0.5632, 0.5606, 0.558, 0.5554, 0.5528, 0.5502, 0.5476, 0.545,
+            0.5424, 0.5398, 0.5372, 0.5346, 0.532, 0.5294, 0.5268, 0.5242, 0.5216, 0.519, 0.5164,
+            0.5138, 0.5112, 0.5086, 0.506, 0.5034, 0.5008, 0.4982, 0.4956, 0.493, 0.4904, 0.4878,
+            0.4852, 0.4826, 0.48, 0.4774, 0.4748, 0.4722, 0.4696, 0.467, 0.4644, 0.4618, 0.4592,
+            0.4566, 0.454, 0.4514, 0.4488, 0.4462, 0.4436, 0.441, 0.4384, 0.4358, 0.4332, 0.4306,
+            0.428, 0.4254, 0.4228, 0.4202, 0.4176, 0.415, 0.4124, 0.4098, 0.4072, 0.4046, 0.402,
+            0.3994, 0.3968, 0.3942, 0.3916, 0.389, 0.3864, 0.3838, 0.3812, 0.3786, 0.376, 0.3734,
+            0.3708, 0.3682, 0.3656, 0.363, 0.3604, 0.3578, 0.3552, 0.3526, 0.35,
+        },
+    },
+    ['.44mag'] = {
+        effectiveRange = 100,
+        maxRange = 250,
+        minDamage = 0.38,
+        samples = {
+            1.0, 0.9963, 0.9932, 0.9902, 0.9873, 0.9844, 0.9817, 0.9789, 0.9762, 0.9736, 0.971,
+            0.9684, 0.9658, 0.9632, 0.9607, 0.9582, 0.9557, 0.9532, 0.9507, 0.9483, 0.9458, 0.9434,
+            0.941, 0.9385, 0.9361, 0.9338, 0.9314, 0.929, 0.9266, 0.9243, 0.9219, 0.9196, 0.9173,
+            0.915, 0.9126, 0.9103, 0.908, 0.9057, 0.9034, 0.9012, 0.8989, 0.8966, 0.8943, 0.8921,
+            0.8898, 0.8876, 0.8853, 0.8831, 0.8808, 0.8786, 0.8764, 0.8742, 0.8719, 0.8697, 0.8675,
+            0.8653, 0.8631, 0.8609, 0.8587, 0.8565, 0.8543, 0.8522, 0.85, 0.8478, 0.8456, 0.8435,
+            0.8413, 0.8391, 0.837, 0.8348, 0.8327, 0.8305, 0.8284, 0.8262, 0.8241, 0.822, 0.8198,
+            0.8177, 0.8156, 0.8134, 0.8113, 0.8092, 0.8071, 0.8049, 0.8028, 0.8007, 0.7986, 0.7965,
+            0.7944, 0.7923, 0.7902, 0.7881, 0.786, 0.7839, 0.7818, 0.7797, 0.7777, 0.7756, 0.7735,
+            0.7714, 0.7693, 0.7673, 0.7652, 0.7631, 0.761, 0.759, 0.7569, 0.7549, 0.7528, 0.7507,
+            0.7487, 0.7466, 0.7446, 0.7425, 0.7405, 0.7384, 0.7364, 0.7343, 0.7323, 0.7302, 0.7282,
+            0.7262, 0.7241, 0.7221, 0.7201, 0.718, 0.716, 0.714, 0.7119, 0.7099, 0.7079, 0.7059,
+            0.7039, 0.7018, 0.6998, 0.6978, 0.6958, 0.6938, 0.6918, 0.6898, 0.6878, 0.6857, 0.6837,
+            0.6817, 0.6797, 0.6777, 0.6757, 0.6737, 0.6717, 0.6697, 0.6678, 0.6658, 0.6638, 0.6618,
+            0.6598, 0.6578, 0.6558, 0.6538, 0.6518, 0.6499, 0.6479, 0.6459, 0.6439, 0.6419, 0.64,
+            0.638, 0.636, 0.634, 0.6321, 0.6301, 0.6281, 0.6262, 0.6242, 0.6222, 0.6203, 0.6183,
+            0.6163, 0.6144, 0.6124, 0.6105, 0.6085, 0.6065, 0.6046, 0.6026, 0.6007, 0.5987, 0.5968,
+            0.5948, 0.5929, 0.5909, 0.589, 0.587, 0.5851, 0.5831, 0.5812, 0.5793, 0.5773, 0.5754,
+            0.5734, 0.5715, 0.5696, 0.5676, 0.5657, 0.5638, 0.5618, 0.5599, 0.558, 0.556, 0.5541,
+            0.5522, 0.5502, 0.5483, 0.5464, 0.5445, 0.5425, 0.5406, 0.5387, 0.5368, 0.5348, 0.5329,
+            0.531, 0.5291, 0.5272, 0.5253, 0.5233, 0.5214, 0.5195, 0.5176, 0.5157, 0.5138, 0.5119,
+            0.51, 0.508, 0.5061, 0.5042, 0.5023, 0.5004, 0.4985, 0.4966, 0.4947, 0.4928, 0.4909,
+            0.489, 0.4871, 0.4852, 0.4833, 0.4814, 0.4795, 0.4776, 0.4757, 0.4738, 0.4719, 0.47,
+            0.4681, 0.4663, 0.4644, 0.4625, 0.4606, 0.4587, 0.4568, 0.4549, 0.453, 0.4511, 0.4493,
+            0.4474, 0.4455, 0.4436, 0.4417, 0.4399, 0.438, 0.4361, 0.4342, 0.4323, 0.4305, 0.4286,
+            0.4267, 0.4248, 0.4229, 0.4211, 0.4192, 0.4173, 0.4155, 0.4136, 0.4117, 0.4098, 0.408,
+            0.4061, 0.4042, 0.4024, 0.4005, 0.3986, 0.3968, 0.3949, 0.393, 0.3912, 0.3893, 0.3874,
+            0.3856, 0.3837, 0.3819, 0.38,
+        },
+    },
+    ['.500sw'] = {
+        effectiveRange = 125,
+        maxRange = 300,
+        minDamage = 0.4,
+        samples = {
+            1.0, 0.9945, 0.9904, 0.9867, 0.9832, 0.98, 0.9768, 0.9738, 0.9708, 0.9679, 0.9651,
+            0.9623, 0.9596, 0.9569, 0.9543, 0.9517, 0.9492, 0.9466, 0.9441, 0.9417, 0.9392, 0.9368,
+            0.9344, 0.932, 0.9297, 0.9273, 0.925, 0.9227, 0.9205, 0.9182, 0.9159, 0.9137, 0.9115,
+            0.9093, 0.9071, 0.9049, 0.9027, 0.9006, 0.8984, 0.8963, 0.8942, 0.8921, 0.89, 0.8879,
+            0.8858, 0.8837, 0.8817, 0.8796, 0.8776, 0.8755, 0.8735, 0.8715, 0.8695, 0.8675, 0.8655,
+            0.8635, 0.8615, 0.8595, 0.8576, 0.8556, 0.8536, 0.8517, 0.8498, 0.8478, 0.8459, 0.844,
+            0.842, 0.8401, 0.8382, 0.8363, 0.8344, 0.8325, 0.8307, 0.8288, 0.8269, 0.825, 0.8232,
+            0.8213, 0.8195, 0.8176, 0.8158, 0.8139, 0.8121, 0.8103, 0.8084, 0.8066, 0.8048, 0.803,
+            0.8012, 0.7994, 0.7976, 0.7958, 0.794, 0.7922, 0.7904, 0.7886, 0.7868, 0.7851, 0.7833,
+            0.7815, 0.7798, 0.778, 0.7762, 0.7745, 0.7727, 0.771, 0.7693, 0.7675, 0.7658, 0.764,
+            0.7623, 0.7606, 0.7589, 0.7571, 0.7554, 0.7537, 0.752, 0.7503, 0.7486, 0.7469, 0.7452,
+            0.7435, 0.7418, 0.7401, 0.7384, 0.7367, 0.735, 0.7334, 0.7317, 0.73, 0.7283, 0.7267,
+            0.725, 0.7233, 0.7217, 0.72, 0.7183, 0.7167, 0.715, 0.7134, 0.7117, 0.7101, 0.7084,
+            0.7068, 0.7052, 0.7035, 0.7019, 0.7003, 0.6986, 0.697, 0.6954, 0.6937, 0.6921, 0.6905,
+            0.6889, 0.6873, 0.6857, 0.6841, 0.6824, 0.6808, 0.6792, 0.6776, 0.676, 0.6744, 0.6728,
+            0.6712, 0.6696, 0.6681, 0.6665, 0.6649, 0.6633, 0.6617, 0.6601, 0.6585, 0.657, 0.6554,
+            0.6538, 0.6522, 0.6507, 0.6491, 0.6475, 0.646, 0.6444, 0.6428, 0.6413, 0.6397, 0.6382,
+            0.6366, 0.6351, 0.6335, 0.632, 0.6304, 0.6289, 0.6273, 0.6258, 0.6242, 0.6227, 0.6211,
+            0.6196, 0.6181, 0.6165, 0.615, 0.6135, 0.6119, 0.6104, 0.6089, 0.6074, 0.6058, 0.6043,
+            0.6028, 0.6013, 0.5998, 0.5982, 0.5967, 0.5952, 0.5937, 0.5922, 0.5907, 0.5892, 0.5877,
+            0.5862, 0.5847, 0.5832, 0.5816, 0.5801, 0.5787, 0.5772, 0.5757, 0.5742, 0.5727, 0.5712,
+            0.5697, 0.5682, 0.5667, 0.5652, 0.5637, 0.5622, 0.5608, 0.5593, 0.5578, 0.5563, 0.5548,
+            0.5534, 0.5519, 0.5504, 0.5489, 0.5475, 0.546, 0.5445, 0.5431, 0.5416, 0.5401, 0.5387,
+            0.5372, 0.5357, 0.5343, 0.5328, 0.5314, 0.5299, 0.5284, 0.527, 0.5255, 0.5241, 0.5226,
+            0.5212, 0.5197, 0.5183, 0.5168, 0.5154, 0.5139, 0.5125, 0.511, 0.5096, 0.5082, 0.5067,
+            0.5053, 0.5038, 0.5024, 0.501, 0.4995, 0.4981, 0.4967, 0.4952, 0.4938, 0.4924, 0.4909,
+            0.4895, 0.4881, 0.4867, 0.4852, 0.4838, 0.4824, 0.481, 0.4795, 0.4781, 0.4767, 0.4753,
+            0.4739, 0.4724, 0.471, 0.4696, 0.4682, 0.4668, 0.4654, 0.464, 0.4626, 0.4611, 0.4597,
+            0.4583, 0.4569, 0.4555, 0.4541, 0.4527, 0.4513, 0.4499, 0.4485, 0.4471, 0.4457, 0.4443,
+            0.4429, 0.4415, 0.4401, 0.4387, 0.4373, 0.4359, 0.4345, 0.4331, 0.4318, 0.4304, 0.429,
+            0.4276, 0.4262, 0.4248, 0.4234, 0.422, 0.4207, 0.4193, 0.4179, 0.4165, 0.4151, 0.4138,
+            0.4124, 0.411, 0.4096, 0.4082, 0.4069, 0.4055, 0.4041, 0.4027, 0.4014, 0.4,
+        },
+    },
+    ['5.56'] = {
+        effectiveRange = 300,
+        maxRange = 600,
+        minDamage = 0.4,
+        samples = {
+            1.0, 0.9964, 0.9937, 0.9913, 0.9891, 0.987, 0.9849, 0.983, 0.981, 0.9792, 0.9773, 0.9755,
+            0.9738, 0.972, 0.9703, 0.9686, 0.967, 0.9653, 0.9637, 0.9621, 0.9605, 0.9589, 0.9574,
+            0.9558, 0.9543, 0.9528, 0.9513, 0.9498, 0.9483, 0.9468, 0.9454, 0.9439, 0.9425, 0.9411,
+            0.9396, 0.9382, 0.9368, 0.9354, 0.934, 0.9326, 0.9312, 0.9299, 0.9285, 0.9272, 0.9258,
+            0.9245, 0.9231, 0.9218, 0.9205, 0.9191, 0.9178, 0.9165, 0.9152, 0.9139, 0.9126, 0.9113,
+            0.91, 0.9087, 0.9075, 0.9062, 0.9049, 0.9036, 0.9024, 0.9011, 0.8999, 0.8986, 0.8974,
+            0.8961, 0.8949, 0.8937, 0.8924, 0.8912, 0.89, 0.8888, 0.8875, 0.8863, 0.8851, 0.8839,
+            0.8827, 0.8815, 0.8803, 0.8791, 0.8779, 0.8767, 0.8755, 0.8743, 0.8732, 0.872, 0.8708,
+            0.8696, 0.8685, 0.8673, 0.8661, 0.865, 0.8638, 0.8627, 0.8615, 0.8603, 0.8592, 0.858,
+            0.8569, 0.8558, 0.8546, 0.8535, 0.8523, 0.8512, 0.8501, 0.8489, 0.8478, 0.8467, 0.8456,
+            0.8444, 0.8433, 0.8422, 0.8411, 0.84, 0.8389, 0.8378, 0.8366, 0.8355, 0.8344, 0.8333,
+            0.8322, 0.8311, 0.83, 0.8289, 0.8278, 0.8268, 0.8257, 0.8246, 0.8235, 0.8224, 0.8213,
+            0.8202, 0.8192, 0.8181, 0.817, 0.8159, 0.8148, 0.8138, 0.8127, 0.8116, 0.8106, 0.8095,
+            0.8084, 0.8074, 0.8063, 0.8052, 0.8042, 0.8031, 0.8021, 0.801, 0.8, 0.7989, 0.7979,
+            0.7968, 0.7958, 0.7947, 0.7937, 0.7926, 0.7916, 0.7905, 0.7895, 0.7885, 0.7874, 0.7864,
+            0.7854, 0.7843, 0.7833, 0.7823, 0.7812, 0.7802, 0.7792, 0.7781, 0.7771, 0.7761, 0.7751,
+            0.7741, 0.773, 0.772, 0.771, 0.77, 0.769, 0.7679, 0.7669, 0.7659, 0.7649, 0.7639, 0.7629,
+            0.7619, 0.7609, 0.7599, 0.7589, 0.7579, 0.7569, 0.7558, 0.7548, 0.7538, 0.7528, 0.7519,
+            0.7509, 0.7499, 0.7489, 0.7479, 0.7469, 0.7459, 0.7449, 0.7439, 0.7429, 0.7419, 0.7409,
+            0.74, 0.739, 0.738, 0.737, 0.736, 0.735, 0.7341, 0.7331, 0.7321, 0.7311, 0.7301, 0.7292,
+            0.7282, 0.7272, 0.7262, 0.7253, 0.7243, 0.7233, 0.7223, 0.7214, 0.7204, 0.7194, 0.7185,
+            0.7175, 0.7165, 0.7156, 0.7146, 0.7137, 0.7127, 0.7117, 0.7108, 0.7098, 0.7089, 0.7079,
+            0.7069, 0.706, 0.705, 0.7041, 0.7031, 0.7022, 0.7012, 0.7003, 0.6993, 0.6984, 0.6974,
+            0.6965, 0.6955, 0.6946, 0.6936, 0.6927, 0.6917, 0.6908, 0.6898, 0.6889, 0.6879, 0.687,
+            0.6861, 0.6851, 0.6842, 0.6832, 0.6823, 0.6814, 0.6804, 0.6795, 0.6786, 0.6776, 0.6767,
+            0.6758, 0.6748, 0.6739, 0.673, 0.672, 0.6711, 0.6702, 0.6692, 0.6683, 0.6674, 0.6665,
+            0.6655, 0.6646, 0.6637, 0.6628, 0.6618, 0.6609, 0.66, 0.6591, 0.6582, 0.6572, 0.6563,
+            0.6554, 0.6545, 0.6536, 0.6526, 0.6517, 0.6508, 0.6499, 0.649, 0.6481, 0.6471, 0.6462,
+            0.6453, 0.6444, 0.6435, 0.6426, 0.6417, 0.6408, 0.6399, 0.6389, 0.638, 0.6371, 0.6362,
+            0.6353, 0.6344, 0.6335, 0.6326, 0.6317, 0.6308, 0.6299, 0.629, 0.6281, 0.6272, 0.6263,
+            0.6254, 0.6245, 0.6236, 0.6227, 0.6218, 0.6209, 0.62, 0.6191, 0.6182, 0.6173, 0.6164,
+            0.6155, 0.6146, 0.6137, 0.6128, 0.6119, 0.6111, 0.6102, 0.6093, 0.6084, 0.6075, 0.6066,
+            0.6057, 0.6048, 0.6039, 0.603, 0.6022, 0.6013, 0.6004, 0.5995, 0.5986, 0.5977, 0.5969,
+            0.596, 0.5951, 0.5942, 0.5933, 0.5924, 0.5916, 0.5907, 0.5898, 0.5889, 0.588, 0.5872,
+            0.5863, 0.5854, 0.5845, 0.5837, 0.5828, 0.5819, 0.581, 0.5801, 0.5793, 0.5784, 0.5775,
+            0.5767, 0.5758, 0.5749, 0.574, 0.5732, 0.5723, 0.5714, 0.5706, 0.5697, 0.5688, 0.5679,
+            0.5671, 0.5662, 0.5653, 0.5645, 0.5636, 0.5627, 0.5619, 0.561, 0.5601, 0.5593, 0.5584,
+            0.5576, 0.5567, 0.5558, 0.555, 0.5541, 0.5532, 0.5524, 0.5515, 0.5507, 0.5498, 0.5489,
+            0.5481, 0.5472, 0.5464, 0.5455, 0.5447, 0.5438, 0.5429, 0.5421, 0.5412, 0.5404, 0.5395,
+            0.5387, 0.5378, 0.537, 0.5361, 0.5352, 0.5344, 0.5335, 0.5327, 0.5318, 0.531, 0.5301,
+            0.5293, 0.5284, 0.5276, 0.5267, 0.5259, 0.525, 0.5242, 0.5233, 0.5225, 0.5217, 0.5208,
+            0.52, 0.5191, 0.5183, 0.5174, 0.5166, 0.5157, 0.5149, 0.5141, 0.5132, 0.5124, 0.5115,
+            0.5107, 0.5098, 0.509, 0.5082, 0.5073, 0.5065, 0.5056, 0.5048, 0.504, 0.5031, 0.5023,
+            0.5014, 0.5006, 0.4998, 0.4989, 0.4981, 0.4973, 0.4964, 0.4956, 0.4947, 0.4939, 0.4931,
+            0.4922, 0.4914, 0.4906, 0.4897, 0.4889, 0.4881, 0.4872, 0.4864, 0.4856, 0.4848, 0.4839,
+            0.4831, 0.4823, 0.4814, 0.4806, 0.4798, 0.4789, 0.4781, 0.4773, 0.4765, 0.4756, 0.4748,
+            0.474, 0.4732, 0.4723, 0.4715, 0.4707, 0.4698, 0.469, 0.4682, 0.4674, 0.4665, 0.4657,
+            0.4649, 0.4641, 0.4633, 0.4624, 0.4616, 0.4608, 0.46, 0.4591, 0.4583, 0.4575, 0.4567,
+            0.4559, 0.455, 0.4542, 0.4534, 0.4526, 0.4518, 0.451, 0.4501, 0.4493, 0.4485, 0.4477,
+            0.4469, 0.4461, 0.4452, 0.4444, 0.4436, 0.4428, 0.442, 0.4412, 0.4403, 0.4395, 0.4387,
+            0.4379, 0.4371, 0.4363, 0.4355, 0.4347, 0.4338, 0.433, 0.4322, 0.4314, 0.4306, 0.4298,
+            0.429, 0.4282, 0.4274, 0.4265, 0.4257, 0.4249, 0.4241, 0.4233, 0.4225, 0.4217, 0.4209,
+            0.4201, 0.4193, 0.4185, 0.4177, 0.4169, 0.4161, 0.4152, 0.4144, 0.4136, 0.4128, 0.412,
+            0.4112, 0.4104, 0.4096, 0.4088, 0.408, 0.4072, 0.4064, 0.4056, 0.4048, 0.404, 0.4032,
+            0.4024, 0.4016, 0.4008, 0.4,
+        },
+    },
+    ['7.62x39'] = {
+        effectiveRange = 250,
+        maxRange = 500,
+        minDamage = 0.38,
+        samples = {
+            1.0, 0.9977, 0.9957, 0.9938, 0.992, 0.9902, 0.9884, 0.9867, 0.985, 0.9833, 0.9817, 0.98,
+            0.9784, 0.9768, 0.9752, 0.9736, 0.972, 0.9704, 0.9689, 0.9673, 0.9658, 0.9642, 0.9627,
+            0.9612, 0.9597, 0.9582, 0.9567, 0.9552, 0.9537, 0.9522, 0.9507, 0.9492, 0.9478, 0.9463,
+            0.9448, 0.9434, 0.9419, 0.9405, 0.939, 0.9376, 0.9361, 0.9347, 0.9333, 0.9319, 0.9304,
+            0.929, 0.9276, 0.9262, 0.9248, 0.9234, 0.9219, 0.9205, 0.9191, 0.9177, 0.9163, 0.915,
+            0.9136, 0.9122, 0.9108, 0.9094, 0.908, 0.9066, 0.9053, 0.9039, 0.9025, 0.9012, 0.8998,
+            0.8984, 0.8971, 0.8957, 0.8943, 0.893, 0.8916, 0.8903, 0.8889, 0.8876, 0.8862, 0.8849,
+            0.8835, 0.8822, 0.8808, 0.8795, 0.8782, 0.8768, 0.8755, 0.8742, 0.8728, 0.8715, 0.8702,
+            0.8688, 0.8675, 0.8662, 0.8649, 0.8636, 0.8622, 0.8609, 0.8596, 0.8583, 0.857, 0.8557,
+            0.8543, 0.853, 0.8517, 0.8504, 0.8491, 0.8478, 0.8465, 0.8452, 0.8439, 0.8426, 0.8413,
+            0.84, 0.8387, 0.8374, 0.8361, 0.8348, 0.8335, 0.8322, 0.831, 0.8297, 0.8284, 0.8271,
+            0.8258, 0.8245, 0.8232, 0.822, 0.8207, 0.8194, 0.8181, 0.8168, 0.8156, 0.8143, 0.813,
+            0.8117, 0.8105, 0.8092, 0.8079, 0.8066, 0.8054, 0.8041, 0.8028, 0.8016, 0.8003, 0.799,
+            0.7978, 0.7965, 0.7952, 0.794, 0.7927, 0.7915, 0.7902, 0.7889, 0.7877, 0.7864, 0.7852,
+            0.7839, 0.7827, 0.7814, 0.7802, 0.7789, 0.7777, 0.7764, 0.7752, 0.7739, 0.7727, 0.7714,
+            0.7702, 0.7689, 0.7677, 0.7664, 0.7652, 0.7639, 0.7627, 0.7615, 0.7602, 0.759, 0.7577,
+            0.7565, 0.7553, 0.754, 0.7528, 0.7516, 0.7503, 0.7491, 0.7479, 0.7466, 0.7454, 0.7442,
+            0.7429, 0.7417, 0.7405, 0.7392, 0.738, 0.7368, 0.7356, 0.7343, 0.7331, 0.7319, 0.7306,
+            0.7294, 0.7282, 0.727, 0.7258, 0.7245, 0.7233, 0.7221, 0.7209, 0.7197, 0.7184, 0.7172,
+            0.716, 0.7148, 0.7136, 0.7124, 0.7111, 0.7099, 0.7087, 0.7075, 0.7063, 0.7051, 0.7039,
+            0.7026, 0.7014, 0.7002, 0.699, 0.6978, 0.6966, 0.6954, 0.6942, 0.693, 0.6918, 0.6906,
+            0.6894, 0.6882, 0.687, 0.6857, 0.6845, 0.6833, 0.6821, 0.6809, 0.6797, 0.6785, 0.6773,
+            0.6761, 0.6749, 0.6737, 0.6725, 0.6713, 0.6701, 0.6689, 0.6678, 0.6666, 0.6654, 0.6642,
+            0.663, 0.6618, 0.6606, 0.6594, 0.6582, 0.657, 0.6558, 0.6546, 0.6534, 0.6522, 0.6511,
+            0.6499, 0.6487, 0.6475, 0.6463, 0.6451, 0.6439, 0.6427, 0.6415, 0.6404, 0.6392, 0.638,
+            0.6368, 0.6356, 0.6344, 0.6333, 0.6321, 0.6309, 0.6297, 0.6285, 0.6273, 0.6262, 0.625,
+            0.6238, 0.6226, 0.6214, 0.6203, 0.6191, 0.6179, 0.6167, 0.6156, 0.6144, 0.6132, 0.612,
+            0.6109, 0.6097, 0.6085, 0.6073, 0.6062, 0.605, 0.6038, 0.6026, 0.6015, 0.6003, 0.5991,
+            0.5979, 0.5968, 0.5956, 0.5944, 0.5933, 0.5921, 0.5909, 0.5898, 0.5886, 0.5874, 0.5863,
+            0.5851, 0.5839, 0.5828, 0.5816, 0.5804, 0.5793, 0.5781, 0.5769, 0.5758, 0.5746, 0.5734,
+            0.5723, 0.5711, 0.57, 0.5688, 0.5676, 0.5665, 0.5653, 0.5641, 0.563, 0.5618, 0.5607,
+            0.5595, 0.5583, 0.5572, 0.556, 0.5549, 0.5537, 0.5526, 0.5514, 0.5502, 0.5491, 0.5479,
+            0.5468, 0.5456, 0.5445, 0.5433, 0.5422, 0.541, 0.5398, 0.5387, 0.5375, 0.5364, 0.5352,
+            0.5341, 0.5329, 0.5318, 0.5306, 0.5295, 0.5283, 0.5272, 0.526, 0.5249, 0.5237, 0.5226,
+            0.5214, 0.5203, 0.5191, 0.518, 0.5168, 0.5157, 0.5145, 0.5134, 0.5122, 0.5111, 0.51,
+            0.5088, 0.5077, 0.5065, 0.5054, 0.5042, 0.5031, 0.5019, 0.5008, 0.4997, 0.4985, 0.4974,
+            0.4962, 0.4951, 0.4939, 0.4928, 0.4917, 0.4905, 0.4894, 0.4882, 0.4871, 0.486, 0.4848,
+            0.4837, 0.4825, 0.4814, 0.4803, 0.4791, 0.478, 0.4769, 0.4757, 0.4746, 0.4734, 0.4723,
+            0.4712, 0.47, 0.4689, 0.4678, 0.4666, 0.4655, 0.4644, 0.4632, 0.4621, 0.461, 0.4598,
+            0.4587, 0.4576, 0.4564, 0.4553, 0.4542, 0.453, 0.4519, 0.4508, 0.4496, 0.4485, 0.4474,
+            0.4463, 0.4451, 0.444, 0.4429, 0.4417, 0.4406, 0.4395, 0.4383, 0.4372, 0.4361, 0.435,
+            0.4338, 0.4327, 0.4316, 0.4305, 0.4293, 0.4282, 0.4271, 0.4259, 0.4248, 0.4237, 0.4226,
+            0.4214, 0.4203, 0.4192, 0.4181, 0.417, 0.4158, 0.4147, 0.4136, 0.4125, 0.4113, 0.4102,
+            0.4091, 0.408, 0.4068, 0.4057, 0.4046, 0.4035, 0.4024, 0.4012, 0.4001, 0.399, 0.3979,
+            0.3968, 0.3956, 0.3945, 0.3934, 0.3923, 0.3912, 0.3901, 0.3889, 0.3878, 0.3867, 0.3856,
+            0.3845, 0.3833, 0.3822, 0.3811, 0.38,
+        },
+    },
+    ['.300blk'] = {
+        effectiveRange = 200,
+        maxRange = 400,
+        minDamage = 0.35,
+        samples = {
+            1.0, 0.9984, 0.9968, 0.9951, 0.9935, 0.9919, 0.9902, 0.9886, 0.987, 0.9854, 0.9838,
+            0.9821, 0.9805, 0.9789, 0.9772, 0.9756, 0.974, 0.9724, 0.9708, 0.9691, 0.9675, 0.9659,
+            0.9643, 0.9626, 0.961, 0.9594, 0.9577, 0.9561, 0.9545, 0.9529, 0.9513, 0.9496, 0.948,
+            0.9464, 0.9447, 0.9431, 0.9415, 0.9399, 0.9383, 0.9366, 0.935, 0.9334, 0.9317, 0.9301,
+            0.9285, 0.9269, 0.9253, 0.9236, 0.922, 0.9204, 0.9187, 0.9171, 0.9155, 0.9139, 0.9123,
+            0.9106, 0.909, 0.9074, 0.9058, 0.9041, 0.9025, 0.9009, 0.8992, 0.8976, 0.896, 0.8944,
+            0.8927, 0.8911, 0.8895, 0.8879, 0.8862, 0.8846, 0.883, 0.8814, 0.8798, 0.8781, 0.8765,
+            0.8749, 0.8732, 0.8716, 0.87, 0.8684, 0.8668, 0.8651, 0.8635, 0.8619, 0.8602, 0.8586,
+            0.857, 0.8554, 0.8538, 0.8521, 0.8505, 0.8489, 0.8473, 0.8456, 0.844, 0.8424, 0.8407,
+            0.8391, 0.8375, 0.8359, 0.8342, 0.8326, 0.831, 0.8294, 0.8277, 0.8261, 0.8245, 0.8229,
+            0.8213, 0.8196, 0.818, 0.8164, 0.8147, 0.8131, 0.8115, 0.8099, 0.8083, 0.8066, 0.805,
+            0.8034, 0.8017, 0.8001, 0.7985, 0.7969, 0.7953, 0.7936, 0.792, 0.7904, 0.7887, 0.7871,
+            0.7855, 0.7839, 0.7823, 0.7806, 0.779, 0.7774, 0.7758, 0.7741, 0.7725, 0.7709, 0.7692,
+            0.7676, 0.766, 0.7644, 0.7628, 0.7611, 0.7595, 0.7579, 0.7562, 0.7546, 0.753, 0.7514,
+            0.7497, 0.7481, 0.7465, 0.7449, 0.7432, 0.7416, 0.74, 0.7384, 0.7368, 0.7351, 0.7335,
+            0.7319, 0.7303, 0.7286, 0.727, 0.7254, 0.7238, 0.7221, 0.7205, 0.7189, 0.7172, 0.7156,
+            0.714, 0.7124, 0.7107, 0.7091, 0.7075, 0.7059, 0.7043, 0.7026, 0.701, 0.6994, 0.6977,
+            0.6961, 0.6945, 0.6929, 0.6913, 0.6896, 0.688, 0.6864, 0.6847, 0.6831, 0.6815, 0.6799,
+            0.6783, 0.6766, 0.675, 0.6734, 0.6717, 0.6701, 0.6685, 0.6669, 0.6652, 0.6636, 0.662,
+            0.6604, 0.6587, 0.6571, 0.6555, 0.6539, 0.6522, 0.6506, 0.649, 0.6474, 0.6457, 0.6441,
+            0.6425, 0.6409, 0.6392, 0.6376, 0.636, 0.6344, 0.6328, 0.6311, 0.6295, 0.6279, 0.6262,
+            0.6246, 0.623, 0.6214, 0.6198, 0.6181, 0.6165, 0.6149, 0.6133, 0.6116, 0.61, 0.6084,
+            0.6068, 0.6051, 0.6035, 0.6019, 0.6002, 0.5986, 0.597, 0.5954, 0.5938, 0.5921, 0.5905,
+            0.5889, 0.5873, 0.5856, 0.584, 0.5824, 0.5807, 0.5791, 0.5775, 0.5759, 0.5742, 0.5726,
+            0.571, 0.5694, 0.5677, 0.5661, 0.5645, 0.5629, 0.5613, 0.5596, 0.558, 0.5564, 0.5547,
+            0.5531, 0.5515, 0.5499, 0.5483, 0.5466, 0.545, 0.5434, 0.5417, 0.5401, 0.5385, 0.5369,
+            0.5353, 0.5336, 0.532, 0.5304, 0.5288, 0.5271, 0.5255, 0.5239, 0.5222, 0.5206, 0.519,
+            0.5174, 0.5157, 0.5141, 0.5125, 0.5109, 0.5092, 0.5076, 0.506, 0.5044, 0.5028, 0.5011,
+            0.4995, 0.4979, 0.4962, 0.4946, 0.493, 0.4914, 0.4897, 0.4881, 0.4865, 0.4849, 0.4832,
+            0.4816, 0.48, 0.4784, 0.4767, 0.4751, 0.4735, 0.4719, 0.4703, 0.4686, 0.467, 0.4654,
+            0.4637, 0.4621, 0.4605, 0.4589, 0.4573, 0.4556, 0.454, 0.4524, 0.4507, 0.4491, 0.4475,
+            0.4459, 0.4443, 0.4426, 0.441, 0.4394, 0.4377, 0.4361, 0.4345, 0.4329, 0.4313, 0.4296,
+            0.428, 0.4264, 0.4247, 0.4231, 0.4215, 0.4199, 0.4183, 0.4166, 0.415, 0.4134, 0.4117,
+            0.4101, 0.4085, 0.4069, 0.4052, 0.4036, 0.402, 0.4004, 0.3987, 0.3971, 0.3955, 0.3939,
+            0.3922, 0.3906, 0.389, 0.3874, 0.3858, 0.3841, 0.3825, 0.3809, 0.3792, 0.3776, 0.376,
+            0.3744, 0.3728, 0.3711, 0.3695, 0.3679, 0.3662, 0.3646, 0.363, 0.3614, 0.3598, 0.3581,
+            0.3565, 0.3549, 0.3532, 0.3516, 0.35,
+        },
+    },
+    ['6.8x51'] = {
+        effectiveRange = 400,
+        maxRange = 800,
+        minDamage = 0.45,
+        samples = {
+            1.0, 0.9949, 0.9917, 0.989, 0.9865, 0.9842, 0.9821, 0.9801, 0.9781, 0.9762, 0.9744,
+            0.9726, 0.9709, 0.9692, 0.9676, 0.966, 0.9644, 0.9629, 0.9614, 0.9599, 0.9584, 0.957,
+            0.9555, 0.9541, 0.9528, 0.9514, 0.95, 0.9487, 0.9474, 0.9461, 0.9448, 0.9435, 0.9422,
+            0.941, 0.9397, 0.9385, 0.9373, 0.936, 0.9348, 0.9336, 0.9324, 0.9313, 0.9301, 0.9289,
+            0.9278, 0.9266, 0.9255, 0.9244, 0.9233, 0.9221, 0.921, 0.9199, 0.9188, 0.9177, 0.9167,
+            0.9156, 0.9145, 0.9134, 0.9124, 0.9113, 0.9103, 0.9092, 0.9082, 0.9072, 0.9061, 0.9051,
+            0.9041, 0.9031, 0.9021, 0.9011, 0.9001, 0.8991, 0.8981, 0.8971, 0.8961, 0.8951, 0.8941,
+            0.8932, 0.8922, 0.8912, 0.8903, 0.8893, 0.8883, 0.8874, 0.8864, 0.8855, 0.8846, 0.8836,
+            0.8827, 0.8818, 0.8808, 0.8799, 0.879, 0.8781, 0.8771, 0.8762, 0.8753, 0.8744, 0.8735,
+            0.8726, 0.8717, 0.8708, 0.8699, 0.869, 0.8681, 0.8673, 0.8664, 0.8655, 0.8646, 0.8637,
+            0.8629, 0.862, 0.8611, 0.8602, 0.8594, 0.8585, 0.8577, 0.8568, 0.8559, 0.8551, 0.8542,
+            0.8534, 0.8525, 0.8517, 0.8509, 0.85, 0.8492, 0.8483, 0.8475, 0.8467, 0.8458, 0.845,
+            0.8442, 0.8434, 0.8425, 0.8417, 0.8409, 0.8401, 0.8393, 0.8384, 0.8376, 0.8368, 0.836,
+            0.8352, 0.8344, 0.8336, 0.8328, 0.832, 0.8312, 0.8304, 0.8296, 0.8288, 0.828, 0.8272,
+            0.8264, 0.8256, 0.8249, 0.8241, 0.8233, 0.8225, 0.8217, 0.8209, 0.8202, 0.8194, 0.8186,
+            0.8178, 0.8171, 0.8163, 0.8155, 0.8148, 0.814, 0.8132, 0.8125, 0.8117, 0.8109, 0.8102,
+            0.8094, 0.8087, 0.8079, 0.8072, 0.8064, 0.8057, 0.8049, 0.8042, 0.8034, 0.8027, 0.8019,
+            0.8012, 0.8004, 0.7997, 0.7989, 0.7982, 0.7975, 0.7967, 0.796, 0.7952, 0.7945, 0.7938,
+            0.7931, 0.7923, 0.7916, 0.7909, 0.7901, 0.7894, 0.7887, 0.788, 0.7872, 0.7865, 0.7858,
+            0.7851, 0.7843, 0.7836, 0.7829, 0.7822, 0.7815, 0.7808, 0.7801, 0.7793, 0.7786, 0.7779,
+            0.7772, 0.7765, 0.7758, 0.7751, 0.7744, 0.7737, 0.773, 0.7723, 0.7716, 0.7709, 0.7702,
+            0.7695, 0.7688, 0.7681, 0.7674, 0.7667, 0.766, 0.7653, 0.7646, 0.7639, 0.7632, 0.7625,
+            0.7618, 0.7612, 0.7605, 0.7598, 0.7591, 0.7584, 0.7577, 0.757, 0.7564, 0.7557, 0.755,
+            0.7543, 0.7536, 0.753, 0.7523, 0.7516, 0.7509, 0.7502, 0.7496, 0.7489, 0.7482, 0.7476,
+            0.7469, 0.7462, 0.7455, 0.7449, 0.7442, 0.7435, 0.7429, 0.7422, 0.7415, 0.7409, 0.7402,
+            0.7395, 0.7389, 0.7382, 0.7376, 0.7369, 0.7362, 0.7356, 0.7349, 0.7343, 0.7336, 0.733,
+            0.7323, 0.7316, 0.731, 0.7303, 0.7297, 0.729, 0.7284, 0.7277, 0.7271, 0.7264, 0.7258,
+            0.7251, 0.7245, 0.7238, 0.7232, 0.7225, 0.7219, 0.7213, 0.7206, 0.72, 0.7193, 0.7187,
+            0.718, 0.7174, 0.7168, 0.7161, 0.7155, 0.7148, 0.7142, 0.7136, 0.7129, 0.7123, 0.7117,
+            0.711, 0.7104, 0.7098, 0.7091, 0.7085, 0.7079, 0.7072, 0.7066, 0.706, 0.7053, 0.7047,
+            0.7041, 0.7035, 0.7028, 0.7022, 0.7016, 0.701, 0.7003, 0.6997, 0.6991, 0.6985, 0.6978,
+            0.6972, 0.6966, 0.696, 0.6954, 0.6947, 0.6941, 0.6935, 0.6929, 0.6923, 0.6916, 0.691,
+            0.6904, 0.6898, 0.6892, 0.6886, 0.688, 0.6873, 0.6867, 0.6861, 0.6855, 0.6849, 0.6843,
+            0.6837, 0.6831, 0.6825, 0.6818, 0.6812, 0.6806, 0.68, 0.6794, 0.6788, 0.6782, 0.6776,
+            0.677, 0.6764, 0.6758, 0.6752, 0.6746, 0.674, 0.6734, 0.6728, 0.6722, 0.6716, 0.671,
+            0.6704, 0.6698, 0.6692, 0.6686, 0.668, 0.6674, 0.6668, 0.6662, 0.6656, 0.665, 0.6644,
+            0.6638, 0.6632, 0.6626, 0.662, 0.6614, 0.6608, 0.6603, 0.6597, 0.6591, 0.6585, 0.6579,
+            0.6573, 0.6567, 0.6561, 0.6555, 0.6549, 0.6544, 0.6538, 0.6532, 0.6526, 0.652, 0.6514,
+            0.6508, 0.6503, 0.6497, 0.6491, 0.6485, 0.6479, 0.6473, 0.6468, 0.6462, 0.6456, 0.645,
+            0.6444, 0.6439, 0.6433, 0.6427, 0.6421, 0.6415, 0.641, 0.6404, 0.6398, 0.6392, 0.6387,
+            0.6381, 0.6375, 0.6369, 0.6364, 0.6358, 0.6352, 0.6346, 0.6341, 0.6335, 0.6329, 0.6323,
+            0.6318, 0.6312, 0.6306, 0.6301, 0.6295, 0.6289, 0.6283, 0.6278, 0.6272, 0.6266, 0.6261,
+            0.6255, 0.6249, 0.6244, 0.6238, 0.6232, 0.6227, 0.6221, 0.6215, 0.621, 0.6204, 0.6198,
+            0.6193, 0.6187, 0.6182, 0.6176, 0.617, 0.6165, 0.6159, 0.6153, 0.6148, 0.6142, 0.6137,
+            0.6131, 0.6125, 0.612, 0.6114, 0.6109, 0.6103, 0.6098, 0.6092, 0.6086, 0.6081, 0.6075,
+            0.607, 0.6064, 0.6059, 0.6053, 0.6048, 0.6042, 0.6036, 0.6031, 0.6025, 0.602, 0.6014,
+            0.6009, 0.6003, 0.5998, 0.5992, 0.5987, 0.5981, 0.5976, 0.597, 0.5965, 0.5959, 0.5954,
+            0.5948, 0.5943, 0.5937, 0.5932, 0.5926, 0.5921, 0.5915, 0.591, 0.5904, 0.5899, 0.5894,
+            0.5888, 0.5883, 0.5877, 0.5872, 0.5866, 0.5861, 0.5855, 0.585, 0.5845, 0.5839, 0.5834,
+            0.5828, 0.5823, 0.5817, 0.5812, 0.5807, 0.5801, 0.5796, 0.579, 0.5785, 0.578, 0.5774,
+            0.5769, 0.5764, 0.5758, 0.5753, 0.5747, 0.5742, 0.5737, 0.5731, 0.5726, 0.5721, 0.5715,
+            0.571, 0.5704, 0.5699, 0.5694, 0.5688, 0.5683, 0.5678, 0.5672, 0.5667, 0.5662, 0.5656,
+            0.5651, 0.5646, 0.564, 0.5635, 0.563, 0.5625, 0.5619, 0.5614, 0.5609, 0.5603, 0.5598,
+            0.5593, 0.5587, 0.5582, 0.5577, 0.5572, 0.5566, 0.5561, 0.5556, 0.5551, 0.5545, 0.554,
+            0.5535, 0.5529, 0.5524, 0.5519, 0.5514, 0.5508, 0.5503, 0.5498, 0.5493, 0.5487, 0.5482,
+            0.5477, 0.5472, 0.5467, 0.5461, 0.5456, 0.5451, 0.5446, 0.544, 0.5435, 0.543, 0.5425,
+            0.542, 0.5414, 0.5409, 0.5404, 0.5399, 0.5394, 0.5388, 0.5383, 0.5378, 0.5373, 0.5368,
+            0.5362, 0.5357, 0.5352, 0.5347, 0.5342, 0.5337, 0.5331, 0.5326, 0.5321, 0.5316, 0.5311,
+            0.5306, 0.5301, 0.5295, 0.529, 0.5285, 0.528, 0.5275, 0.527, 0.5265, 0.5259, 0.5254,
+            0.5249, 0.5244, 0.5239, 0.5234, 0.5229, 0.5224, 0.5218, 0.5213, 0.5208, 0.5203, 0.5198,
+            0.5193, 0.5188, 0.5183, 0.5178, 0.5173, 0.5167, 0.5162, 0.5157, 0.5152, 0.5147, 0.5142,
+            0.5137, 0.5132, 0.5127, 0.5122, 0.5117, 0.5112, 0.5107, 0.5102, 0.5096, 0.5091, 0.5086,
+            0.5081, 0.5076, 0.5071, 0.5066, 0.5061, 0.5056, 0.5051, 0.5046, 0.5041, 0.5036, 0.5031,
+            0.5026, 0.5021, 0.5016, 0.5011, 0.5006, 0.5001, 0.4996, 0.4991, 0.4986, 0.4981, 0.4976,
+            0.4971, 0.4966, 0.4961, 0.4956, 0.4951, 0.4946, 0.4941, 0.4936, 0.4931, 0.4926, 0.4921,
+            0.4916, 0.4911, 0.4906, 0.4901, 0.4896, 0.4891, 0.4886, 0.4881, 0.4876, 0.4871, 0.4866,
+            0.4861, 0.4856, 0.4851, 0.4846, 0.4841, 0.4837, 0.4832, 0.4827, 0.4822, 0.4817, 0.4812,
+            0.4807, 0.4802, 0.4797, 0.4792, 0.4787, 0.4782, 0.4777, 0.4772, 0.4768, 0.4763, 0.4758,
+            0.4753, 0.4748, 0.4743, 0.4738, 0.4733, 0.4728, 0.4723, 0.4718, 0.4714, 0.4709, 0.4704,
+            0.4699, 0.4694, 0.4689, 0.4684, 0.4679, 0.4674, 0.467, 0.4665, 0.466, 0.4655, 0.465,
+            0.4645, 0.464, 0.4635, 0.4631, 0.4626, 0.4621, 0.4616, 0.4611, 0.4606, 0.4601, 0.4597,
+            0.4592, 0.4587, 0.4582, 0.4577, 0.4572, 0.4568, 0.4563, 0.4558, 0.4553, 0.4548, 0.4543,
+            0.4539, 0.4534, 0.4529, 0.4524, 0.4519, 0.4514, 0.451, 0.4505, 0.45,
+        },
+    },
+    ['7.62x51'] = {
+        effectiveRange = 500,
+        maxRange = 1000,
+        minDamage = 0.5,
+        samples = {
+            1.0, 0.9921, 0.988, 0.9847, 0.9818, 0.9792, 0.9768, 0.9745, 0.9724, 0.9704, 0.9685,
+            0.9666, 0.9648, 0.9631, 0.9614, 0.9598, 0.9582, 0.9566, 0.9551, 0.9536, 0.9522, 0.9508,
+            0.9494, 0.948, 0.9467, 0.9453, 0.944, 0.9427, 0.9415, 0.9402, 0.939, 0.9378, 0.9366,
+            0.9354, 0.9343, 0.9331, 0.932, 0.9308, 0.9297, 0.9286, 0.9275, 0.9264, 0.9254, 0.9243,
+            0.9233, 0.9222, 0.9212, 0.9202, 0.9191, 0.9181, 0.9171, 0.9161, 0.9152, 0.9142, 0.9132,
+            0.9123, 0.9113, 0.9104, 0.9094, 0.9085, 0.9076, 0.9066, 0.9057, 0.9048, 0.9039, 0.903,
+            0.9021, 0.9012, 0.9004, 0.8995, 0.8986, 0.8977, 0.8969, 0.896, 0.8952, 0.8943, 0.8935,
+            0.8926, 0.8918, 0.891, 0.8901, 0.8893, 0.8885, 0.8877, 0.8869, 0.8861, 0.8853, 0.8845,
+            0.8837, 0.8829, 0.8821, 0.8813, 0.8805, 0.8798, 0.879, 0.8782, 0.8774, 0.8767, 0.8759,
+            0.8752, 0.8744, 0.8737, 0.8729, 0.8722, 0.8714, 0.8707, 0.8699, 0.8692, 0.8685, 0.8677,
+            0.867, 0.8663, 0.8656, 0.8648, 0.8641, 0.8634, 0.8627, 0.862, 0.8613, 0.8606, 0.8599,
+            0.8592, 0.8585, 0.8578, 0.8571, 0.8564, 0.8557, 0.855, 0.8544, 0.8537, 0.853, 0.8523,
+            0.8516, 0.851, 0.8503, 0.8496, 0.849, 0.8483, 0.8476, 0.847, 0.8463, 0.8457, 0.845,
+            0.8443, 0.8437, 0.843, 0.8424, 0.8417, 0.8411, 0.8405, 0.8398, 0.8392, 0.8385, 0.8379,
+            0.8373, 0.8366, 0.836, 0.8354, 0.8347, 0.8341, 0.8335, 0.8329, 0.8322, 0.8316, 0.831,
+            0.8304, 0.8298, 0.8292, 0.8285, 0.8279, 0.8273, 0.8267, 0.8261, 0.8255, 0.8249, 0.8243,
+            0.8237, 0.8231, 0.8225, 0.8219, 0.8213, 0.8207, 0.8201, 0.8195, 0.8189, 0.8183, 0.8177,
+            0.8172, 0.8166, 0.816, 0.8154, 0.8148, 0.8142, 0.8137, 0.8131, 0.8125, 0.8119, 0.8114,
+            0.8108, 0.8102, 0.8096, 0.8091, 0.8085, 0.8079, 0.8074, 0.8068, 0.8062, 0.8057, 0.8051,
+            0.8045, 0.804, 0.8034, 0.8029, 0.8023, 0.8017, 0.8012, 0.8006, 0.8001, 0.7995, 0.799,
+            0.7984, 0.7979, 0.7973, 0.7968, 0.7962, 0.7957, 0.7952, 0.7946, 0.7941, 0.7935, 0.793,
+            0.7924, 0.7919, 0.7914, 0.7908, 0.7903, 0.7898, 0.7892, 0.7887, 0.7882, 0.7876, 0.7871,
+            0.7866, 0.786, 0.7855, 0.785, 0.7845, 0.7839, 0.7834, 0.7829, 0.7824, 0.7818, 0.7813,
+            0.7808, 0.7803, 0.7798, 0.7792, 0.7787, 0.7782, 0.7777, 0.7772, 0.7767, 0.7762, 0.7756,
+            0.7751, 0.7746, 0.7741, 0.7736, 0.7731, 0.7726, 0.7721, 0.7716, 0.7711, 0.7706, 0.7701,
+            0.7696, 0.7691, 0.7685, 0.768, 0.7675, 0.767, 0.7666, 0.7661, 0.7656, 0.7651, 0.7646,
+            0.7641, 0.7636, 0.7631, 0.7626, 0.7621, 0.7616, 0.7611, 0.7606, 0.7601, 0.7596, 0.7592,
+            0.7587, 0.7582, 0.7577, 0.7572, 0.7567, 0.7562, 0.7557, 0.7553, 0.7548, 0.7543, 0.7538,
+            0.7533, 0.7529, 0.7524, 0.7519, 0.7514, 0.7509, 0.7505, 0.75, 0.7495, 0.749, 0.7486,
+            0.7481, 0.7476, 0.7471, 0.7467, 0.7462, 0.7457, 0.7453, 0.7448, 0.7443, 0.7439, 0.7434,
+            0.7429, 0.7424, 0.742, 0.7415, 0.741, 0.7406, 0.7401, 0.7397, 0.7392, 0.7387, 0.7383,
+            0.7378, 0.7373, 0.7369, 0.7364, 0.736, 0.7355, 0.735, 0.7346, 0.7341, 0.7337, 0.7332,
+            0.7328, 0.7323, 0.7319, 0.7314, 0.7309, 0.7305, 0.73, 0.7296, 0.7291, 0.7287, 0.7282,
+            0.7278, 0.7273, 0.7269, 0.7264, 0.726, 0.7255, 0.7251, 0.7246, 0.7242, 0.7238, 0.7233,
+            0.7229, 0.7224, 0.722, 0.7215, 0.7211, 0.7206, 0.7202, 0.7198, 0.7193, 0.7189, 0.7184,
+            0.718, 0.7176, 0.7171, 0.7167, 0.7162, 0.7158, 0.7154, 0.7149, 0.7145, 0.7141, 0.7136,
+            0.7132, 0.7128, 0.7123, 0.7119, 0.7115, 0.711, 0.7106, 0.7102, 0.7097, 0.7093, 0.7089,
+            0.7084, 0.708, 0.7076, 0.7072, 0.7067, 0.7063, 0.7059, 0.7054, 0.705, 0.7046, 0.7042,
+            0.7037, 0.7033, 0.7029, 0.7025, 0.702, 0.7016, 0.7012, 0.7008, 0.7003, 0.6999, 0.6995,
+            0.6991, 0.6987, 0.6982, 0.6978, 0.6974, 0.697, 0.6966, 0.6961, 0.6957, 0.6953, 0.6949,
+            0.6945, 0.6941, 0.6936, 0.6932, 0.6928, 0.6924, 0.692, 0.6916, 0.6912, 0.6907, 0.6903,
+            0.6899, 0.6895, 0.6891, 0.6887, 0.6883, 0.6879, 0.6874, 0.687, 0.6866, 0.6862, 0.6858,
+            0.6854, 0.685, 0.6846, 0.6842, 0.6838, 0.6834, 0.683, 0.6826, 0.6821, 0.6817, 0.6813,
+            0.6809, 0.6805, 0.6801, 0.6797, 0.6793, 0.6789, 0.6785, 0.6781, 0.6777, 0.6773, 0.6769,
+            0.6765, 0.6761, 0.6757, 0.6753, 0.6749, 0.6745, 0.6741, 0.6737, 0.6733, 0.6729, 0.6725,
+            0.6721, 0.6717, 0.6713, 0.6709, 0.6705, 0.6701, 0.6697, 0.6693, 0.6689, 0.6685, 0.6681,
+            0.6678, 0.6674, 0.667, 0.6666, 0.6662, 0.6658, 0.6654, 0.665, 0.6646, 0.6642, 0.6638,
+            0.6634, 0.663, 0.6627, 0.6623, 0.6619, 0.6615, 0.6611, 0.6607, 0.6603, 0.6599, 0.6595,
+            0.6592, 0.6588, 0.6584, 0.658, 0.6576, 0.6572, 0.6568, 0.6565, 0.6561, 0.6557, 0.6553,
+            0.6549, 0.6545, 0.6541, 0.6538, 0.6534, 0.653, 0.6526, 0.6522, 0.6519, 0.6515, 0.6511,
+            0.6507, 0.6503, 0.6499, 0.6496, 0.6492, 0.6488, 0.6484, 0.648, 0.6477, 0.6473, 0.6469,
+            0.6465, 0.6462, 0.6458, 0.6454, 0.645, 0.6446, 0.6443, 0.6439, 0.6435, 0.6431, 0.6428,
+            0.6424, 0.642, 0.6416, 0.6413, 0.6409, 0.6405, 0.6401, 0.6398, 0.6394, 0.639, 0.6387,
+            0.6383, 0.6379, 0.6375, 0.6372, 0.6368, 0.6364, 0.6361, 0.6357, 0.6353, 0.6349, 0.6346,
+            0.6342, 0.6338, 0.6335, 0.6331, 0.6327, 0.6324, 0.632, 0.6316, 0.6313, 0.6309, 0.6305,
+            0.6302, 0.6298, 0.6294, 0.6291, 0.6287, 0.6283, 0.628, 0.6276, 0.6272, 0.6269, 0.6265,
+            0.6261, 0.6258, 0.6254, 0.625, 0.6247, 0.6243, 0.624, 0.6236, 0.6232, 0.6229, 0.6225,
+            0.6221, 0.6218, 0.6214, 0.6211, 0.6207, 0.6203, 0.62, 0.6196, 0.6193, 0.6189, 0.6185,
+            0.6182, 0.6178, 0.6175, 0.6171, 0.6167, 0.6164, 0.616, 0.6157, 0.6153, 0.615, 0.6146,
+            0.6142, 0.6139, 0.6135, 0.6132, 0.6128, 0.6125, 0.6121, 0.6117, 0.6114, 0.611, 0.6107,
+            0.6103, 0.61, 0.6096, 0.6093, 0.6089, 0.6086, 0.6082, 0.6079, 0.6075, 0.6072, 0.6068,
+            0.6064, 0.6061, 0.6057, 0.6054, 0.605, 0.6047, 0.6043, 0.604, 0.6036, 0.6033, 0.6029,
+            0.6026, 0.6022, 0.6019, 0.6015, 0.6012, 0.6008, 0.6005, 0.6001, 0.5998, 0.5994, 0.5991,
+            0.5988, 0.5984, 0.5981, 0.5977, 0.5974, 0.597, 0.5967, 0.5963, 0.596, 0.5956, 0.5953,
+            0.5949, 0.5946, 0.5943, 0.5939, 0.5936, 0.5932, 0.5929, 0.5925, 0.5922, 0.5918, 0.5915,
+            0.5912, 0.5908, 0.5905, 0.5901, 0.5898, 0.5894, 0.5891, 0.5888, 0.5884, 0.5881, 0.5877,
+            0.5874, 0.5871, 0.5867, 0.5864, 0.586, 0.5857, 0.5854, 0.585, 0.5847, 0.5843, 0.584,
+            0.5837, 0.5833, 0.583, 0.5826, 0.5823, 0.582, 0.5816, 0.5813, 0.581, 0.5806, 0.5803,
+            0.5799, 0.5796, 0.5793, 0.5789, 0.5786, 0.5783, 0.5779, 0.5776, 0.5773, 0.5769, 0.5766,
+            0.5762, 0.5759, 0.5756, 0.5752, 0.5749, 0.5746, 0.5742, 0.5739, 0.5736, 0.5732, 0.5729,
+            0.5726, 0.5722, 0.5719, 0.5716, 0.5712, 0.5709, 0.5706, 0.5702, 0.5699, 0.5696, 0.5692,
+            0.5689, 0.5686, 0.5683, 0.5679, 0.5676, 0.5673, 0.5669, 0.5666, 0.5663, 0.5659, 0.5656,
+            0.5653, 0.565, 0.5646, 0.5643, 0.564, 0.5636, 0.5633, 0.563, 0.5627, 0.5623, 0.562,
+            0.5617, 0.5613, 0.561, 0.5607, 0.5604, 0.56, 0.5597, 0.5594, 0.5591, 0.5587, 0.5584,
+            0.5581, 0.5578, 0.5574, 0.5571, 0.5568, 0.5565, 0.5561, 0.5558, 0.5555, 0.5552, 0.5548,
+            0.5545, 0.5542, 0.5539, 0.5535, 0.5532, 0.5529, 0.5526, 0.5522, 0.5519, 0.5516, 0.5513,
+            0.551, 0.5506, 0.5503, 0.55, 0.5497, 0.5493, 0.549, 0.5487, 0.5484, 0.5481, 0.5477,
+            0.5474, 0.5471, 0.5468, 0.5465, 0.5461, 0.5458, 0.5455, 0.5452, 0.5449, 0.5445, 0.5442,
+            0.5439, 0.5436, 0.5433, 0.5429, 0.5426, 0.5423, 0.542, 0.5417, 0.5414, 0.541, 0.5407,
+            0.5404, 0.5401, 0.5398, 0.5394, 0.5391, 0.5388, 0.5385, 0.5382, 0.5379, 0.5375, 0.5372,
+            0.5369, 0.5366, 0.5363, 0.536, 0.5357, 0.5353, 0.535, 0.5347, 0.5344, 0.5341, 0.5338,
+            0.5335, 0.5331, 0.5328, 0.5325, 0.5322, 0.5319, 0.5316, 0.5313, 0.5309, 0.5306, 0.5303,
+            0.53, 0.5297, 0.5294, 0.5291, 0.5288, 0.5284, 0.5281, 0.5278, 0.5275, 0.5272, 0.5269,
+            0.5266, 0.5263, 0.526, 0.5256, 0.5253, 0.525, 0.5247, 0.5244, 0.5241, 0.5238, 0.5235,
+            0.5232, 0.5228, 0.5225, 0.5222, 0.5219, 0.5216, 0.5213, 0.521, 0.5207, 0.5204, 0.5201,
+            0.5198, 0.5195, 0.5191, 0.5188, 0.5185, 0.5182, 0.5179, 0.5176, 0.5173, 0.517, 0.5167,
+            0.5164, 0.5161, 0.5158, 0.5155, 0.5152, 0.5148, 0.5145, 0.5142, 0.5139, 0.5136, 0.5133,
+            0.513, 0.5127, 0.5124, 0.5121, 0.5118, 0.5115, 0.5112, 0.5109, 0.5106, 0.5103, 0.51,
+            0.5097, 0.5094, 0.5091, 0.5088, 0.5084, 0.5081, 0.5078, 0.5075, 0.5072, 0.5069, 0.5066,
+            0.5063, 0.506, 0.5057, 0.5054, 0.5051, 0.5048, 0.5045, 0.5042, 0.5039, 0.5036, 0.5033,
+            0.503, 0.5027, 0.5024, 0.5021, 0.5018, 0.5015, 0.5012, 0.5009, 0.5006, 0.5003, 0.5,
+        },
+    },
+    ['.300wm'] = {
+        effectiveRange = 800,
+        maxRange = 1500,
+        minDamage = 0.55,
+        samples = {
+            1.0, 0.988, 0.983, 0.9792, 0.9759, 0.9731, 0.9705, 0.9682, 0.966, 0.9639, 0.962, 0.9601,
+            0.9583, 0.9566, 0.955, 0.9534, 0.9519, 0.9504, 0.949, 0.9476, 0.9462, 0.9449, 0.9436,
+            0.9423, 0.9411, 0.9399, 0.9387, 0.9375, 0.9364, 0.9352, 0.9341, 0.933, 0.932, 0.9309,
+            0.9299, 0.9288, 0.9278, 0.9268, 0.9259, 0.9249, 0.9239, 0.923, 0.9221, 0.9211, 0.9202,
+            0.9193, 0.9184, 0.9175, 0.9167, 0.9158, 0.915, 0.9141, 0.9133, 0.9124, 0.9116, 0.9108,
+            0.91, 0.9092, 0.9084, 0.9076, 0.9068, 0.9061, 0.9053, 0.9045, 0.9038, 0.903, 0.9023,
+            0.9016, 0.9008, 0.9001, 0.8994, 0.8987, 0.8979, 0.8972, 0.8965, 0.8958, 0.8952, 0.8945,
+            0.8938, 0.8931, 0.8924, 0.8918, 0.8911, 0.8904, 0.8898, 0.8891, 0.8885, 0.8878, 0.8872,
+            0.8865, 0.8859, 0.8853, 0.8846, 0.884, 0.8834, 0.8828, 0.8822, 0.8816, 0.8809, 0.8803,
+            0.8797, 0.8791, 0.8785, 0.8779, 0.8774, 0.8768, 0.8762, 0.8756, 0.875, 0.8744, 0.8739,
+            0.8733, 0.8727, 0.8722, 0.8716, 0.871, 0.8705, 0.8699, 0.8694, 0.8688, 0.8683, 0.8677,
+            0.8672, 0.8666, 0.8661, 0.8655, 0.865, 0.8645, 0.8639, 0.8634, 0.8629, 0.8623, 0.8618,
+            0.8613, 0.8608, 0.8603, 0.8597, 0.8592, 0.8587, 0.8582, 0.8577, 0.8572, 0.8567, 0.8562,
+            0.8557, 0.8552, 0.8547, 0.8542, 0.8537, 0.8532, 0.8527, 0.8522, 0.8517, 0.8512, 0.8508,
+            0.8503, 0.8498, 0.8493, 0.8488, 0.8483, 0.8479, 0.8474, 0.8469, 0.8465, 0.846, 0.8455,
+            0.845, 0.8446, 0.8441, 0.8437, 0.8432, 0.8427, 0.8423, 0.8418, 0.8414, 0.8409, 0.8404,
+            0.84, 0.8395, 0.8391, 0.8386, 0.8382, 0.8378, 0.8373, 0.8369, 0.8364, 0.836, 0.8355,
+            0.8351, 0.8347, 0.8342, 0.8338, 0.8334, 0.8329, 0.8325, 0.8321, 0.8316, 0.8312, 0.8308,
+            0.8303, 0.8299, 0.8295, 0.8291, 0.8286, 0.8282, 0.8278, 0.8274, 0.827, 0.8265, 0.8261,
+            0.8257, 0.8253, 0.8249, 0.8245, 0.8241, 0.8237, 0.8232, 0.8228, 0.8224, 0.822, 0.8216,
+            0.8212, 0.8208, 0.8204, 0.82, 0.8196, 0.8192, 0.8188, 0.8184, 0.818, 0.8176, 0.8172,
+            0.8168, 0.8164, 0.816, 0.8156, 0.8152, 0.8149, 0.8145, 0.8141, 0.8137, 0.8133, 0.8129,
+            0.8125, 0.8121, 0.8118, 0.8114, 0.811, 0.8106, 0.8102, 0.8098, 0.8095, 0.8091, 0.8087,
+            0.8083, 0.8079, 0.8076, 0.8072, 0.8068, 0.8064, 0.8061, 0.8057, 0.8053, 0.805, 0.8046,
+            0.8042, 0.8038, 0.8035, 0.8031, 0.8027, 0.8024, 0.802, 0.8016, 0.8013, 0.8009, 0.8006,
+            0.8002, 0.7998, 0.7995, 0.7991, 0.7988, 0.7984, 0.798, 0.7977, 0.7973, 0.797, 0.7966,
+            0.7963, 0.7959, 0.7955, 0.7952, 0.7948, 0.7945, 0.7941, 0.7938, 0.7934, 0.7931, 0.7927,
+            0.7924, 0.792, 0.7917, 0.7913, 0.791, 0.7907, 0.7903, 0.79, 0.7896, 0.7893, 0.7889,
+            0.7886, 0.7882, 0.7879, 0.7876, 0.7872, 0.7869, 0.7865, 0.7862, 0.7859, 0.7855, 0.7852,
+            0.7849, 0.7845, 0.7842, 0.7839, 0.7835, 0.7832, 0.7829, 0.7825, 0.7822, 0.7819, 0.7815,
+            0.7812, 0.7809, 0.7805, 0.7802, 0.7799, 0.7795, 0.7792, 0.7789, 0.7786, 0.7782, 0.7779,
+            0.7776, 0.7773, 0.7769, 0.7766, 0.7763, 0.776, 0.7756, 0.7753, 0.775, 0.7747, 0.7744,
+            0.774, 0.7737, 0.7734, 0.7731, 0.7728, 0.7724, 0.7721, 0.7718, 0.7715, 0.7712, 0.7709,
+            0.7705, 0.7702, 0.7699, 0.7696, 0.7693, 0.769, 0.7687, 0.7683, 0.768, 0.7677, 0.7674,
+            0.7671, 0.7668, 0.7665, 0.7662, 0.7659, 0.7656, 0.7652, 0.7649, 0.7646, 0.7643, 0.764,
+            0.7637, 0.7634, 0.7631, 0.7628, 0.7625, 0.7622, 0.7619, 0.7616, 0.7613, 0.761, 0.7607,
+            0.7604, 0.7601, 0.7598, 0.7595, 0.7592, 0.7589, 0.7586, 0.7583, 0.758, 0.7577, 0.7574,
+            0.7571, 0.7568, 0.7565, 0.7562, 0.7559, 0.7556, 0.7553, 0.755, 0.7547, 0.7544, 0.7541,
+            0.7538, 0.7535, 0.7532, 0.7529, 0.7526, 0.7524, 0.7521, 0.7518, 0.7515, 0.7512, 0.7509,
+            0.7506, 0.7503, 0.75, 0.7497, 0.7495, 0.7492, 0.7489, 0.7486, 0.7483, 0.748, 0.7477,
+            0.7474, 0.7472, 0.7469, 0.7466, 0.7463, 0.746, 0.7457, 0.7454, 0.7452, 0.7449, 0.7446,
+            0.7443, 0.744, 0.7437, 0.7435, 0.7432, 0.7429, 0.7426, 0.7423, 0.7421, 0.7418, 0.7415,
+            0.7412, 0.7409, 0.7407, 0.7404, 0.7401, 0.7398, 0.7395, 0.7393, 0.739, 0.7387, 0.7384,
+            0.7382, 0.7379, 0.7376, 0.7373, 0.7371, 0.7368, 0.7365, 0.7362, 0.736, 0.7357, 0.7354,
+            0.7351, 0.7349, 0.7346, 0.7343, 0.734, 0.7338, 0.7335, 0.7332, 0.733, 0.7327, 0.7324,
+            0.7322, 0.7319, 0.7316, 0.7313, 0.7311, 0.7308, 0.7305, 0.7303, 0.73, 0.7297, 0.7295,
+            0.7292, 0.7289, 0.7287, 0.7284, 0.7281, 0.7279, 0.7276, 0.7273, 0.7271, 0.7268, 0.7265,
+            0.7263, 0.726, 0.7257, 0.7255, 0.7252, 0.725, 0.7247, 0.7244, 0.7242, 0.7239, 0.7236,
+            0.7234, 0.7231, 0.7229, 0.7226, 0.7223, 0.7221, 0.7218, 0.7216, 0.7213, 0.721, 0.7208,
+            0.7205, 0.7203, 0.72, 0.7197, 0.7195, 0.7192, 0.719, 0.7187, 0.7185, 0.7182, 0.7179,
+            0.7177, 0.7174, 0.7172, 0.7169, 0.7167, 0.7164, 0.7162, 0.7159, 0.7156, 0.7154, 0.7151,
+            0.7149, 0.7146, 0.7144, 0.7141, 0.7139, 0.7136, 0.7134, 0.7131, 0.7129, 0.7126, 0.7124,
+            0.7121, 0.7119, 0.7116, 0.7114, 0.7111, 0.7109, 0.7106, 0.7104, 0.7101, 0.7099, 0.7096,
+            0.7094, 0.7091, 0.7089, 0.7086, 0.7084, 0.7081, 0.7079, 0.7076, 0.7074, 0.7071, 0.7069,
+            0.7066, 0.7064, 0.7061, 0.7059, 0.7057, 0.7054, 0.7052, 0.7049, 0.7047, 0.7044, 0.7042,
+            0.7039, 0.7037, 0.7034, 0.7032, 0.703, 0.7027, 0.7025, 0.7022, 0.702, 0.7017, 0.7015,
+            0.7013, 0.701, 0.7008, 0.7005, 0.7003, 0.7001, 0.6998, 0.6996, 0.6993, 0.6991, 0.6989,
+            0.6986, 0.6984, 0.6981, 0.6979, 0.6977, 0.6974, 0.6972, 0.6969, 0.6967, 0.6965, 0.6962,
+            0.696, 0.6957, 0.6955, 0.6953, 0.695, 0.6948, 0.6946, 0.6943, 0.6941, 0.6938, 0.6936,
+            0.6934, 0.6931, 0.6929, 0.6927, 0.6924, 0.6922, 0.692, 0.6917, 0.6915, 0.6913, 0.691,
+            0.6908, 0.6906, 0.6903, 0.6901, 0.6899, 0.6896, 0.6894, 0.6892, 0.6889, 0.6887, 0.6885,
+            0.6882, 0.688, 0.6878, 0.6875, 0.6873, 0.6871, 0.6868, 0.6866, 0.6864, 0.6862, 0.6859,
+            0.6857, 0.6855, 0.6852, 0.685, 0.6848, 0.6845, 0.6843, 0.6841, 0.6839, 0.6836, 0.6834,
+            0.6832, 0.6829, 0.6827, 0.6825, 0.6823, 0.682, 0.6818, 0.6816, 0.6813, 0.6811, 0.6809,
+            0.6807, 0.6804, 0.6802, 0.68, 0.6798, 0.6795, 0.6793, 0.6791, 0.6789, 0.6786, 0.6784,
+            0.6782, 0.678, 0.6777, 0.6775, 0.6773, 0.6771, 0.6768, 0.6766, 0.6764, 0.6762, 0.6759,
+            0.6757, 0.6755, 0.6753, 0.6751, 0.6748, 0.6746, 0.6744, 0.6742, 0.6739, 0.6737, 0.6735,
+            0.6733, 0.6731, 0.6728, 0.6726, 0.6724, 0.6722, 0.672, 0.6717, 0.6715, 0.6713, 0.6711,
+            0.6709, 0.6706, 0.6704, 0.6702, 0.67, 0.6698, 0.6695, 0.6693, 0.6691, 0.6689, 0.6687,
+            0.6684, 0.6682, 0.668, 0.6678, 0.6676, 0.6674, 0.6671, 0.6669, 0.6667, 0.6665, 0.6663,
+            0.6661, 0.6658, 0.6656, 0.6654, 0.6652, 0.665, 0.6648, 0.6645, 0.6643, 0.6641, 0.6639,
+            0.6637, 0.6635, 0.6633, 0.663, 0.6628, 0.6626, 0.6624, 0.6622, 0.662, 0.6618, 0.6615,
+            0.6613, 0.6611, 0.6609, 0.6607, 0.6605, 0.6603, 0.66, 0.6598, 0.6596, 0.6594, 0.6592,
+            0.659, 0.6588, 0.6586, 0.6583, 0.6581, 0.6579, 0.6577, 0.6575, 0.6573, 0.6571, 0.6569,
+            0.6567, 0.6564, 0.6562, 0.656, 0.6558, 0.6556, 0.6554, 0.6552, 0.655, 0.6548, 0.6546,
+            0.6543, 0.6541, 0.6539, 0.6537, 0.6535, 0.6533, 0.6531, 0.6529, 0.6527, 0.6525, 0.6523,
+            0.6521, 0.6518, 0.6516, 0.6514, 0.6512, 0.651, 0.6508, 0.6506, 0.6504, 0.6502, 0.65,
+            0.6498, 0.6496, 0.6494, 0.6492, 0.649, 0.6487, 0.6485, 0.6483, 0.6481, 0.6479, 0.6477,
+            0.6475, 0.6473, 0.6471, 0.6469, 0.6467, 0.6465, 0.6463, 0.6461, 0.6459, 0.6457, 0.6455,
+            0.6453, 0.6451, 0.6449, 0.6447, 0.6444, 0.6442, 0.644, 0.6438, 0.6436, 0.6434, 0.6432,
+            0.643, 0.6428, 0.6426, 0.6424, 0.6422, 0.642, 0.6418, 0.6416, 0.6414, 0.6412, 0.641,
+            0.6408, 0.6406, 0.6404, 0.6402, 0.64, 0.6398, 0.6396, 0.6394, 0.6392, 0.639, 0.6388,
+            0.6386, 0.6384, 0.6382, 0.638, 0.6378, 0.6376, 0.6374, 0.6372, 0.637, 0.6368, 0.6366,
+            0.6364, 0.6362, 0.636, 0.6358, 0.6356, 0.6354, 0.6352, 0.635, 0.6348, 0.6346, 0.6344,
+            0.6342, 0.634, 0.6338, 0.6336, 0.6334, 0.6332, 0.633, 0.6328, 0.6326, 0.6324, 0.6322,
+            0.6321, 0.6319, 0.6317, 0.6315, 0.6313, 0.6311, 0.6309, 0.6307, 0.6305, 0.6303, 0.6301,
+            0.6299, 0.6297, 0.6295, 0.6293, 0.6291, 0.6289, 0.6287, 0.6285, 0.6283, 0.6281, 0.6279,
+            0.6278, 0.6276, 0.6274, 0.6272, 0.627, 0.6268, 0.6266, 0.6264, 0.6262, 0.626, 0.6258,
+            0.6256, 0.6254, 0.6252, 0.625, 0.6249, 0.6247, 0.6245, 0.6243, 0.6241, 0.6239, 0.6237,
+            0.6235, 0.6233, 0.6231, 0.6229, 0.6227, 0.6225, 0.6224, 0.6222, 0.622, 0.6218, 0.6216,
+            0.6214, 0.6212, 0.621, 0.6208, 0.6206, 0.6204, 0.6203, 0.6201, 0.6199, 0.6197, 0.6195,
+            0.6193, 0.6191, 0.6189, 0.6187, 0.6185, 0.6184, 0.6182, 0.618, 0.6178, 0.6176, 0.6174,
+            0.6172, 0.617, 0.6168, 0.6167, 0.6165, 0.6163, 0.6161, 0.6159, 0.6157, 0.6155, 0.6153,
+            0.6151, 0.615, 0.6148, 0.6146, 0.6144, 0.6142, 0.614, 0.6138, 0.6136, 0.6135, 0.6133,
+            0.6131, 0.6129, 0.6127, 0.6125, 0.6123, 0.6121, 0.612, 0.6118, 0.6116, 0.6114, 0.6112,
+            0.611, 0.6108, 0.6107, 0.6105, 0.6103, 0.6101, 0.6099, 0.6097, 0.6095, 0.6094, 0.6092,
+            0.609, 0.6088, 0.6086, 0.6084, 0.6083, 0.6081, 0.6079, 0.6077, 0.6075, 0.6073, 0.6071,
+            0.607, 0.6068, 0.6066, 0.6064, 0.6062, 0.606, 0.6059, 0.6057, 0.6055, 0.6053, 0.6051,
+            0.6049, 0.6048, 0.6046, 0.6044, 0.6042, 0.604, 0.6038, 0.6037, 0.6035, 0.6033, 0.6031,
+            0.6029, 0.6028, 0.6026, 0.6024, 0.6022, 0.602, 0.6018, 0.6017, 0.6015, 0.6013, 0.6011,
+            0.6009, 0.6008, 0.6006, 0.6004, 0.6002, 0.6, 0.5999, 0.5997, 0.5995, 0.5993, 0.5991,
+            0.5989, 0.5988, 0.5986, 0.5984, 0.5982, 0.598, 0.5979, 0.5977, 0.5975, 0.5973, 0.5971,
+            0.597, 0.5968, 0.5966, 0.5964, 0.5963, 0.5961, 0.5959, 0.5957, 0.5955, 0.5954, 0.5952,
+            0.595, 0.5948, 0.5946, 0.5945, 0.5943, 0.5941, 0.5939, 0.5938, 0.5936, 0.5934, 0.5932,
+            0.593, 0.5929, 0.5927, 0.5925, 0.5923, 0.5922, 0.592, 0.5918, 0.5916, 0.5914, 0.5913,
+            0.5911, 0.5909, 0.5907, 0.5906, 0.5904, 0.5902, 0.59, 0.5899, 0.5897, 0.5895, 0.5893,
+            0.5891, 0.589, 0.5888, 0.5886, 0.5884, 0.5883, 0.5881, 0.5879, 0.5877, 0.5876, 0.5874,
+            0.5872, 0.587, 0.5869, 0.5867, 0.5865, 0.5863, 0.5862, 0.586, 0.5858, 0.5856, 0.5855,
+            0.5853, 0.5851, 0.5849, 0.5848, 0.5846, 0.5844, 0.5842, 0.5841, 0.5839, 0.5837, 0.5836,
+            0.5834, 0.5832, 0.583, 0.5829, 0.5827, 0.5825, 0.5823, 0.5822, 0.582, 0.5818, 0.5816,
+            0.5815, 0.5813, 0.5811, 0.581, 0.5808, 0.5806, 0.5804, 0.5803, 0.5801, 0.5799, 0.5798,
+            0.5796, 0.5794, 0.5792, 0.5791, 0.5789, 0.5787, 0.5785, 0.5784, 0.5782, 0.578, 0.5779,
+            0.5777, 0.5775, 0.5773, 0.5772, 0.577, 0.5768, 0.5767, 0.5765, 0.5763, 0.5762, 0.576,
+            0.5758, 0.5756, 0.5755, 0.5753, 0.5751, 0.575, 0.5748, 0.5746, 0.5744, 0.5743, 0.5741,
+            0.5739, 0.5738, 0.5736, 0.5734, 0.5733, 0.5731, 0.5729, 0.5728, 0.5726, 0.5724, 0.5722,
+            0.5721, 0.5719, 0.5717, 0.5716, 0.5714, 0.5712, 0.5711, 0.5709, 0.5707, 0.5706, 0.5704,
+            0.5702, 0.5701, 0.5699, 0.5697, 0.5695, 0.5694, 0.5692, 0.569, 0.5689, 0.5687, 0.5685,
+            0.5684, 0.5682, 0.568, 0.5679, 0.5677, 0.5675, 0.5674, 0.5672, 0.567, 0.5669, 0.5667,
+            0.5665, 0.5664, 0.5662, 0.566, 0.5659, 0.5657, 0.5655, 0.5654, 0.5652, 0.565, 0.5649,
+            0.5647, 0.5645, 0.5644, 0.5642, 0.564, 0.5639, 0.5637, 0.5635, 0.5634, 0.5632, 0.563,
+            0.5629, 0.5627, 0.5626, 0.5624, 0.5622, 0.5621, 0.5619, 0.5617, 0.5616, 0.5614, 0.5612,
+            0.5611, 0.5609, 0.5607, 0.5606, 0.5604, 0.5602, 0.5601, 0.5599, 0.5597, 0.5596, 0.5594,
+            0.5593, 0.5591, 0.5589, 0.5588, 0.5586, 0.5584, 0.5583, 0.5581, 0.5579, 0.5578, 0.5576,
+            0.5575, 0.5573, 0.5571, 0.557, 0.5568, 0.5566, 0.5565, 0.5563, 0.5561, 0.556, 0.5558,
+            0.5557, 0.5555, 0.5553, 0.5552, 0.555, 0.5548, 0.5547, 0.5545, 0.5544, 0.5542, 0.554,
+            0.5539, 0.5537, 0.5535, 0.5534, 0.5532, 0.5531, 0.5529, 0.5527, 0.5526, 0.5524, 0.5523,
+            0.5521, 0.5519, 0.5518, 0.5516, 0.5514, 0.5513, 0.5511, 0.551, 0.5508, 0.5506, 0.5505,
+            0.5503, 0.5502, 0.55,
+        },
+    },
+    ['.50bmg'] = {
+        effectiveRange = 1200,
+        maxRange = 2500,
+        minDamage = 0.6,
+        samples = {
+            1.0, 0.9828, 0.9773, 0.9733, 0.97, 0.9672, 0.9647, 0.9625, 0.9604, 0.9585, 0.9567,
+            0.9551, 0.9535, 0.952, 0.9505, 0.9491, 0.9478, 0.9465, 0.9453, 0.9441, 0.9429, 0.9418,
+            0.9407, 0.9396, 0.9386, 0.9376, 0.9366, 0.9356, 0.9347, 0.9338, 0.9329, 0.932, 0.9311,
+            0.9303, 0.9294, 0.9286, 0.9278, 0.927, 0.9262, 0.9254, 0.9247, 0.9239, 0.9232, 0.9225,
+            0.9218, 0.921, 0.9204, 0.9197, 0.919, 0.9183, 0.9177, 0.917, 0.9163, 0.9157, 0.9151,
+            0.9145, 0.9138, 0.9132, 0.9126, 0.912, 0.9114, 0.9108, 0.9103, 0.9097, 0.9091, 0.9085,
+            0.908, 0.9074, 0.9069, 0.9063, 0.9058, 0.9053, 0.9047, 0.9042, 0.9037, 0.9032, 0.9026,
+            0.9021, 0.9016, 0.9011, 0.9006, 0.9001, 0.8996, 0.8991, 0.8987, 0.8982, 0.8977, 0.8972,
+            0.8968, 0.8963, 0.8958, 0.8954, 0.8949, 0.8944, 0.894, 0.8935, 0.8931, 0.8927, 0.8922,
+            0.8918, 0.8913, 0.8909, 0.8905, 0.89, 0.8896, 0.8892, 0.8888, 0.8884, 0.8879, 0.8875,
+            0.8871, 0.8867, 0.8863, 0.8859, 0.8855, 0.8851, 0.8847, 0.8843, 0.8839, 0.8835, 0.8831,
+            0.8827, 0.8823, 0.882, 0.8816, 0.8812, 0.8808, 0.8804, 0.8801, 0.8797, 0.8793, 0.8789,
+            0.8786, 0.8782, 0.8778, 0.8775, 0.8771, 0.8768, 0.8764, 0.876, 0.8757, 0.8753, 0.875,
+            0.8746, 0.8743, 0.8739, 0.8736, 0.8732, 0.8729, 0.8725, 0.8722, 0.8719, 0.8715, 0.8712,
+            0.8709, 0.8705, 0.8702, 0.8699, 0.8695, 0.8692, 0.8689, 0.8685, 0.8682, 0.8679, 0.8676,
+            0.8672, 0.8669, 0.8666, 0.8663, 0.866, 0.8656, 0.8653, 0.865, 0.8647, 0.8644, 0.8641,
+            0.8638, 0.8635, 0.8632, 0.8628, 0.8625, 0.8622, 0.8619, 0.8616, 0.8613, 0.861, 0.8607,
+            0.8604, 0.8601, 0.8598, 0.8595, 0.8592, 0.8589, 0.8587, 0.8584, 0.8581, 0.8578, 0.8575,
+            0.8572, 0.8569, 0.8566, 0.8563, 0.8561, 0.8558, 0.8555, 0.8552, 0.8549, 0.8546, 0.8544,
+            0.8541, 0.8538, 0.8535, 0.8532, 0.853, 0.8527, 0.8524, 0.8521, 0.8519, 0.8516, 0.8513,
+            0.8511, 0.8508, 0.8505, 0.8502, 0.85, 0.8497, 0.8494, 0.8492, 0.8489, 0.8486, 0.8484,
+            0.8481, 0.8479, 0.8476, 0.8473, 0.8471, 0.8468, 0.8465, 0.8463, 0.846, 0.8458, 0.8455,
+            0.8453, 0.845, 0.8448, 0.8445, 0.8442, 0.844, 0.8437, 0.8435, 0.8432, 0.843, 0.8427,
+            0.8425, 0.8422, 0.842, 0.8417, 0.8415, 0.8412, 0.841, 0.8408, 0.8405, 0.8403, 0.84,
+            0.8398, 0.8395, 0.8393, 0.8391, 0.8388, 0.8386, 0.8383, 0.8381, 0.8379, 0.8376, 0.8374,
+            0.8371, 0.8369, 0.8367, 0.8364, 0.8362, 0.836, 0.8357, 0.8355, 0.8353, 0.835, 0.8348,
+            0.8346, 0.8343, 0.8341, 0.8339, 0.8336, 0.8334, 0.8332, 0.833, 0.8327, 0.8325, 0.8323,
+            0.8321, 0.8318, 0.8316, 0.8314, 0.8312, 0.8309, 0.8307, 0.8305, 0.8303, 0.83, 0.8298,
+            0.8296, 0.8294, 0.8291, 0.8289, 0.8287, 0.8285, 0.8283, 0.8281, 0.8278, 0.8276, 0.8274,
+            0.8272, 0.827, 0.8268, 0.8265, 0.8263, 0.8261, 0.8259, 0.8257, 0.8255, 0.8252, 0.825,
+            0.8248, 0.8246, 0.8244, 0.8242, 0.824, 0.8238, 0.8236, 0.8233, 0.8231, 0.8229, 0.8227,
+            0.8225, 0.8223, 0.8221, 0.8219, 0.8217, 0.8215, 0.8213, 0.8211, 0.8209, 0.8207, 0.8204,
+            0.8202, 0.82, 0.8198, 0.8196, 0.8194, 0.8192, 0.819, 0.8188, 0.8186, 0.8184, 0.8182,
+            0.818, 0.8178, 0.8176, 0.8174, 0.8172, 0.817, 0.8168, 0.8166, 0.8164, 0.8162, 0.816,
+            0.8158, 0.8156, 0.8154, 0.8152, 0.815, 0.8148, 0.8147, 0.8145, 0.8143, 0.8141, 0.8139,
+            0.8137, 0.8135, 0.8133, 0.8131, 0.8129, 0.8127, 0.8125, 0.8123, 0.8121, 0.812, 0.8118,
+            0.8116, 0.8114, 0.8112, 0.811, 0.8108, 0.8106, 0.8104, 0.8102, 0.8101, 0.8099, 0.8097,
+            0.8095, 0.8093, 0.8091, 0.8089, 0.8087, 0.8086, 0.8084, 0.8082, 0.808, 0.8078, 0.8076,
+            0.8075, 0.8073, 0.8071, 0.8069, 0.8067, 0.8065, 0.8064, 0.8062, 0.806, 0.8058, 0.8056,
+            0.8054, 0.8053, 0.8051, 0.8049, 0.8047, 0.8045, 0.8044, 0.8042, 0.804, 0.8038, 0.8036,
+            0.8035, 0.8033, 0.8031, 0.8029, 0.8027, 0.8026, 0.8024, 0.8022, 0.802, 0.8019, 0.8017,
+            0.8015, 0.8013, 0.8012, 0.801, 0.8008, 0.8006, 0.8005, 0.8003, 0.8001, 0.7999, 0.7998,
+            0.7996, 0.7994, 0.7992, 0.7991, 0.7989, 0.7987, 0.7985, 0.7984, 0.7982, 0.798, 0.7979,
+            0.7977, 0.7975, 0.7973, 0.7972, 0.797, 0.7968, 0.7967, 0.7965, 0.7963, 0.7962, 0.796,
+            0.7958, 0.7957, 0.7955, 0.7953, 0.7951, 0.795, 0.7948, 0.7946, 0.7945, 0.7943, 0.7941,
+            0.794, 0.7938, 0.7936, 0.7935, 0.7933, 0.7931, 0.793, 0.7928, 0.7927, 0.7925, 0.7923,
+            0.7922, 0.792, 0.7918, 0.7917, 0.7915, 0.7913, 0.7912, 0.791, 0.7909, 0.7907, 0.7905,
+            0.7904, 0.7902, 0.79, 0.7899, 0.7897, 0.7896, 0.7894, 0.7892, 0.7891, 0.7889, 0.7888,
+            0.7886, 0.7884, 0.7883, 0.7881, 0.788, 0.7878, 0.7876, 0.7875, 0.7873, 0.7872, 0.787,
+            0.7868, 0.7867, 0.7865, 0.7864, 0.7862, 0.7861, 0.7859, 0.7857, 0.7856, 0.7854, 0.7853,
+            0.7851, 0.785, 0.7848, 0.7846, 0.7845, 0.7843, 0.7842, 0.784, 0.7839, 0.7837, 0.7836,
+            0.7834, 0.7832, 0.7831, 0.7829, 0.7828, 0.7826, 0.7825, 0.7823, 0.7822, 0.782, 0.7819,
+            0.7817, 0.7816, 0.7814, 0.7813, 0.7811, 0.781, 0.7808, 0.7806, 0.7805, 0.7803, 0.7802,
+            0.78, 0.7799, 0.7797, 0.7796, 0.7794, 0.7793, 0.7791, 0.779, 0.7788, 0.7787, 0.7785,
+            0.7784, 0.7782, 0.7781, 0.7779, 0.7778, 0.7776, 0.7775, 0.7774, 0.7772, 0.7771, 0.7769,
+            0.7768, 0.7766, 0.7765, 0.7763, 0.7762, 0.776, 0.7759, 0.7757, 0.7756, 0.7754, 0.7753,
+            0.7751, 0.775, 0.7749, 0.7747, 0.7746, 0.7744, 0.7743, 0.7741, 0.774, 0.7738, 0.7737,
+            0.7735, 0.7734, 0.7733, 0.7731, 0.773, 0.7728, 0.7727, 0.7725, 0.7724, 0.7723, 0.7721,
+            0.772, 0.7718, 0.7717, 0.7715, 0.7714, 0.7713, 0.7711, 0.771, 0.7708, 0.7707, 0.7705,
+            0.7704, 0.7703, 0.7701, 0.77, 0.7698, 0.7697, 0.7696, 0.7694, 0.7693, 0.7691, 0.769,
+            0.7689, 0.7687, 0.7686, 0.7684, 0.7683, 0.7682, 0.768, 0.7679, 0.7677, 0.7676, 0.7675,
+            0.7673, 0.7672, 0.767, 0.7669, 0.7668, 0.7666, 0.7665, 0.7664, 0.7662, 0.7661, 0.7659,
+            0.7658, 0.7657, 0.7655, 0.7654, 0.7653, 0.7651, 0.765, 0.7648, 0.7647, 0.7646, 0.7644,
+            0.7643, 0.7642, 0.764, 0.7639, 0.7638, 0.7636, 0.7635, 0.7633, 0.7632, 0.7631, 0.7629,
+            0.7628, 0.7627, 0.7625, 0.7624, 0.7623, 0.7621, 0.762, 0.7619, 0.7617, 0.7616, 0.7615,
+            0.7613, 0.7612, 0.7611, 0.7609, 0.7608, 0.7607, 0.7605, 0.7604, 0.7603, 0.7601, 0.76,
+            0.7599, 0.7597, 0.7596, 0.7595, 0.7593, 0.7592, 0.7591, 0.7589, 0.7588, 0.7587, 0.7586,
+            0.7584, 0.7583, 0.7582, 0.758, 0.7579, 0.7578, 0.7576, 0.7575, 0.7574, 0.7572, 0.7571,
+            0.757, 0.7569, 0.7567, 0.7566, 0.7565, 0.7563, 0.7562, 0.7561, 0.7559, 0.7558, 0.7557,
+            0.7556, 0.7554, 0.7553, 0.7552, 0.755, 0.7549, 0.7548, 0.7547, 0.7545, 0.7544, 0.7543,
+            0.7542, 0.754, 0.7539, 0.7538, 0.7536, 0.7535, 0.7534, 0.7533, 0.7531, 0.753, 0.7529,
+            0.7528, 0.7526, 0.7525, 0.7524, 0.7522, 0.7521, 0.752, 0.7519, 0.7517, 0.7516, 0.7515,
+            0.7514, 0.7512, 0.7511, 0.751, 0.7509, 0.7507, 0.7506, 0.7505, 0.7504, 0.7502, 0.7501,
+            0.75, 0.7499, 0.7497, 0.7496, 0.7495, 0.7494, 0.7492, 0.7491, 0.749, 0.7489, 0.7487,
+            0.7486, 0.7485, 0.7484, 0.7483, 0.7481, 0.748, 0.7479, 0.7478, 0.7476, 0.7475, 0.7474,
+            0.7473, 0.7472, 0.747, 0.7469, 0.7468, 0.7467, 0.7465, 0.7464, 0.7463, 0.7462, 0.7461,
+            0.7459, 0.7458, 0.7457, 0.7456, 0.7454, 0.7453, 0.7452, 0.7451, 0.745, 0.7448, 0.7447,
+            0.7446, 0.7445, 0.7444, 0.7442, 0.7441, 0.744, 0.7439, 0.7438, 0.7436, 0.7435, 0.7434,
+            0.7433, 0.7432, 0.743, 0.7429, 0.7428, 0.7427, 0.7426, 0.7424, 0.7423, 0.7422, 0.7421,
+            0.742, 0.7418, 0.7417, 0.7416, 0.7415, 0.7414, 0.7413, 0.7411, 0.741, 0.7409, 0.7408,
+            0.7407, 0.7405, 0.7404, 0.7403, 0.7402, 0.7401, 0.74, 0.7398, 0.7397, 0.7396, 0.7395,
+            0.7394, 0.7393, 0.7391, 0.739, 0.7389, 0.7388, 0.7387, 0.7386, 0.7384, 0.7383, 0.7382,
+            0.7381, 0.738, 0.7379, 0.7377, 0.7376, 0.7375, 0.7374, 0.7373, 0.7372, 0.737, 0.7369,
+            0.7368, 0.7367, 0.7366, 0.7365, 0.7364, 0.7362, 0.7361, 0.736, 0.7359, 0.7358, 0.7357,
+            0.7356, 0.7354, 0.7353, 0.7352, 0.7351, 0.735, 0.7349, 0.7348, 0.7346, 0.7345, 0.7344,
+            0.7343, 0.7342, 0.7341, 0.734, 0.7338, 0.7337, 0.7336, 0.7335, 0.7334, 0.7333, 0.7332,
+            0.7331, 0.7329, 0.7328, 0.7327, 0.7326, 0.7325, 0.7324, 0.7323, 0.7322, 0.732, 0.7319,
+            0.7318, 0.7317, 0.7316, 0.7315, 0.7314, 0.7313, 0.7311, 0.731, 0.7309, 0.7308, 0.7307,
+            0.7306, 0.7305, 0.7304, 0.7303, 0.7301, 0.73, 0.7299, 0.7298, 0.7297, 0.7296, 0.7295,
+            0.7294, 0.7293, 0.7291, 0.729, 0.7289, 0.7288, 0.7287, 0.7286, 0.7285, 0.7284, 0.7283,
+            0.7282, 0.728, 0.7279, 0.7278, 0.7277, 0.7276, 0.7275, 0.7274, 0.7273, 0.7272, 0.7271,
+            0.7269, 0.7268, 0.7267, 0.7266, 0.7265, 0.7264, 0.7263, 0.7262, 0.7261, 0.726, 0.7259,
+            0.7258, 0.7256, 0.7255, 0.7254, 0.7253, 0.7252, 0.7251, 0.725, 0.7249, 0.7248, 0.7247,
+            0.7246, 0.7245, 0.7243, 0.7242, 0.7241, 0.724, 0.7239, 0.7238, 0.7237, 0.7236, 0.7235,
+            0.7234, 0.7233, 0.7232, 0.7231, 0.723, 0.7228, 0.7227, 0.7226, 0.7225, 0.7224, 0.7223,
+            0.7222, 0.7221, 0.722, 0.7219, 0.7218, 0.7217, 0.7216, 0.7215, 0.7214, 0.7213, 0.7211,
+            0.721, 0.7209, 0.7208, 0.7207, 0.7206, 0.7205, 0.7204, 0.7203, 0.7202, 0.7201, 0.72,
+            0.7199, 0.7198, 0.7197, 0.7196, 0.7195, 0.7194, 0.7193, 0.7192, 0.719, 0.7189, 0.7188,
+            0.7187, 0.7186, 0.7185, 0.7184, 0.7183, 0.7182, 0.7181, 0.718, 0.7179, 0.7178, 0.7177,
+            0.7176, 0.7175, 0.7174, 0.7173, 0.7172, 0.7171, 0.717, 0.7169, 0.7168, 0.7167, 0.7166,
+            0.7165, 0.7163, 0.7162, 0.7161, 0.716, 0.7159, 0.7158, 0.7157, 0.7156, 0.7155, 0.7154,
+            0.7153, 0.7152, 0.7151, 0.715, 0.7149, 0.7148, 0.7147, 0.7146, 0.7145, 0.7144, 0.7143,
+            0.7142, 0.7141, 0.714, 0.7139, 0.7138, 0.7137, 0.7136, 0.7135, 0.7134, 0.7133, 0.7132,
+            0.7131, 0.713, 0.7129, 0.7128, 0.7127, 0.7126, 0.7125, 0.7124, 0.7123, 0.7122, 0.7121,
+            0.712, 0.7119, 0.7118, 0.7117, 0.7116, 0.7115, 0.7114, 0.7113, 0.7112, 0.7111, 0.711,
+            0.7109, 0.7108, 0.7107, 0.7106, 0.7105, 0.7104, 0.7103, 0.7102, 0.7101, 0.71, 0.7099,
+            0.7098, 0.7097, 0.7096, 0.7095, 0.7094, 0.7093, 0.7092, 0.7091, 0.709, 0.7089, 0.7088,
+            0.7087, 0.7086, 0.7085, 0.7084, 0.7083, 0.7082, 0.7081, 0.708, 0.7079, 0.7078, 0.7077,
+            0.7076, 0.7075, 0.7074, 0.7073, 0.7072, 0.7071, 0.707, 0.7069, 0.7068, 0.7067, 0.7066,
+            0.7065, 0.7064, 0.7063, 0.7062, 0.7061, 0.706, 0.7059, 0.7058, 0.7057, 0.7056, 0.7055,
+            0.7054, 0.7053, 0.7052, 0.7051, 0.705, 0.7049, 0.7048, 0.7048, 0.7047, 0.7046, 0.7045,
+            0.7044, 0.7043, 0.7042, 0.7041, 0.704, 0.7039, 0.7038, 0.7037, 0.7036, 0.7035, 0.7034,
+            0.7033, 0.7032, 0.7031, 0.703, 0.7029, 0.7028, 0.7027, 0.7026, 0.7025, 0.7024, 0.7023,
+            0.7022, 0.7021, 0.7021, 0.702, 0.7019, 0.7018, 0.7017, 0.7016, 0.7015, 0.7014, 0.7013,
+            0.7012, 0.7011, 0.701, 0.7009, 0.7008, 0.7007, 0.7006, 0.7005, 0.7004, 0.7003, 0.7002,
+            0.7001, 0.7001, 0.7, 0.6999, 0.6998, 0.6997, 0.6996, 0.6995, 0.6994, 0.6993, 0.6992,
+            0.6991, 0.699, 0.6989, 0.6988, 0.6987, 0.6986, 0.6985, 0.6984, 0.6984, 0.6983, 0.6982,
+            0.6981, 0.698, 0.6979, 0.6978, 0.6977, 0.6976, 0.6975, 0.6974, 0.6973, 0.6972, 0.6971,
+            0.697, 0.6969, 0.6969, 0.6968, 0.6967, 0.6966, 0.6965, 0.6964, 0.6963, 0.6962, 0.6961,
+            0.696, 0.6959, 0.6958, 0.6957, 0.6956, 0.6956, 0.6955, 0.6954, 0.6953, 0.6952, 0.6951,
+            0.695, 0.6949, 0.6948, 0.6947, 0.6946, 0.6945, 0.6944, 0.6944, 0.6943, 0.6942, 0.6941,
+            0.694, 0.6939, 0.6938, 0.6937, 0.6936, 0.6935, 0.6934, 0.6933, 0.6933, 0.6932, 0.6931,
+            0.693, 0.6929, 0.6928, 0.6927, 0.6926, 0.6925, 0.6924, 0.6923, 0.6922, 0.6922, 0.6921,
+            0.692, 0.6919, 0.6918, 0.6917, 0.6916, 0.6915, 0.6914, 0.6913, 0.6912, 0.6912, 0.6911,
+            0.691, 0.6909, 0.6908, 0.6907, 0.6906, 0.6905, 0.6904, 0.6903, 0.6902, 0.6902, 0.6901,
+            0.69, 0.6899, 0.6898, 0.6897, 0.6896, 0.6895, 0.6894, 0.6893, 0.6893, 0.6892, 0.6891,
+            0.689, 0.6889, 0.6888, 0.6887, 0.6886, 0.6885, 0.6885, 0.6884, 0.6883, 0.6882, 0.6881,
+            0.688, 0.6879, 0.6878, 0.6877, 0.6876, 0.6876, 0.6875, 0.6874, 0.6873, 0.6872, 0.6871,
+            0.687, 0.6869, 0.6868, 0.6868, 0.6867, 0.6866, 0.6865, 0.6864, 0.6863, 0.6862, 0.6861,
+            0.686, 0.686, 0.6859, 0.6858, 0.6857, 0.6856, 0.6855, 0.6854, 0.6853, 0.6853, 0.6852,
+            0.6851, 0.685, 0.6849, 0.6848, 0.6847, 0.6846, 0.6845, 0.6845, 0.6844, 0.6843, 0.6842,
+            0.6841, 0.684, 0.6839, 0.6838, 0.6838, 0.6837, 0.6836, 0.6835, 0.6834, 0.6833, 0.6832,
+            0.6831, 0.6831, 0.683, 0.6829, 0.6828, 0.6827, 0.6826, 0.6825, 0.6825, 0.6824, 0.6823,
+            0.6822, 0.6821, 0.682, 0.6819, 0.6818, 0.6818, 0.6817, 0.6816, 0.6815, 0.6814, 0.6813,
+            0.6812, 0.6811, 0.6811, 0.681, 0.6809, 0.6808, 0.6807, 0.6806, 0.6805, 0.6805, 0.6804,
+            0.6803, 0.6802, 0.6801, 0.68, 0.6799, 0.6799, 0.6798, 0.6797, 0.6796, 0.6795, 0.6794,
+            0.6793, 0.6793, 0.6792, 0.6791, 0.679, 0.6789, 0.6788, 0.6787, 0.6787, 0.6786, 0.6785,
+            0.6784, 0.6783, 0.6782, 0.6781, 0.6781, 0.678, 0.6779, 0.6778, 0.6777, 0.6776, 0.6775,
+            0.6775, 0.6774, 0.6773, 0.6772, 0.6771, 0.677, 0.677, 0.6769, 0.6768, 0.6767, 0.6766,
+            0.6765, 0.6764, 0.6764, 0.6763, 0.6762, 0.6761, 0.676, 0.6759, 0.6759, 0.6758, 0.6757,
+            0.6756, 0.6755, 0.6754, 0.6753, 0.6753, 0.6752, 0.6751, 0.675, 0.6749, 0.6748, 0.6748,
+            0.6747, 0.6746, 0.6745, 0.6744, 0.6743, 0.6743, 0.6742, 0.6741, 0.674, 0.6739, 0.6738,
+            0.6738, 0.6737, 0.6736, 0.6735, 0.6734, 0.6733, 0.6733, 0.6732, 0.6731, 0.673, 0.6729,
+            0.6728, 0.6728, 0.6727, 0.6726, 0.6725, 0.6724, 0.6723, 0.6723, 0.6722, 0.6721, 0.672,
+            0.6719, 0.6718, 0.6718, 0.6717, 0.6716, 0.6715, 0.6714, 0.6713, 0.6713, 0.6712, 0.6711,
+            0.671, 0.6709, 0.6709, 0.6708, 0.6707, 0.6706, 0.6705, 0.6704, 0.6704, 0.6703, 0.6702,
+            0.6701, 0.67, 0.6699, 0.6699, 0.6698, 0.6697, 0.6696, 0.6695, 0.6695, 0.6694, 0.6693,
+            0.6692, 0.6691, 0.669, 0.669, 0.6689, 0.6688, 0.6687, 0.6686, 0.6686, 0.6685, 0.6684,
+            0.6683, 0.6682, 0.6681, 0.6681, 0.668, 0.6679, 0.6678, 0.6677, 0.6677, 0.6676, 0.6675,
+            0.6674, 0.6673, 0.6673, 0.6672, 0.6671, 0.667, 0.6669, 0.6668, 0.6668, 0.6667, 0.6666,
+            0.6665, 0.6664, 0.6664, 0.6663, 0.6662, 0.6661, 0.666, 0.666, 0.6659, 0.6658, 0.6657,
+            0.6656, 0.6656, 0.6655, 0.6654, 0.6653, 0.6652, 0.6652, 0.6651, 0.665, 0.6649, 0.6648,
+            0.6648, 0.6647, 0.6646, 0.6645, 0.6644, 0.6644, 0.6643, 0.6642, 0.6641, 0.664, 0.664,
+            0.6639, 0.6638, 0.6637, 0.6636, 0.6636, 0.6635, 0.6634, 0.6633, 0.6632, 0.6632, 0.6631,
+            0.663, 0.6629, 0.6628, 0.6628, 0.6627, 0.6626, 0.6625, 0.6624, 0.6624, 0.6623, 0.6622,
+            0.6621, 0.662, 0.662, 0.6619, 0.6618, 0.6617, 0.6616, 0.6616, 0.6615, 0.6614, 0.6613,
+            0.6613, 0.6612, 0.6611, 0.661, 0.6609, 0.6609, 0.6608, 0.6607, 0.6606, 0.6605, 0.6605,
+            0.6604, 0.6603, 0.6602, 0.6601, 0.6601, 0.66, 0.6599, 0.6598, 0.6598, 0.6597, 0.6596,
+            0.6595, 0.6594, 0.6594, 0.6593, 0.6592, 0.6591, 0.6591, 0.659, 0.6589, 0.6588, 0.6587,
+            0.6587, 0.6586, 0.6585, 0.6584, 0.6583, 0.6583, 0.6582, 0.6581, 0.658, 0.658, 0.6579,
+            0.6578, 0.6577, 0.6576, 0.6576, 0.6575, 0.6574, 0.6573, 0.6573, 0.6572, 0.6571, 0.657,
+            0.6569, 0.6569, 0.6568, 0.6567, 0.6566, 0.6566, 0.6565, 0.6564, 0.6563, 0.6563, 0.6562,
+            0.6561, 0.656, 0.6559, 0.6559, 0.6558, 0.6557, 0.6556, 0.6556, 0.6555, 0.6554, 0.6553,
+            0.6553, 0.6552, 0.6551, 0.655, 0.6549, 0.6549, 0.6548, 0.6547, 0.6546, 0.6546, 0.6545,
+            0.6544, 0.6543, 0.6543, 0.6542, 0.6541, 0.654, 0.6539, 0.6539, 0.6538, 0.6537, 0.6536,
+            0.6536, 0.6535, 0.6534, 0.6533, 0.6533, 0.6532, 0.6531, 0.653, 0.653, 0.6529, 0.6528,
+            0.6527, 0.6527, 0.6526, 0.6525, 0.6524, 0.6523, 0.6523, 0.6522, 0.6521, 0.652, 0.652,
+            0.6519, 0.6518, 0.6517, 0.6517, 0.6516, 0.6515, 0.6514, 0.6514, 0.6513, 0.6512, 0.6511,
+            0.6511, 0.651, 0.6509, 0.6508, 0.6508, 0.6507, 0.6506, 0.6505, 0.6505, 0.6504, 0.6503,
+            0.6502, 0.6502, 0.6501, 0.65, 0.6499, 0.6499, 0.6498, 0.6497, 0.6496, 0.6496, 0.6495,
+            0.6494, 0.6493, 0.6493, 0.6492, 0.6491, 0.649, 0.649, 0.6489, 0.6488, 0.6487, 0.6487,
+            0.6486, 0.6485, 0.6484, 0.6484, 0.6483, 0.6482, 0.6481, 0.6481, 0.648, 0.6479, 0.6478,
+            0.6478, 0.6477, 0.6476, 0.6475, 0.6475, 0.6474, 0.6473, 0.6472, 0.6472, 0.6471, 0.647,
+            0.6469, 0.6469, 0.6468, 0.6467, 0.6466, 0.6466, 0.6465, 0.6464, 0.6463, 0.6463, 0.6462,
+            0.6461, 0.6461, 0.646, 0.6459, 0.6458, 0.6458, 0.6457, 0.6456, 0.6455, 0.6455, 0.6454,
+            0.6453, 0.6452, 0.6452, 0.6451, 0.645, 0.6449, 0.6449, 0.6448, 0.6447, 0.6447, 0.6446,
+            0.6445, 0.6444, 0.6444, 0.6443, 0.6442, 0.6441, 0.6441, 0.644, 0.6439, 0.6438, 0.6438,
+            0.6437, 0.6436, 0.6436, 0.6435, 0.6434, 0.6433, 0.6433, 0.6432, 0.6431, 0.643, 0.643,
+            0.6429, 0.6428, 0.6427, 0.6427, 0.6426, 0.6425, 0.6425, 0.6424, 0.6423, 0.6422, 0.6422,
+            0.6421, 0.642, 0.6419, 0.6419, 0.6418, 0.6417, 0.6417, 0.6416, 0.6415, 0.6414, 0.6414,
+            0.6413, 0.6412, 0.6412, 0.6411, 0.641, 0.6409, 0.6409, 0.6408, 0.6407, 0.6406, 0.6406,
+            0.6405, 0.6404, 0.6404, 0.6403, 0.6402, 0.6401, 0.6401, 0.64, 0.6399, 0.6399, 0.6398,
+            0.6397, 0.6396, 0.6396, 0.6395, 0.6394, 0.6393, 0.6393, 0.6392, 0.6391, 0.6391, 0.639,
+            0.6389, 0.6388, 0.6388, 0.6387, 0.6386, 0.6386, 0.6385, 0.6384, 0.6383, 0.6383, 0.6382,
+            0.6381, 0.6381, 0.638, 0.6379, 0.6378, 0.6378, 0.6377, 0.6376, 0.6376, 0.6375, 0.6374,
+            0.6373, 0.6373, 0.6372, 0.6371, 0.6371, 0.637, 0.6369, 0.6368, 0.6368, 0.6367, 0.6366,
+            0.6366, 0.6365, 0.6364, 0.6363, 0.6363, 0.6362, 0.6361, 0.6361, 0.636, 0.6359, 0.6359,
+            0.6358, 0.6357, 0.6356, 0.6356, 0.6355, 0.6354, 0.6354, 0.6353, 0.6352, 0.6351, 0.6351,
+            0.635, 0.6349, 0.6349, 0.6348, 0.6347, 0.6346, 0.6346, 0.6345, 0.6344, 0.6344, 0.6343,
+            0.6342, 0.6342, 0.6341, 0.634, 0.6339, 0.6339, 0.6338, 0.6337, 0.6337, 0.6336, 0.6335,
+            0.6335, 0.6334, 0.6333, 0.6332, 0.6332, 0.6331, 0.633, 0.633, 0.6329, 0.6328, 0.6328,
+            0.6327, 0.6326, 0.6325, 0.6325, 0.6324, 0.6323, 0.6323, 0.6322, 0.6321, 0.6321, 0.632,
+            0.6319, 0.6318, 0.6318, 0.6317, 0.6316, 0.6316, 0.6315, 0.6314, 0.6314, 0.6313, 0.6312,
+            0.6311, 0.6311, 0.631, 0.6309, 0.6309, 0.6308, 0.6307, 0.6307, 0.6306, 0.6305, 0.6305,
+            0.6304, 0.6303, 0.6302, 0.6302, 0.6301, 0.63, 0.63, 0.6299, 0.6298, 0.6298, 0.6297,
+            0.6296, 0.6296, 0.6295, 0.6294, 0.6293, 0.6293, 0.6292, 0.6291, 0.6291, 0.629, 0.6289,
+            0.6289, 0.6288, 0.6287, 0.6287, 0.6286, 0.6285, 0.6285, 0.6284, 0.6283, 0.6282, 0.6282,
+            0.6281, 0.628, 0.628, 0.6279, 0.6278, 0.6278, 0.6277, 0.6276, 0.6276, 0.6275, 0.6274,
+            0.6274, 0.6273, 0.6272, 0.6272, 0.6271, 0.627, 0.6269, 0.6269, 0.6268, 0.6267, 0.6267,
+            0.6266, 0.6265, 0.6265, 0.6264, 0.6263, 0.6263, 0.6262, 0.6261, 0.6261, 0.626, 0.6259,
+            0.6259, 0.6258, 0.6257, 0.6257, 0.6256, 0.6255, 0.6254, 0.6254, 0.6253, 0.6252, 0.6252,
+            0.6251, 0.625, 0.625, 0.6249, 0.6248, 0.6248, 0.6247, 0.6246, 0.6246, 0.6245, 0.6244,
+            0.6244, 0.6243, 0.6242, 0.6242, 0.6241, 0.624, 0.624, 0.6239, 0.6238, 0.6238, 0.6237,
+            0.6236, 0.6236, 0.6235, 0.6234, 0.6234, 0.6233, 0.6232, 0.6231, 0.6231, 0.623, 0.6229,
+            0.6229, 0.6228, 0.6227, 0.6227, 0.6226, 0.6225, 0.6225, 0.6224, 0.6223, 0.6223, 0.6222,
+            0.6221, 0.6221, 0.622, 0.6219, 0.6219, 0.6218, 0.6217, 0.6217, 0.6216, 0.6215, 0.6215,
+            0.6214, 0.6213, 0.6213, 0.6212, 0.6211, 0.6211, 0.621, 0.6209, 0.6209, 0.6208, 0.6207,
+            0.6207, 0.6206, 0.6205, 0.6205, 0.6204, 0.6203, 0.6203, 0.6202, 0.6201, 0.6201, 0.62,
+            0.6199, 0.6199, 0.6198, 0.6197, 0.6197, 0.6196, 0.6195, 0.6195, 0.6194, 0.6193, 0.6193,
+            0.6192, 0.6191, 0.6191, 0.619, 0.6189, 0.6189, 0.6188, 0.6187, 0.6187, 0.6186, 0.6185,
+            0.6185, 0.6184, 0.6183, 0.6183, 0.6182, 0.6182, 0.6181, 0.618, 0.618, 0.6179, 0.6178,
+            0.6178, 0.6177, 0.6176, 0.6176, 0.6175, 0.6174, 0.6174, 0.6173, 0.6172, 0.6172, 0.6171,
+            0.617, 0.617, 0.6169, 0.6168, 0.6168, 0.6167, 0.6166, 0.6166, 0.6165, 0.6164, 0.6164,
+            0.6163, 0.6162, 0.6162, 0.6161, 0.616, 0.616, 0.6159, 0.6159, 0.6158, 0.6157, 0.6157,
+            0.6156, 0.6155, 0.6155, 0.6154, 0.6153, 0.6153, 0.6152, 0.6151, 0.6151, 0.615, 0.6149,
+            0.6149, 0.6148, 0.6147, 0.6147, 0.6146, 0.6145, 0.6145, 0.6144, 0.6144, 0.6143, 0.6142,
+            0.6142, 0.6141, 0.614, 0.614, 0.6139, 0.6138, 0.6138, 0.6137, 0.6136, 0.6136, 0.6135,
+            0.6134, 0.6134, 0.6133, 0.6133, 0.6132, 0.6131, 0.6131, 0.613, 0.6129, 0.6129, 0.6128,
+            0.6127, 0.6127, 0.6126, 0.6125, 0.6125, 0.6124, 0.6123, 0.6123, 0.6122, 0.6122, 0.6121,
+            0.612, 0.612, 0.6119, 0.6118, 0.6118, 0.6117, 0.6116, 0.6116, 0.6115, 0.6114, 0.6114,
+            0.6113, 0.6113, 0.6112, 0.6111, 0.6111, 0.611, 0.6109, 0.6109, 0.6108, 0.6107, 0.6107,
+            0.6106, 0.6105, 0.6105, 0.6104, 0.6104, 0.6103, 0.6102, 0.6102, 0.6101, 0.61, 0.61,
+            0.6099, 0.6098, 0.6098, 0.6097, 0.6097, 0.6096, 0.6095, 0.6095, 0.6094, 0.6093, 0.6093,
+            0.6092, 0.6091, 0.6091, 0.609, 0.6089, 0.6089, 0.6088, 0.6088, 0.6087, 0.6086, 0.6086,
+            0.6085, 0.6084, 0.6084, 0.6083, 0.6083, 0.6082, 0.6081, 0.6081, 0.608, 0.6079, 0.6079,
+            0.6078, 0.6077, 0.6077, 0.6076, 0.6076, 0.6075, 0.6074, 0.6074, 0.6073, 0.6072, 0.6072,
+            0.6071, 0.607, 0.607, 0.6069, 0.6069, 0.6068, 0.6067, 0.6067, 0.6066, 0.6065, 0.6065,
+            0.6064, 0.6064, 0.6063, 0.6062, 0.6062, 0.6061, 0.606, 0.606, 0.6059, 0.6058, 0.6058,
+            0.6057, 0.6057, 0.6056, 0.6055, 0.6055, 0.6054, 0.6053, 0.6053, 0.6052, 0.6052, 0.6051,
+            0.605, 0.605, 0.6049, 0.6048, 0.6048, 0.6047, 0.6047, 0.6046, 0.6045, 0.6045, 0.6044,
+            0.6043, 0.6043, 0.6042, 0.6042, 0.6041, 0.604, 0.604, 0.6039, 0.6038, 0.6038, 0.6037,
+            0.6037, 0.6036, 0.6035, 0.6035, 0.6034, 0.6033, 0.6033, 0.6032, 0.6032, 0.6031, 0.603,
+            0.603, 0.6029, 0.6028, 0.6028, 0.6027, 0.6027, 0.6026, 0.6025, 0.6025, 0.6024, 0.6023,
+            0.6023, 0.6022, 0.6022, 0.6021, 0.602, 0.602, 0.6019, 0.6019, 0.6018, 0.6017, 0.6017,
+            0.6016, 0.6015, 0.6015, 0.6014, 0.6014, 0.6013, 0.6012, 0.6012, 0.6011, 0.601, 0.601,
+            0.6009, 0.6009, 0.6008, 0.6007, 0.6007, 0.6006, 0.6006, 0.6005, 0.6004, 0.6004, 0.6003,
+            0.6002, 0.6002, 0.6001, 0.6001, 0.6,
+        },
+    },
+    ['12ga'] = {
+        effectiveRange = 30,
+        maxRange = 75,
+        minDamage = 0.15,
+        samples = {
+            1.0, 0.9999, 0.9996, 0.9991, 0.9983, 0.9974, 0.9962, 0.9949, 0.9933, 0.9915, 0.9895,
+            0.9873, 0.9849, 0.9823, 0.9794, 0.9764, 0.9731, 0.9697, 0.966, 0.9621, 0.958, 0.9537,
+            0.9492, 0.9445, 0.9396, 0.9344, 0.9291, 0.9235, 0.9177, 0.9117, 0.9056, 0.8992, 0.8925,
+            0.8857, 0.8787, 0.8715, 0.864, 0.8563, 0.8485, 0.8404, 0.8321, 0.8236, 0.8149, 0.806,
+            0.7968, 0.7875, 0.778, 0.7682, 0.7582, 0.748, 0.7377, 0.7271, 0.7162, 0.7052, 0.694,
+            0.6826, 0.6709, 0.6591, 0.647, 0.6347, 0.6222, 0.6095, 0.5966, 0.5835, 0.5702, 0.5566,
+            0.5429, 0.5289, 0.5148, 0.5004, 0.4858, 0.471, 0.456, 0.4408, 0.4254, 0.4097, 0.3939,
+            0.3778, 0.3616, 0.3451, 0.3284, 0.3115, 0.2944, 0.2771, 0.2596, 0.2418, 0.2239, 0.2057,
+            0.1874, 0.1688, 0.15,
+        },
+    },
+    ['12ga_slug'] = {
+        effectiveRange = 100,
+        maxRange = 200,
+        minDamage = 0.35,
+        samples = {
+            1.0, 0.9989, 0.9974, 0.9958, 0.9941, 0.9922, 0.9903, 0.9884, 0.9863, 0.9843, 0.9821,
+            0.98, 0.9778, 0.9755, 0.9733, 0.971, 0.9686, 0.9663, 0.9639, 0.9614, 0.959, 0.9565,
+            0.954, 0.9515, 0.949, 0.9464, 0.9438, 0.9412, 0.9386, 0.9359, 0.9333, 0.9306, 0.9279,
+            0.9252, 0.9225, 0.9197, 0.917, 0.9142, 0.9114, 0.9086, 0.9058, 0.9029, 0.9001, 0.8972,
+            0.8944, 0.8915, 0.8886, 0.8857, 0.8827, 0.8798, 0.8768, 0.8739, 0.8709, 0.8679, 0.8649,
+            0.8619, 0.8589, 0.8559, 0.8528, 0.8498, 0.8467, 0.8437, 0.8406, 0.8375, 0.8344, 0.8313,
+            0.8282, 0.825, 0.8219, 0.8187, 0.8156, 0.8124, 0.8092, 0.8061, 0.8029, 0.7997, 0.7965,
+            0.7932, 0.79, 0.7868, 0.7835, 0.7803, 0.777, 0.7738, 0.7705, 0.7672, 0.7639, 0.7606,
+            0.7573, 0.754, 0.7507, 0.7473, 0.744, 0.7407, 0.7373, 0.734, 0.7306, 0.7272, 0.7238,
+            0.7205, 0.7171, 0.7137, 0.7103, 0.7069, 0.7034, 0.7, 0.6966, 0.6931, 0.6897, 0.6862,
+            0.6828, 0.6793, 0.6759, 0.6724, 0.6689, 0.6654, 0.6619, 0.6584, 0.6549, 0.6514, 0.6479,
+            0.6444, 0.6408, 0.6373, 0.6337, 0.6302, 0.6266, 0.6231, 0.6195, 0.616, 0.6124, 0.6088,
+            0.6052, 0.6016, 0.598, 0.5944, 0.5908, 0.5872, 0.5836, 0.58, 0.5763, 0.5727, 0.5691,
+            0.5654, 0.5618, 0.5581, 0.5544, 0.5508, 0.5471, 0.5434, 0.5398, 0.5361, 0.5324, 0.5287,
+            0.525, 0.5213, 0.5176, 0.5139, 0.5101, 0.5064, 0.5027, 0.499, 0.4952, 0.4915, 0.4877,
+            0.484, 0.4802, 0.4765, 0.4727, 0.4689, 0.4652, 0.4614, 0.4576, 0.4538, 0.45, 0.4462,
+            0.4424, 0.4386, 0.4348, 0.431, 0.4272, 0.4234, 0.4196, 0.4157, 0.4119, 0.4081, 0.4042,
+            0.4004, 0.3965, 0.3927, 0.3888, 0.3849, 0.3811, 0.3772, 0.3733, 0.3695, 0.3656, 0.3617,
+            0.3578, 0.3539, 0.35,
+        },
+    },
+}
+
+-- Armor effectiveness by integrity: armorEffectiveness[integrity + 1]
+DamageTable.armorEffectiveness = {
+    0.15, 0.15, 0.15, 0.15, 0.15, 0.15, 0.15, 0.15, 0.15, 0.15, 0.15, 0.15, 0.15, 0.15, 0.15, 0.15,
+    0.15, 0.15, 0.15, 0.15, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4,
+    0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.65, 0.65, 0.65, 0.65, 0.65, 0.65, 0.65, 0.65, 0.65, 0.65, 0.65,
+    0.65, 0.65, 0.65, 0.65, 0.65, 0.65, 0.65, 0.65, 0.65, 0.85, 0.85, 0.85, 0.85, 0.85, 0.85, 0.85,
+    0.85, 0.85, 0.85, 0.85, 0.85, 0.85, 0.85, 0.85, 0.85, 0.85, 0.85, 0.85, 0.85, 1.0, 1.0, 1.0, 1.0,
+    1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0,
+}
+
+local F = DamageTable.falloff
+
+-- Resolved modifiers: ammo[caliber][ammoType]
+DamageTable.ammo = {
+    ['9mm'] = {
+        fmj = {
+            damageMult = 1.0,
+            armorMult = 1.0,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 6,
+            falloff = F['9mm'],
+        },
+        hp = {
+            damageMult = 1.18,
+            armorMult = 0.5,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 12,
+            falloff = F['9mm'],
+        },
+        ap = {
+            damageMult = 0.92,
+            armorMult = 1.75,
+            armorBypass = true,
+            suppressedMult = 1.0,
+            degradation = 2,
+            falloff = F['9mm'],
+        },
+    },
+    ['.45acp'] = {
+        fmj = {
+            damageMult = 1.0,
+            armorMult = 0.95,
+            armorBypass = false,
+            suppressedMult = 0.95,
+            degradation = 8,
+            falloff = F['.45acp'],
+        },
+        jhp = {
+            damageMult = 1.22,
+            armorMult = 0.42,
+            armorBypass = false,
+            suppressedMult = 0.95,
+            degradation = 18,
+            falloff = F['.45acp'],
+        },
+    },
+    ['.40sw'] = {
+        fmj = {
+            damageMult = 1.0,
+            armorMult = 1.02,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 7,
+            falloff = F['.40sw'],
+        },
+        jhp = {
+            damageMult = 1.2,
+            armorMult = 0.48,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 16,
+            falloff = F['.40sw'],
+        },
+    },
+    ['.357mag'] = {
+        fmj = {
+            damageMult = 1.0,
+            armorMult = 1.08,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 10,
+            falloff = F['.357mag'],
+        },
+        jhp = {
+            damageMult = 1.28,
+            armorMult = 0.52,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 23,
+            falloff = F['.357mag'],
+        },
+    },
+    ['.38spl'] = {
+        fmj = {
+            damageMult = 1.0,
+            armorMult = 0.85,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 4,
+            falloff = F['.38spl'],
+        },
+        jhp = {
+            damageMult = 1.15,
+            armorMult = 0.4,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 9,
+            falloff = F['.38spl'],
+        },
+    },
+    ['.44mag'] = {
+        fmj = {
+            damageMult = 1.0,
+            armorMult = 1.12,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 12,
+            falloff = F['.44mag'],
+        },
+        jhp = {
+            damageMult = 1.25,
+            armorMult = 0.58,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 28,
+            falloff = F['.44mag'],
+        },
+    },
+    ['.500sw'] = {
+        fmj = {
+            damageMult = 1.0,
+            armorMult = 1.25,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 17,
+            falloff = F['.500sw'],
+        },
+        jhp = {
+            damageMult = 1.22,
+            armorMult = 0.65,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 39,
+            falloff = F['.500sw'],
+        },
+        bear = {
+            damageMult = 1.35,
+            armorMult = 1.42,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 26,
+            falloff = F['.500sw'],
+        },
+    },
+    ['5.7x28'] = {
+        fmj = {
+            damageMult = 1.0,
+            armorMult = 1.05,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 4,
+            falloff = F['5.7x28'],
+        },
+        jhp = {
+            damageMult = 1.12,
+            armorMult = 0.45,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 10,
+            falloff = F['5.7x28'],
+        },
+        ap = {
+            damageMult = 0.88,
+            armorMult = 2.2,
+            armorBypass = true,
+            suppressedMult = 1.0,
+            degradation = 1,
+            falloff = F['5.7x28'],
+        },
+    },
+    ['10mm'] = {
+        fbi = {
+            damageMult = 1.0,
+            armorMult = 1.0,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 8,
+            falloff = F['10mm'],
+        },
+        fullpower = {
+            damageMult = 1.0,
+            armorMult = 1.0,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 8,
+            falloff = F['10mm'],
+        },
+        bear = {
+            damageMult = 1.48,
+            armorMult = 1.22,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 13,
+            falloff = F['10mm'],
+        },
+    },
+    ['.22lr'] = {
+        fmj = {
+            damageMult = 1.0,
+            armorMult = 0.65,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 2,
+            falloff = F['.22lr'],
+        },
+        jhp = {
+            damageMult = 1.15,
+            armorMult = 0.35,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 5,
+            falloff = F['.22lr'],
+        },
+    },
+    ['12ga'] = {
+        ['00buck'] = {
+            damageMult = 1.0,
+            armorMult = 0.6,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 14,
+            falloff = F['12ga'],
+        },
+        ['1buck'] = {
+            damageMult = 0.72,
+            armorMult = 0.52,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 14,
+            falloff = F['12ga'],
+        },
+        slug = {
+            damageMult = 5.5,
+            armorMult = 1.05,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 14,
+            falloff = F['12ga_slug'],
+        },
+        birdshot = {
+            damageMult = 0.42,
+            armorMult = 0.28,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 14,
+            falloff = F['12ga'],
+        },
+        pepperball = {
+            damageMult = 0.03,
+            armorMult = 1.0,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 14,
+            falloff = F['12ga'],
+        },
+        dragonsbreath = {
+            damageMult = 0.78,
+            armorMult = 0.48,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 14,
+            falloff = F['12ga'],
+        },
+        beanbag = {
+            damageMult = 0.06,
+            armorMult = 0.82,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 14,
+            falloff = F['12ga'],
+        },
+        breach = {
+            damageMult = 0.32,
+            armorMult = 0.52,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 14,
+            falloff = F['12ga'],
+        },
+    },
+    ['5.56'] = {
+        fmj = {
+            damageMult = 1.0,
+            armorMult = 1.15,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 11,
+            falloff = F['5.56'],
+        },
+        sp = {
+            damageMult = 1.0,
+            armorMult = 1.0,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 11,
+            falloff = F['5.56'],
+        },
+        ap = {
+            damageMult = 0.88,
+            armorMult = 1.95,
+            armorBypass = true,
+            suppressedMult = 1.0,
+            degradation = 4,
+            falloff = F['5.56'],
+        },
+    },
+    ['6.8x51'] = {
+        fmj = {
+            damageMult = 1.0,
+            armorMult = 1.45,
+            armorBypass = true,
+            suppressedMult = 1.0,
+            degradation = 8,
+            falloff = F['6.8x51'],
+        },
+        ap = {
+            damageMult = 0.95,
+            armorMult = 2.1,
+            armorBypass = true,
+            suppressedMult = 1.0,
+            degradation = 3,
+            falloff = F['6.8x51'],
+        },
+    },
+    ['.300blk'] = {
+        hunting = {
+            damageMult = 1.0,
+            armorMult = 1.0,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 8,
+            falloff = F['.300blk'],
+        },
+        subsonic = {
+            damageMult = 0.82,
+            armorMult = 0.88,
+            armorBypass = false,
+            suppressedMult = 0.95,
+            degradation = 6,
+            falloff = F['.300blk'],
+        },
+    },
+    ['7.62x39'] = {
+        fmj = {
+            damageMult = 1.0,
+            armorMult = 1.05,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 12,
+            falloff = F['7.62x39'],
+        },
+        sp = {
+            damageMult = 1.0,
+            armorMult = 1.0,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 12,
+            falloff = F['7.62x39'],
+        },
+        ap = {
+            damageMult = 0.9,
+            armorMult = 1.85,
+            armorBypass = true,
+            suppressedMult = 1.0,
+            degradation = 4,
+            falloff = F['7.62x39'],
+        },
+    },
+    ['7.62x51'] = {
+        fmj = {
+            damageMult = 1.0,
+            armorMult = 1.22,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 16,
+            falloff = F['7.62x51'],
+        },
+        match = {
+            damageMult = 1.08,
+            armorMult = 1.18,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 16,
+            falloff = F['7.62x51'],
+        },
+        ap = {
+            damageMult = 0.92,
+            armorMult = 2.05,
+            armorBypass = true,
+            suppressedMult = 1.0,
+            degradation = 6,
+            falloff = F['7.62x51'],
+        },
+    },
+    ['.300wm'] = {
+        fmj = {
+            damageMult = 1.0,
+            armorMult = 1.32,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 19,
+            falloff = F['.300wm'],
+        },
+        match = {
+            damageMult = 1.08,
+            armorMult = 1.28,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 19,
+            falloff = F['.300wm'],
+        },
+    },
+    ['.50bmg'] = {
+        ball = {
+            damageMult = 1.0,
+            armorMult = 1.65,
+            armorBypass = true,
+            suppressedMult = 1.0,
+            degradation = 40,
+            falloff = F['.50bmg'],
+        },
+        api = {
+            damageMult = 0.95,
+            armorMult = 2.25,
+            armorBypass = true,
+            suppressedMult = 1.0,
+            degradation = 40,
+            falloff = F['.50bmg'],
+        },
+        boom = {
+            damageMult = 3.0,
+            armorMult = 1.85,
+            armorBypass = true,
+            suppressedMult = 1.0,
+            degradation = 40,
+            falloff = F['.50bmg'],
+        },
+    },
+    dart = {
+        tranq = {
+            damageMult = 0.02,
+            armorMult = 0.0,
+            armorBypass = false,
+            suppressedMult = 1.0,
+            degradation = 8,
+            falloff = nil,
+        },
+    },
+}
+
+local A = DamageTable.ammo
+
+-- weapons[hash][ammoType] -> ammo entry
+DamageTable.weapons = {
+    [`WEAPON_G26`] = A['9mm'],
+    [`WEAPON_G26_SWITCH`] = A['9mm'],
+    [`WEAPON_G43X`] = A['9mm'],
+    [`WEAPON_GX4`] = A['9mm'],
+    [`WEAPON_HELLCAT`] = A['9mm'],
+    [`WEAPON_FN509`] = A['9mm'],
+    [`WEAPON_G17`] = A['9mm'],
+    [`WEAPON_G17_BLK`] = A['9mm'],
+    [`WEAPON_G17_GEN5`] = A['9mm'],
+    [`WEAPON_G19`] = A['9mm'],
+    [`WEAPON_G19X`] = A['9mm'],
+    [`WEAPON_G19X_SWITCH`] = A['9mm'],
+    [`WEAPON_G19XD`] = A['9mm'],
+    [`WEAPON_G45`] = A['9mm'],
+    [`WEAPON_G45_TAN`] = A['9mm'],
+    [`WEAPON_M9`] = A['9mm'],
+    [`WEAPON_M9A3`] = A['9mm'],
+    [`WEAPON_P320`] = A['9mm'],
+    [`WEAPON_PX4`] = A['9mm'],
+    [`WEAPON_TP9SF`] = A['9mm'],
+    [`WEAPON_G21`] = A['.45acp'],
+    [`WEAPON_G30`] = A['.45acp'],
+    [`WEAPON_G41`] = A['.45acp'],
+    [`WEAPON_JUNK1911`] = A['.45acp'],
+    [`WEAPON_KIMBER1911`] = A['.45acp'],
+    [`WEAPON_KIMBER_ECLIPSE`] = A['.45acp'],
+    [`WEAPON_M45A1`] = A['.45acp'],
+    [`WEAPON_G22_GEN4`] = A['.40sw'],
+    [`WEAPON_G22_GEN5`] = A['.40sw'],
+    [`WEAPON_GLOCK_DEMON`] = A['.40sw'],
+    [`WEAPON_KINGCOBRA`] = A['.357mag'],
+    [`WEAPON_KINGCOBRA_SNUB`] = A['.357mag'],
+    [`WEAPON_KINGCOBRA_TARGET`] = A['.357mag'],
+    [`WEAPON_PYTHON`] = A['.357mag'],
+    [`WEAPON_SW_MODEL15`] = A['.38spl'],
+    [`WEAPON_RAGINGBULL`] = A['.44mag'],
+    [`WEAPON_SW500`] = A['.500sw'],
+    [`WEAPON_SW657`] = A['.357mag'],
+    [`WEAPON_SWMODEL29`] = A['.44mag'],
+    [`WEAPON_FN57`] = A['5.7x28'],
+    [`WEAPON_RUGER57`] = A['5.7x28'],
+    [`WEAPON_FN502`] = A['.22lr'],
+    [`WEAPON_P22`] = A['.22lr'],
+    [`WEAPON_PMR30`] = A['.22lr'],
+    [`WEAPON_SIGP22`] = A['.22lr'],
+    [`WEAPON_WALTHERP88`] = A['9mm'],
+    [`WEAPON_GLOCK20`] = A['10mm'],
+    [`WEAPON_G18`] = A['9mm'],
+    [`WEAPON_BLUEARP`] = A['.300blk'],
+    [`WEAPON_PSADAGGER`] = A['9mm'],
+    [`WEAPON_PX4STORM`] = A['9mm'],
+    [`WEAPON_RUGERSR9`] = A['9mm'],
+    [`WEAPON_SIGP210`] = A['9mm'],
+    [`WEAPON_SIGP220`] = A['.45acp'],
+    [`WEAPON_SIGP226`] = A['9mm'],
+    [`WEAPON_SIGP226ELITE`] = A['9mm'],
+    [`WEAPON_SIGP226MK25`] = A['9mm'],
+    [`WEAPON_SIGP229`] = A['9mm'],
+    [`WEAPON_SIGP320`] = A['9mm'],
+    [`WEAPON_UDP9`] = A['9mm'],
+    [`WEAPON_MINI_AK47`] = A['7.62x39'],
+    [`WEAPON_MK47`] = A['7.62x39'],
+    [`WEAPON_M7`] = A['6.8x51'],
+    [`WEAPON_MCX300`] = A['.300blk'],
+    [`WEAPON_SIG_SPEAR`] = A['6.8x51'],
+    [`WEAPON_MICRO_MP5`] = A['9mm'],
+    [`WEAPON_MPA30`] = A['9mm'],
+    [`WEAPON_RAM9_DESERT`] = A['9mm'],
+    [`WEAPON_SCORPION`] = A['9mm'],
+    [`WEAPON_SIG_MPX`] = A['9mm'],
+    [`WEAPON_SUB2000`] = A['9mm'],
+    [`WEAPON_TEC9`] = A['9mm'],
+    [`WEAPON_MAC10`] = A['.45acp'],
+    [`WEAPON_MAC4A1`] = A['.45acp'],
+    [`WEAPON_ARP_BUMPSTOCK`] = A['5.56'],
+    [`WEAPON_MK18`] = A['5.56'],
+    [`WEAPON_SBR9`] = A['5.56'],
+    [`WEAPON_BERETTA1301`] = A['12ga'],
+    [`WEAPON_BROWNINGAUTO5`] = A['12ga'],
+    [`WEAPON_MINISHOTTY`] = A['12ga'],
+    [`WEAPON_MODEL680`] = A['12ga'],
+    [`WEAPON_MOSSBERG500`] = A['12ga'],
+    [`WEAPON_SHOCKWAVE`] = A['12ga'],
+    [`WEAPON_REMINGTON870`] = A['12ga'],
+    [`WEAPON_BARRETTM107A1`] = A['.50bmg'],
+    [`WEAPON_BARRETTM82A1`] = A['.50bmg'],
+    [`WEAPON_NEMOWATCHMAN`] = A['.300wm'],
+    [`WEAPON_REMINGTON700`] = A['7.62x51'],
+    [`WEAPON_REMINGTONM24`] = A['7.62x51'],
+    [`WEAPON_SAUER101`] = A['7.62x51'],
+    [`WEAPON_SIG550`] = A['5.56'],
+    [`WEAPON_VICTUSXMR`] = A['.50bmg'],
+    [`WEAPON_SWMODEL60`] = A['.38spl'],
+    [`WEAPON_SWMODEL10`] = A['.38spl'],
+    [`WEAPON_SWMODEL442`] = A['.38spl'],
+    [`WEAPON_SWMODEL642`] = A['.38spl'],
+    [`WEAPON_RUGERLCR`] = A['.38spl'],
+    [`WEAPON_TAURUS856`] = A['.38spl'],
+    [`WEAPON_DARTGUN`] = A['dart'],
+}
@@ -0,0 +1,339 @@
+--[[
+    AUTO-GENERATED by scripts/magazine_index_gen.py - DO NOT EDIT
+    ===============================================================
+
+    Inverted magazine/speedloader compatibility index for magazines.lua.
+    Regenerate after changing free-bullets/shared/*.lua:
+
+        python scripts/magazine_index_gen.py
+
+    Source hash: 550dfe71ed5a042a023b5adc50a200c9062e8406
+]]
+
+MagazineIndex = {}
+
+MagazineIndex.magazinesByWeapon = {
+    [`WEAPON_ARP_BUMPSTOCK`] = { mag_556_drum = true, mag_556_extended = true, mag_556_standard = true },
+    [`WEAPON_BARRETTM107A1`] = { mag_50bmg_barrett = true },
+    [`WEAPON_BARRETTM82A1`] = { mag_50bmg_barrett = true },
+    [`WEAPON_BLUEARP`] = { mag_bluearp_extended = true, mag_bluearp_standard = true },
+    [`WEAPON_DARTGUN`] = { mag_dart_standard = true },
+    [`WEAPON_FN502`] = { mag_fn502_standard = true },
+    [`WEAPON_FN509`] = { mag_fn509_extended = true, mag_fn509_standard = true },
+    [`WEAPON_G17`] = { mag_glock9_drum = true, mag_glock9_extended = true, mag_glock9_standard = true },
+    [`WEAPON_G17_BLK`] = { mag_glock9_drum = true, mag_glock9_extended = true, mag_glock9_standard = true },
+    [`WEAPON_G17_GEN5`] = { mag_glock9_drum = true, mag_glock9_extended = true, mag_glock9_standard = true },
+    [`WEAPON_G18`] = { mag_glock9_drum = true, mag_glock9_extended = true, mag_glock9_standard = true },
+    [`WEAPON_G19`] = { mag_glock9_drum = true, mag_glock9_extended = true, mag_glock9_standard = true },
+    [`WEAPON_G19X`] = { mag_glock9_drum = true, mag_glock9_extended = true, mag_glock9_standard = true },
+    [`WEAPON_G19XD`] = { mag_glock9_drum = true, mag_glock9_extended = true, mag_glock9_standard = true },
+    [`WEAPON_G19X_SWITCH`] = { mag_glock9_drum = true, mag_glock9_extended = true },
+    [`WEAPON_G21`] = { mag_glock45_extended = true, mag_glock45_standard = true },
+    [`WEAPON_G22_GEN4`] = { mag_glock40_extended = true, mag_glock40_standard = true },
+    [`WEAPON_G22_GEN5`] = { mag_glock40_extended = true, mag_glock40_standard = true },
+    [`WEAPON_G26`] = { mag_g26_extended = true, mag_g26_standard = true, mag_g26_stick = true },
+    [`WEAPON_G26_SWITCH`] = { mag_g26_stick = true },
+    [`WEAPON_G30`] = { mag_glock45_compact = true, mag_glock45_extended = true },
+    [`WEAPON_G41`] = { mag_glock45_extended = true, mag_glock45_standard = true },
+    [`WEAPON_G43X`] = { mag_g26_extended = true, mag_g26_standard = true, mag_g26_stick = true },
+    [`WEAPON_G45`] = { mag_glock9_drum = true, mag_glock9_extended = true, mag_glock9_standard = true },
+    [`WEAPON_G45_TAN`] = { mag_glock9_drum = true, mag_glock9_extended = true, mag_glock9_standard = true },
+    [`WEAPON_GLOCK20`] = { mag_10mm_extended = true, mag_10mm_standard = true },
+    [`WEAPON_GLOCK_DEMON`] = { mag_glock40_compact = true, mag_glock40_extended = true },
+    [`WEAPON_GX4`] = { mag_compact9_extended = true, mag_compact9_standard = true },
+    [`WEAPON_HELLCAT`] = { mag_compact9_extended = true, mag_compact9_standard = true },
+    [`WEAPON_JUNK1911`] = { mag_1911_standard = true },
+    [`WEAPON_KIMBER1911`] = { mag_1911_extended = true, mag_1911_standard = true },
+    [`WEAPON_KIMBER_ECLIPSE`] = { mag_1911_8rd = true, mag_1911_extended = true },
+    [`WEAPON_M45A1`] = { mag_1911_8rd = true, mag_1911_extended = true, mag_1911_standard = true },
+    [`WEAPON_M7`] = { mag_68x51_standard = true },
+    [`WEAPON_M9`] = { mag_beretta_extended = true, mag_beretta_standard = true },
+    [`WEAPON_M9A3`] = { mag_beretta_extended = true, mag_beretta_m9a3 = true },
+    [`WEAPON_MAC10`] = { mag_mac_extended = true, mag_mac_standard = true },
+    [`WEAPON_MAC4A1`] = { mag_mac_extended = true, mag_mac_standard = true },
+    [`WEAPON_MCX300`] = { mag_300blk_standard = true },
+    [`WEAPON_MICRO_MP5`] = { mag_mp5_standard = true },
+    [`WEAPON_MINI_AK47`] = { mag_762x39_extended = true, mag_762x39_standard = true },
+    [`WEAPON_MK18`] = { mag_556_drum = true, mag_556_extended = true, mag_556_standard = true },
+    [`WEAPON_MK47`] = { mag_762x39_drum = true, mag_762x39_extended = true, mag_762x39_standard = true },
+    [`WEAPON_MPA30`] = { mag_mpa30_standard = true },
+    [`WEAPON_NEMOWATCHMAN`] = { mag_300wm_standard = true },
+    [`WEAPON_P22`] = { mag_22_standard = true },
+    [`WEAPON_P320`] = { mag_sig_extended = true, mag_sig_standard = true },
+    [`WEAPON_PMR30`] = { mag_pmr30_standard = true },
+    [`WEAPON_PSADAGGER`] = { mag_psadagger_standard = true },
+    [`WEAPON_PX4`] = { mag_beretta_extended = true, mag_beretta_standard = true },
+    [`WEAPON_PX4STORM`] = { mag_beretta_extended = true, mag_beretta_standard = true },
+    [`WEAPON_RAM9_DESERT`] = { mag_ram9_standard = true },
+    [`WEAPON_RUGER57`] = { mag_57_extended = true, mag_57_standard = true },
+    [`WEAPON_RUGERSR9`] = { mag_rugersr9_standard = true },
+    [`WEAPON_SBR9`] = { mag_556_drum = true, mag_556_extended = true, mag_556_standard = true },
+    [`WEAPON_SCORPION`] = { mag_scorpion_drum = true, mag_scorpion_standard = true },
+    [`WEAPON_SIG550`] = { mag_sig550_extended = true, mag_sig550_standard = true },
+    [`WEAPON_SIGP210`] = { mag_sig_p210 = true },
+    [`WEAPON_SIGP22`] = { mag_22_standard = true },
+    [`WEAPON_SIGP220`] = { mag_sigp220_standard = true },
+    [`WEAPON_SIGP226`] = { mag_sig_extended = true, mag_sig_standard = true },
+    [`WEAPON_SIGP226ELITE`] = { mag_sig_extended = true, mag_sig_standard = true },
+    [`WEAPON_SIGP226MK25`] = { mag_sig_extended = true, mag_sig_standard = true },
+    [`WEAPON_SIGP229`] = { mag_sig_extended = true, mag_sig_standard = true },
+    [`WEAPON_SIG_MPX`] = { mag_mpx_standard = true },
+    [`WEAPON_SIG_SPEAR`] = { mag_68x51_standard = true },
+    [`WEAPON_SUB2000`] = { mag_sub2000_standard = true },
+    [`WEAPON_TEC9`] = { mag_tec9_standard = true },
+    [`WEAPON_TP9SF`] = { mag_tp9sf_standard = true },
+    [`WEAPON_UDP9`] = { mag_ar9_extended = true, mag_ar9_standard = true },
+    [`WEAPON_VICTUSXMR`] = { mag_50bmg_victus = true },
+    [`WEAPON_WALTHERP88`] = { mag_walther_standard = true },
+}
+
+MagazineIndex.speedloadersByWeapon = {
+    [`WEAPON_KINGCOBRA`] = { speedloader_357 = true },
+    [`WEAPON_KINGCOBRA_SNUB`] = { speedloader_357 = true },
+    [`WEAPON_KINGCOBRA_TARGET`] = { speedloader_357 = true },
+    [`WEAPON_PYTHON`] = { speedloader_357 = true },
+    [`WEAPON_RAGINGBULL`] = { speedloader_44 = true },
+    [`WEAPON_RUGERLCR`] = { speedloader_38_5rd = true },
+    [`WEAPON_SW500`] = { speedloader_500 = true },
+    [`WEAPON_SW657`] = { speedloader_357 = true },
+    [`WEAPON_SWMODEL10`] = { speedloader_38 = true },
+    [`WEAPON_SWMODEL29`] = { speedloader_44 = true },
+    [`WEAPON_SWMODEL442`] = { speedloader_38_5rd = true },
+    [`WEAPON_SWMODEL60`] = { speedloader_38_5rd = true },
+    [`WEAPON_SWMODEL642`] = { speedloader_38_5rd = true },
+    [`WEAPON_SW_MODEL15`] = { speedloader_38 = true },
+    [`WEAPON_TAURUS856`] = { speedloader_taurus856 = true },
+}
+
+-- Upper-cased weapon names (string lookups)
+MagazineIndex.magazinesByWeaponName = {
+    WEAPON_ARP_BUMPSTOCK = { mag_556_drum = true, mag_556_extended = true, mag_556_standard = true },
+    WEAPON_BARRETTM107A1 = { mag_50bmg_barrett = true },
+    WEAPON_BARRETTM82A1 = { mag_50bmg_barrett = true },
+    WEAPON_BLUEARP = { mag_bluearp_extended = true, mag_bluearp_standard = true },
+    WEAPON_DARTGUN = { mag_dart_standard = true },
+    WEAPON_FN502 = { mag_fn502_standard = true },
+    WEAPON_FN509 = { mag_fn509_extended = true, mag_fn509_standard = true },
+    WEAPON_FN57 = { mag_57_extended = true, mag_57_standard = true },
+    WEAPON_G17 = { mag_glock9_drum = true, mag_glock9_extended = true, mag_glock9_standard = true },
+    WEAPON_G17_BLK = { mag_glock9_drum = true, mag_glock9_extended = true, mag_glock9_standard = true },
+    WEAPON_G17_GEN5 = { mag_glock9_drum = true, mag_glock9_extended = true, mag_glock9_standard = true },
+    WEAPON_G18 = { mag_glock9_drum = true, mag_glock9_extended = true, mag_glock9_standard = true },
+    WEAPON_G19 = { mag_glock9_drum = true, mag_glock9_extended = true, mag_glock9_standard = true },
+    WEAPON_G19X = { mag_glock9_drum = true, mag_glock9_extended = true, mag_glock9_standard = true },
+    WEAPON_G19XD = { mag_glock9_drum = true, mag_glock9_extended = true, mag_glock9_standard = true },
+    WEAPON_G19X_SWITCH = { mag_glock9_drum = true, mag_glock9_extended = true },
+    WEAPON_G21 = { mag_glock45_extended = true, mag_glock45_standard = true },
+    WEAPON_G22_GEN4 = { mag_glock40_extended = true, mag_glock40_standard = true },
+    WEAPON_G22_GEN5 = { mag_glock40_extended = true, mag_glock40_standard = true },
+    WEAPON_G26 = { mag_g26_extended = true, mag_g26_standard = true, mag_g26_stick = true },
+    WEAPON_G26_SWITCH = { mag_g26_stick = true },
+    WEAPON_G30 = { mag_glock45_compact = true, mag_glock45_extended = true },
+    WEAPON_G41 = { mag_glock45_extended = true, mag_glock45_standard = true },
+    WEAPON_G43X = { mag_g26_extended = true, mag_g26_standard = true, mag_g26_stick = true },
+    WEAPON_G45 = { mag_glock9_drum = true, mag_glock9_extended = true, mag_glock9_standard = true },
+    WEAPON_G45_TAN = { mag_glock9_drum = true, mag_glock9_extended = true, mag_glock9_standard = true },
+    WEAPON_GLOCK20 = { mag_10mm_extended = true, mag_10mm_standard = true },
+    WEAPON_GLOCK_DEMON = { mag_glock40_compact = true, mag_glock40_extended = true },
+    WEAPON_GX4 = { mag_compact9_extended = true, mag_compact9_standard = true },
+    WEAPON_HELLCAT = { mag_compact9_extended = true, mag_compact9_standard = true },
+    WEAPON_JUNK1911 = { mag_1911_standard = true },
+    WEAPON_KIMBER1911 = { mag_1911_extended = true, mag_1911_standard = true },
+    WEAPON_KIMBER_ECLIPSE = { mag_1911_8rd = true, mag_1911_extended = true },
+    WEAPON_M45A1 = { mag_1911_8rd = true, mag_1911_extended = true, mag_1911_standard = true },
+    WEAPON_M7 = { mag_68x51_standard = true },
+    WEAPON_M9 = { mag_beretta_extended = true, mag_beretta_standard = true },
+    WEAPON_M9A3 = { mag_beretta_extended = true, mag_beretta_m9a3 = true },
+    WEAPON_MAC10 = { mag_mac_extended = true, mag_mac_standard = true },
+    WEAPON_MAC4A1 = { mag_mac_extended = true, mag_mac_standard = true },
+    WEAPON_MCX300 = { mag_300blk_standard = true },
+    WEAPON_MICRO_MP5 = { mag_mp5_standard = true },
+    WEAPON_MINI_AK47 = { mag_762x39_extended = true, mag_762x39_standard = true },
+    WEAPON_MK18 = { mag_556_drum = true, mag_556_extended = true, mag_556_standard = true },
+    WEAPON_MK47 = { mag_762x39_drum = true, mag_762x39_extended = true, mag_762x39_standard = true },
+    WEAPON_MPA30 = { mag_mpa30_standard = true },
+    WEAPON_NEMOWATCHMAN = { mag_300wm_standard = true },
+    WEAPON_P22 = { mag_22_standard = true },
+    WEAPON_P320 = { mag_sig_extended = true, mag_sig_standard = true },
+    WEAPON_PMR30 = { mag_pmr30_standard = true },
+    WEAPON_PSADAGGER = { mag_psadagger_standard = true },
+    WEAPON_PX4 = { mag_beretta_extended = true, mag_beretta_standard = true },
+    WEAPON_PX4STORM = { mag_beretta_extended = true, mag_beretta_standard = true },
+    WEAPON_RAM9_DESERT = { mag_ram9_standard = true },
+    WEAPON_RUGER57 = { mag_57_extended = true, mag_57_standard = true },
+    WEAPON_RUGERSR9 = { mag_rugersr9_standard = true },
+    WEAPON_SBR9 = { mag_556_drum = true, mag_556_extended = true, mag_556_standard = true },
+    WEAPON_SCORPION = { mag_scorpion_drum = true, mag_scorpion_standard = true },
+    WEAPON_SIG550 = { mag_sig550_extended = true, mag_sig550_standard = true },
+    WEAPON_SIGP210 = { mag_sig_p210 = true },
+    WEAPON_SIGP22 = { mag_22_standard = true },
+    WEAPON_SIGP220 = { mag_sigp220_standard = true },
+    WEAPON_SIGP226 = { mag_sig_extended = true, mag_sig_standard = true },
+    WEAPON_SIGP226ELITE = { mag_sig_extended = true, mag_sig_standard = true },
+    WEAPON_SIGP226MK25 = { mag_sig_extended = true, mag_sig_standard = true },
+    WEAPON_SIGP229 = { mag_sig_extended = true, mag_sig_standard = true },
+    WEAPON_SIGP320 = { mag_sig_extended = true, mag_sig_standard = true },
+    WEAPON_SIG_MPX = { mag_mpx_standard = true },
+    WEAPON_SIG_SPEAR = { mag_68x51_standard = true },
+    WEAPON_SUB2000 = { mag_sub2000_standard = true },
+    WEAPON_TEC9 = { mag_tec9_standard = true },
+    WEAPON_TP9SF = { mag_tp9sf_standard = true },
+    WEAPON_UDP9 = { mag_ar9_extended = true, mag_ar9_standard = true },
+    WEAPON_VICTUSXMR = { mag_50bmg_victus = true },
+    WEAPON_WALTHERP88 = { mag_walther_standard = true },
+}
+
+MagazineIndex.speedloadersByWeaponName = {
+    WEAPON_KINGCOBRA = { speedloader_357 = true },
+    WEAPON_KINGCOBRA_SNUB = { speedloader_357 = true },
+    WEAPON_KINGCOBRA_TARGET = { speedloader_357 = true },
+    WEAPON_PYTHON = { speedloader_357 = true },
+    WEAPON_RAGINGBULL = { speedloader_44 = true },
+    WEAPON_RUGERLCR = { speedloader_38_5rd = true },
+    WEAPON_SW500 = { speedloader_500 = true },
+    WEAPON_SW657 = { speedloader_357 = true },
+    WEAPON_SWMODEL10 = { speedloader_38 = true },
+    WEAPON_SWMODEL29 = { speedloader_44 = true },
+    WEAPON_SWMODEL442 = { speedloader_38_5rd = true },
+    WEAPON_SWMODEL60 = { speedloader_38_5rd = true },
+    WEAPON_SWMODEL642 = { speedloader_38_5rd = true },
+    WEAPON_SW_MODEL15 = { speedloader_38 = true },
+    WEAPON_TAURUS856 = { speedloader_taurus856 = true },
+}
+
+MagazineIndex.weaponsByMagazine = {
+    mag_10mm_extended = { [`WEAPON_GLOCK20`] = true },
+    mag_10mm_standard = { [`WEAPON_GLOCK20`] = true },
+    mag_1911_8rd = { [`WEAPON_KIMBER_ECLIPSE`] = true, [`WEAPON_M45A1`] = true },
+    mag_1911_extended = { [`WEAPON_KIMBER1911`] = true, [`WEAPON_KIMBER_ECLIPSE`] = true, [`WEAPON_M45A1`] = true },
+    mag_1911_standard = { [`WEAPON_JUNK1911`] = true, [`WEAPON_KIMBER1911`] = true, [`WEAPON_M45A1`] = true },
+    mag_22_standard = { [`WEAPON_P22`] = true, [`WEAPON_SIGP22`] = true },
+    mag_300blk_standard = { [`WEAPON_MCX300`] = true },
+    mag_300wm_standard = { [`WEAPON_NEMOWATCHMAN`] = true },
+    mag_50bmg_barrett = { [`WEAPON_BARRETTM107A1`] = true, [`WEAPON_BARRETTM82A1`] = true },
+    mag_50bmg_victus = { [`WEAPON_VICTUSXMR`] = true },
+    mag_556_drum = { [`WEAPON_ARP_BUMPSTOCK`] = true, [`WEAPON_MK18`] = true, [`WEAPON_SBR9`] = true },
+    mag_556_extended = { [`WEAPON_ARP_BUMPSTOCK`] = true, [`WEAPON_MK18`] = true, [`WEAPON_SBR9`] = true },
+    mag_556_standard = { [`WEAPON_ARP_BUMPSTOCK`] = true, [`WEAPON_MK18`] = true, [`WEAPON_SBR9`] = true },
+    mag_57_extended = { [`WEAPON_RUGER57`] = true },
+    mag_57_standard = { [`WEAPON_RUGER57`] = true },
+    mag_68x51_standard = { [`WEAPON_M7`] = true, [`WEAPON_SIG_SPEAR`] = true },
+    mag_762x39_drum = { [`WEAPON_MK47`] = true },
+    mag_762x39_extended = { [`WEAPON_MINI_AK47`] = true, [`WEAPON_MK47`] = true },
+    mag_762x39_standard = { [`WEAPON_MINI_AK47`] = true, [`WEAPON_MK47`] = true },
+    mag_ar9_extended = { [`WEAPON_UDP9`] = true },
+    mag_ar9_standard = { [`WEAPON_UDP9`] = true },
+    mag_beretta_extended = {
+        [`WEAPON_M9`] = true,
+        [`WEAPON_M9A3`] = true,
+        [`WEAPON_PX4`] = true,
+        [`WEAPON_PX4STORM`] = true,
+    },
+    mag_beretta_m9a3 = { [`WEAPON_M9A3`] = true },
+    mag_beretta_standard = { [`WEAPON_M9`] = true, [`WEAPON_PX4`] = true, [`WEAPON_PX4STORM`] = true },
+    mag_bluearp_extended = { [`WEAPON_BLUEARP`] = true },
+    mag_bluearp_standard = { [`WEAPON_BLUEARP`] = true },
+    mag_compact9_extended = { [`WEAPON_GX4`] = true, [`WEAPON_HELLCAT`] = true },
+    mag_compact9_standard = { [`WEAPON_GX4`] = true, [`WEAPON_HELLCAT`] = true },
+    mag_dart_standard = { [`WEAPON_DARTGUN`] = true },
+    mag_fn502_standard = { [`WEAPON_FN502`] = true },
+    mag_fn509_extended = { [`WEAPON_FN509`] = true },
+    mag_fn509_standard = { [`WEAPON_FN509`] = true },
+    mag_g26_extended = { [`WEAPON_G26`] = true, [`WEAPON_G43X`] = true },
+    mag_g26_standard = { [`WEAPON_G26`] = true, [`WEAPON_G43X`] = true },
+    mag_g26_stick = { [`WEAPON_G26`] = true, [`WEAPON_G26_SWITCH`] = true, [`WEAPON_G43X`] = true },
+    mag_glock40_compact = { [`WEAPON_GLOCK_DEMON`] = true },
+    mag_glock40_extended = { [`WEAPON_G22_GEN4`] = true, [`WEAPON_G22_GEN5`] = true, [`WEAPON_GLOCK_DEMON`] = true },
+    mag_glock40_standard = { [`WEAPON_G22_GEN4`] = true, [`WEAPON_G22_GEN5`] = true },
+    mag_glock45_compact = { [`WEAPON_G30`] = true },
+    mag_glock45_extended = { [`WEAPON_G21`] = true, [`WEAPON_G30`] = true, [`WEAPON_G41`] = true },
+    mag_glock45_standard = { [`WEAPON_G21`] = true, [`WEAPON_G41`] = true },
+    mag_glock9_drum = {
+        [`WEAPON_G17`] = true,
+        [`WEAPON_G17_BLK`] = true,
+        [`WEAPON_G17_GEN5`] = true,
+        [`WEAPON_G18`] = true,
+        [`WEAPON_G19`] = true,
+        [`WEAPON_G19X`] = true,
+        [`WEAPON_G19XD`] = true,
+        [`WEAPON_G19X_SWITCH`] = true,
+        [`WEAPON_G45`] = true,
+        [`WEAPON_G45_TAN`] = true,
+    },
+    mag_glock9_extended = {
+        [`WEAPON_G17`] = true,
+        [`WEAPON_G17_BLK`] = true,
+        [`WEAPON_G17_GEN5`] = true,
+        [`WEAPON_G18`] = true,
+        [`WEAPON_G19`] = true,
+        [`WEAPON_G19X`] = true,
+        [`WEAPON_G19XD`] = true,
+        [`WEAPON_G19X_SWITCH`] = true,
+        [`WEAPON_G45`] = true,
+        [`WEAPON_G45_TAN`] = true,
+    },
+    mag_glock9_standard = {
+        [`WEAPON_G17`] = true,
+        [`WEAPON_G17_BLK`] = true,
+        [`WEAPON_G17_GEN5`] = true,
+        [`WEAPON_G18`] = true,
+        [`WEAPON_G19`] = true,
+        [`WEAPON_G19X`] = true,
+        [`WEAPON_G19XD`] = true,
+        [`WEAPON_G45`] = true,
+        [`WEAPON_G45_TAN`] = true,
+    },
+    mag_mac_extended = { [`WEAPON_MAC10`] = true, [`WEAPON_MAC4A1`] = true },
+    mag_mac_standard = { [`WEAPON_MAC10`] = true, [`WEAPON_MAC4A1`] = true },
+    mag_mp5_standard = { [`WEAPON_MICRO_MP5`] = true },
+    mag_mpa30_standard = { [`WEAPON_MPA30`] = true },
+    mag_mpx_standard = { [`WEAPON_SIG_MPX`] = true },
+    mag_pmr30_standard = { [`WEAPON_PMR30`] = true },
+    mag_psadagger_standard = { [`WEAPON_PSADAGGER`] = true },
+    mag_ram9_standard = { [`WEAPON_RAM9_DESERT`] = true },
+    mag_rugersr9_standard = { [`WEAPON_RUGERSR9`] = true },
+    mag_scorpion_drum = { [`WEAPON_SCORPION`] = true },
+    mag_scorpion_standard = { [`WEAPON_SCORPION`] = true },
+    mag_sig550_extended = { [`WEAPON_SIG550`] = true },
+    mag_sig550_standard = { [`WEAPON_SIG550`] = true },
+    mag_sig_extended = {
+        [`WEAPON_P320`] = true,
+        [`WEAPON_SIGP226`] = true,
+        [`WEAPON_SIGP226ELITE`] = true,
+        [`WEAPON_SIGP226MK25`] = true,
+        [`WEAPON_SIGP229`] = true,
+    },
+    mag_sig_p210 = { [`WEAPON_SIGP210`] = true },
+    mag_sig_standard = {
+        [`WEAPON_P320`] = true,
+        [`WEAPON_SIGP226`] = true,
+        [`WEAPON_SIGP226ELITE`] = true,
+        [`WEAPON_SIGP226MK25`] = true,
+        [`WEAPON_SIGP229`] = true,
+    },
+    mag_sigp220_standard = { [`WEAPON_SIGP220`] = true },
+    mag_sub2000_standard = { [`WEAPON_SUB2000`] = true },
+    mag_tec9_standard = { [`WEAPON_TEC9`] = true },
+    mag_tp9sf_standard = { [`WEAPON_TP9SF`] = true },
+    mag_walther_standard = { [`WEAPON_WALTHERP88`] = true },
+}
+
+MagazineIndex.weaponsBySpeedloader = {
+    speedloader_357 = {
+        [`WEAPON_KINGCOBRA`] = true,
+        [`WEAPON_KINGCOBRA_SNUB`] = true,
+        [`WEAPON_KINGCOBRA_TARGET`] = true,
+        [`WEAPON_PYTHON`] = true,
+        [`WEAPON_SW657`] = true,
+    },
+    speedloader_38 = { [`WEAPON_SWMODEL10`] = true, [`WEAPON_SW_MODEL15`] = true },
+    speedloader_38_5rd = {
+        [`WEAPON_RUGERLCR`] = true,
+        [`WEAPON_SWMODEL442`] = true,
+        [`WEAPON_SWMODEL60`] = true,
+        [`WEAPON_SWMODEL642`] = true,
+    },
+    speedloader_44 = { [`WEAPON_RAGINGBULL`] = true, [`WEAPON_SWMODEL29`] = true },
+    speedloader_500 = { [`WEAPON_SW500`] = true },
+    speedloader_taurus856 = { [`WEAPON_TAURUS856`] = true },
+}
@@ -946,9 +946,32 @@ function GetSpeedloaderInfo(itemName)
     return Config.Speedloaders[itemName]
 end
 
+--- Indexed compatible items for a weapon (shared/magazine_index.lua, generated
+-- by scripts/magazine_index_gen.py). Returns nil when the index isn't loaded.
+-- @param byHash table Index keyed by weapon hash
+-- @param byName table Index keyed by upper-cased weapon name
+-- @param weaponHash number|string Weapon hash or name
+-- @return table|nil { [itemName] = true }
+local function GetIndexedItems(byHash, byName, weaponHash)
+    if not MagazineIndex then return nil end
+
+    if type(weaponHash) == 'number' then
+        return MagazineIndex[byHash][weaponHash] or {}
+    end
+    return MagazineIndex[byName][string.upper(tostring(weaponHash))] or {}
+end
+
 function GetCompatibleMagazines(weaponHash)
     local compatible = {}
 
+    local indexed = GetIndexedItems('magazinesByWeapon', 'magazinesByWeaponName', weaponHash)
+    if indexed then
+        for magName in pairs(indexed) do
+            compatible[magName] = Config.Magazines[magName]
+        end
+        return compatible
+    end
+
     for magName, magInfo in pairs(Config.Magazines) do
         if IsMagazineCompatible(weaponHash, magName) then
             compatible[magName] = magInfo
@@ -962,6 +985,11 @@ function IsMagazineCompatible(weaponHash, magazineItem)
     local magInfo = Config.Magazines[magazineItem]
     if not magInfo then return false end
 
+    local indexed = GetIndexedItems('magazinesByWeapon', 'magazinesByWeaponName', weaponHash)
+    if indexed then
+        return indexed[magazineItem] == true
+    end
+
     local weapons = type(magInfo.weapons) == 'table' and magInfo.weapons or { magInfo.weapons }
 
     if type(weaponHash) == 'number' then
@@ -999,6 +1027,11 @@ function IsSpeedloaderCompatible(weaponHash, speedloaderItem)
     local slInfo = Config.Speedloaders[speedloaderItem]
     if not slInfo then return false end
 
+    local indexed = GetIndexedItems('speedloadersByWeapon', 'speedloadersByWeaponName', weaponHash)
+    if indexed then
+        return indexed[speedloaderItem] == true
+    end
+
     local weapons = type(slInfo.weapons) == 'table' and slInfo.weapons or { slInfo.weapons }
 
     if type(weaponHash) == 'number' then
@@ -1022,6 +1055,15 @@ end
 
 function GetCompatibleSpeedloaders(weaponHash)
     local compatible = {}
+
+    local indexed = GetIndexedItems('speedloadersByWeapon', 'speedloadersByWeaponName', weaponHash)
+    if indexed then
+        for slName in pairs(indexed) do
+            compatible[slName] = Config.Speedloaders[slName]
+        end
+        return compatible
+    end
+
     for slName, slInfo in pairs(Config.Speedloaders) do
         if IsSpeedloaderCompatible(weaponHash, slName) then
             compatible[slName] = slInfo
@@ -10,13 +10,62 @@
         componentBase = 'COMPONENT_X', -- Base name for components (suffix added)
         clipSize = 17,                 -- Standard magazine capacity
     }
+
+    Config.Weapons is generated from scripts/weapon_registry.json:
+        python scripts/weapon_registry.py --write-lua
 ]]
 
 Config.Weapons = {
+    -- ======================================================================
+    -- BATCH 1: COMPACT 9mm PISTOLS
+    -- ======================================================================
+
+    -- Glock 26 Gen 5 (10 rounds)
+    [`WEAPON_G26`] = {
+        caliber = '9mm',
+        componentBase = 'COMPONENT_G26',
+        clipSize = 10,
+    },
+
+    -- Glock 26 with Switch (33 rounds, full-auto)
+    [`WEAPON_G26_SWITCH`] = {
+        caliber = '9mm',
+        componentBase = 'COMPONENT_G26_SWITCH',
+        clipSize = 33,
+    },
+
+    -- Glock 43X (10 rounds)
+    [`WEAPON_G43X`] = {
+        caliber = '9mm',
+        componentBase = 'COMPONENT_G43X',
+        clipSize = 10,
+    },
+
+    -- Taurus GX4 (11 rounds)
+    [`WEAPON_GX4`] = {
+        caliber = '9mm',
+        componentBase = 'COMPONENT_GX4',
+        clipSize = 11,
+    },
+
+    -- Springfield Hellcat (11 rounds)
+    [`WEAPON_HELLCAT`] = {
+        caliber = '9mm',
+        componentBase = 'COMPONENT_HELLCAT',
+        clipSize = 11,
+    },
+
     -- ======================================================================
     -- BATCH 2: FULL-SIZE 9mm PISTOLS
     -- ======================================================================
 
+    -- FN 509 (17 rounds)
+    [`WEAPON_FN509`] = {
+        caliber = '9mm',
+        componentBase = 'COMPONENT_FN509',
+        clipSize = 17,
+    },
+
     -- Glock 17 Gen 4 (17 rounds)
     [`WEAPON_G17`] = {
         caliber = '9mm',
@@ -94,17 +143,17 @@ Config.Weapons = {
         clipSize = 17,
     },
 
-    -- Beretta PX4 Storm (17 rounds)
-    [`WEAPON_PX4`] = {
+    -- SIG Sauer P320 (17 rounds)
+    [`WEAPON_P320`] = {
         caliber = '9mm',
-        componentBase = 'COMPONENT_PX4',
+        componentBase = 'COMPONENT_P320',
         clipSize = 17,
     },
 
-    -- SIG Sauer P320 (17 rounds)
-    [`WEAPON_P320`] = {
+    -- Beretta PX4 Storm (17 rounds)
+    [`WEAPON_PX4`] = {
         caliber = '9mm',
-        componentBase = 'COMPONENT_P320',
+        componentBase = 'COMPONENT_PX4',
         clipSize = 17,
     },
 
@@ -115,71 +164,10 @@ Config.Weapons = {
         clipSize = 18,
     },
 
-    -- FN 509 (17 rounds)
-    [`WEAPON_FN509`] = {
-        caliber = '9mm',
-        componentBase = 'COMPONENT_FN509',
-        clipSize = 17,
-    },
-
-    -- Walther P88 - Premium German 9mm (16 rounds, 4.0" barrel)
-    -- Best accuracy of any 9mm, heavy frame absorbs recoil
-    [`WEAPON_WALTHERP88`] = {
-        caliber = '9mm',
-        componentBase = 'COMPONENT_WALTHERP88',
-        clipSize = 16,
-    },
-
-    -- ======================================================================
-    -- BATCH 1: COMPACT 9mm PISTOLS
-    -- ======================================================================
-
-    -- Glock 26 Gen 5 (10 rounds)
-    [`WEAPON_G26`] = {
-        caliber = '9mm',
-        componentBase = 'COMPONENT_G26',
-        clipSize = 10,
-    },
-
-    -- Glock 26 with Switch (33 rounds, full-auto)
-    [`WEAPON_G26_SWITCH`] = {
-        caliber = '9mm',
-        componentBase = 'COMPONENT_G26_SWITCH',
-        clipSize = 33,
-    },
-
-    -- Glock 43X (10 rounds)
-    [`WEAPON_G43X`] = {
-        caliber = '9mm',
-        componentBase = 'COMPONENT_G43X',
-        clipSize = 10,
-    },
-
-    -- Taurus GX4 (11 rounds)
-    [`WEAPON_GX4`] = {
-        caliber = '9mm',
-        componentBase = 'COMPONENT_GX4',
-        clipSize = 11,
-    },
-
-    -- Springfield Hellcat (11 rounds)
-    [`WEAPON_HELLCAT`] = {
-        caliber = '9mm',
-        componentBase = 'COMPONENT_HELLCAT',
-        clipSize = 11,
-    },
-
     -- ======================================================================
     -- BATCH 3: .45 ACP PISTOLS
     -- ======================================================================
 
-    -- Colt M45A1 CQBP - Military 1911 (8 rounds)
-    [`WEAPON_M45A1`] = {
-        caliber = '.45acp',
-        componentBase = 'COMPONENT_M45A1',
-        clipSize = 8,
-    },
-
     -- Glock 21 Gen 4 - Full-Size .45 (13 rounds)
     [`WEAPON_G21`] = {
         caliber = '.45acp',
@@ -201,6 +189,13 @@ Config.Weapons = {
         clipSize = 13,
     },
 
+    -- Junk 1911 - Degraded .45 (7 rounds)
+    [`WEAPON_JUNK1911`] = {
+        caliber = '.45acp',
+        componentBase = 'COMPONENT_JUNK1911',
+        clipSize = 7,
+    },
+
     -- Kimber Custom II 1911 - Premium .45 (7 rounds)
     [`WEAPON_KIMBER1911`] = {
         caliber = '.45acp',
@@ -215,17 +210,10 @@ Config.Weapons = {
         clipSize = 8,
     },
 
-    -- Junk 1911 - Degraded .45 (7 rounds)
-    [`WEAPON_JUNK1911`] = {
-        caliber = '.45acp',
-        componentBase = 'COMPONENT_JUNK1911',
-        clipSize = 7,
-    },
-
-    -- SIG Sauer P220 - Classic .45 ACP (8 rounds, 4.4" barrel)
-    [`WEAPON_SIGP220`] = {
+    -- Colt M45A1 CQBP - Military 1911 (8 rounds)
+    [`WEAPON_M45A1`] = {
         caliber = '.45acp',
-        componentBase = 'COMPONENT_SIGP220',
+        componentBase = 'COMPONENT_M45A1',
         clipSize = 8,
     },
 
@@ -297,13 +285,6 @@ Config.Weapons = {
     -- BATCH 6: .44 MAGNUM & .500 S&W MAGNUM REVOLVERS
     -- ======================================================================
 
-    -- S&W Model 29 "Dirty Harry" - .44 Magnum (6 rounds, 6.5" barrel)
-    [`WEAPON_SWMODEL29`] = {
-        caliber = '.44mag',
-        componentBase = 'COMPONENT_SWMODEL29',
-        clipSize = 6,
-    },
-
     -- Taurus Raging Bull - .44 Magnum Ported (6 rounds, 6.5" barrel)
     -- Factory porting reduces recoil, slightly lower velocity
     [`WEAPON_RAGINGBULL`] = {
@@ -312,6 +293,14 @@ Config.Weapons = {
         clipSize = 6,
     },
 
+    -- S&W Model 500 - .500 S&W Magnum (5 rounds, 6.5" barrel)
+    -- THE MOST POWERFUL PRODUCTION REVOLVER - rifle-equivalent energy
+    [`WEAPON_SW500`] = {
+        caliber = '.500sw',
+        componentBase = 'COMPONENT_SW500',
+        clipSize = 5,
+    },
+
     -- S&W 657 - .41 Magnum (uses .357 ammo, 6 rounds, 6" barrel)
     -- The "forgotten magnum" - .41 Mag ballistics, .357 Mag ammo system
     [`WEAPON_SW657`] = {
@@ -320,12 +309,11 @@ Config.Weapons = {
         clipSize = 6,
     },
 
-    -- S&W Model 500 - .500 S&W Magnum (5 rounds, 6.5" barrel)
-    -- THE MOST POWERFUL PRODUCTION REVOLVER - rifle-equivalent energy
-    [`WEAPON_SW500`] = {
-        caliber = '.500sw',
-        componentBase = 'COMPONENT_SW500',
-        clipSize = 5,
+    -- S&W Model 29 "Dirty Harry" - .44 Magnum (6 rounds, 6.5" barrel)
+    [`WEAPON_SWMODEL29`] = {
+        caliber = '.44mag',
+        componentBase = 'COMPONENT_SWMODEL29',
+        clipSize = 6,
     },
 
     -- ======================================================================
@@ -354,6 +342,14 @@ Config.Weapons = {
     -- Compensated by: Minimal recoil, high capacity, high headshot multipliers
     -- ======================================================================
 
+    -- FN 502 Tactical - Premium Precision (15 rounds, 4.6" barrel)
+    -- Best accuracy in .22 LR, optics-ready, threaded barrel
+    [`WEAPON_FN502`] = {
+        caliber = '.22lr',
+        componentBase = 'COMPONENT_FN502',
+        clipSize = 15,
+    },
+
     -- Walther P22 Standard - Budget Trainer (10 rounds, 3.42" barrel)
     -- DA/SA operation, zinc slide, entry-level rimfire
     [`WEAPON_P22`] = {
@@ -362,6 +358,14 @@ Config.Weapons = {
         clipSize = 10,
     },
 
+    -- Kel-Tec PMR-30 - High-Capacity Magnum (30 rounds, 4.3" barrel)
+    -- .22 WMR ballistics (160 ft-lbs), ultra-light, significant muzzle flash
+    [`WEAPON_PMR30`] = {
+        caliber = '.22lr',
+        componentBase = 'COMPONENT_PMR30',
+        clipSize = 30,
+    },
+
     -- SIG P22 (Walther P22 Budget) - Entry Trainer (10 rounds, 3.42" barrel)
     -- Budget variant with slightly lower performance
     [`WEAPON_SIGP22`] = {
@@ -370,45 +374,72 @@ Config.Weapons = {
         clipSize = 10,
     },
 
-    -- FN 502 Tactical - Premium Precision (15 rounds, 4.6" barrel)
-    -- Best accuracy in .22 LR, optics-ready, threaded barrel
-    [`WEAPON_FN502`] = {
-        caliber = '.22lr',
-        componentBase = 'COMPONENT_FN502',
-        clipSize = 15,
+    -- ======================================================================
+    -- BATCH 9: POCKET PISTOLS
+    -- ======================================================================
+
+    -- Walther P88 - Premium German 9mm (16 rounds, 4.0" barrel)
+    -- Best accuracy of any 9mm, heavy frame absorbs recoil
+    [`WEAPON_WALTHERP88`] = {
+        caliber = '9mm',
+        componentBase = 'COMPONENT_WALTHERP88',
+        clipSize = 16,
     },
 
-    -- Kel-Tec PMR-30 - High-Capacity Magnum (30 rounds, 4.3" barrel)
-    -- .22 WMR ballistics (160 ft-lbs), ultra-light, significant muzzle flash
-    [`WEAPON_PMR30`] = {
-        caliber = '.22lr',
-        componentBase = 'COMPONENT_PMR30',
-        clipSize = 30,
+    -- ======================================================================
+    -- BATCH 10: HIGH-POWER & FULL-AUTO PISTOLS
+    -- 10mm AUTO: FBI-spec (~400 ft-lbs) vs Full-power (~650 ft-lbs)
+    -- Glock 18: Factory select-fire 9mm machine pistol
+    -- ======================================================================
+
+    -- Glock 20 Gen 4 - Full-Size 10mm (15+1 rounds, 4.61" barrel)
+    -- .357 Magnum energy with semi-auto capacity and reload speed
+    [`WEAPON_GLOCK20`] = {
+        caliber = '10mm',
+        componentBase = 'COMPONENT_GLOCK20',
+        clipSize = 16,
+    },
+
+    -- Glock 18 Gen 4 - Select-Fire Machine Pistol (17+1 rounds, 4.49" barrel)
+    -- FACTORY FULL-AUTO: 1,100-1,200 RPM, extreme recoil without stock
+    -- Only Glock with factory select-fire capability (semi/full-auto switch)
+    -- Compensated slide reduces muzzle rise, 33rd stick mag recommended
+    [`WEAPON_G18`] = {
+        caliber = '9mm',
+        componentBase = 'COMPONENT_G18',
+        clipSize = 18,
     },
 
     -- ======================================================================
     -- BATCH 11: MISC FULL-SIZE 9mm & AR-9 PLATFORMS
     -- ======================================================================
 
-    -- SIG Sauer P226 - Classic Combat Pistol (15 rounds, 4.4" barrel)
-    [`WEAPON_SIGP226`] = {
+    -- Blue ARP - Budget .300 BLK AR Pistol (10 rounds, 4-5" barrel)
+    [`WEAPON_BLUEARP`] = {
+        caliber = '.300blk',
+        componentBase = 'COMPONENT_BLUEARP',
+        clipSize = 10,
+    },
+
+    -- PSA Dagger - Budget Glock Clone (15 rounds, 3.9" barrel)
+    [`WEAPON_PSADAGGER`] = {
         caliber = '9mm',
-        componentBase = 'COMPONENT_SIGP226',
+        componentBase = 'COMPONENT_PSADAGGER',
         clipSize = 15,
     },
 
-    -- SIG Sauer P226 MK25 - Navy SEAL Sidearm (15 rounds, 4.4" barrel)
-    [`WEAPON_SIGP226MK25`] = {
+    -- Beretta PX4 Storm (Batch 11) - Rotating Barrel (17 rounds, 4.0" barrel)
+    [`WEAPON_PX4STORM`] = {
         caliber = '9mm',
-        componentBase = 'COMPONENT_SIGP226MK25',
-        clipSize = 15,
+        componentBase = 'COMPONENT_PX4STORM',
+        clipSize = 17,
     },
 
-    -- SIG Sauer P226 Elite - Enhanced Target Model (15 rounds, 4.4" barrel)
-    [`WEAPON_SIGP226ELITE`] = {
+    -- Ruger SR9 - Slim-Grip Striker-Fired (17 rounds, 4.14" barrel)
+    [`WEAPON_RUGERSR9`] = {
         caliber = '9mm',
-        componentBase = 'COMPONENT_SIGP226ELITE',
-        clipSize = 15,
+        componentBase = 'COMPONENT_RUGERSR9',
+        clipSize = 17,
     },
 
     -- SIG Sauer P210 Target - Swiss Precision (8 rounds, 5.0" barrel)
@@ -418,38 +449,45 @@ Config.Weapons = {
         clipSize = 8,
     },
 
-    -- SIG Sauer P229 - Compact Federal Agency (15 rounds, 3.9" barrel)
-    [`WEAPON_SIGP229`] = {
+    -- SIG Sauer P220 - Classic .45 ACP (8 rounds, 4.4" barrel)
+    [`WEAPON_SIGP220`] = {
+        caliber = '.45acp',
+        componentBase = 'COMPONENT_SIGP220',
+        clipSize = 8,
+    },
+
+    -- SIG Sauer P226 - Classic Combat Pistol (15 rounds, 4.4" barrel)
+    [`WEAPON_SIGP226`] = {
         caliber = '9mm',
-        componentBase = 'COMPONENT_SIGP229',
+        componentBase = 'COMPONENT_SIGP226',
         clipSize = 15,
     },
 
-    -- SIG Sauer P320 (Batch 11) - Modular Military (17 rounds, 4.7" barrel)
-    [`WEAPON_SIGP320`] = {
+    -- SIG Sauer P226 Elite - Enhanced Target Model (15 rounds, 4.4" barrel)
+    [`WEAPON_SIGP226ELITE`] = {
         caliber = '9mm',
-        componentBase = 'COMPONENT_SIGP320_B11',
-        clipSize = 17,
+        componentBase = 'COMPONENT_SIGP226ELITE',
+        clipSize = 15,
     },
 
-    -- Beretta PX4 Storm (Batch 11) - Rotating Barrel (17 rounds, 4.0" barrel)
-    [`WEAPON_PX4STORM`] = {
+    -- SIG Sauer P226 MK25 - Navy SEAL Sidearm (15 rounds, 4.4" barrel)
+    [`WEAPON_SIGP226MK25`] = {
         caliber = '9mm',
-        componentBase = 'COMPONENT_PX4STORM',
-        clipSize = 17,
+        componentBase = 'COMPONENT_SIGP226MK25',
+        clipSize = 15,
     },
 
-    -- PSA Dagger - Budget Glock Clone (15 rounds, 3.9" barrel)
-    [`WEAPON_PSADAGGER`] = {
+    -- SIG Sauer P229 - Compact Federal Agency (15 rounds, 3.9" barrel)
+    [`WEAPON_SIGP229`] = {
         caliber = '9mm',
-        componentBase = 'COMPONENT_PSADAGGER',
+        componentBase = 'COMPONENT_SIGP229',
         clipSize = 15,
     },
 
-    -- Ruger SR9 - Slim-Grip Striker-Fired (17 rounds, 4.14" barrel)
-    [`WEAPON_RUGERSR9`] = {
+    -- SIG Sauer P320 (Batch 11) - Modular Military (17 rounds, 4.7" barrel)
+    [`WEAPON_SIGP320`] = {
         caliber = '9mm',
-        componentBase = 'COMPONENT_RUGERSR9',
+        componentBase = 'COMPONENT_SIGP320_B11',
         clipSize = 17,
     },
 
@@ -460,48 +498,34 @@ Config.Weapons = {
         clipSize = 17,
     },
 
-    -- Blue ARP - Budget .300 BLK AR Pistol (10 rounds, 4-5" barrel)
-    [`WEAPON_BLUEARP`] = {
-        caliber = '.300blk',
-        componentBase = 'COMPONENT_BLUEARP',
-        clipSize = 10,
-    },
-
     -- ======================================================================
-    -- BATCH 10: HIGH-POWER & FULL-AUTO PISTOLS
-    -- 10mm AUTO: FBI-spec (~400 ft-lbs) vs Full-power (~650 ft-lbs)
-    -- Glock 18: Factory select-fire 9mm machine pistol
+    -- BATCH 13: 7.62x39mm AK-PLATFORM RIFLES
+    -- Soviet intermediate cartridge: +14% damage vs 5.56 NATO
+    -- Superior short-barrel performance, excellent barrier penetration
     -- ======================================================================
 
-    -- Glock 20 Gen 4 - Full-Size 10mm (15+1 rounds, 4.61" barrel)
-    -- .357 Magnum energy with semi-auto capacity and reload speed
-    [`WEAPON_GLOCK20`] = {
-        caliber = '10mm',
-        componentBase = 'COMPONENT_GLOCK20',
-        clipSize = 16,
+    -- Micro Draco - Ultra-Compact AK Pistol (30 rounds, 6.25" barrel)
+    -- "Fire-breathing dragon" - massive muzzle flash, extreme recoil
+    -- Fastest ADS of any rifle, worst accuracy, devastating CQB
+    [`WEAPON_MINI_AK47`] = {
+        caliber = '7.62x39',
+        componentBase = 'COMPONENT_MINI_AK47',
+        clipSize = 30,
     },
 
-    -- Glock 18 Gen 4 - Select-Fire Machine Pistol (17+1 rounds, 4.49" barrel)
-    -- FACTORY FULL-AUTO: 1,100-1,200 RPM, extreme recoil without stock
-    -- Only Glock with factory select-fire capability (semi/full-auto switch)
-    -- Compensated slide reduces muzzle rise, 33rd stick mag recommended
-    [`WEAPON_G18`] = {
-        caliber = '9mm',
-        componentBase = 'COMPONENT_G18',
-        clipSize = 18,
+    -- CMMG Mk47 Mutant - Precision AK/AR Hybrid (30 rounds, 16.1" barrel)
+    -- AR ergonomics + AK magazine compatibility, sub-2 MOA accuracy
+    -- Best 7.62x39 platform - moderate recoil, excellent accuracy
+    [`WEAPON_MK47`] = {
+        caliber = '7.62x39',
+        componentBase = 'COMPONENT_MK47',
+        clipSize = 30,
     },
 
     -- ======================================================================
     -- BATCH 14: 6.8x51mm & .300 BLACKOUT RIFLES
     -- ======================================================================
 
-    -- SIG MCX SPEAR - 6.8x51mm NGSW Rifle (20 rounds, 13" barrel)
-    [`WEAPON_SIG_SPEAR`] = {
-        caliber = '6.8x51',
-        componentBase = 'COMPONENT_SIG_SPEAR',
-        clipSize = 20,
-    },
-
     -- XM7 - 6.8x51mm NGSW Rifle (20 rounds, 13" barrel)
     [`WEAPON_M7`] = {
         caliber = '6.8x51',
@@ -516,6 +540,13 @@ Config.Weapons = {
         clipSize = 30,
     },
 
+    -- SIG MCX SPEAR - 6.8x51mm NGSW Rifle (20 rounds, 13" barrel)
+    [`WEAPON_SIG_SPEAR`] = {
+        caliber = '6.8x51',
+        componentBase = 'COMPONENT_SIG_SPEAR',
+        clipSize = 20,
+    },
+
     -- ======================================================================
     -- BATCH 15: 9mm SMG PLATFORMS
     -- ======================================================================
@@ -527,17 +558,10 @@ Config.Weapons = {
         clipSize = 30,
     },
 
-    -- SIG MPX - Gas-Piston SMG (30 rounds, 4.5" barrel)
-    [`WEAPON_SIG_MPX`] = {
-        caliber = '9mm',
-        componentBase = 'COMPONENT_SIG_MPX',
-        clipSize = 30,
-    },
-
-    -- CZ Scorpion EVO 3 - High-RPM Blowback SMG (30 rounds, 7.72" barrel)
-    [`WEAPON_SCORPION`] = {
+    -- Masterpiece Arms MPA30 - Improved MAC-Style PDW (30 rounds, 5.5" barrel)
+    [`WEAPON_MPA30`] = {
         caliber = '9mm',
-        componentBase = 'COMPONENT_SCORPION',
+        componentBase = 'COMPONENT_MPA30',
         clipSize = 30,
     },
 
@@ -548,17 +572,17 @@ Config.Weapons = {
         clipSize = 33,
     },
 
-    -- Intratec TEC-9 - Budget Machine Pistol (32 rounds, 5" barrel)
-    [`WEAPON_TEC9`] = {
+    -- CZ Scorpion EVO 3 - High-RPM Blowback SMG (30 rounds, 7.72" barrel)
+    [`WEAPON_SCORPION`] = {
         caliber = '9mm',
-        componentBase = 'COMPONENT_TEC9',
-        clipSize = 32,
+        componentBase = 'COMPONENT_SCORPION',
+        clipSize = 30,
     },
 
-    -- Masterpiece Arms MPA30 - Improved MAC-Style PDW (30 rounds, 5.5" barrel)
-    [`WEAPON_MPA30`] = {
+    -- SIG MPX - Gas-Piston SMG (30 rounds, 4.5" barrel)
+    [`WEAPON_SIG_MPX`] = {
         caliber = '9mm',
-        componentBase = 'COMPONENT_MPA30',
+        componentBase = 'COMPONENT_SIG_MPX',
         clipSize = 30,
     },
 
@@ -569,6 +593,13 @@ Config.Weapons = {
         clipSize = 33,
     },
 
+    -- Intratec TEC-9 - Budget Machine Pistol (32 rounds, 5" barrel)
+    [`WEAPON_TEC9`] = {
+        caliber = '9mm',
+        componentBase = 'COMPONENT_TEC9',
+        clipSize = 32,
+    },
+
     -- ======================================================================
     -- BATCH 16: .45 ACP SMG PLATFORMS (MAC variants)
     -- ======================================================================
@@ -593,14 +624,6 @@ Config.Weapons = {
     -- BATCH 17: 5.56 NATO AR PISTOLS / SHORT BARREL RIFLES
     -- ======================================================================
 
-    -- Mk18 CQBR - Military 10.3" Close Quarters Battle Receiver (30 rounds)
-    -- SOCOM minimum barrel length, professional CQB platform
-    [`WEAPON_MK18`] = {
-        caliber = '5.56',
-        componentBase = 'COMPONENT_MK18',
-        clipSize = 30,
-    },
-
     -- 7.5" AR Pistol with Bumpstock - Full-Auto Chaos (30 rounds)
     -- Extreme muzzle flash, uncontrollable spray, devastating at point-blank
     [`WEAPON_ARP_BUMPSTOCK`] = {
@@ -609,6 +632,14 @@ Config.Weapons = {
         clipSize = 30,
     },
 
+    -- Mk18 CQBR - Military 10.3" Close Quarters Battle Receiver (30 rounds)
+    -- SOCOM minimum barrel length, professional CQB platform
+    [`WEAPON_MK18`] = {
+        caliber = '5.56',
+        componentBase = 'COMPONENT_MK18',
+        clipSize = 30,
+    },
+
     -- 9" SBR Custom Build - Illegal Street Rifle (30 rounds)
     -- Unregistered NFA item, custom tuned, criminal roleplay
     [`WEAPON_SBR9`] = {
@@ -623,6 +654,22 @@ Config.Weapons = {
     -- 8 ammo types: 00 Buck, #1 Buck, Slug, Birdshot, Pepperball, Dragon's Breath, Beanbag, Breach
     -- ======================================================================
 
+    -- Beretta 1301 Tactical - Fast Semi-Auto (8 rounds, 18.5" barrel)
+    -- Competition-grade gas system, 140 RPM, fastest follow-up shots
+    [`WEAPON_BERETTA1301`] = {
+        caliber = '12ga',
+        componentBase = 'COMPONENT_BERETTA1301',
+        clipSize = 8,
+    },
+
+    -- Browning Auto-5 - Classic Semi-Auto (5 rounds, 18-20" barrel)
+    -- John Browning's 1898 long-recoil design, lowest recoil, double fire rate
+    [`WEAPON_BROWNINGAUTO5`] = {
+        caliber = '12ga',
+        componentBase = 'COMPONENT_BROWNINGAUTO5',
+        clipSize = 5,
+    },
+
     -- Mini Shotty - Illegal Sawn-Off (4 rounds, 10-12" barrel)
     -- Devastating close range, useless beyond 15m, hip-fire only
     [`WEAPON_MINISHOTTY`] = {
@@ -639,14 +686,6 @@ Config.Weapons = {
         clipSize = 5,
     },
 
-    -- Remington 870 Express - Standard Pump (5 rounds, 18" barrel)
-    -- Most-produced pump shotgun (13M+ units), dual action bars
-    [`WEAPON_REMINGTON870`] = {
-        caliber = '12ga',
-        componentBase = 'COMPONENT_REMINGTON870',
-        clipSize = 5,
-    },
-
     -- Mossberg 500 - MIL-SPEC Pump (6 rounds, 18" barrel)
     -- Military-certified MIL-SPEC 3443E, tang-mounted safety
     [`WEAPON_MOSSBERG500`] = {
@@ -655,22 +694,6 @@ Config.Weapons = {
         clipSize = 6,
     },
 
-    -- Browning Auto-5 - Classic Semi-Auto (5 rounds, 18-20" barrel)
-    -- John Browning's 1898 long-recoil design, lowest recoil, double fire rate
-    [`WEAPON_BROWNINGAUTO5`] = {
-        caliber = '12ga',
-        componentBase = 'COMPONENT_BROWNINGAUTO5',
-        clipSize = 5,
-    },
-
-    -- Beretta 1301 Tactical - Fast Semi-Auto (8 rounds, 18.5" barrel)
-    -- Competition-grade gas system, 140 RPM, fastest follow-up shots
-    [`WEAPON_BERETTA1301`] = {
-        caliber = '12ga',
-        componentBase = 'COMPONENT_BERETTA1301',
-        clipSize = 8,
-    },
-
     -- Mossberg 590 Shockwave - Stockless "Firearm" (6 rounds, 14.375" barrel)
     -- Bird's head grip, hip-fire only, devastating CQB, legal loophole
     [`WEAPON_SHOCKWAVE`] = {
@@ -679,28 +702,12 @@ Config.Weapons = {
         clipSize = 6,
     },
 
-    -- ======================================================================
-    -- BATCH 13: 7.62x39mm AK-PLATFORM RIFLES
-    -- Soviet intermediate cartridge: +14% damage vs 5.56 NATO
-    -- Superior short-barrel performance, excellent barrier penetration
-    -- ======================================================================
-
-    -- Micro Draco - Ultra-Compact AK Pistol (30 rounds, 6.25" barrel)
-    -- "Fire-breathing dragon" - massive muzzle flash, extreme recoil
-    -- Fastest ADS of any rifle, worst accuracy, devastating CQB
-    [`WEAPON_MINI_AK47`] = {
-        caliber = '7.62x39',
-        componentBase = 'COMPONENT_MINI_AK47',
-        clipSize = 30,
-    },
-
-    -- CMMG Mk47 Mutant - Precision AK/AR Hybrid (30 rounds, 16.1" barrel)
-    -- AR ergonomics + AK magazine compatibility, sub-2 MOA accuracy
-    -- Best 7.62x39 platform - moderate recoil, excellent accuracy
-    [`WEAPON_MK47`] = {
-        caliber = '7.62x39',
-        componentBase = 'COMPONENT_MK47',
-        clipSize = 30,
+    -- Remington 870 Express - Standard Pump (5 rounds, 18" barrel)
+    -- Most-produced pump shotgun (13M+ units), dual action bars
+    [`WEAPON_REMINGTON870`] = {
+        caliber = '12ga',
+        componentBase = 'COMPONENT_REMINGTON870',
+        clipSize = 5,
     },
 
     -- ======================================================================
@@ -709,12 +716,31 @@ Config.Weapons = {
     -- Energy range: 1,300 ft-lbs to 13,200 ft-lbs (10x spread)
     -- ======================================================================
 
-    -- SIG 550 (Stgw 90) - Swiss Assault Rifle (20 rounds, 20.8" barrel)
-    -- Swiss military standard since 1990, exceptional 0.72 MOA accuracy
-    [`WEAPON_SIG550`] = {
-        caliber = '5.56',
-        componentBase = 'COMPONENT_SIG550',
-        clipSize = 20,
+    -- Barrett M107A1 - .50 BMG Semi-Auto Upgraded (10 rounds, 29" barrel)
+    -- Improved M82A1: lighter (28.7 lbs), better accuracy (1.0-1.5 MOA)
+    -- Hydraulic buffer, suppressor-ready, best overall .50 platform
+    [`WEAPON_BARRETTM107A1`] = {
+        caliber = '.50bmg',
+        componentBase = 'COMPONENT_BARRETTM107A1',
+        clipSize = 10,
+    },
+
+    -- Barrett M82A1 - .50 BMG Semi-Auto Original (10 rounds, 29" barrel)
+    -- Original Barrett .50 cal, short-recoil semi-auto, 1.5-2.0 MOA
+    -- Anti-materiel capability: 9" concrete penetration
+    [`WEAPON_BARRETTM82A1`] = {
+        caliber = '.50bmg',
+        componentBase = 'COMPONENT_BARRETTM82A1',
+        clipSize = 10,
+    },
+
+    -- NEMO Omen Watchman - .300 WM Semi-Auto (14 rounds, 24" barrel)
+    -- World's first reliable .300 WM AR, 0.5-1.0 MOA
+    -- HIGH CAPACITY magnum platform - 14 rounds of .300 Win Mag
+    [`WEAPON_NEMOWATCHMAN`] = {
+        caliber = '.300wm',
+        componentBase = 'COMPONENT_NEMOWATCHMAN',
+        clipSize = 14,
     },
 
     -- Remington 700 - Civilian Bolt-Action (4 rounds, 22-24" barrel)
@@ -725,6 +751,14 @@ Config.Weapons = {
         clipSize = 4,
     },
 
+    -- Remington M24 SWS - Military Sniper (5 rounds, 24" barrel)
+    -- U.S. Army sniper rifle 1988-2014, ≤0.35 MOA machine rest
+    [`WEAPON_REMINGTONM24`] = {
+        caliber = '7.62x51',
+        componentBase = 'COMPONENT_REMINGTONM24',
+        clipSize = 5,
+    },
+
     -- Sauer 101 - German Precision Rifle (5 rounds, 22" barrel)
     -- J.P. Sauer & Sohn since 1751, sub-MOA factory guarantee
     -- 60° bolt throw = fastest .308 bolt cycle
@@ -734,21 +768,12 @@ Config.Weapons = {
         clipSize = 5,
     },
 
-    -- Remington M24 SWS - Military Sniper (5 rounds, 24" barrel)
-    -- U.S. Army sniper rifle 1988-2014, ≤0.35 MOA machine rest
-    [`WEAPON_REMINGTONM24`] = {
-        caliber = '7.62x51',
-        componentBase = 'COMPONENT_REMINGTONM24',
-        clipSize = 5,
-    },
-
-    -- NEMO Omen Watchman - .300 WM Semi-Auto (14 rounds, 24" barrel)
-    -- World's first reliable .300 WM AR, 0.5-1.0 MOA
-    -- HIGH CAPACITY magnum platform - 14 rounds of .300 Win Mag
-    [`WEAPON_NEMOWATCHMAN`] = {
-        caliber = '.300wm',
-        componentBase = 'COMPONENT_NEMOWATCHMAN',
-        clipSize = 14,
+    -- SIG 550 (Stgw 90) - Swiss Assault Rifle (20 rounds, 20.8" barrel)
+    -- Swiss military standard since 1990, exceptional 0.72 MOA accuracy
+    [`WEAPON_SIG550`] = {
+        caliber = '5.56',
+        componentBase = 'COMPONENT_SIG550',
+        clipSize = 20,
     },
 
     -- Victus XMR - .50 BMG Precision Bolt (5 rounds, 27" barrel)
@@ -759,24 +784,6 @@ Config.Weapons = {
         clipSize = 5,
     },
 
-    -- Barrett M82A1 - .50 BMG Semi-Auto Original (10 rounds, 29" barrel)
-    -- Original Barrett .50 cal, short-recoil semi-auto, 1.5-2.0 MOA
-    -- Anti-materiel capability: 9" concrete penetration
-    [`WEAPON_BARRETTM82A1`] = {
-        caliber = '.50bmg',
-        componentBase = 'COMPONENT_BARRETTM82A1',
-        clipSize = 10,
-    },
-
-    -- Barrett M107A1 - .50 BMG Semi-Auto Upgraded (10 rounds, 29" barrel)
-    -- Improved M82A1: lighter (28.7 lbs), better accuracy (1.0-1.5 MOA)
-    -- Hydraulic buffer, suppressor-ready, best overall .50 platform
-    [`WEAPON_BARRETTM107A1`] = {
-        caliber = '.50bmg',
-        componentBase = 'COMPONENT_BARRETTM107A1',
-        clipSize = 10,
-    },
-
     -- ======================================================================
     -- BATCH 20: .38 SPECIAL REVOLVERS & TRANQUILIZER DART GUN
     -- .38 Special +P: 64-93% of 9mm energy depending on barrel
@@ -31,6 +31,13 @@ local cachedPed = nil
 local pedCacheTime = 0
 local PED_CACHE_INTERVAL = 1000
 
+-- Shot telemetry batch (Config.Telemetry)
+local batchWeapon = nil              -- Weapon/mode the pending batch was fired with
+local batchMode = nil
+local batchStart = 0                 -- GetGameTimer() of the batch's first shot
+local batchLast = 0
+local batchGaps = {}                 -- ms from each shot to the next
+
 -- State flags
 local isArmed = false
 local isAlive = true
@@ -84,7 +91,54 @@ local function GetEffectiveModes(ped, weaponHash)
     return config.modes or {'SEMI'}
 end
 
+-- ============================================================================
+-- SHOT TELEMETRY
+-- ============================================================================
+
+--- Send the pending shot batch (if any) as one selectivefire:shotBatch event
+local function FlushShots()
+    if not batchWeapon then return end
+    TriggerServerEvent('selectivefire:shotBatch', batchWeapon, batchMode, batchStart, batchGaps)
+    batchWeapon = nil
+    batchMode = nil
+    batchGaps = {}
+end
+
+--- Report one shot: batched, or as its own event when telemetry batching is off
+local function RecordShot(currentTime)
+    if not Config.Telemetry.Batched then
+        TriggerServerEvent('selectivefire:shotFired', currentWeaponHash, currentMode)
+        return
+    end
+
+    if batchWeapon ~= currentWeaponHash or batchMode ~= currentMode then
+        FlushShots()
+    end
+
+    if not batchWeapon then
+        batchWeapon = currentWeaponHash
+        batchMode = currentMode
+        batchStart = currentTime
+    else
+        batchGaps[#batchGaps + 1] = currentTime - batchLast
+    end
+    batchLast = currentTime
+
+    if #batchGaps + 1 >= Config.Telemetry.MaxBatch then
+        FlushShots()
+    end
+end
+
+--- Flush once the batch is FlushInterval old (weapon/mode changes and
+-- MaxBatch flush in RecordShot), so semi-auto pulls share one event too
+local function UpdateTelemetry()
+    if batchWeapon and GetGameTimer() - batchStart >= Config.Telemetry.FlushInterval then
+        FlushShots()
+    end
+end
+
 local function ResetFireState()
+    FlushShots()
     isTriggerHeld = false
     isInBurst = false
     burstShotsRemaining = 0
@@ -134,7 +188,8 @@ local function CycleFireMode()
         weaponModes[currentWeaponHash] = currentMode
     end
 
-    -- Notify server
+    -- Notify server (after the shots fired in the old mode)
+    FlushShots()
     TriggerServerEvent('selectivefire:modeChanged', currentWeaponHash, currentMode)
 
     -- Play sound
@@ -290,7 +345,7 @@ local function TrackShotsFired()
         if isInBurst then
             burstShotsRemaining = burstShotsRemaining - shotsFired
         end
-        TriggerServerEvent('selectivefire:shotFired', currentWeaponHash, currentMode)
+        RecordShot(GetGameTimer())
     end
 
     lastAmmoCount = currentAmmo
@@ -307,6 +362,7 @@ CreateThread(function()
     while true do
         if isArmed and isAlive and currentWeaponHash then
             TrackShotsFired()
+            UpdateTelemetry()
 
             if currentMode == 'SEMI' then
                 HandleSemiAuto()
@@ -318,6 +374,7 @@ CreateThread(function()
 
             Wait(0)
         else
+            FlushShots()
             Wait(250)
         end
     end
@@ -427,6 +484,7 @@ exports('SetFireMode', function(mode)
             if Config.RememberMode then
                 weaponModes[currentWeaponHash] = currentMode
             end
+            FlushShots()
             TriggerServerEvent('selectivefire:modeChanged', currentWeaponHash, currentMode)
             return true
         end
@@ -38,6 +38,7 @@ client_scripts {
 }
 
 server_scripts {
+    'server/sv_fire_thresholds.lua', -- Per-weapon fire-rate limits (generated)
     'server/sv_firevalidation.lua',
 }
 
@@ -0,0 +1,55 @@
+--[[
+    AUTO-GENERATED by scripts/fire_threshold_gen.py - DO NOT EDIT
+    ===============================================================
+
+    Per-weapon fire-rate limits for sv_firevalidation.lua (ms).
+    Regenerate after changing free_selectivefire/shared/config.lua,
+    ValidationConfig or a weapon's TimeBetweenShots:
+
+        python scripts/fire_threshold_gen.py
+
+    Source hash: 9345b728f136f0f967be9e85727b746bed722ea4
+]]
+
+-- FireThresholds[weaponHash] -> { semi = ms, burstWindow = ms, burstMax = shots }
+FireThresholds = {
+    [`WEAPON_ARP_BUMPSTOCK`] = { semi = 90 },
+    [`WEAPON_BARRETTM107A1`] = { semi = 540 },
+    [`WEAPON_BARRETTM82A1`] = { semi = 576 },
+    [`WEAPON_BLUEARP`] = { semi = 355 },
+    [`WEAPON_CZ_BREN`] = { semi = 90 },
+    [`WEAPON_DESERT_AR15`] = { semi = 90 },
+    [`WEAPON_G17`] = { semi = 459 },
+    [`WEAPON_G17_BLK`] = { semi = 459 },
+    [`WEAPON_G17_GEN5`] = { semi = 329 },
+    [`WEAPON_G19`] = { semi = 475 },
+    [`WEAPON_G19X`] = { semi = 335 },
+    [`WEAPON_G19XD`] = { semi = 335 },
+    [`WEAPON_G19X_SWITCH`] = { semi = 288 },
+    [`WEAPON_G26`] = { semi = 506 },
+    [`WEAPON_G26_SWITCH`] = { semi = 288 },
+    [`WEAPON_G43X`] = { semi = 417 },
+    [`WEAPON_G45`] = { semi = 345 },
+    [`WEAPON_G45_TAN`] = { semi = 345 },
+    [`WEAPON_GLOCK20`] = { semi = 472 },
+    [`WEAPON_M16`] = { semi = 90, burstWindow = 360, burstMax = 3 },
+    [`WEAPON_MAC4A1`] = { semi = 90 },
+    [`WEAPON_MCX300`] = { semi = 90 },
+    [`WEAPON_MICRO_MP5`] = { semi = 90, burstWindow = 360, burstMax = 3 },
+    [`WEAPON_MINI_AK47`] = { semi = 90 },
+    [`WEAPON_MK18`] = { semi = 90 },
+    [`WEAPON_MK47`] = { semi = 90 },
+    [`WEAPON_MPA30`] = { semi = 90 },
+    [`WEAPON_NEMOWATCHMAN`] = { semi = 252 },
+    [`WEAPON_PSA_AR15`] = { semi = 90 },
+    [`WEAPON_RAM7KNIGHT`] = { semi = 90 },
+    [`WEAPON_RAM9_DESERT`] = { semi = 90 },
+    [`WEAPON_RED_AUG`] = { semi = 90 },
+    [`WEAPON_SBR9`] = { semi = 90 },
+    [`WEAPON_SCORPION`] = { semi = 90 },
+    [`WEAPON_SIG550`] = { semi = 90, burstWindow = 375, burstMax = 3 },
+    [`WEAPON_SIG_MPX`] = { semi = 90 },
+    [`WEAPON_SUB2000`] = { semi = 90 },
+    [`WEAPON_TEC9`] = { semi = 90 },
+    [`WEAPON_UDP9`] = { semi = 386 },
+}
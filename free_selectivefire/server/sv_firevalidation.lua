@@ -4,6 +4,8 @@
 
     Features:
     - Lightweight fire rate validation
+    - Per-weapon limits from a generated table (sv_fire_thresholds.lua)
+    - Batched shot telemetry (one event per FlushInterval / MaxBatch shots)
     - Death/respawn state reset
     - Character switch cleanup
     - Event-driven architecture
@@ -25,6 +27,10 @@ local ValidationConfig = {
     ViolationThreshold = 5,
     ViolationDecay = 15000,
 
+    -- Batched telemetry: network jitter allowed when checking a batch's
+    -- client timing against server arrival times (ms)
+    BatchJitter = 250,
+
     -- Features
     EnableValidation = true,
     EnableLogging = true,
@@ -36,6 +42,11 @@ local ValidationConfig = {
     ResetOnCharacterSwitch = true,   -- Full wipe on character switch
 }
 
+-- Per-weapon limits from server/sv_fire_thresholds.lua (generated by
+-- scripts/fire_threshold_gen.py); missing fields use the globals above
+local FireThresholds = FireThresholds or {}
+local NoThresholds = {}
+
 -- ============================================================================
 -- PLAYER STATE
 -- ============================================================================
@@ -52,6 +63,15 @@ local function GetState(source)
             shotIndex = 1,
             violations = 0,
             lastViolation = 0,
+            -- Batched shots carry client GetGameTimer() times, so they get
+            -- their own buffer instead of sharing the server-clock one above
+            batch = {
+                recentShots = {},
+                shotIndex = 1,
+                lastShot = nil,
+                received = nil,     -- Server time the previous batch arrived
+                floor = nil,        -- Lowest arrival - last shot a legit client can show
+            },
         }
     end
     return playerStates[source]
@@ -67,6 +87,8 @@ local function ResetViolations(source)
         state.violations = 0
         state.recentShots = {}
         state.shotIndex = 1
+        state.batch.recentShots = {}
+        state.batch.shotIndex = 1
     end
 end
 
@@ -74,65 +96,163 @@ end
 -- VALIDATION LOGIC
 -- ============================================================================
 
-local function ValidateShot(source, mode)
-    if not ValidationConfig.EnableValidation then return true end
-
-    local state = GetState(source)
-    local now = GetGameTimer()
-
-    -- Decay violations over time
+--- Decay violations over time
+-- @param now number Server time (ms)
+local function DecayViolations(state, now)
     if (now - state.lastViolation) > ValidationConfig.ViolationDecay then
         state.violations = 0
     end
+end
 
+--- Record one shot in a circular buffer and check it against the limits
+-- @param clock table Buffer the shot belongs to (player state, or its batch table)
+-- @param limits table FireThresholds entry (or NoThresholds)
+-- @param mode string Fire mode the shot was fired in
+-- @param now number Shot time (ms, in the buffer's clock)
+-- @return boolean isValid
+local function CheckShot(clock, limits, mode, now)
     -- Record shot time in circular buffer
-    state.recentShots[state.shotIndex] = now
-    state.shotIndex = (state.shotIndex % 5) + 1
-
-    local isValid = true
+    clock.recentShots[clock.shotIndex] = now
+    clock.shotIndex = (clock.shotIndex % 5) + 1
+    clock.lastShot = now
 
     if mode == 'SEMI' then
-        local prevIndex = state.shotIndex - 2
+        local prevIndex = clock.shotIndex - 2
         if prevIndex < 1 then prevIndex = prevIndex + 5 end
-        local prevShot = state.recentShots[prevIndex]
+        local prevShot = clock.recentShots[prevIndex]
 
-        if prevShot and (now - prevShot) < ValidationConfig.SemiAutoMinInterval then
-            isValid = false
+        if prevShot and (now - prevShot) < (limits.semi or ValidationConfig.SemiAutoMinInterval) then
+            return false
         end
 
     elseif mode == 'BURST' then
+        local window = limits.burstWindow or ValidationConfig.BurstWindow
         local count = 0
         for i = 1, 5 do
-            local t = state.recentShots[i]
-            if t and (now - t) < ValidationConfig.BurstWindow then
+            local t = clock.recentShots[i]
+            if t and (now - t) < window then
                 count = count + 1
             end
         end
-        if count > ValidationConfig.BurstMaxShots then
-            isValid = false
+        if count > (limits.burstMax or ValidationConfig.BurstMaxShots) then
+            return false
         end
     end
 
-    if not isValid then
-        state.violations = state.violations + 1
-        state.lastViolation = now
+    return true
+end
+
+--- Count a violation
+-- @return boolean true once violations reach ViolationThreshold
+local function AddViolation(state, now)
+    state.violations = state.violations + 1
+    state.lastViolation = now
+    return state.violations >= ValidationConfig.ViolationThreshold
+end
+
+--- Log a rapid-fire warning and drop the player past KickThreshold
+-- @return boolean true if the player was dropped
+local function WarnOrKick(source, mode, violations)
+    if ValidationConfig.EnableLogging then
+        local name = GetPlayerName(source) or 'Unknown'
+        print(('[SelectiveFire] WARN: %s (%d) - Rapid fire (mode: %s, violations: %d)'):format(
+            name, source, mode, violations
+        ))
+    end
+
+    if ValidationConfig.EnableKick and violations >= ValidationConfig.KickThreshold then
+        DropPlayer(source, 'Fire rate anomaly')
+        return true
+    end
+    return false
+end
 
-        if state.violations >= ValidationConfig.ViolationThreshold then
-            if ValidationConfig.EnableLogging then
-                local name = GetPlayerName(source) or 'Unknown'
-                print(('[SelectiveFire] WARN: %s (%d) - Rapid fire (mode: %s, violations: %d)'):format(
-                    name, source, mode, state.violations
-                ))
-            end
+local function ValidateShot(source, weaponHash, mode)
+    if not ValidationConfig.EnableValidation then return true end
 
-            if ValidationConfig.EnableKick and state.violations >= ValidationConfig.KickThreshold then
-                DropPlayer(source, 'Fire rate anomaly')
+    local state = GetState(source)
+    local now = GetGameTimer()
+    DecayViolations(state, now)
+    local isValid = CheckShot(state, FireThresholds[weaponHash] or NoThresholds, mode, now)
+
+    if not isValid and AddViolation(state, now) then
+        WarnOrKick(source, mode, state.violations)
+    end
+    return isValid
+end
+
+--- Validate a batch of shots (Config.Telemetry) in one call. Shot times
+-- are the client's GetGameTimer() values, checked in the batch buffer so
+-- network jitter does not move them; the batch itself is bounded by server
+-- time first. One violation is counted when the batch is oversize, when its
+-- gaps cover more time than passed on the server since the previous batch,
+-- or when its last shot is later than the arrivals so far allow (a client
+-- stretching its clock). One warning is logged per batch.
+-- @param firstShot number Client time of the first shot (ms)
+-- @param gaps table ms from each shot to the next (#gaps + 1 shots)
+-- @return number Violations counted for the batch
+local function ValidateBatch(source, weaponHash, mode, firstShot, gaps)
+    if not ValidationConfig.EnableValidation then return 0 end
+    if type(firstShot) ~= 'number' or type(gaps) ~= 'table' then return 0 end
+
+    local state = GetState(source)
+    local clock = state.batch
+    local limits = FireThresholds[weaponHash] or NoThresholds
+    local received = GetGameTimer()
+    local jitter = ValidationConfig.BatchJitter
+    local shots = math.min(#gaps + 1, Config.Telemetry.MaxBatch)
+    local invalid = 0
+    local warn = false
+
+    DecayViolations(state, received)
+
+    local span = 0
+    for i = 1, shots - 1 do
+        gaps[i] = math.max(tonumber(gaps[i]) or 0, 0)
+        span = span + gaps[i]
+    end
+
+    -- A legit client holds a batch at most FlushInterval, so its arrival
+    -- minus its last shot never drops more than that below the previous high
+    local elapsed = clock.received and (received - clock.received) or Config.Telemetry.FlushInterval
+    local delay = received - (firstShot + span)
+    local suspect = #gaps + 1 > Config.Telemetry.MaxBatch
+        or span > elapsed + jitter
+        or (clock.floor ~= nil and delay < clock.floor)
+    if suspect then
+        invalid = invalid + 1
+        warn = AddViolation(state, received)
+    end
+
+    -- Only unflagged batches move the limit, so a flagged one cannot lower it
+    local floor = delay - Config.Telemetry.FlushInterval - jitter
+    if not clock.floor then
+        clock.floor = floor
+    elseif not suspect then
+        clock.floor = math.max(clock.floor, floor)
+    end
+    clock.received = received
+
+    local now = math.max(firstShot, clock.lastShot or firstShot)    -- Client time never runs backwards
+    for i = 1, shots do
+        if i > 1 then
+            now = now + gaps[i - 1]
+        end
+        if not CheckShot(clock, limits, mode, now) then
+            invalid = invalid + 1
+            if AddViolation(state, received) then
+                warn = true
+                if ValidationConfig.EnableKick and state.violations >= ValidationConfig.KickThreshold then
+                    break
+                end
             end
         end
     end
 
-    state.lastShot = now
-    return isValid
+    if warn then
+        WarnOrKick(source, mode, state.violations)
+    end
+    return invalid
 end
 
 -- ============================================================================
@@ -145,10 +265,16 @@ RegisterNetEvent('selectivefire:modeChanged', function(weaponHash, mode)
     state.weapon = weaponHash
     state.recentShots = {}
     state.shotIndex = 1
+    state.batch.recentShots = {}
+    state.batch.shotIndex = 1
 end)
 
 RegisterNetEvent('selectivefire:shotFired', function(weaponHash, mode)
-    ValidateShot(source, mode)
+    ValidateShot(source, weaponHash, mode)
+end)
+
+RegisterNetEvent('selectivefire:shotBatch', function(weaponHash, mode, firstShot, gaps)
+    ValidateBatch(source, weaponHash, mode, firstShot, gaps)
 end)
 
 -- ============================================================================
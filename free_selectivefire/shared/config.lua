@@ -49,6 +49,15 @@ Config.FireRates = {
 Config.BurstDelay = 350             -- Delay after burst before next burst (ms)
 Config.DefaultBurstCount = 3        -- Default rounds per burst
 
+-- Shot telemetry: the client batches shot times into one server event per
+-- FlushInterval (or MaxBatch shots, or weapon/mode change) instead of one
+-- event per round
+Config.Telemetry = {
+    Batched = true,                 -- false = one selectivefire:shotFired per shot
+    FlushInterval = 500,            -- Longest a batch is held after its first shot (ms)
+    MaxBatch = 32,                  -- Shots per batch (a larger batch is a violation)
+}
+
 -- ============================================================================
 -- UNIVERSAL MODIFICATION COMPONENTS
 -- Define groups of weapons that can share the same modification component
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Weapon Animations Template Deduplication
+
+Fingerprints every weaponanimations*.meta in the weapon folders against
+the canonical templates in weapon_meta_package/ (pistol, pistol_auto,
+pistol_complete), after normalizing out weapon identifiers:
+- Per weapon: which template it matches exactly, or the nearest one and
+  the true field-level diffs (set, field, template value -> file value)
+- Families: weapons grouped by their nearest template; weapons with no
+  close template (rifles, SMGs, revolvers) cluster among themselves
+- --output: one merged, compact animations file per family, holding every
+  member's entries (lossless apart from comments/whitespace)
+
+Usage:
+    python anim_template_dedup.py                 # Report
+    python anim_template_dedup.py --diffs         # Include per-weapon diffs
+    python anim_template_dedup.py --output bundles/animations
+"""
+
+import os
+import re
+import hashlib
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+
+import meta_index
+
+BASE_PATH = "/home/user/project_pipes"
+TEMPLATE_DIR = "weapon_meta_package"
+TEMPLATE_GLOB = re.compile(r'^weaponanimations_(.+)\.meta$')
+TEMPLATE_WEAPON = "WEAPON_YOURWEAPON"
+PLACEHOLDER = "{WEAPON}"
+
+# Folders that are not weapon resources
+SKIP_BATCHES = {TEMPLATE_DIR, "free-bullets", "free_selectivefire"}
+
+# A weapon joins its nearest template's family if at most this many fields differ
+MAX_FAMILY_DIFFS = 12
+
+
+# =============================================================================
+# NORMALIZATION
+# =============================================================================
+@dataclass
+class AnimUnit:
+    """One weapon's animation entries across all sets, weapon name normalized out"""
+    weapon: str
+    source: str
+    sets: dict = field(default_factory=dict)   # set key -> (fallback, ((tag, attrs, text), ...))
+
+    @property
+    def fingerprint(self) -> str:
+        return hashlib.sha1(repr(sorted(self.sets.items())).encode()).hexdigest()[:12]
+
+
+def normalize_text(text: str, weapon: str) -> str:
+    text = (text or "").strip()
+    if not text:
+        return ""
+    short = weapon[len("WEAPON_"):] if weapon.startswith("WEAPON_") else weapon
+    return re.sub(re.escape(short), PLACEHOLDER, text, flags=re.IGNORECASE) if short else text
+
+
+def normalize_fields(item: ET.Element, weapon: str) -> tuple:
+    return tuple((child.tag, tuple(sorted(child.attrib.items())), normalize_text(child.text, weapon))
+                 for child in item)
+
+
+def read_units(path: str, source: str) -> tuple:
+    """
+    AnimUnits of a CWeaponAnimationsSets file. Returns (units, problem);
+    problem is set for unparseable or other-format files.
+    """
+    try:
+        root = ET.parse(path).getroot()
+    except ET.ParseError as e:
+        return [], f"parse error ({e})"
+    if root.tag != "CWeaponAnimationsSets":
+        return [], f"not a CWeaponAnimationsSets file (<{root.tag}>)"
+
+    units = {}
+    for anim_set in root.findall("WeaponAnimationsSets/Item"):
+        set_key = anim_set.get("key")
+        fallback = (anim_set.findtext("Fallback") or "").strip()
+        for item in anim_set.findall("WeaponAnimations/Item"):
+            weapon = item.get("key") or ""
+            unit = units.setdefault(weapon, AnimUnit(weapon, source))
+            unit.sets[set_key] = (fallback, normalize_fields(item, weapon))
+    return list(units.values()), None
+
+
+def diff_units(template: AnimUnit, unit: AnimUnit) -> list:
+    """Field-level differences: [(set, field, template value, unit value)]"""
+    diffs = []
+    for set_key in list(template.sets) + [k for k in unit.sets if k not in template.sets]:
+        if set_key not in unit.sets:
+            diffs.append((set_key, "*", "present", "missing"))
+            continue
+        if set_key not in template.sets:
+            diffs.append((set_key, "*", "missing", "present"))
+            continue
+        t_fallback, t_fields = template.sets[set_key]
+        u_fallback, u_fields = unit.sets[set_key]
+        if t_fallback != u_fallback:
+            diffs.append((set_key, "Fallback", t_fallback, u_fallback))
+        t_map = {tag: (attrs, text) for tag, attrs, text in t_fields}
+        u_map = {tag: (attrs, text) for tag, attrs, text in u_fields}
+        for tag in list(t_map) + [t for t in u_map if t not in t_map]:
+            t_value, u_value = t_map.get(tag), u_map.get(tag)
+            if t_value != u_value:
+                diffs.append((set_key, tag, format_value(t_value), format_value(u_value)))
+    return diffs
+
+
+def format_value(value) -> str:
+    if value is None:
+        return "-"
+    attrs, text = value
+    parts = [f'{k}="{v}"' for k, v in attrs]
+    if text:
+        parts.append(text)
+    return " ".join(parts) or "(empty)"
+
+
+# =============================================================================
+# ANALYSIS
+# =============================================================================
+def load_templates(root: str) -> dict:
+    """{template name: AnimUnit} from weapon_meta_package/weaponanimations_*.meta"""
+    templates = {}
+    template_dir = os.path.join(root, TEMPLATE_DIR)
+    for file_name in sorted(os.listdir(template_dir)):
+        match = TEMPLATE_GLOB.match(file_name)
+        if not match:
+            continue
+        units, _ = read_units(os.path.join(template_dir, file_name), f"{TEMPLATE_DIR}/{file_name}")
+        for unit in units:
+            if unit.weapon == TEMPLATE_WEAPON:
+                templates[match.group(1)] = unit
+    return templates
+
+
+def load_weapon_units(root: str) -> tuple:
+    """(units, skipped files, total bytes); first copy of each weapon wins"""
+    index = meta_index.get_index(root)
+    entries = sorted((e for e in index.entries.values()
+                      if e.kind == "animations" and e.batch not in SKIP_BATCHES and e.batch),
+                     key=lambda e: (e.path.count("/"), e.path))
+    units, skipped = {}, []
+    total_bytes = 0
+    for entry in entries:
+        file_units, problem = read_units(index.abspath(entry.path), entry.path)
+        if problem:
+            skipped.append((entry.path, problem))
+            continue
+        total_bytes += entry.size
+        for unit in file_units:
+            units.setdefault(unit.weapon, unit)
+    return list(units.values()), skipped, total_bytes
+
+
+@dataclass
+class Match:
+    unit: AnimUnit
+    template: str          # Nearest template name, "" if none close
+    diffs: list
+
+
+def nearest(unit: AnimUnit, candidates: dict) -> tuple:
+    """(name, diffs) of the closest candidate, name "" if none within MAX_FAMILY_DIFFS"""
+    best_name, best_diffs = "", None
+    for name, template in candidates.items():
+        diffs = diff_units(template, unit)
+        if best_diffs is None or len(diffs) < len(best_diffs):
+            best_name, best_diffs = name, diffs
+    if best_diffs is None or len(best_diffs) > MAX_FAMILY_DIFFS:
+        return "", best_diffs or []
+    return best_name, best_diffs
+
+
+def classify(units: list, templates: dict) -> list:
+    return [Match(unit, *nearest(unit, templates)) for unit in units]
+
+
+def families(matches: list) -> dict:
+    """
+    {family name: [Match]} - template families, then weapons with no close
+    template clustered around the first member of each new family.
+    """
+    groups = {}
+    leaders = {}
+    for match in matches:
+        name = match.template
+        if not name:
+            name, _ = nearest(match.unit, leaders)
+            if not name:
+                name = f"custom_{match.unit.weapon.lower().replace('weapon_', '')}"
+                leaders[name] = match.unit
+        groups.setdefault(name, []).append(match)
+    return groups
+
+
+# =============================================================================
+# OUTPUT
+# =============================================================================
+def build_family_meta(members: list) -> tuple:
+    """
+    Merged CWeaponAnimationsSets holding every member's entries, plus the
+    weapons whose set Fallback differs from the first member's (one
+    Fallback per set survives a merge).
+    """
+    root = ET.Element("CWeaponAnimationsSets")
+    sets_element = ET.SubElement(root, "WeaponAnimationsSets")
+    set_elements = {}
+    set_fallbacks = {}
+    conflicts = []
+    for match in members:
+        unit = match.unit
+        short = unit.weapon[len("WEAPON_"):] if unit.weapon.startswith("WEAPON_") else unit.weapon
+        for set_key, (fallback, fields) in unit.sets.items():
+            if set_fallbacks.setdefault(set_key, fallback) != fallback:
+                conflicts.append(f"{unit.weapon} {set_key}: Fallback '{fallback}' "
+                                 f"(merged file keeps '{set_fallbacks[set_key]}')")
+            if set_key not in set_elements:
+                set_item = ET.SubElement(sets_element, "Item", {"key": set_key} if set_key else {})
+                if fallback:
+                    ET.SubElement(set_item, "Fallback").text = fallback
+                set_elements[set_key] = ET.SubElement(set_item, "WeaponAnimations")
+            item = ET.SubElement(set_elements[set_key], "Item", key=unit.weapon)
+            for tag, attrs, text in fields:
+                child = ET.SubElement(item, tag, dict(attrs))
+                if text:
+                    child.text = text.replace(PLACEHOLDER, short)
+    tree = ET.ElementTree(root)
+    ET.indent(tree, space=" ")
+    return tree, conflicts
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Fingerprint weaponanimations metas against the templates")
+    parser.add_argument("--root", default=BASE_PATH, help="Project root")
+    parser.add_argument("--diffs", action="store_true", help="Print per-weapon diffs against the nearest template")
+    parser.add_argument("--output", type=str, help="Write one merged animations meta per family here")
+    args = parser.parse_args()
+
+    templates = load_templates(args.root)
+    units, skipped, total_bytes = load_weapon_units(args.root)
+    matches = classify(units, templates)
+    groups = families(matches)
+
+    print(f"Templates: {', '.join(templates)}")
+    print(f"Weapons: {len(units)} ({total_bytes / 1024:.0f} KB of animation metas)")
+    for path, problem in skipped:
+        print(f"  Skipped {path}: {problem}")
+
+    exact = sum(1 for m in matches if m.template and not m.diffs)
+    print(f"  Exact template matches: {exact}")
+    print(f"  Near matches:           {sum(1 for m in matches if m.template and m.diffs)}")
+    print(f"  No close template:      {sum(1 for m in matches if not m.template)}")
+
+    print("\nFamilies:")
+    for name, members in groups.items():
+        fingerprints = {m.unit.fingerprint for m in members}
+        print(f"  {name:<28} {len(members):>3} weapons, {len(fingerprints)} distinct variants")
+
+    if args.diffs:
+        for match in matches:
+            if not match.diffs:
+                continue
+            label = match.template or "(no close template)"
+            print(f"\n{match.unit.weapon} vs {label} ({match.unit.source}): {len(match.diffs)} diffs")
+            if not match.template:
+                continue
+            for set_key, tag, template_value, value in match.diffs:
+                print(f"    {str(set_key):<18} {tag:<40} {template_value} -> {value}")
+
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+        written = 0
+        for name, members in groups.items():
+            path = os.path.join(args.output, f"weaponanimations_{name}.meta")
+            tree, conflicts = build_family_meta(members)
+            tree.write(path, encoding="UTF-8", xml_declaration=True)
+            written += os.path.getsize(path)
+            for conflict in conflicts:
+                print(f"  {name}: {conflict}")
+        print(f"\nWritten {len(groups)} family files to {args.output}: "
+              f"{written / 1024:.0f} KB (was {total_bytes / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
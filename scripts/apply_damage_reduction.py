@@ -4,75 +4,64 @@ Apply 11% damage reduction to all weapons in batches 12-19.
 """
 
 import os
-import re
-import sys
+from functools import partial
 from pathlib import Path
 
+import meta_txn
+import parallel
+import weapon_meta
+from meta_index import find_batch_weapon_metas
+
 # Configuration
+BASE_PATH = "/home/user/project_pipes"
 DAMAGE_REDUCTION = 0.11  # 11% reduction
 BATCHES = [
-    ("batch12_weapons", "/home/user/project_pipes/batch12_weapons"),
-    ("batch13_weapons", "/home/user/project_pipes/batch13_weapons"),
-    ("batch14_weapons", "/home/user/project_pipes/batch14_weapons"),
-    ("batch15_weapons", "/home/user/project_pipes/batch15_weapons"),
-    ("batch16_weapons", "/home/user/project_pipes/batch16_weapons"),
-    ("batch17_weapons", "/home/user/project_pipes/batch17_weapons"),
-    ("batch18_shotguns", "/home/user/project_pipes/batch18_shotguns"),
-    ("batch19_rifles", "/home/user/project_pipes/batch19_rifles"),
+    "batch12_weapons",
+    "batch13_weapons",
+    "batch14_weapons",
+    "batch15_weapons",
+    "batch16_weapons",
+    "batch17_weapons",
+    "batch18_shotguns",
+    "batch19_rifles",
 ]
 
 def find_weapons_meta(batch_path):
-    """Find all weapons.meta files in a batch directory."""
-    meta_files = []
-    for root, dirs, files in os.walk(batch_path):
-        for f in files:
-            if f.endswith('.meta') and 'weapons' in f.lower():
-                meta_files.append(os.path.join(root, f))
-            # Also check for weapon_*.meta pattern
-            if f.startswith('weapon_') and f.endswith('.meta') and 'archetypes' not in f and 'animations' not in f and 'personality' not in f:
-                full_path = os.path.join(root, f)
-                if full_path not in meta_files:
-                    meta_files.append(full_path)
-    return meta_files
-
-def extract_weapon_name(content):
-    """Extract weapon name from file content."""
-    match = re.search(r'<Name>(WEAPON_[^<]+)</Name>', content)
-    if match:
-        return match.group(1)
-    return "Unknown"
+    """Find all weapons.meta files in a batch directory (via the meta index)."""
+    return find_batch_weapon_metas(batch_path)
 
 def apply_damage_reduction(file_path, dry_run=True):
-    """Apply 11% damage reduction to a weapon meta file."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    weapon_name = extract_weapon_name(content)
-
-    # Find and reduce damage value
-    damage_pattern = r'<Damage\s+value="([\d.]+)"'
-    match = re.search(damage_pattern, content)
-
-    if not match:
-        return None, None, weapon_name
-
-    old_damage = float(match.group(1))
-    new_damage = round(old_damage * (1 - DAMAGE_REDUCTION), 2)
-
-    new_content = re.sub(
-        damage_pattern,
-        f'<Damage value="{new_damage:.2f}"',
-        content
-    )
-
-    if not dry_run:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+    """
+    Apply 11% damage reduction to every CWeaponInfo in a weapon meta file.
+    Only each item's own <Damage> is rewritten. Returns ([(weapon, old, new)],
+    new content or None) - pool workers run with dry_run=True and the caller
+    stages the content.
+    """
+    meta = weapon_meta.load(file_path)
+    changes = []
+
+    for info in meta.items:
+        old_damage = info.damage
+        if old_damage is None:
+            continue
+        new_damage = round(old_damage * (1 - DAMAGE_REDUCTION), 2)
+        info.set('Damage', new_damage, '.2f')
+        changes.append((info.name or "Unknown", old_damage, new_damage))
 
-    return old_damage, new_damage, weapon_name
+    new_content = meta.render() if meta.dirty else None
+    if new_content is not None and not dry_run:
+        meta.save()
+    return changes, new_content
 
 def main():
-    dry_run = '--apply' not in sys.argv
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Apply the batch 12-19 damage reduction")
+    parser.add_argument("--apply", action="store_true", help="Apply changes (default is dry-run)")
+    parser.add_argument("--root", default=BASE_PATH, help="Project root")
+    parallel.add_workers_argument(parser)
+    args = parser.parse_args()
+    dry_run = not args.apply
 
     print("=" * 70)
     print("DAMAGE REDUCTION SCRIPT - 11% Reduction")
@@ -80,15 +69,23 @@ def main():
     print(f"Mode: {'DRY RUN' if dry_run else 'APPLYING'}")
     print()
 
+    # Reduce every batch's files on the pool, then report in batch order
+    batch_paths = [(batch_name, os.path.join(args.root, batch_name)) for batch_name in BATCHES]
+    batch_files = [(batch_name, batch_path, find_weapons_meta(batch_path) if os.path.exists(batch_path) else None)
+                   for batch_name, batch_path in batch_paths]
+    all_files = [f for _, _, files in batch_files for f in files or []]
+    with parallel.OrderedExecutor(args.workers) as executor:
+        outcomes = iter(executor.map(partial(apply_damage_reduction, dry_run=True), all_files))
+    if not dry_run:
+        meta_txn.begin(args.root)
+
     all_changes = []
 
-    for batch_name, batch_path in BATCHES:
-        if not os.path.exists(batch_path):
+    for batch_name, batch_path, meta_files in batch_files:
+        if meta_files is None:
             print(f"⚠ Batch not found: {batch_path}")
             continue
 
-        meta_files = find_weapons_meta(batch_path)
-
         if not meta_files:
             print(f"⚠ No weapons.meta files in {batch_name}")
             continue
@@ -98,9 +95,11 @@ def main():
         print(f"{'=' * 70}")
 
         for meta_file in meta_files:
-            old_dmg, new_dmg, weapon_name = apply_damage_reduction(meta_file, dry_run)
+            changes, new_content = next(outcomes)
+            if new_content is not None and not dry_run:
+                meta_txn.write_text(meta_file, new_content)
 
-            if old_dmg is not None:
+            for weapon_name, old_dmg, new_dmg in changes:
                 print(f"  {weapon_name}")
                 print(f"    Damage: {old_dmg:.2f} → {new_dmg:.2f} (-{DAMAGE_REDUCTION*100:.0f}%)")
                 all_changes.append({
@@ -113,6 +112,9 @@ def main():
                 if not dry_run:
                     print(f"    ✓ Updated")
 
+    if not dry_run:
+        print(f"\nCommitted {meta_txn.commit()} files")
+
     print(f"\n{'=' * 70}")
     print(f"SUMMARY: {len(all_changes)} weapons processed")
     print(f"{'=' * 70}")
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Incremental Build Graph
+
+Records, for every weapon a tuning script writes, the inputs its meta
+values were computed from and the values as written:
+- spec: the weapon's spec row
+- constants: only the calculator constants that row reads (its caliber's
+  ranges, its tier's multipliers, the shared offsets)
+- template: hash of the formula functions and output formats
+
+A later run rewrites a weapon only if one of those hashes changed or its
+written values were edited since (size/mtime first, then the values
+themselves). Changing one caliber's constants therefore touches only that
+caliber's files, and a no-op --apply is a stat per weapon.
+
+The graph lives next to the tree in .build_graph.json, one node per
+(tool, meta file, weapon).
+
+Usage:
+    python build_graph.py                       # Nodes per tool
+    python build_graph.py --stale               # Nodes whose outputs were edited or removed
+    python build_graph.py --forget weapon_calc  # Drop a tool's nodes (full rebuild next run)
+"""
+
+import os
+import json
+import inspect
+import hashlib
+from dataclasses import dataclass, field, asdict
+from typing import Optional
+
+from meta_patch import MetaPatcher
+
+BASE_PATH = "/home/user/project_pipes"
+
+GRAPH_FILENAME = ".build_graph.json"
+GRAPH_VERSION = 1
+
+
+# =============================================================================
+# HASHING
+# =============================================================================
+def digest(value) -> str:
+    """Stable hash of a JSON-able value (dict order does not matter)"""
+    text = json.dumps(value, sort_keys=True, separators=(",", ":"), default=repr)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+_SOURCE_DIGESTS: dict = {}
+
+
+def source_digest(*objects) -> str:
+    """Hash of the source of functions/classes - the 'template version' of a formula"""
+    key = tuple(id(o) for o in objects)
+    if key not in _SOURCE_DIGESTS:
+        _SOURCE_DIGESTS[key] = digest([inspect.getsource(o) for o in objects])
+    return _SOURCE_DIGESTS[key]
+
+
+def read_values(path: str, params) -> dict:
+    """Current value text of each parameter in a meta file (None if absent)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        patcher = MetaPatcher(f.read())
+    return {param: patcher.get(param) for param in params}
+
+
+# =============================================================================
+# GRAPH
+# =============================================================================
+@dataclass
+class BuildNode:
+    tool: str
+    path: str                                   # Meta file relative to the root
+    target: str                                 # Weapon the values belong to
+    inputs: dict = field(default_factory=dict)  # Input name -> digest
+    values: dict = field(default_factory=dict)  # Parameter -> value text as written
+    base: dict = field(default_factory=dict)    # Parameter -> text before the first write (relative tools)
+    size: int = 0
+    mtime_ns: int = 0
+
+
+class BuildGraph:
+    """Build graph rooted at a project directory"""
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        self.graph_path = os.path.join(self.root, GRAPH_FILENAME)
+        self.nodes: dict[str, BuildNode] = {}
+        self.dirty = False
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+    def load(self) -> bool:
+        """Load the on-disk graph. Returns False if missing or stale format."""
+        try:
+            with open(self.graph_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        if data.get("version") != GRAPH_VERSION:
+            return False
+
+        for node in data.get("nodes", []):
+            node = BuildNode(**node)
+            self.nodes[self.key(node.tool, node.path, node.target)] = node
+        return True
+
+    def save(self):
+        """Write the graph if anything changed (silently skipped on read-only trees)"""
+        if not self.dirty:
+            return
+        data = {
+            "version": GRAPH_VERSION,
+            "nodes": [asdict(self.nodes[k]) for k in sorted(self.nodes)],
+        }
+        temp_path = self.graph_path + ".tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=1)
+            os.replace(temp_path, self.graph_path)
+            self.dirty = False
+        except OSError:
+            pass
+
+    # -------------------------------------------------------------------------
+    # Nodes
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def key(tool: str, rel_path: str, target: str) -> str:
+        return f"{tool}:{rel_path}:{target}"
+
+    def relpath(self, path: str) -> str:
+        return os.path.relpath(os.path.abspath(path), self.root).replace(os.sep, "/")
+
+    def node(self, tool: str, path: str, target: str) -> Optional[BuildNode]:
+        return self.nodes.get(self.key(tool, self.relpath(path), target))
+
+    def stale(self, tool: str, path: str, target: str, inputs: dict) -> list:
+        """
+        Reasons the target must be rebuilt: "new", changed input names,
+        "output missing" or "output edited". Empty list = up to date.
+        """
+        node = self.node(tool, path, target)
+        if node is None:
+            return ["new"]
+        reasons = [name for name in sorted(set(inputs) | set(node.inputs))
+                   if inputs.get(name) != node.inputs.get(name)]
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return reasons + ["output missing"]
+        if (stat.st_size, stat.st_mtime_ns) != (node.size, node.mtime_ns):
+            if read_values(path, node.values) != node.values:
+                reasons.append("output edited")
+            else:
+                # Another tool rewrote other tags - keep the fast path for next time
+                node.size, node.mtime_ns = stat.st_size, stat.st_mtime_ns
+                self.dirty = True
+        return reasons
+
+    def record(self, tool: str, path: str, target: str, inputs: dict, expected: dict,
+               base: Optional[dict] = None) -> bool:
+        """
+        Store a target's inputs and its parameters' current text (call after
+        writing). expected maps parameter -> text it should now have (None =
+        any); if the file disagrees the write did not land and the target
+        stays stale. base keeps the values a relative adjustment started
+        from, so a rebuild can recompute from them. Returns True if recorded.
+        """
+        key = self.key(tool, self.relpath(path), target)
+        stat = os.stat(path)
+        values = read_values(path, expected)
+        if any(text is not None and values[param] not in (text, None) for param, text in expected.items()):
+            self.dirty = self.nodes.pop(key, None) is not None or self.dirty
+            return False
+        self.nodes[key] = BuildNode(tool, self.relpath(path), target, dict(inputs),
+                                    values, dict(base or {}), stat.st_size, stat.st_mtime_ns)
+        self.dirty = True
+        return True
+
+    def forget(self, tool: Optional[str] = None) -> int:
+        """Drop every node (of one tool); returns the count removed"""
+        keys = [k for k, n in self.nodes.items() if tool is None or n.tool == tool]
+        for k in keys:
+            del self.nodes[k]
+        self.dirty = self.dirty or bool(keys)
+        return len(keys)
+
+
+_GRAPHS: dict[str, BuildGraph] = {}
+
+
+def get_graph(root: str = BASE_PATH) -> BuildGraph:
+    """Load the graph for a root, once per process"""
+    root = os.path.abspath(root)
+    graph = _GRAPHS.get(root)
+    if graph is None:
+        graph = BuildGraph(root)
+        graph.load()
+        _GRAPHS[root] = graph
+    return graph
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect the incremental build graph")
+    parser.add_argument("--root", default=BASE_PATH, help="Project root")
+    parser.add_argument("--stale", action="store_true", help="List nodes whose outputs were edited or removed")
+    parser.add_argument("--forget", metavar="TOOL", help="Drop a tool's nodes ('all' for every tool)")
+    args = parser.parse_args()
+
+    graph = get_graph(args.root)
+    print(f"Build graph: {graph.graph_path}")
+
+    if args.forget:
+        removed = graph.forget(None if args.forget == "all" else args.forget)
+        graph.save()
+        print(f"  Forgot {removed} nodes")
+        return
+
+    tools = {}
+    for node in graph.nodes.values():
+        tools.setdefault(node.tool, []).append(node)
+    for tool, nodes in sorted(tools.items()):
+        print(f"  {tool:<20} {len(nodes):>4} nodes")
+
+    if args.stale:
+        print("\nStale outputs:")
+        count = 0
+        for node in sorted(graph.nodes.values(), key=lambda n: (n.tool, n.path, n.target)):
+            reasons = graph.stale(node.tool, os.path.join(graph.root, node.path), node.target, node.inputs)
+            if reasons:
+                count += 1
+                print(f"  {node.tool:<16} {node.target:<24} {', '.join(reasons)}")
+        print(f"  {count} stale")
+        graph.save()
+
+
+if __name__ == "__main__":
+    main()
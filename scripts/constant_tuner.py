@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Constrained Auto-Tuner for Calculator Constants
+
+Solves weapon_calc / rifle_smg_calc constants for target handling bands
+instead of trial-and-error passes over the metas:
+- Knobs: any numeric constant leaf (PARAMETER_RANGES bounds, tier offsets,
+  VALUE_FLOORS/VALUE_CEILINGS, scalar offsets, CALIBER_DATA fields, ...)
+- Constraints: value bands per caliber/tier ("9mm standard shake between
+  X and Y") and tier ordering ("match must beat quality on AccuracySpread")
+- Batched objective: every generation evaluates a whole population of
+  candidate constant sets in one pass of the vectorized kernels
+- Reports the best constant set and the slack of every constraint
+
+Nothing is written to meta files; paste the tuned constants into the
+calculator and run it with --apply as usual.
+
+Usage:
+    python constant_tuner.py                      # Built-in targets
+    python constant_tuner.py --targets tune.json  # {"knobs": [...], "constraints": [...]}
+
+Requires NumPy.
+"""
+
+import copy
+import json
+import time
+
+import numpy as np
+
+import weapon_calc as wc
+import weapon_calc_batch as handgun_batch
+import rifle_smg_calc_batch as rifle_batch
+
+# =============================================================================
+# DEFAULT TARGETS
+# =============================================================================
+# Knob: calc ("handgun"/"rifle"), path into the constants, optional bounds.
+# Paths are lists because caliber keys contain dots (".45_acp", "5.56x45").
+DEFAULT_KNOBS = [
+    {"calc": "handgun", "path": ["SHAKE_BASE_OFFSET"], "bounds": [1.20, 2.40]},
+    {"calc": "handgun", "path": ["SHAKE_TIER_SCALE"], "bounds": [0.20, 0.80]},
+    {"calc": "handgun", "path": ["PARAMETER_RANGES", "9mm", "RecoilShakeAmplitude", 0]},
+    {"calc": "handgun", "path": ["PARAMETER_RANGES", "9mm", "RecoilShakeAmplitude", 1]},
+    {"calc": "handgun", "path": ["PARAMETER_RANGES", ".45_acp", "RecoilShakeAmplitude", 1]},
+    {"calc": "handgun", "path": ["PARAMETER_RANGES", ".44_mag", "RecoilShakeAmplitude", 0]},
+    {"calc": "handgun", "path": ["PARAMETER_RANGES", ".44_mag", "RecoilShakeAmplitude", 1]},
+    {"calc": "handgun", "path": ["TIER_OFFSETS", "quality"], "bounds": [-0.8, 0.0]},
+    {"calc": "handgun", "path": ["TIER_OFFSETS", "match"], "bounds": [-1.2, -0.2]},
+    {"calc": "rifle", "path": ["SHAKE_OFFSET_BASE"], "bounds": [0.80, 1.60]},
+    {"calc": "rifle", "path": ["CALIBER_DATA", "7.62x51", "recoil_base"]},
+    {"calc": "rifle", "path": ["QUALITY_TIERS", "match", "accuracy_mult"], "bounds": [0.30, 0.70]},
+]
+
+# Constraint types:
+#   band:  every matching weapon's value within [min, max] (either optional)
+#   order: mean of the `better` tier beats mean of the `worse` tier
+#          ("lower" = better has the lower value) by at least `margin`
+DEFAULT_CONSTRAINTS = [
+    {"type": "band", "calc": "handgun", "caliber": "9mm", "tier": "standard",
+     "param": "RecoilShakeAmplitude", "min": 2.40, "max": 2.80},
+    {"type": "band", "calc": "handgun", "caliber": "9mm", "tier": "quality",
+     "param": "RecoilShakeAmplitude", "min": 2.00, "max": 2.50},
+    {"type": "band", "calc": "handgun", "caliber": ".45_acp", "tier": "standard",
+     "param": "RecoilShakeAmplitude", "min": 2.90, "max": 3.40},
+    {"type": "band", "calc": "handgun", "caliber": ".44_mag",
+     "param": "RecoilShakeAmplitude", "min": 6.00},
+    {"type": "order", "calc": "handgun", "param": "AccuracySpread",
+     "better": "match", "worse": "quality", "direction": "lower", "margin": 0.10},
+    {"type": "order", "calc": "handgun", "param": "RecoilShakeAmplitude",
+     "better": "quality", "worse": "standard", "direction": "lower", "margin": 0.30},
+    {"type": "band", "calc": "rifle", "caliber": "7.62x51",
+     "param": "RecoilShakeAmplitude", "min": 2.80},
+    {"type": "order", "calc": "rifle", "param": "AccuracySpread",
+     "better": "match", "worse": "quality", "direction": "lower", "margin": 0.10},
+]
+
+# Search settings
+POPULATION = 2048
+GENERATIONS = 40
+INITIAL_SIGMA = 0.25          # Fraction of each knob's bound width
+SIGMA_DECAY = 0.90
+REGULARIZATION = 0.01         # Pull toward current constants (smallest change)
+DEFAULT_BOUND_FRACTION = 0.30  # Knobs without bounds: current +/- 30%
+
+
+# =============================================================================
+# CALCULATOR ADAPTERS
+# =============================================================================
+class Calculator:
+    """One vectorized calculator bound to its roster"""
+
+    def __init__(self, name: str):
+        self.name = name
+        if name == "handgun":
+            self.module = handgun_batch
+            self.specs = handgun_batch.roster_specs()
+            self.calibers = [wc.normalize_caliber(s.caliber) for s in self.specs]
+            self.tiers = [s.quality_tier for s in self.specs]
+            self.is_switch = np.array([s.is_switch for s in self.specs])
+        elif name == "rifle":
+            self.module = rifle_batch
+            self.specs = rifle_batch.roster_specs()
+            self.calibers = [s.caliber for s in self.specs]
+            self.tiers = [s.quality for s in self.specs]
+            self.is_switch = np.zeros(len(self.specs), dtype=bool)
+        else:
+            raise ValueError(f"Unknown calculator: {name}")
+
+        self.constants = self.module.current_constants()
+        self.columns = self.module.build_columns(self.specs, self.constants)
+
+    def evaluate(self, constants: dict, population: int) -> dict:
+        """Rounded outputs as {param: (population, n_specs)}"""
+        if self.name == "handgun":
+            values = handgun_batch.calculate_values_batch(self.columns, constants)
+        else:
+            values = rifle_batch.calculate_stats_batch(self.columns, constants)
+        shape = (population, len(self.specs))
+        return {param: np.broadcast_to(value, shape) for param, value in values.items()}
+
+    def mask(self, caliber: str = None, tier: str = None) -> np.ndarray:
+        """Non-switch weapons matching a caliber and/or tier"""
+        mask = ~self.is_switch
+        if caliber:
+            mask &= np.array([c == caliber for c in self.calibers])
+        if tier:
+            mask &= np.array([t == tier for t in self.tiers])
+        return mask
+
+
+# =============================================================================
+# KNOBS
+# =============================================================================
+def get_leaf(tree, path: list):
+    for key in path:
+        tree = tree[key]
+    return tree
+
+
+def set_leaf(tree: dict, path: list, value) -> dict:
+    """Copy of `tree` with the leaf at `path` replaced (tuples become lists)"""
+    if not path:
+        return value
+    head, rest = path[0], path[1:]
+    copied = list(tree) if isinstance(tree, (list, tuple)) else dict(tree)
+    copied[head] = set_leaf(tree[head], rest, value)
+    return copied
+
+
+def knob_label(knob: dict) -> str:
+    return f"{knob['calc']}:" + ".".join(str(p) for p in knob["path"])
+
+
+def knob_bounds(knob: dict, current: float) -> tuple:
+    if "bounds" in knob:
+        return tuple(knob["bounds"])
+    span = abs(current) * DEFAULT_BOUND_FRACTION or 0.5
+    return (current - span, current + span)
+
+
+# =============================================================================
+# CONSTRAINTS
+# =============================================================================
+def constraint_label(con: dict) -> str:
+    where = " ".join(filter(None, [con.get("caliber"), con.get("tier")])) or "all"
+    if con["type"] == "band":
+        lo = con.get("min", "-inf")
+        hi = con.get("max", "inf")
+        return f"{con['calc']} {where} {con['param']} in [{lo}, {hi}]"
+    return (f"{con['calc']} {where} {con['param']}: {con['better']} "
+            f"{con.get('direction', 'lower')} than {con['worse']} by {con.get('margin', 0.0)}")
+
+
+class ConstraintSet:
+    """Precomputed weapon masks and scales for the batched slack computation"""
+
+    def __init__(self, constraints: list, calcs: dict):
+        self.constraints = constraints
+        self.prepared = []
+        for con in constraints:
+            calc = calcs[con["calc"]]
+            if con["type"] == "band":
+                mask = calc.mask(con.get("caliber"), con.get("tier"))
+                if not mask.any():
+                    raise ValueError(f"No weapons match: {constraint_label(con)}")
+                lo, hi = con.get("min"), con.get("max")
+                scale = (hi - lo) if lo is not None and hi is not None else abs(lo if lo is not None else hi)
+                self.prepared.append((con, mask, None, scale or 1.0))
+            elif con["type"] == "order":
+                better = calc.mask(con.get("caliber"), con["better"])
+                worse = calc.mask(con.get("caliber"), con["worse"])
+                if not better.any() or not worse.any():
+                    raise ValueError(f"No weapons match: {constraint_label(con)}")
+                self.prepared.append((con, better, worse, 1.0))
+            else:
+                raise ValueError(f"Unknown constraint type: {con['type']}")
+
+    def slack(self, outputs: dict) -> np.ndarray:
+        """(population, n_constraints) slack - negative means violated"""
+        columns = []
+        for con, mask, other, _ in self.prepared:
+            values = outputs[con["calc"]][con["param"]]
+            if con["type"] == "band":
+                group = values[:, mask]
+                slack = np.full(group.shape[0], np.inf)
+                if con.get("min") is not None:
+                    slack = np.minimum(slack, group.min(axis=1) - con["min"])
+                if con.get("max") is not None:
+                    slack = np.minimum(slack, con["max"] - group.max(axis=1))
+            else:
+                gap = values[:, other].mean(axis=1) - values[:, mask].mean(axis=1)
+                if con.get("direction", "lower") == "higher":
+                    gap = -gap
+                slack = gap - con.get("margin", 0.0)
+            columns.append(slack)
+        return np.column_stack(columns)
+
+    def penalty(self, slack: np.ndarray) -> np.ndarray:
+        scales = np.array([scale for *_, scale in self.prepared])
+        weights = np.array([con.get("weight", 1.0) for con in self.constraints])
+        violation = np.maximum(0.0, -slack) / scales
+        return (weights * violation ** 2).sum(axis=1)
+
+
+# =============================================================================
+# TUNER
+# =============================================================================
+class Tuner:
+    def __init__(self, knobs: list, constraints: list):
+        names = {k["calc"] for k in knobs} | {c["calc"] for c in constraints}
+        self.calcs = {name: Calculator(name) for name in sorted(names)}
+        self.knobs = knobs
+        self.constraints = ConstraintSet(constraints, self.calcs)
+
+        self.current = np.array([float(get_leaf(self.calcs[k["calc"]].constants, k["path"])) for k in knobs])
+        bounds = [knob_bounds(k, v) for k, v in zip(knobs, self.current)]
+        self.lower = np.array([b[0] for b in bounds])
+        self.upper = np.array([b[1] for b in bounds])
+        self.width = np.maximum(self.upper - self.lower, 1e-9)
+
+    def evaluate(self, candidates: np.ndarray) -> tuple:
+        """Objective and slack for a (population, n_knobs) candidate matrix"""
+        population = len(candidates)
+        constants = {name: calc.constants for name, calc in self.calcs.items()}
+        for i, knob in enumerate(self.knobs):
+            constants[knob["calc"]] = set_leaf(constants[knob["calc"]], knob["path"], candidates[:, i:i + 1])
+
+        outputs = {name: calc.evaluate(constants[name], population) for name, calc in self.calcs.items()}
+        slack = self.constraints.slack(outputs)
+        drift = ((candidates - self.current) / self.width) ** 2
+        objective = self.constraints.penalty(slack) + REGULARIZATION * drift.sum(axis=1)
+        return objective, slack
+
+    def solve(self, population: int = POPULATION, generations: int = GENERATIONS, seed: int = 0) -> dict:
+        rng = np.random.default_rng(seed)
+        start = np.clip(self.current, self.lower, self.upper)
+        best_objective, _ = self.evaluate(start[None, :])
+        best = start
+        best_objective = float(best_objective[0])
+        sigma = INITIAL_SIGMA * self.width
+
+        for _ in range(generations):
+            candidates = best + rng.standard_normal((population, len(best))) * sigma
+            candidates = np.clip(candidates, self.lower, self.upper)
+            candidates[0] = best
+            objective, _ = self.evaluate(candidates)
+            k = int(np.argmin(objective))
+            if objective[k] < best_objective:
+                best, best_objective = candidates[k].copy(), float(objective[k])
+            sigma = sigma * SIGMA_DECAY
+
+        baseline_objective, baseline_slack = self.evaluate(self.current[None, :])
+        _, best_slack = self.evaluate(best[None, :])
+        return {
+            "values": best,
+            "objective": best_objective,
+            "baseline_objective": float(baseline_objective[0]),
+            "slack": best_slack[0],
+            "baseline_slack": baseline_slack[0],
+        }
+
+
+def load_targets(path: str) -> tuple:
+    """Knobs and constraints from a JSON targets file (missing keys use defaults)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return data.get("knobs", DEFAULT_KNOBS), data.get("constraints", DEFAULT_CONSTRAINTS)
+
+
+def print_report(tuner: Tuner, result: dict):
+    print(f"\n{'='*78}")
+    print("BEST CONSTANT SET")
+    print('='*78)
+    for knob, current, tuned in zip(tuner.knobs, tuner.current, result["values"]):
+        mark = "" if abs(tuned - current) < 1e-9 else "  *"
+        print(f"  {knob_label(knob):<55} {current:>8.4f} -> {tuned:>8.4f}{mark}")
+
+    print(f"\n{'='*78}")
+    print("CONSTRAINT SLACK (negative = violated)")
+    print('='*78)
+    for con, before, after in zip(tuner.constraints.constraints, result["baseline_slack"], result["slack"]):
+        status = "OK " if after >= 0 else "VIOLATED"
+        print(f"  [{status:<8}] {before:>+8.3f} -> {after:>+8.3f}  {constraint_label(con)}")
+
+    satisfied = int((result["slack"] >= 0).sum())
+    print(f"\nSatisfied: {satisfied}/{len(result['slack'])} | "
+          f"Objective: {result['baseline_objective']:.4f} -> {result['objective']:.4f}")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Solve calculator constants for target handling bands")
+    parser.add_argument("--targets", type=str, help="JSON file with knobs and constraints")
+    parser.add_argument("--population", type=int, default=POPULATION, help="Candidates per generation")
+    parser.add_argument("--generations", type=int, default=GENERATIONS, help="Search generations")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", type=str, help="Write the best constant set as JSON")
+    args = parser.parse_args()
+
+    knobs, constraints = (load_targets(args.targets) if args.targets
+                          else (copy.deepcopy(DEFAULT_KNOBS), copy.deepcopy(DEFAULT_CONSTRAINTS)))
+
+    tuner = Tuner(knobs, constraints)
+    print(f"Tuning {len(knobs)} constants against {len(constraints)} constraints "
+          f"({args.population} x {args.generations} candidates)")
+
+    start = time.perf_counter()
+    result = tuner.solve(args.population, args.generations, args.seed)
+    print(f"Search finished in {time.perf_counter() - start:.2f}s")
+
+    print_report(tuner, result)
+
+    if args.output:
+        data = {
+            "constants": [{"calc": k["calc"], "path": k["path"], "value": round(float(v), 6)}
+                          for k, v in zip(knobs, result["values"])],
+            "slack": {constraint_label(c): round(float(s), 6)
+                      for c, s in zip(constraints, result["slack"])},
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        print(f"Written: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
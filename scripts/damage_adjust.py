@@ -3,17 +3,33 @@
 Weapon Damage Adjustment Script
 
 Adjusts damage values across all weapon batches by a specified percentage.
+
+The adjustment is relative, so each file is recorded in the build graph
+(build_graph.py) with its Damage/HudDamage from before the first
+adjustment: re-running with the same multiplier skips files whose values
+are still as written, and a new multiplier is applied to those base
+values, so a re-run never compounds the reduction. A file whose values
+were edited since is adjusted from its new values. Use --force to adjust
+the current values again on purpose.
 """
 
 import os
 import re
-import glob
+from functools import partial
 from pathlib import Path
+from typing import Optional
+
+import build_graph
+import meta_txn
+import parallel
+from meta_patch import MetaPatcher
+from meta_index import find_batch_weapon_metas
 
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
 DAMAGE_MULTIPLIER = 0.88  # 12% reduction = multiply by 0.88
+DAMAGE_VALUE_PATTERN = re.compile(r'\d+\.?\d*')
 
 # Batch directories (batches 1-11 for handguns)
 BASE_PATH = "/home/user/project_pipes"
@@ -32,77 +48,84 @@ BATCH_DIRS = [
 ]
 
 
-def find_weapon_meta_files(batch_path: str) -> list:
-    """Find all weapon meta files in a batch directory"""
-    meta_files = []
-
-    # Pattern 1: weapon_*/meta/weapon_*.meta
-    pattern1 = os.path.join(batch_path, "weapon_*", "meta", "weapon_*.meta")
-    meta_files.extend(glob.glob(pattern1))
-
-    # Pattern 2: weapon_*/meta/weapons.meta (some batches use this)
-    pattern2 = os.path.join(batch_path, "weapon_*", "meta", "weapons.meta")
-    meta_files.extend(glob.glob(pattern2))
+# Build graph node per adjusted file (build_graph.py)
+BUILD_TOOL = "damage_adjust"
+BUILD_TARGET = "Damage"
+BUILD_PARAMS = ("Damage", "HudDamage")
 
-    # Pattern 3: nested batch directories (like batch6_magnums/batch7_57x28)
-    pattern3 = os.path.join(batch_path, "*", "*", "weapon_*", "meta", "*.meta")
-    meta_files.extend(glob.glob(pattern3))
 
-    return meta_files
-
-
-def adjust_damage_in_file(file_path: str, multiplier: float, dry_run: bool = True) -> dict:
-    """Adjust damage values in a weapon meta file"""
+def find_weapon_meta_files(batch_path: str) -> list:
+    """Find all weapon meta files in a batch directory.
+
+    Resolved through the persistent meta index (meta_index.py), which also
+    covers nested batch directories (like batch6_magnums/batch7_57x28).
+    """
+    return find_batch_weapon_metas(batch_path)
+
+
+def adjust_damage_in_file(file_path: str, multiplier: float, dry_run: bool = True,
+                          base: Optional[dict] = None) -> dict:
+    """
+    Adjust damage values in a weapon meta file. "content" holds the new
+    file content (None if unchanged) so pool workers can run with
+    dry_run=True and leave the write to the caller. base (parameter ->
+    value text) is what the multiplier applies to instead of the current
+    values; "base" in the result is the text actually used.
+    """
+    base = base or {}
     result = {
         "file": file_path,
         "changes": [],
+        "content": None,
+        "base": {},
         "error": None
     }
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        original_content = content
-
-        # Pattern to match <Damage value="X"/> (excluding DamageTime, DamageFallOff, etc.)
-        # We need to be careful to only match the main Damage value
-        damage_pattern = r'(<Damage value=")(\d+\.?\d*)("/>|" />)'
-
-        def replace_damage(match):
-            prefix = match.group(1)
-            old_value = float(match.group(2))
-            suffix = match.group(3)
-            new_value = round(old_value * multiplier, 6)
+        content = meta_txn.read_text(file_path)
+
+        patcher = MetaPatcher(content)
+
+        # Only the main Damage tag is touched - DamageTime, DamageFallOff etc.
+        # are separate tags in the patcher's index
+        def replace_damage(old_text):
+            base_text = base.get("Damage") or old_text
+            if not DAMAGE_VALUE_PATTERN.fullmatch(base_text):
+                return None
+            result["base"]["Damage"] = base_text
+            old_value = float(old_text)
+            new_value = round(float(base_text) * multiplier, 6)
             result["changes"].append({
                 "param": "Damage",
                 "old": old_value,
                 "new": new_value
             })
-            return f'{prefix}{new_value:.6f}{suffix}'
+            return f'{new_value:.6f}'
 
-        content = re.sub(damage_pattern, replace_damage, content)
+        patcher.transform("Damage", replace_damage)
 
         # Also update HudDamage to match (integer value)
-        hud_pattern = r'(<HudDamage value=")(\d+)("/>|" />)'
-
-        def replace_hud_damage(match):
-            prefix = match.group(1)
-            old_value = int(match.group(2))
-            suffix = match.group(3)
-            new_value = int(round(old_value * multiplier))
+        def replace_hud_damage(old_text):
+            base_text = base.get("HudDamage") or old_text
+            if not base_text.isdigit() or not old_text.isdigit():
+                return None
+            result["base"]["HudDamage"] = base_text
+            old_value = int(old_text)
+            new_value = int(round(int(base_text) * multiplier))
             result["changes"].append({
                 "param": "HudDamage",
                 "old": old_value,
                 "new": new_value
             })
-            return f'{prefix}{new_value}{suffix}'
+            return f'{new_value}'
 
-        content = re.sub(hud_pattern, replace_hud_damage, content)
+        patcher.transform("HudDamage", replace_hud_damage)
 
-        if content != original_content and not dry_run:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+        new_content = patcher.apply()
+        if new_content != content:
+            result["content"] = new_content
+            if not dry_run:
+                meta_txn.write_text(file_path, new_content)
 
     except Exception as e:
         result["error"] = str(e)
@@ -110,36 +133,84 @@ def adjust_damage_in_file(file_path: str, multiplier: float, dry_run: bool = Tru
     return result
 
 
-def process_all_batches(dry_run: bool = True) -> dict:
-    """Process all batch directories"""
+def process_all_batches(dry_run: bool = True, multiplier: float = DAMAGE_MULTIPLIER,
+                        base_path: str = BASE_PATH, force: bool = False,
+                        executor: Optional[parallel.OrderedExecutor] = None) -> dict:
+    """
+    Process all batch directories (skipping files already adjusted by this
+    multiplier). Files are adjusted on the executor (serial if None) and
+    reported in batch/file order; writes are staged into the open meta_txn
+    transaction if there is one.
+    """
     results = {
         "processed": [],
         "errors": [],
         "summary": {
             "total_files": 0,
-            "total_changes": 0
+            "total_changes": 0,
+            "current_files": 0,
         }
     }
+    graph = build_graph.get_graph(base_path)
+    # Only the multiplier: the values are always recomputed from the recorded
+    # base, so a change to this script can never re-apply the reduction
+    inputs = {"multiplier": build_graph.digest(multiplier)}
 
+    # Plan in batch order: a missing batch is reported where it would have been met
+    plan = []
     for batch_dir in BATCH_DIRS:
-        batch_path = os.path.join(BASE_PATH, batch_dir)
+        batch_path = os.path.join(base_path, batch_dir)
 
         if not os.path.exists(batch_path):
-            results["errors"].append(f"Batch directory not found: {batch_path}")
+            plan.append((batch_path, None))
             continue
 
-        meta_files = find_weapon_meta_files(batch_path)
-
-        for meta_file in meta_files:
-            result = adjust_damage_in_file(meta_file, DAMAGE_MULTIPLIER, dry_run)
-
-            if result["error"]:
-                results["errors"].append(f"{meta_file}: {result['error']}")
-            elif result["changes"]:
-                results["processed"].append(result)
-                results["summary"]["total_files"] += 1
-                results["summary"]["total_changes"] += len(result["changes"])
+        for meta_file in find_weapon_meta_files(batch_path):
+            # Nodes from before base values were recorded also carry a "template" input
+            reasons = [r for r in graph.stale(BUILD_TOOL, meta_file, BUILD_TARGET, inputs) if r != "template"]
+            if not force and not reasons:
+                results["summary"]["current_files"] += 1
+                continue
+            node = graph.node(BUILD_TOOL, meta_file, BUILD_TARGET)
+            if force or node is None:
+                plan.append((meta_file, {}))
+            elif node.base:
+                # An edited value is the new base; the others keep their recorded one
+                current = build_graph.read_values(meta_file, node.values)
+                plan.append((meta_file, {param: text for param, text in node.base.items()
+                                         if current.get(param) == node.values.get(param)}))
+            else:
+                plan.append((meta_file, "adjusted before base values were recorded - "
+                                        "restore the originals or use --force"))
+
+    executor = executor or parallel.OrderedExecutor(workers=1)
+    adjusted = iter(executor.starmap(adjust_damage_in_file,
+                                     [(path, multiplier, True, base) for path, base in plan if isinstance(base, dict)]))
+
+    for path, base in plan:
+        if base is None:
+            results["errors"].append(f"Batch directory not found: {path}")
+            continue
+        if isinstance(base, str):
+            results["errors"].append(f"{path}: {base}")
+            continue
 
+        result = next(adjusted)
+        if result["error"]:
+            results["errors"].append(f"{path}: {result['error']}")
+            continue
+        content = result.pop("content")
+        if not dry_run:
+            if content is not None:
+                meta_txn.write_text(path, content)
+            meta_txn.after_commit(partial(graph.record, BUILD_TOOL, path, BUILD_TARGET, inputs,
+                                          dict.fromkeys(BUILD_PARAMS), base=result["base"]))
+        if result["changes"]:
+            results["processed"].append(result)
+            results["summary"]["total_files"] += 1
+            results["summary"]["total_changes"] += len(result["changes"])
+
+    meta_txn.after_commit(graph.save)
     return results
 
 
@@ -150,6 +221,10 @@ def main():
     parser.add_argument("--apply", action="store_true", help="Apply changes (default is dry-run)")
     parser.add_argument("--multiplier", type=float, default=DAMAGE_MULTIPLIER,
                         help=f"Damage multiplier (default: {DAMAGE_MULTIPLIER})")
+    parser.add_argument("--force", action="store_true",
+                        help="Adjust the current values again, even if already adjusted")
+    parser.add_argument("--root", default=BASE_PATH, help="Project root")
+    parallel.add_workers_argument(parser)
     args = parser.parse_args()
 
     multiplier = args.multiplier
@@ -157,12 +232,19 @@ def main():
     print(f"\nDamage Adjustment: {(1 - multiplier) * 100:.1f}% reduction (multiplier: {multiplier})")
     print(f"Dry run: {not args.apply}\n")
 
-    results = process_all_batches(dry_run=not args.apply)
+    if args.apply:
+        meta_txn.begin(args.root)
+    with parallel.OrderedExecutor(args.workers) as executor:
+        results = process_all_batches(dry_run=not args.apply, multiplier=multiplier,
+                                      base_path=args.root, force=args.force, executor=executor)
+    if args.apply:
+        print(f"Committed {meta_txn.commit()} files\n")
 
     # Print results
     print(f"{'='*60}")
     print(f"Processed {results['summary']['total_files']} files")
     print(f"Total changes: {results['summary']['total_changes']}")
+    print(f"Already adjusted (skipped): {results['summary']['current_files']}")
     print(f"{'='*60}\n")
 
     for item in results["processed"]:
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+free-bullets Damage Model (Lua mirrors)
+
+Python ports of the shared/modifiers.lua functions the offline tools
+evaluate, kept in one place so ttk_matrix.py and damage_table_gen.py use
+the same rules:
+- GetAmmoModifier, CalculateRangeFalloff (vectorized over distances),
+  GetSuppressorModifiers damage modifier, CalculateArmorDegradation
+- GetArmorEffectiveness sampled at every integer integrity
+
+Each takes the free-bullets Config table (lua_config.free_bullets_config).
+
+Requires NumPy.
+"""
+
+import numpy as np
+
+FULL_INTEGRITY = 100          # GetArmorIntegrity() default
+
+# Fallback used by GetAmmoModifier() when no modifier matches
+GENERIC_MODIFIER = {
+    "damageMult": 1.00,
+    "armorMult": 1.00,
+    "penetration": 0.70,
+    "armorBypass": False,
+    "effects": {},
+}
+
+
+# =============================================================================
+# LUA MIRRORS (shared/modifiers.lua)
+# =============================================================================
+def get_ammo_modifier(config: dict, ammo_type: str, caliber: str) -> tuple:
+    """GetAmmoModifier(): returns (modifier, matched) - matched False for the generic fallback"""
+    modifier_key = (config["CaliberAmmoMap"].get(caliber) or {}).get(ammo_type)
+    if modifier_key and modifier_key in config["AmmoModifiers"]:
+        return config["AmmoModifiers"][modifier_key], True
+    if ammo_type in config["AmmoModifiers"]:
+        return config["AmmoModifiers"][ammo_type], True
+    return GENERIC_MODIFIER, False
+
+
+def range_falloff(config: dict, caliber: str, ammo_type: str, distances: np.ndarray) -> np.ndarray:
+    """Vectorized CalculateRangeFalloff()"""
+    falloff = config["RangeFalloff"]
+    range_data = falloff["calibers"].get(caliber)
+    if not falloff.get("enabled") or not range_data:
+        return np.ones_like(distances)
+    if caliber == "12ga" and ammo_type == "slug":
+        range_data = falloff["slugOverride"]
+
+    effective = range_data["effectiveRange"]
+    max_range = range_data["maxRange"]
+    min_percent = range_data["minDamagePercent"]
+
+    percent = (distances - effective) / (max_range - effective)
+    curved = np.power(np.clip(percent, 0.0, None), range_data["falloffCurve"])
+    damage_percent = np.maximum(min_percent, 1.0 - (curved * (1.0 - min_percent)))
+
+    return np.where(distances <= effective, 1.0,
+                    np.where(distances >= max_range, min_percent, damage_percent))
+
+
+def suppressor_damage_modifier(config: dict, caliber: str, ammo_type: str) -> float:
+    """GetSuppressorModifiers(...).damageModifier with a suppressor fitted"""
+    synergy = config["SuppressorSynergy"]
+    if not synergy.get("enabled"):
+        return 1.0
+    if synergy["unsuppressible"].get(caliber):
+        return 1.0
+    is_subsonic = ammo_type == "subsonic" or caliber == ".45acp"
+    if is_subsonic and synergy["subsonicCapable"].get(caliber):
+        return synergy["subsonicSuppressed"]["damageModifier"]
+    return synergy["supersonicSuppressed"]["damageModifier"]
+
+
+def armor_degradation(config: dict, caliber: str, ammo_type: str) -> int:
+    """CalculateArmorDegradation()"""
+    degradation = config["ArmorDegradation"]
+    if not degradation.get("enabled"):
+        return 0
+    base_rate = degradation["degradationRates"].get(ammo_type, 8)
+    caliber_mult = degradation["caliberDegradation"].get(caliber, 1.0)
+    return int(np.floor(base_rate * caliber_mult))
+
+
+def effectiveness_table(config: dict) -> np.ndarray:
+    """GetArmorEffectiveness() for every integer integrity 0..100"""
+    table = np.full(FULL_INTEGRITY + 1, 0.15)
+    degradation = config["ArmorDegradation"]
+    if not degradation.get("enabled"):
+        return np.ones(FULL_INTEGRITY + 1)
+    for integrity in range(FULL_INTEGRITY + 1):
+        for tier in degradation["integrityEffectiveness"]:
+            if tier["min"] <= integrity <= tier["max"]:
+                table[integrity] = tier["effectiveness"]
+                break
+    return table
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Damage Table Generator (sv_damage hot path)
+
+Folds the free-bullets config into a flat, precomputed Lua lookup that
+sv_damage.lua reads instead of resolving modifiers on every
+weaponDamageEvent:
+- DamageTable.weapons[`WEAPON_X`][ammoType] -> resolved multipliers
+  (GetAmmoModifier damage/armor mults + bypass, GetSuppressorModifiers
+  damage modifier, CalculateArmorDegradation points, falloff curve)
+- DamageTable.falloff[caliber] -> CalculateRangeFalloff sampled every
+  STEP meters between effectiveRange and maxRange (12ga slugs separate)
+- DamageTable.armorEffectiveness[integrity + 1] -> GetArmorEffectiveness
+
+The output records a hash of the shared Lua files it was built from;
+--check exits non-zero if the table is stale.
+
+Usage:
+    python damage_table_gen.py
+    python damage_table_gen.py --check
+"""
+
+import os
+import sys
+
+import numpy as np
+
+import lua_config
+from lua_config import LuaExpr, LuaHash
+from damage_model import (get_ammo_modifier, range_falloff, suppressor_damage_modifier,
+                          armor_degradation, effectiveness_table)
+
+BASE_PATH = "/home/user/project_pipes"
+OUTPUT_PATH = "free-bullets/server/sv_damage_table.lua"
+
+STEP = 0.5                    # Falloff sample spacing (m)
+SAMPLE_DIGITS = 4             # Falloff samples rounded to this many decimals
+SLUG_CURVE = "12ga_slug"      # Falloff key for CalculateRangeFalloff's slug override
+
+HEADER = """--[[
+    AUTO-GENERATED by scripts/damage_table_gen.py - DO NOT EDIT
+    =============================================================
+
+    Precomputed per-(weapon, ammo) damage modifiers for sv_damage.lua.
+    Regenerate after changing free-bullets/shared/*.lua:
+
+        python scripts/damage_table_gen.py
+
+    Source hash: {source_hash}
+]]
+"""
+
+
+# =============================================================================
+# TABLE BUILDING
+# =============================================================================
+def falloff_key(caliber: str, ammo_type: str) -> str:
+    return SLUG_CURVE if caliber == "12ga" and ammo_type == "slug" else caliber
+
+
+def build_falloff(config: dict, step: float = STEP) -> dict:
+    """{key: curve} with samples[i] = multiplier at effectiveRange + (i - 1) * step"""
+    falloff = config["RangeFalloff"]
+    if not falloff.get("enabled"):
+        return {}
+
+    sources = dict(falloff["calibers"])
+    if "12ga" in sources:
+        sources[SLUG_CURVE] = falloff["slugOverride"]
+
+    curves = {}
+    for key, data in sources.items():
+        caliber, ammo = ("12ga", "slug") if key == SLUG_CURVE else (key, "")
+        effective, max_range = data["effectiveRange"], data["maxRange"]
+        count = int(np.ceil((max_range - effective) / step)) + 1
+        distances = effective + np.arange(count) * step
+        samples = range_falloff(config, caliber, ammo, distances)
+        curves[key] = {
+            "effectiveRange": effective,
+            "maxRange": max_range,
+            "minDamage": data["minDamagePercent"],
+            "samples": [round(float(v), SAMPLE_DIGITS) for v in samples],
+        }
+    return curves
+
+
+def quantized_falloff(curve: dict, distances: np.ndarray, step: float) -> np.ndarray:
+    """What the Lua lookup returns for each distance (mirror of ResolvedRangeFalloff)"""
+    samples = np.array(curve["samples"])
+    idx = np.floor((distances - curve["effectiveRange"]) / step + 0.5).astype(int)
+    values = samples[np.clip(idx, 0, len(samples) - 1)]
+    values = np.where(distances >= curve["maxRange"], curve["minDamage"], values)
+    return np.where(distances <= curve["effectiveRange"], 1.0, values)
+
+
+def build_ammo(config: dict, curves: dict) -> tuple:
+    """{caliber: {ammoType: entry}} and the ammo types using the generic modifier"""
+    ammo = {}
+    unmapped = []
+    for caliber, ammo_types in config["AmmoTypes"].items():
+        entries = {}
+        for ammo_type in ammo_types:
+            modifier, matched = get_ammo_modifier(config, ammo_type, caliber)
+            if not matched:
+                unmapped.append(f"{caliber} {ammo_type}")
+            key = falloff_key(caliber, ammo_type)
+            entries[ammo_type] = {
+                "damageMult": modifier["damageMult"],
+                "armorMult": modifier["armorMult"],
+                "armorBypass": bool(modifier.get("armorBypass")),
+                "suppressedMult": suppressor_damage_modifier(config, caliber, ammo_type),
+                "degradation": armor_degradation(config, caliber, ammo_type),
+                "falloff": LuaExpr(f"F[{lua_config.lua_value(key)}]") if key in curves else None,
+            }
+        ammo[caliber] = entries
+    return ammo, unmapped
+
+
+def render(config: dict, source_hash: str, step: float = STEP) -> tuple:
+    """Generated Lua source plus a report dict"""
+    curves = build_falloff(config, step)
+    ammo, unmapped = build_ammo(config, curves)
+    weapons = {LuaHash(name): LuaExpr(f"A[{lua_config.lua_value(info['caliber'])}]")
+               for name, info in config["Weapons"].items() if info.get("caliber") in ammo}
+
+    sections = [
+        HEADER.format(source_hash=source_hash),
+        "DamageTable = {}",
+        "",
+        f"DamageTable.falloffStep = {lua_config.lua_value(float(step))}",
+        "",
+        "-- Range falloff: samples[i] = multiplier at effectiveRange + (i - 1) * falloffStep",
+        f"DamageTable.falloff = {lua_config.to_lua(curves)}",
+        "",
+        "-- Armor effectiveness by integrity: armorEffectiveness[integrity + 1]",
+        f"DamageTable.armorEffectiveness = {lua_config.to_lua([float(v) for v in effectiveness_table(config)])}",
+        "",
+        "local F = DamageTable.falloff",
+        "",
+        "-- Resolved modifiers: ammo[caliber][ammoType]",
+        f"DamageTable.ammo = {lua_config.to_lua(ammo)}",
+        "",
+        "local A = DamageTable.ammo",
+        "",
+        "-- weapons[hash][ammoType] -> ammo entry",
+        f"DamageTable.weapons = {lua_config.to_lua(weapons)}",
+        "",
+    ]
+
+    probe = np.arange(0.0, max([c["maxRange"] for c in curves.values()] + [0]) + 10, 0.01)
+    max_error = 0.0
+    for key, curve in curves.items():
+        caliber, ammo_type = ("12ga", "slug") if key == SLUG_CURVE else (key, "")
+        exact = range_falloff(config, caliber, ammo_type, probe)
+        max_error = max(max_error, float(np.abs(quantized_falloff(curve, probe, step) - exact).max()))
+
+    report = {
+        "weapons": len(weapons),
+        "entries": sum(len(e) for e in ammo.values()),
+        "curves": len(curves),
+        "samples": sum(len(c["samples"]) for c in curves.values()),
+        "max_falloff_error": max_error,
+        "unmapped": unmapped,
+    }
+    return "\n".join(sections), report
+
+
+def source_paths(base_path: str) -> list:
+    return [os.path.join(base_path, p) for p in lua_config.FREE_BULLETS_SHARED]
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate the precomputed sv_damage lookup table")
+    parser.add_argument("--root", default=BASE_PATH, help="Project root")
+    parser.add_argument("--output", type=str, help=f"Output path (default: <root>/{OUTPUT_PATH})")
+    parser.add_argument("--step", type=float, default=STEP, help="Falloff sample spacing (m)")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the table is missing or stale")
+    args = parser.parse_args()
+
+    output = args.output or os.path.join(args.root, OUTPUT_PATH)
+    source_hash = lua_config.content_key(source_paths(args.root))
+
+    if args.check:
+        recorded = lua_config.generated_source_hash(output)
+        if recorded != source_hash:
+            print(f"STALE: {output} (recorded {recorded}, current {source_hash})")
+            sys.exit(1)
+        print(f"Up to date: {output}")
+        return
+
+    config = lua_config.free_bullets_config(args.root)
+    source, report = render(config, source_hash, args.step)
+
+    with open(output, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(source)
+
+    print(f"Written: {output}")
+    print(f"  Weapons:        {report['weapons']}")
+    print(f"  Ammo entries:   {report['entries']}")
+    print(f"  Falloff curves: {report['curves']} ({report['samples']} samples @ {args.step:g}m)")
+    print(f"  Max falloff quantization error: {report['max_falloff_error']:.4f}")
+    if report["unmapped"]:
+        print(f"  Generic modifier (no CaliberAmmoMap entry): {', '.join(report['unmapped'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Fire-Rate Threshold Generator (sv_firevalidation per-weapon limits)
+
+Builds a flat Lua table of per-weapon fire-rate limits for
+sv_firevalidation.lua, which otherwise applies one SemiAutoMinInterval /
+BurstWindow to every weapon (too loose for a 1 s revolver, too strict for
+a fast semi):
+- FireThresholds[`WEAPON_X`].semi -> minimum ms between SEMI shots:
+  max(TimeBetweenShots, TRIGGER_MIN_MS) scaled by the tolerance
+- FireThresholds[`WEAPON_X`].burstWindow / .burstMax -> at most burstMax
+  shots in any burstWindow ms: the shortest legitimate span of
+  burstMax + 1 shots (burst gaps plus Config.BurstDelay, per the
+  cl_firecontrol rules) scaled by the tolerance
+- The tolerance defaults to today's global margin
+  (ValidationConfig.SemiAutoMinInterval / Config.FireRates.SEMI)
+
+Only modes a weapon can fire (modes or modesWhenModified) get entries;
+anything else keeps the ValidationConfig globals. TimeBetweenShots comes
+from each weapon's meta. The validator indexes the table with the hash it
+already receives, so there is no extra per-shot work.
+
+The output records a hash of the config, validator and metas it was built
+from; --check exits non-zero if the table is stale.
+
+Usage:
+    python fire_threshold_gen.py
+    python fire_threshold_gen.py --check
+    python fire_threshold_gen.py --tolerance 0.8
+"""
+
+import os
+import sys
+
+import lua_config
+import meta_index
+import weapon_meta
+from shot_replay import VALIDATION_LUA, BUFFER_SLOTS, read_validation_config
+
+BASE_PATH = "/home/user/project_pipes"
+OUTPUT_PATH = "free_selectivefire/server/sv_fire_thresholds.lua"
+
+TRIGGER_MIN_MS = 125          # Fastest sustained trigger pull (8/s) - SEMI cadence floor
+MODES = ("SEMI", "BURST")     # FULL is not rate-checked
+
+HEADER = """--[[
+    AUTO-GENERATED by scripts/fire_threshold_gen.py - DO NOT EDIT
+    ===============================================================
+
+    Per-weapon fire-rate limits for sv_firevalidation.lua (ms).
+    Regenerate after changing free_selectivefire/shared/config.lua,
+    ValidationConfig or a weapon's TimeBetweenShots:
+
+        python scripts/fire_threshold_gen.py
+
+    Source hash: {source_hash}
+]]
+"""
+
+
+# =============================================================================
+# TABLE BUILDING
+# =============================================================================
+def burst_gaps(time_between_shots: float, fire: dict, burst_count: int) -> list:
+    """Shortest legitimate gaps (ms) over one burst cycle, per cl_firecontrol"""
+    interval = max(time_between_shots * 1000.0, fire["FireRates"]["BURST"])
+    pause = max(time_between_shots * 1000.0, fire["BurstDelay"])
+    return [interval] * (burst_count - 1) + [pause]
+
+
+def min_span(gaps: list, shots: int) -> float:
+    """Shortest time covered by `shots` consecutive shots of a repeating gap cycle"""
+    cycle = gaps * (shots // len(gaps) + 2)
+    return min(sum(cycle[i:i + shots - 1]) for i in range(len(gaps)))
+
+
+def weapon_thresholds(name: str, entry: dict, time_between_shots: float, fire: dict,
+                      tolerance: float) -> dict:
+    """{semi, burstWindow, burstMax} for the modes the weapon can fire"""
+    modes = set(entry.get("modes") or []) | set(entry.get("modesWhenModified") or [])
+    limits = {}
+    if "SEMI" in modes:
+        limits["semi"] = int(max(time_between_shots * 1000.0, TRIGGER_MIN_MS) * tolerance)
+    if "BURST" in modes:
+        burst_count = int(entry.get("burstCount") or fire["DefaultBurstCount"])
+        burst_max = min(burst_count, BUFFER_SLOTS - 1)     # The buffer holds burstMax + 1 shots at most
+        span = min_span(burst_gaps(time_between_shots, fire, burst_count), burst_max + 1)
+        limits["burstWindow"] = max(1, int(span * tolerance))
+        limits["burstMax"] = burst_max
+    return limits
+
+
+def weapon_sources(root: str, fire: dict) -> tuple:
+    """{name: meta path} for selective-fire weapons, plus names without a meta"""
+    index = meta_index.get_index(root)
+    paths, missing = {}, []
+    for name in fire.get("Weapons") or {}:
+        path = index.find_by_name(name)
+        if path:
+            paths[name] = path
+        else:
+            missing.append(name)
+    return paths, missing
+
+
+def build_table(root: str, tolerance: float = None) -> tuple:
+    """({name: limits}, report dict)"""
+    fire = lua_config.selectivefire_config(root)
+    validation = read_validation_config(root)
+    if tolerance is None:
+        tolerance = validation["SemiAutoMinInterval"] / fire["FireRates"]["SEMI"]
+
+    paths, missing = weapon_sources(root, fire)
+    table, stats = {}, {}
+    for name, entry in (fire.get("Weapons") or {}).items():
+        info = weapon_meta.load(paths[name]).weapon(name) if name in paths else None
+        time_between_shots = info.time_between_shots if info else None
+        if time_between_shots is None:
+            if name not in missing:
+                missing.append(name)
+            continue
+        limits = weapon_thresholds(name, entry, time_between_shots, fire, tolerance)
+        if limits:
+            table[name] = limits
+            stats[name] = time_between_shots
+
+    report = {
+        "tolerance": tolerance,
+        "global": validation,
+        "tbs": stats,
+        "missing": missing,
+        "paths": paths,
+    }
+    return table, report
+
+
+def render(table: dict, source_hash: str) -> str:
+    entries = {lua_config.LuaHash(name): limits for name, limits in sorted(table.items())}
+    return "\n".join([
+        HEADER.format(source_hash=source_hash),
+        "-- FireThresholds[weaponHash] -> { semi = ms, burstWindow = ms, burstMax = shots }",
+        f"FireThresholds = {lua_config.to_lua(entries)}",
+        "",
+    ])
+
+
+def source_paths(root: str, meta_paths: dict) -> list:
+    paths = [os.path.join(root, p) for p in lua_config.SELECTIVEFIRE_SHARED]
+    paths.append(os.path.join(root, VALIDATION_LUA))
+    return paths + sorted(set(meta_paths.values()))
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate per-weapon fire-rate thresholds for sv_firevalidation")
+    parser.add_argument("--root", default=BASE_PATH, help="Project root")
+    parser.add_argument("--output", type=str, help=f"Output path (default: <root>/{OUTPUT_PATH})")
+    parser.add_argument("--tolerance", type=float,
+                        help="Fraction of the legitimate interval allowed (default: SemiAutoMinInterval / FireRates.SEMI)")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the table is missing or stale")
+    args = parser.parse_args()
+
+    output = args.output or os.path.join(args.root, OUTPUT_PATH)
+
+    if args.check:
+        paths, _ = weapon_sources(args.root, lua_config.selectivefire_config(args.root))
+        source_hash = lua_config.content_key(source_paths(args.root, paths))
+        recorded = lua_config.generated_source_hash(output)
+        if recorded != source_hash:
+            print(f"STALE: {output} (recorded {recorded}, current {source_hash})")
+            sys.exit(1)
+        print(f"Up to date: {output}")
+        return
+
+    table, report = build_table(args.root, args.tolerance)
+    source_hash = lua_config.content_key(source_paths(args.root, report["paths"]))
+
+    with open(output, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(render(table, source_hash))
+
+    validation = report["global"]
+    print(f"Written: {output}")
+    print(f"  Weapons:   {len(table)}  (tolerance {report['tolerance']:.2f})")
+    print(f"  Global:    SEMI {validation['SemiAutoMinInterval']} ms, "
+          f"BURST {validation['BurstMaxShots']} shots / {validation['BurstWindow']} ms")
+    print(f"\n  {'Weapon':<26} {'TBS (s)':>8} {'SEMI':>6} {'BURST':>12}")
+    for name in sorted(table):
+        limits = table[name]
+        semi = f"{limits['semi']}" if "semi" in limits else "-"
+        burst = f"{limits['burstMax']} / {limits['burstWindow']}" if "burstMax" in limits else "-"
+        print(f"  {name:<26} {report['tbs'][name]:8.3f} {semi:>6} {burst:>12}")
+    if report["missing"]:
+        print(f"\n  No meta TimeBetweenShots (global limits): {', '.join(sorted(report['missing']))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,9 @@ import os
 import re
 from pathlib import Path
 
+import meta_txn
+import parallel
+
 # Base project directory
 PROJECT_DIR = Path("/home/user/project_pipes")
 
@@ -76,18 +79,17 @@ def determine_model_name(weapon_name, component_name):
 
     return None
 
-def fix_weaponcomponents_file(filepath):
+def fixed_weaponcomponents_content(filepath):
     """
-    Fix empty <Model /> tags in a weaponcomponents.meta file.
-    Returns tuple of (modified, changes_made)
+    Fixed content of a weaponcomponents.meta file without writing it.
+    Returns tuple of (new_content or None if unchanged, changes_made)
     """
     weapon_name = get_weapon_name_from_path(filepath)
     if not weapon_name:
         print(f"  WARNING: Could not determine weapon name for {filepath}")
-        return False, 0
+        return None, 0
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = meta_txn.read_text(str(filepath))
 
     original_content = content
     changes_made = 0
@@ -114,45 +116,77 @@ def fix_weaponcomponents_file(filepath):
     content = re.sub(item_pattern, replace_model, content, flags=re.DOTALL)
 
     if content != original_content:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-        return True, changes_made
+        return content, changes_made
 
-    return False, 0
+    return None, 0
+
+def fix_weaponcomponents_file(filepath):
+    """
+    Fix empty <Model /> tags in a weaponcomponents.meta file (staged into
+    the active meta_txn transaction if there is one).
+    Returns tuple of (modified, changes_made)
+    """
+    content, changes_made = fixed_weaponcomponents_content(filepath)
+    if content is None:
+        return False, 0
+    meta_txn.write_text(str(filepath), content)
+    return True, changes_made
 
-def find_batch_directories():
+def find_batch_directories(project_dir=PROJECT_DIR):
     """Find all batch directories matching our patterns."""
     batch_dirs = []
     for pattern in BATCH_PATTERNS:
-        matches = list(PROJECT_DIR.glob(pattern))
+        matches = list(Path(project_dir).glob(pattern))
         batch_dirs.extend(matches)
     return sorted(set(batch_dirs))
 
 def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Fix empty magazine <Model /> tags (batches 1-11)")
+    parser.add_argument("--root", default=str(PROJECT_DIR), help="Project root")
+    parallel.add_workers_argument(parser)
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Magazine Model Reference Fixer for Batches 1-11")
     print("=" * 60)
     print()
 
-    batch_dirs = find_batch_directories()
+    batch_dirs = find_batch_directories(args.root)
     print(f"Found {len(batch_dirs)} batch directories to process")
     print()
 
+    # Find all weaponcomponents.meta files per batch, fix them on the pool,
+    # then stage the writes and report in the same order as a serial run
+    batch_files = [(batch_dir, list(batch_dir.glob("**/weaponcomponents.meta"))) for batch_dir in batch_dirs]
+    fixable = [f for _, files in batch_files for f in files if get_weapon_name_from_path(f)]
+    with parallel.OrderedExecutor(args.workers) as executor:
+        outcomes = dict(zip(fixable, executor.map(fixed_weaponcomponents_content, fixable)))
+
+    meta_txn.begin(args.root)
+    for meta_file, (content, _) in outcomes.items():
+        if content is not None:
+            meta_txn.write_text(str(meta_file), content)
+    meta_txn.commit()
+
     total_files = 0
     total_modified = 0
     total_changes = 0
 
-    for batch_dir in batch_dirs:
+    for batch_dir, meta_files in batch_files:
         print(f"Processing: {batch_dir.name}")
 
-        # Find all weaponcomponents.meta files in this batch
-        meta_files = list(batch_dir.glob("**/weaponcomponents.meta"))
-
         for meta_file in meta_files:
             weapon_name = get_weapon_name_from_path(meta_file)
             total_files += 1
 
-            modified, changes = fix_weaponcomponents_file(meta_file)
+            if weapon_name:
+                content, changes = outcomes[meta_file]
+                modified = content is not None
+            else:
+                print(f"  WARNING: Could not determine weapon name for {meta_file}")
+                modified, changes = False, 0
 
             if modified:
                 total_modified += 1
@@ -21,315 +21,15 @@ import os
 import re
 from pathlib import Path
 
-BASE_PATH = "/home/user/project_pipes"
+import meta_generator
+import meta_scan
+import meta_txn
+import weapon_registry
 
-# Weapon configurations
-RIFLE_CONFIGS = {
-    # Batch 12 - Assault Rifles (5.56 NATO)
-    "weapon_cz_bren": {
-        "name": "WEAPON_CZ_BREN",
-        "display": "CZ Bren 2",
-        "model": "w_ar_cz_bren",
-        "slot": "SLOT_CZ_BREN",
-        "order_nav": 300,
-        "order_best": 150,
-        "ammo": "AMMO_RIFLE",
-        "group": "GROUP_RIFLE",
-        "wheel_slot": "WHEEL_RIFLE",
-        "audio": "AUDIO_ITEM_CARBINERIFLE",
-    },
-    "weapon_desert_ar15": {
-        "name": "WEAPON_DESERT_AR15",
-        "display": "Desert AR-15",
-        "model": "w_ar_desert_ar15",
-        "slot": "SLOT_DESERT_AR15",
-        "order_nav": 301,
-        "order_best": 151,
-        "ammo": "AMMO_RIFLE",
-        "group": "GROUP_RIFLE",
-        "wheel_slot": "WHEEL_RIFLE",
-        "audio": "AUDIO_ITEM_CARBINERIFLE",
-    },
-    "weapon_m16": {
-        "name": "WEAPON_M16",
-        "display": "M16A4",
-        "model": "w_ar_m16",
-        "slot": "SLOT_M16",
-        "order_nav": 302,
-        "order_best": 152,
-        "ammo": "AMMO_RIFLE",
-        "group": "GROUP_RIFLE",
-        "wheel_slot": "WHEEL_RIFLE",
-        "audio": "AUDIO_ITEM_CARBINERIFLE",
-    },
-    "weapon_psa_ar15": {
-        "name": "WEAPON_PSA_AR15",
-        "display": "PSA AR-15",
-        "model": "w_ar_psa_ar15",
-        "slot": "SLOT_PSA_AR15",
-        "order_nav": 303,
-        "order_best": 153,
-        "ammo": "AMMO_RIFLE",
-        "group": "GROUP_RIFLE",
-        "wheel_slot": "WHEEL_RIFLE",
-        "audio": "AUDIO_ITEM_CARBINERIFLE",
-    },
-    "weapon_ram7knight": {
-        "name": "WEAPON_RAM7KNIGHT",
-        "display": "RAM-7 Knight",
-        "model": "w_ar_ram7knight",
-        "slot": "SLOT_RAM7KNIGHT",
-        "order_nav": 304,
-        "order_best": 154,
-        "ammo": "AMMO_RIFLE",
-        "group": "GROUP_RIFLE",
-        "wheel_slot": "WHEEL_RIFLE",
-        "audio": "AUDIO_ITEM_CARBINERIFLE",
-    },
-    "weapon_red_aug": {
-        "name": "WEAPON_RED_AUG",
-        "display": "Steyr AUG",
-        "model": "w_ar_red_aug",
-        "slot": "SLOT_RED_AUG",
-        "order_nav": 305,
-        "order_best": 155,
-        "ammo": "AMMO_RIFLE",
-        "group": "GROUP_RIFLE",
-        "wheel_slot": "WHEEL_RIFLE",
-        "audio": "AUDIO_ITEM_CARBINERIFLE",
-    },
-    # Batch 13 - AK Variants (7.62x39)
-    "weapon_mini_ak47": {
-        "name": "WEAPON_MINI_AK47",
-        "display": "Mini AK-47",
-        "model": "w_ar_mini_ak47",
-        "slot": "SLOT_MINI_AK47",
-        "order_nav": 310,
-        "order_best": 160,
-        "ammo": "AMMO_RIFLE",
-        "group": "GROUP_RIFLE",
-        "wheel_slot": "WHEEL_RIFLE",
-        "audio": "AUDIO_ITEM_ASSAULTRIFLE",
-    },
-    "weapon_mk47": {
-        "name": "WEAPON_MK47",
-        "display": "MK47 Mutant",
-        "model": "w_ar_mk47",
-        "slot": "SLOT_MK47",
-        "order_nav": 311,
-        "order_best": 161,
-        "ammo": "AMMO_RIFLE",
-        "group": "GROUP_RIFLE",
-        "wheel_slot": "WHEEL_RIFLE",
-        "audio": "AUDIO_ITEM_ASSAULTRIFLE",
-    },
-    # Batch 14 - Battle Rifles (.308/6.8mm)
-    "weapon_m7": {
-        "name": "WEAPON_M7",
-        "display": "M7",
-        "model": "w_ar_m7",
-        "slot": "SLOT_M7",
-        "order_nav": 320,
-        "order_best": 170,
-        "ammo": "AMMO_RIFLE",
-        "group": "GROUP_RIFLE",
-        "wheel_slot": "WHEEL_RIFLE",
-        "audio": "AUDIO_ITEM_ASSAULTRIFLE",
-    },
-    "weapon_mcx300": {
-        "name": "WEAPON_MCX300",
-        "display": "SIG MCX .300",
-        "model": "w_ar_mcx300",
-        "slot": "SLOT_MCX300",
-        "order_nav": 321,
-        "order_best": 171,
-        "ammo": "AMMO_RIFLE",
-        "group": "GROUP_RIFLE",
-        "wheel_slot": "WHEEL_RIFLE",
-        "audio": "AUDIO_ITEM_ASSAULTRIFLE",
-    },
-    "weapon_sig_spear": {
-        "name": "WEAPON_SIG_SPEAR",
-        "display": "SIG Spear",
-        "model": "w_ar_sig_spear",
-        "slot": "SLOT_SIG_SPEAR",
-        "order_nav": 322,
-        "order_best": 172,
-        "ammo": "AMMO_RIFLE",
-        "group": "GROUP_RIFLE",
-        "wheel_slot": "WHEEL_RIFLE",
-        "audio": "AUDIO_ITEM_ASSAULTRIFLE",
-    },
-}
+BASE_PATH = "/home/user/project_pipes"
 
-# Template for complete weapons.meta structure
-WEAPONS_META_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
-<CWeaponInfoBlob>
-  <SlotNavigateOrder>
-    <Item>
-      <WeaponSlots>
-        <Item>
-          <OrderNumber value="{order_nav}" />
-          <Entry>{slot}</Entry>
-        </Item>
-      </WeaponSlots>
-    </Item>
-    <Item>
-      <WeaponSlots>
-        <Item>
-          <OrderNumber value="{order_nav}" />
-          <Entry>{slot}</Entry>
-        </Item>
-      </WeaponSlots>
-    </Item>
-  </SlotNavigateOrder>
-  <SlotBestOrder>
-    <WeaponSlots>
-      <Item>
-        <OrderNumber value="{order_best}" />
-        <Entry>{slot}</Entry>
-      </Item>
-    </WeaponSlots>
-  </SlotBestOrder>
-  <TintSpecValues />
-  <FiringPatternAliases />
-  <UpperBodyFixupExpressionData />
-  <AimingInfos>
-    <Item type="CAimingInfo">
-      <Name>{aiming_info_name}</Name>
-      <HeadingLimit value="90.000000" />
-      <SweepPitchMin value="-45.000000" />
-      <SweepPitchMax value="45.000000" />
-    </Item>
-  </AimingInfos>
-  <Infos>
-    <Item>
-      <Infos />
-    </Item>
-    <Item>
-      <Infos>
-        <Item type="CWeaponInfo">
-{weapon_info_content}
-        </Item>
-      </Infos>
-    </Item>
-  </Infos>
-</CWeaponInfoBlob>
-'''
-
-# FX block template for assault rifles
-RIFLE_FX_BLOCK = '''          <AimOffset>
-            <X value="0.000000" />
-            <Y value="0.020000" />
-            <Z value="0.000000" />
-          </AimOffset>
-          <FirstPersonAimOffset>
-            <X value="0.000000" />
-            <Y value="0.000000" />
-            <Z value="0.000000" />
-          </FirstPersonAimOffset>
-          <FirstPersonScopeOffset>
-            <X value="0.000000" />
-            <Y value="0.000000" />
-            <Z value="0.000000" />
-          </FirstPersonScopeOffset>
-          <CrouchAimOffset>
-            <X value="0.000000" />
-            <Y value="0.000000" />
-            <Z value="0.000000" />
-          </CrouchAimOffset>
-          <FirstPersonCrouchAimOffset>
-            <X value="0.000000" />
-            <Y value="0.000000" />
-            <Z value="0.000000" />
-          </FirstPersonCrouchAimOffset>
-          <ZoomFactorForAccurateMode value="1.000000" />
-          <ReticuleMinSizeStanding value="0.000000" />
-          <ReticuleMinSizeDucked value="0.000000" />
-          <ReticuleScale value="0.400000" />
-          <IronSightCameraZoomFactor value="1.000000" />
-          <WeaponSoundBoneTag />
-          <Hud>
-            <FlashColor value="0xFFFFFFFF" />
-            <ScrollSelect>true</ScrollSelect>
-          </Hud>
-          <AmmoPickup>
-            <AmmoType>{ammo}</AmmoType>
-            <Amount value="30" />
-          </AmmoPickup>
-          <AmmoPickup2>
-            <AmmoType>{ammo}</AmmoType>
-            <Amount value="60" />
-          </AmmoPickup2>
-          <FireFx>
-            <Direction>
-              <X value="0.000000" />
-              <Y value="5.000000" />
-              <Z value="0.000000" />
-            </Direction>
-            <Rotation>
-              <X value="0.000000" />
-              <Y value="0.000000" />
-              <Z value="0.000000" />
-            </Rotation>
-            <Scale value="1.000000" />
-            <EffectName>muz_assault_rifle_fp</EffectName>
-            <FxBone>Gun_Muzzle</FxBone>
-          </FireFx>
-          <MuzzleFx>
-            <Direction>
-              <X value="0.000000" />
-              <Y value="5.000000" />
-              <Z value="0.000000" />
-            </Direction>
-            <Rotation>
-              <X value="0.000000" />
-              <Y value="0.000000" />
-              <Z value="0.000000" />
-            </Rotation>
-            <Scale value="1.200000" />
-            <EffectName>muz_assault_rifle</EffectName>
-            <FxBone>Gun_Muzzle</FxBone>
-          </MuzzleFx>
-          <ShellFx>
-            <Direction>
-              <X value="0.000000" />
-              <Y value="0.000000" />
-              <Z value="0.000000" />
-            </Direction>
-            <Rotation>
-              <X value="0.000000" />
-              <Y value="0.000000" />
-              <Z value="0.000000" />
-            </Rotation>
-            <Scale value="1.000000" />
-            <EffectName>weap_sh_ar</EffectName>
-            <FxBone>Gun_Shell</FxBone>
-          </ShellFx>
-          <TracerFx>
-            <Direction>
-              <X value="0.000000" />
-              <Y value="0.000000" />
-              <Z value="0.000000" />
-            </Direction>
-            <Rotation>
-              <X value="0.000000" />
-              <Y value="0.000000" />
-              <Z value="0.000000" />
-            </Rotation>
-            <Scale value="1.000000" />
-            <EffectName>proj_tracer</EffectName>
-            <FxBone />
-          </TracerFx>
-          <FlashFxLightEnabled value="true" />
-          <FlashFxLightCastsShadows value="false" />
-          <FlashFxLightOffsetDistance value="4.000000" />
-          <FlashFxLightRGBAMax value="0xFFFFE4C9" />
-          <FlashFxLightIntensityMax value="1.500000" />
-          <FlashFxLightFallOffMax value="8.000000" />
-          <FlashFxFadeOutTime value="0.050000" />
-          <FlashFxAltBone />
-          <ReloadUpperBodyFixupExpression></ReloadUpperBodyFixupExpression>'''
+# Weapon configurations (weapon_registry.json meta blocks), keyed by folder name
+RIFLE_CONFIGS = weapon_registry.load().meta_configs("rifle")
 
 
 def extract_weapon_info_content(content: str) -> str:
@@ -342,186 +42,39 @@ def extract_weapon_info_content(content: str) -> str:
     return None
 
 
-def extract_existing_values(content: str) -> dict:
-    """Extract key values from existing weapons.meta"""
-    values = {}
-
-    # Extract common weapon attributes
-    patterns = {
-        'damage': r'<Damage value="([^"]+)"',
-        'clip_size': r'<ClipSize value="([^"]+)"',
-        'accuracy_spread': r'<AccuracySpread value="([^"]+)"',
-        'recoil_accuracy_max': r'<RecoilAccuracyMax value="([^"]+)"',
-        'recoil_recovery_rate': r'<RecoilRecoveryRate value="([^"]+)"',
-        'time_between_shots': r'<TimeBetweenShots value="([^"]+)"',
-        'weapon_range': r'<WeaponRange value="([^"]+)"',
-        'speed': r'<Speed value="([^"]+)"',
-        'force': r'<Force value="([^"]+)"',
-        'penetration': r'<Penetration value="([^"]+)"',
-        'damage_falloff_min': r'<DamageFallOffRangeMin value="([^"]+)"',
-        'damage_falloff_max': r'<DamageFallOffRangeMax value="([^"]+)"',
-        'damage_falloff_modifier': r'<DamageFallOffModifier value="([^"]+)"',
-        'recoil_shake_amplitude': r'<RecoilShakeAmplitude value="([^"]+)"',
-        'recoil_shake_frequency': r'<RecoilShakeFrequency value="([^"]+)"',
-    }
+# extract_existing_values key -> weapons.meta tag
+EXISTING_VALUE_TAGS = {
+    'damage': 'Damage',
+    'clip_size': 'ClipSize',
+    'accuracy_spread': 'AccuracySpread',
+    'recoil_accuracy_max': 'RecoilAccuracyMax',
+    'recoil_recovery_rate': 'RecoilRecoveryRate',
+    'time_between_shots': 'TimeBetweenShots',
+    'weapon_range': 'WeaponRange',
+    'speed': 'Speed',
+    'force': 'Force',
+    'penetration': 'Penetration',
+    'damage_falloff_min': 'DamageFallOffRangeMin',
+    'damage_falloff_max': 'DamageFallOffRangeMax',
+    'damage_falloff_modifier': 'DamageFallOffModifier',
+    'recoil_shake_amplitude': 'RecoilShakeAmplitude',
+    'recoil_shake_frequency': 'RecoilShakeFrequency',
+}
+
 
-    for key, pattern in patterns.items():
-        match = re.search(pattern, content)
-        if match:
-            values[key] = match.group(1)
+def extract_existing_values(content: str) -> dict:
+    """Extract key values from existing weapons.meta (one pass over the file)"""
+    scan = meta_scan.scan(content)
+    values = scan.values(EXISTING_VALUE_TAGS)
 
     # Extract comment block if present
-    comment_pattern = r'(<!--.*?-->)'
-    comments = re.findall(comment_pattern, content, re.DOTALL)
-    if comments:
-        values['comment'] = comments[0]
+    comment = scan.first_comment()
+    if comment:
+        values['comment'] = comment
 
     return values
 
 
-def build_weapon_info_content(config: dict, existing_values: dict) -> str:
-    """Build the weapon info content block"""
-
-    comment = existing_values.get('comment', f'''          <!-- {config["display"]} -->''')
-
-    # Get values with defaults
-    damage = existing_values.get('damage', '42.0')
-    clip_size = existing_values.get('clip_size', '30')
-    accuracy_spread = existing_values.get('accuracy_spread', '0.80')
-    recoil_accuracy_max = existing_values.get('recoil_accuracy_max', '1.80')
-    recoil_recovery_rate = existing_values.get('recoil_recovery_rate', '0.55')
-    time_between_shots = existing_values.get('time_between_shots', '0.085')
-    weapon_range = existing_values.get('weapon_range', '400.0')
-    speed = existing_values.get('speed', '900.0')
-    force = existing_values.get('force', '120.0')
-    penetration = existing_values.get('penetration', '0.40')
-    damage_falloff_min = existing_values.get('damage_falloff_min', '70.0')
-    damage_falloff_max = existing_values.get('damage_falloff_max', '200.0')
-    damage_falloff_modifier = existing_values.get('damage_falloff_modifier', '0.40')
-    recoil_shake_amplitude = existing_values.get('recoil_shake_amplitude', '0.25')
-    recoil_shake_frequency = existing_values.get('recoil_shake_frequency', '0.50')
-
-    aiming_info_name = f"AI_{config['name'].replace('WEAPON_', '')}"
-
-    content = f'''{comment}
-          <Name>{config["name"]}</Name>
-          <Model>{config["model"]}</Model>
-          <Audio>{config["audio"]}</Audio>
-          <Slot>{config["slot"]}</Slot>
-          <HumanNameHash>{config["name"]}</HumanNameHash>
-          <DamageType>BULLET</DamageType>
-          <Explosion>
-            <Default>DONTCARE</Default>
-            <HitCar>DONTCARE</HitCar>
-            <HitTruck>DONTCARE</HitTruck>
-            <HitBike>DONTCARE</HitBike>
-            <HitBoat>DONTCARE</HitBoat>
-            <HitPlane>DONTCARE</HitPlane>
-          </Explosion>
-          <FireType>INSTANT_HIT</FireType>
-          <EffectGroup>WEAPON_EFFECT_GROUP_RIFLE</EffectGroup>
-          <PedDamageHash>BulletLarge</PedDamageHash>
-          <WheelSlot>{config["wheel_slot"]}</WheelSlot>
-          <Group>{config["group"]}</Group>
-          <AmmoInfo ref="{config["ammo"]}" />
-          <AimingInfo ref="{aiming_info_name}" />
-
-          <ClipSize value="{clip_size}" />
-
-          <AccuracySpread value="{accuracy_spread}" />
-          <AccurateModeAccuracyModifier value="0.150000" />
-          <RunAndGunAccuracyModifier value="0.550000" />
-          <RunAndGunAccuracyMinOverride value="-1.000000" />
-          <RecoilAccuracyMax value="{recoil_accuracy_max}" />
-          <RecoilErrorTime value="0.400000" />
-          <RecoilRecoveryRate value="{recoil_recovery_rate}" />
-
-          <RecoilAccuracyToAllowHeadShotAI value="0.450000" />
-          <MinHeadShotDistanceAI value="5.000000" />
-          <MaxHeadShotDistanceAI value="200.000000" />
-          <HeadShotDamageModifierAI value="4.000000" />
-          <RecoilAccuracyToAllowHeadShotPlayer value="0.450000" />
-          <MinHeadShotDistancePlayer value="0.000000" />
-          <MaxHeadShotDistancePlayer value="200.000000" />
-          <HeadShotDamageModifierPlayer value="2.500000" />
-
-          <Damage value="{damage}" />
-          <DamageTime value="0.000000" />
-          <DamageTimeInVehicle value="0.000000" />
-          <DamageTimeInVehicleHeadShot value="0.000000" />
-          <HitLimbsDamageModifier value="0.500000" />
-          <NetworkHitLimbsDamageModifier value="0.800000" />
-          <LightlyArmouredDamageModifier value="0.700000" />
-
-          <Force value="{force}" />
-          <ForceHitPed value="100.000000" />
-          <ForceHitVehicle value="50.000000" />
-          <ForceHitFlyingHeli value="35.000000" />
-          <OverrideForces />
-          <ForceMaxStrengthMult value="1.000000" />
-          <ForceFalloffRangeStart value="0.000000" />
-          <ForceFalloffRangeEnd value="200.000000" />
-          <ForceFalloffMin value="0.400000" />
-          <ProjectileForce value="0.000000" />
-          <FragImpulse value="350.000000" />
-
-          <Penetration value="{penetration}" />
-          <VerticalLaunchAdjustment value="0.000000" />
-          <DropForwardVelocity value="0.000000" />
-
-          <Speed value="{speed}" />
-
-          <BulletsInBatch value="1" />
-          <BatchSpread value="0.000000" />
-
-          <ReloadTimeMP value="2.500000" />
-          <ReloadTimeSP value="2.500000" />
-
-          <TimeBetweenShots value="{time_between_shots}" />
-
-          <DamageFallOffRangeMin value="{damage_falloff_min}" />
-          <DamageFallOffRangeMax value="{damage_falloff_max}" />
-          <DamageFallOffModifier value="{damage_falloff_modifier}" />
-
-          <NetworkPlayerDamageModifier value="1.000000" />
-          <NetworkPedDamageModifier value="1.000000" />
-          <NetworkHeadShotPlayerDamageModifier value="1.000000" />
-          <LockOnRange value="0.000000" />
-          <WeaponRange value="{weapon_range}" />
-
-          <BulletDirectionOffsetInDegrees value="0.080000" />
-          <RecoilShakeAmplitude value="{recoil_shake_amplitude}" />
-          <RecoilShakeFrequency value="{recoil_shake_frequency}" />
-          <RecoilShakeRollMagnitude value="0.150000" />
-          <RecoilShakeDuration value="0.200000" />
-
-          <AiSoundRange value="180.000000" />
-          <AimingMod1 value="0.650000" />
-          <AimingModTime1 value="0.200000" />
-          <AimingMod2 value="0.400000" />
-          <AimingModTime2 value="0.350000" />
-
-          <Flags>WF_GUN, WF_GUN_2_HANDED, WF_NO_SHOOTING_BERSERK, WF_PED_GUN_2_HANDED, WF_WEAPON, WF_LOUDWEAPON, WF_TAKE_ARM_L_LONG_GUN_IMMEDIATE_DAMAGE_REACTIONS, WF_MAKE_PED_BACKUP</Flags>
-
-          <AltWheelSlot>WHEEL_UNARMED</AltWheelSlot>
-          <PickupGlowAsset />
-          <PickupTextRep />
-          <ModelHashKey>{config["model"]}</ModelHashKey>
-          <DefaultCameraHash>DEFAULT_FOLLOW_CAMERA</DefaultCameraHash>
-          <CoverCameraHash>DEFAULT_FOLLOW_CAMERA</CoverCameraHash>
-          <RunAndGunCameraHash>DEFAULT_FOLLOW_CAMERA</RunAndGunCameraHash>
-          <CinematicShootingCameraHash>DEFAULT_CINEMATIC_SHOOTING_CAMERA</CinematicShootingCameraHash>
-          <PickupHash>PICKUP_WEAPON_ASSAULTRIFLE</PickupHash>
-          <MPPickupHash>PICKUP_AMMO_BULLET_MP</MPPickupHash>
-          <NmShotTuningSet>Normal</NmShotTuningSet>
-'''
-
-    # Add FX block
-    content += RIFLE_FX_BLOCK.format(ammo=config["ammo"])
-
-    return content
-
-
 def process_weapon(folder_name: str, batch_path: str, dry_run: bool = True) -> bool:
     """Process a single weapon folder"""
     if folder_name not in RIFLE_CONFIGS:
@@ -551,28 +104,16 @@ def process_weapon(folder_name: str, batch_path: str, dry_run: bool = True) -> b
     # Extract existing values
     existing_values = extract_existing_values(content)
 
-    # Build new weapon info content
-    weapon_info_content = build_weapon_info_content(config, existing_values)
-
-    # Generate aiming info name
-    aiming_info_name = f"AI_{config['name'].replace('WEAPON_', '')}"
-
-    # Build complete weapons.meta
-    new_content = WEAPONS_META_TEMPLATE.format(
-        slot=config["slot"],
-        order_nav=config["order_nav"],
-        order_best=config["order_best"],
-        aiming_info_name=aiming_info_name,
-        weapon_info_content=weapon_info_content
-    )
+    # Render through the shared rifle class template
+    spec = meta_generator.spec_from_config("rifle", config, existing_values)
+    new_content = meta_generator.render_weapons_meta(spec, BASE_PATH)
 
     if dry_run:
         print(f"  Would rewrite: {os.path.basename(weapons_meta)}")
         return True
     else:
         # Write new content
-        with open(weapons_meta, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+        meta_txn.write_text(weapons_meta, new_content)
         print(f"  Rewrote: {os.path.basename(weapons_meta)}")
         return True
 
@@ -591,8 +132,7 @@ def fix_other_meta(filepath: str, dry_run: bool = True) -> bool:
             print(f"    Would fix: {os.path.basename(filepath)}")
             return True
         else:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+            meta_txn.write_text(filepath, content)
             print(f"    Fixed: {os.path.basename(filepath)}")
             return True
     return False
@@ -614,8 +154,7 @@ def fix_weapon_names_lua(filepath: str, folder_name: str, dry_run: bool = True)
             print(f"    Would fix: cl_weaponNames.lua")
             return True
         else:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            meta_txn.write_text(filepath, new_content)
             print(f"    Fixed: cl_weaponNames.lua")
             return True
     return False
@@ -701,12 +240,19 @@ def main():
         "lua_files": 0,
     }
 
+    # Every file of the run lands in one journaled commit (meta_txn.py)
+    if not dry_run:
+        meta_txn.begin(BASE_PATH)
+
     for batch_name in batches:
         results = process_batch(batch_name, dry_run)
         total_results["weapons_meta"] += len(results["weapons_meta"])
         total_results["other_meta"] += len(results["other_meta"])
         total_results["lua_files"] += len(results["lua_files"])
 
+    if not dry_run:
+        print(f"\nCommitted {meta_txn.commit()} files")
+
     print("\n" + "=" * 60)
     print("SUMMARY")
     print("=" * 60)
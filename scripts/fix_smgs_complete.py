@@ -24,520 +24,56 @@ import os
 import re
 from pathlib import Path
 
+import meta_generator
+import meta_scan
+import meta_txn
+import weapon_registry
+
 BASE_PATH = "/home/user/project_pipes"
 
-# SMG weapon configurations
-SMG_CONFIGS = {
-    # Batch 15 - 9mm SMGs
-    "weapon_micro_mp5": {
-        "name": "WEAPON_MICRO_MP5",
-        "display": "Micro MP5",
-        "model": "w_sb_micro_mp5",
-        "slot": "SLOT_MICRO_MP5",
-        "order_nav": 400,
-        "order_best": 200,
-        "ammo": "AMMO_SMG",
-        "group": "GROUP_SMG",
-        "wheel_slot": "WHEEL_SMG",
-        "audio": "AUDIO_ITEM_SMG",
-    },
-    "weapon_mpa30": {
-        "name": "WEAPON_MPA30",
-        "display": "MPA30",
-        "model": "w_sb_mpa30",
-        "slot": "SLOT_MPA30",
-        "order_nav": 401,
-        "order_best": 201,
-        "ammo": "AMMO_SMG",
-        "group": "GROUP_SMG",
-        "wheel_slot": "WHEEL_SMG",
-        "audio": "AUDIO_ITEM_SMG",
-    },
-    "weapon_ram9_desert": {
-        "name": "WEAPON_RAM9_DESERT",
-        "display": "RAM-9 Desert",
-        "model": "w_sb_ram9_desert",
-        "slot": "SLOT_RAM9_DESERT",
-        "order_nav": 402,
-        "order_best": 202,
-        "ammo": "AMMO_SMG",
-        "group": "GROUP_SMG",
-        "wheel_slot": "WHEEL_SMG",
-        "audio": "AUDIO_ITEM_SMG",
-    },
-    "weapon_scorpion": {
-        "name": "WEAPON_SCORPION",
-        "display": "CZ Scorpion",
-        "model": "w_sb_scorpion",
-        "slot": "SLOT_SCORPION",
-        "order_nav": 403,
-        "order_best": 203,
-        "ammo": "AMMO_SMG",
-        "group": "GROUP_SMG",
-        "wheel_slot": "WHEEL_SMG",
-        "audio": "AUDIO_ITEM_SMG",
-    },
-    "weapon_sig_mpx": {
-        "name": "WEAPON_SIG_MPX",
-        "display": "SIG MPX",
-        "model": "w_sb_sig_mpx",
-        "slot": "SLOT_SIG_MPX",
-        "order_nav": 404,
-        "order_best": 204,
-        "ammo": "AMMO_SMG",
-        "group": "GROUP_SMG",
-        "wheel_slot": "WHEEL_SMG",
-        "audio": "AUDIO_ITEM_SMG",
-    },
-    "weapon_sub2000": {
-        "name": "WEAPON_SUB2000",
-        "display": "SUB-2000",
-        "model": "w_sb_sub2000",
-        "slot": "SLOT_SUB2000",
-        "order_nav": 405,
-        "order_best": 205,
-        "ammo": "AMMO_SMG",
-        "group": "GROUP_SMG",
-        "wheel_slot": "WHEEL_SMG",
-        "audio": "AUDIO_ITEM_SMG",
-    },
-    "weapon_tec9": {
-        "name": "WEAPON_TEC9",
-        "display": "TEC-9",
-        "model": "w_sb_tec9",
-        "slot": "SLOT_TEC9",
-        "order_nav": 406,
-        "order_best": 206,
-        "ammo": "AMMO_SMG",
-        "group": "GROUP_SMG",
-        "wheel_slot": "WHEEL_SMG",
-        "audio": "AUDIO_ITEM_SMG",
-    },
-    # Batch 16 - .45 ACP SMGs
-    "weapon_mac10": {
-        "name": "WEAPON_MAC10",
-        "display": "MAC-10",
-        "model": "w_sb_mac10",
-        "slot": "SLOT_MAC10",
-        "order_nav": 410,
-        "order_best": 210,
-        "ammo": "AMMO_SMG",
-        "group": "GROUP_SMG",
-        "wheel_slot": "WHEEL_SMG",
-        "audio": "AUDIO_ITEM_SMG",
-    },
-    "weapon_mac4a1": {
-        "name": "WEAPON_MAC4A1",
-        "display": "MAC-4A1",
-        "model": "w_sb_mac4a1",
-        "slot": "SLOT_MAC4A1",
-        "order_nav": 411,
-        "order_best": 211,
-        "ammo": "AMMO_SMG",
-        "group": "GROUP_SMG",
-        "wheel_slot": "WHEEL_SMG",
-        "audio": "AUDIO_ITEM_SMG",
-    },
-    # Batch 17 - Special SMGs/PDWs
-    "weapon_arp_bumpstock": {
-        "name": "WEAPON_ARP_BUMPSTOCK",
-        "display": "ARP Bumpstock",
-        "model": "w_sb_arp_bumpstock",
-        "slot": "SLOT_ARP_BUMPSTOCK",
-        "order_nav": 420,
-        "order_best": 220,
-        "ammo": "AMMO_SMG",
-        "group": "GROUP_SMG",
-        "wheel_slot": "WHEEL_SMG",
-        "audio": "AUDIO_ITEM_SMG",
-    },
-    "weapon_mk18": {
-        "name": "WEAPON_MK18",
-        "display": "MK18",
-        "model": "w_sb_mk18",
-        "slot": "SLOT_MK18",
-        "order_nav": 421,
-        "order_best": 221,
-        "ammo": "AMMO_SMG",
-        "group": "GROUP_SMG",
-        "wheel_slot": "WHEEL_SMG",
-        "audio": "AUDIO_ITEM_SMG",
-    },
-    "weapon_sbr9": {
-        "name": "WEAPON_SBR9",
-        "display": "SBR9",
-        "model": "w_sb_sbr9",
-        "slot": "SLOT_SBR9",
-        "order_nav": 422,
-        "order_best": 222,
-        "ammo": "AMMO_SMG",
-        "group": "GROUP_SMG",
-        "wheel_slot": "WHEEL_SMG",
-        "audio": "AUDIO_ITEM_SMG",
-    },
+# Weapon configurations (weapon_registry.json meta blocks), keyed by folder name
+SMG_CONFIGS = weapon_registry.load().meta_configs("smg")
+
+
+# extract_existing_values key -> weapons.meta tag
+EXISTING_VALUE_TAGS = {
+    'damage': 'Damage',
+    'clip_size': 'ClipSize',
+    'accuracy_spread': 'AccuracySpread',
+    'recoil_accuracy_max': 'RecoilAccuracyMax',
+    'recoil_recovery_rate': 'RecoilRecoveryRate',
+    'time_between_shots': 'TimeBetweenShots',
+    'weapon_range': 'WeaponRange',
+    'speed': 'Speed',
+    'force': 'Force',
+    'penetration': 'Penetration',
+    'damage_falloff_min': 'DamageFallOffRangeMin',
+    'damage_falloff_max': 'DamageFallOffRangeMax',
+    'damage_falloff_modifier': 'DamageFallOffModifier',
+    'recoil_shake_amplitude': 'RecoilShakeAmplitude',
+    'recoil_shake_frequency': 'RecoilShakeFrequency',
+    'force_hit_ped': 'ForceHitPed',
+    'force_hit_vehicle': 'ForceHitVehicle',
+    'force_hit_heli': 'ForceHitFlyingHeli',
+    'armor_penetration': 'ArmorPenetration',
+    'aiming_time': 'AimingTime',
+    'bullet_direction_offset': 'BulletDirectionOffsetInDegrees',
 }
 
-# Template for complete weapons.meta structure (SMG variant)
-WEAPONS_META_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
-<CWeaponInfoBlob>
-  <SlotNavigateOrder>
-    <Item>
-      <WeaponSlots>
-        <Item>
-          <OrderNumber value="{order_nav}" />
-          <Entry>{slot}</Entry>
-        </Item>
-      </WeaponSlots>
-    </Item>
-    <Item>
-      <WeaponSlots>
-        <Item>
-          <OrderNumber value="{order_nav}" />
-          <Entry>{slot}</Entry>
-        </Item>
-      </WeaponSlots>
-    </Item>
-  </SlotNavigateOrder>
-  <SlotBestOrder>
-    <WeaponSlots>
-      <Item>
-        <OrderNumber value="{order_best}" />
-        <Entry>{slot}</Entry>
-      </Item>
-    </WeaponSlots>
-  </SlotBestOrder>
-  <TintSpecValues />
-  <FiringPatternAliases />
-  <UpperBodyFixupExpressionData />
-  <AimingInfos>
-    <Item type="CAimingInfo">
-      <Name>{aiming_info_name}</Name>
-      <HeadingLimit value="90.000000" />
-      <SweepPitchMin value="-45.000000" />
-      <SweepPitchMax value="45.000000" />
-    </Item>
-  </AimingInfos>
-  <Infos>
-    <Item>
-      <Infos />
-    </Item>
-    <Item>
-      <Infos>
-        <Item type="CWeaponInfo">
-{weapon_info_content}
-        </Item>
-      </Infos>
-    </Item>
-  </Infos>
-</CWeaponInfoBlob>
-'''
-
-# FX block template for SMGs
-SMG_FX_BLOCK = '''          <AimOffset>
-            <X value="0.000000" />
-            <Y value="0.015000" />
-            <Z value="0.000000" />
-          </AimOffset>
-          <FirstPersonAimOffset>
-            <X value="0.000000" />
-            <Y value="0.000000" />
-            <Z value="0.000000" />
-          </FirstPersonAimOffset>
-          <FirstPersonScopeOffset>
-            <X value="0.000000" />
-            <Y value="0.000000" />
-            <Z value="0.000000" />
-          </FirstPersonScopeOffset>
-          <CrouchAimOffset>
-            <X value="0.000000" />
-            <Y value="0.000000" />
-            <Z value="0.000000" />
-          </CrouchAimOffset>
-          <FirstPersonCrouchAimOffset>
-            <X value="0.000000" />
-            <Y value="0.000000" />
-            <Z value="0.000000" />
-          </FirstPersonCrouchAimOffset>
-          <ZoomFactorForAccurateMode value="1.000000" />
-          <ReticuleMinSizeStanding value="0.000000" />
-          <ReticuleMinSizeDucked value="0.000000" />
-          <ReticuleScale value="0.400000" />
-          <IronSightCameraZoomFactor value="1.000000" />
-          <WeaponSoundBoneTag />
-          <Hud>
-            <FlashColor value="0xFFFFFFFF" />
-            <ScrollSelect>true</ScrollSelect>
-          </Hud>
-          <AmmoPickup>
-            <AmmoType>{ammo}</AmmoType>
-            <Amount value="30" />
-          </AmmoPickup>
-          <AmmoPickup2>
-            <AmmoType>{ammo}</AmmoType>
-            <Amount value="60" />
-          </AmmoPickup2>
-          <FireFx>
-            <Direction>
-              <X value="0.000000" />
-              <Y value="5.000000" />
-              <Z value="0.000000" />
-            </Direction>
-            <Rotation>
-              <X value="0.000000" />
-              <Y value="0.000000" />
-              <Z value="0.000000" />
-            </Rotation>
-            <Scale value="1.000000" />
-            <EffectName>muz_smg_fp</EffectName>
-            <FxBone>Gun_Muzzle</FxBone>
-          </FireFx>
-          <MuzzleFx>
-            <Direction>
-              <X value="0.000000" />
-              <Y value="5.000000" />
-              <Z value="0.000000" />
-            </Direction>
-            <Rotation>
-              <X value="0.000000" />
-              <Y value="0.000000" />
-              <Z value="0.000000" />
-            </Rotation>
-            <Scale value="1.000000" />
-            <EffectName>muz_smg</EffectName>
-            <FxBone>Gun_Muzzle</FxBone>
-          </MuzzleFx>
-          <ShellFx>
-            <Direction>
-              <X value="0.000000" />
-              <Y value="0.000000" />
-              <Z value="0.000000" />
-            </Direction>
-            <Rotation>
-              <X value="0.000000" />
-              <Y value="0.000000" />
-              <Z value="0.000000" />
-            </Rotation>
-            <Scale value="1.000000" />
-            <EffectName>weap_sh_smg</EffectName>
-            <FxBone>Gun_Shell</FxBone>
-          </ShellFx>
-          <TracerFx>
-            <Direction>
-              <X value="0.000000" />
-              <Y value="0.000000" />
-              <Z value="0.000000" />
-            </Direction>
-            <Rotation>
-              <X value="0.000000" />
-              <Y value="0.000000" />
-              <Z value="0.000000" />
-            </Rotation>
-            <Scale value="1.000000" />
-            <EffectName>proj_tracer</EffectName>
-            <FxBone />
-          </TracerFx>
-          <FlashFxLightEnabled value="true" />
-          <FlashFxLightCastsShadows value="false" />
-          <FlashFxLightOffsetDistance value="3.000000" />
-          <FlashFxLightRGBAMax value="0xFFFFE4C9" />
-          <FlashFxLightIntensityMax value="1.200000" />
-          <FlashFxLightFallOffMax value="6.000000" />
-          <FlashFxFadeOutTime value="0.040000" />
-          <FlashFxAltBone />
-          <ReloadUpperBodyFixupExpression></ReloadUpperBodyFixupExpression>'''
-
 
 def extract_existing_values(content: str) -> dict:
-    """Extract key values from existing weapons.meta"""
-    values = {}
-
-    patterns = {
-        'damage': r'<Damage value="([^"]+)"',
-        'clip_size': r'<ClipSize value="([^"]+)"',
-        'accuracy_spread': r'<AccuracySpread value="([^"]+)"',
-        'recoil_accuracy_max': r'<RecoilAccuracyMax value="([^"]+)"',
-        'recoil_recovery_rate': r'<RecoilRecoveryRate value="([^"]+)"',
-        'time_between_shots': r'<TimeBetweenShots value="([^"]+)"',
-        'weapon_range': r'<WeaponRange value="([^"]+)"',
-        'speed': r'<Speed value="([^"]+)"',
-        'force': r'<Force value="([^"]+)"',
-        'penetration': r'<Penetration value="([^"]+)"',
-        'damage_falloff_min': r'<DamageFallOffRangeMin value="([^"]+)"',
-        'damage_falloff_max': r'<DamageFallOffRangeMax value="([^"]+)"',
-        'damage_falloff_modifier': r'<DamageFallOffModifier value="([^"]+)"',
-        'recoil_shake_amplitude': r'<RecoilShakeAmplitude value="([^"]+)"',
-        'recoil_shake_frequency': r'<RecoilShakeFrequency value="([^"]+)"',
-        'force_hit_ped': r'<ForceHitPed value="([^"]+)"',
-        'force_hit_vehicle': r'<ForceHitVehicle value="([^"]+)"',
-        'force_hit_heli': r'<ForceHitFlyingHeli value="([^"]+)"',
-        'armor_penetration': r'<ArmorPenetration value="([^"]+)"',
-        'aiming_time': r'<AimingTime value="([^"]+)"',
-        'bullet_direction_offset': r'<BulletDirectionOffsetInDegrees value="([^"]+)"',
-    }
-
-    for key, pattern in patterns.items():
-        match = re.search(pattern, content)
-        if match:
-            values[key] = match.group(1)
+    """Extract key values from existing weapons.meta (one pass over the file)"""
+    scan = meta_scan.scan(content)
+    values = scan.values(EXISTING_VALUE_TAGS)
 
     # Extract comment block if present
-    comment_pattern = r'(<!--.*?-->)'
-    comments = re.findall(comment_pattern, content, re.DOTALL)
-    if comments:
-        values['comment'] = comments[0]
+    comment = scan.first_comment()
+    if comment:
+        values['comment'] = comment
 
     return values
 
 
-def build_weapon_info_content(config: dict, existing_values: dict) -> str:
-    """Build the weapon info content block for SMG"""
-
-    comment = existing_values.get('comment', f'''          <!-- {config["display"]} -->''')
-
-    # Get values with defaults for SMGs
-    damage = existing_values.get('damage', '25.0')
-    clip_size = existing_values.get('clip_size', '30')
-    accuracy_spread = existing_values.get('accuracy_spread', '1.50')
-    recoil_accuracy_max = existing_values.get('recoil_accuracy_max', '2.00')
-    recoil_recovery_rate = existing_values.get('recoil_recovery_rate', '0.55')
-    time_between_shots = existing_values.get('time_between_shots', '0.085')
-    weapon_range = existing_values.get('weapon_range', '80.0')
-    speed = existing_values.get('speed', '370.0')
-    force = existing_values.get('force', '65.0')
-    penetration = existing_values.get('penetration', '0.25')
-    damage_falloff_min = existing_values.get('damage_falloff_min', '25.0')
-    damage_falloff_max = existing_values.get('damage_falloff_max', '70.0')
-    damage_falloff_modifier = existing_values.get('damage_falloff_modifier', '0.35')
-    recoil_shake_amplitude = existing_values.get('recoil_shake_amplitude', '0.18')
-    recoil_shake_frequency = existing_values.get('recoil_shake_frequency', '0.45')
-    force_hit_ped = existing_values.get('force_hit_ped', '55.0')
-    force_hit_vehicle = existing_values.get('force_hit_vehicle', '28.0')
-    force_hit_heli = existing_values.get('force_hit_heli', '18.0')
-    armor_penetration = existing_values.get('armor_penetration', '0.18')
-    aiming_time = existing_values.get('aiming_time', '0.30')
-    bullet_direction_offset = existing_values.get('bullet_direction_offset', '0.12')
-
-    aiming_info_name = f"AI_{config['name'].replace('WEAPON_', '')}"
-
-    content = f'''{comment}
-          <Name>{config["name"]}</Name>
-          <Model>{config["model"]}</Model>
-          <Audio>{config["audio"]}</Audio>
-          <Slot>{config["slot"]}</Slot>
-          <HumanNameHash>{config["name"]}</HumanNameHash>
-          <DamageType>BULLET</DamageType>
-          <Explosion>
-            <Default>DONTCARE</Default>
-            <HitCar>DONTCARE</HitCar>
-            <HitTruck>DONTCARE</HitTruck>
-            <HitBike>DONTCARE</HitBike>
-            <HitBoat>DONTCARE</HitBoat>
-            <HitPlane>DONTCARE</HitPlane>
-          </Explosion>
-          <FireType>INSTANT_HIT</FireType>
-          <EffectGroup>WEAPON_EFFECT_GROUP_SMG</EffectGroup>
-          <PedDamageHash>BulletSmall</PedDamageHash>
-          <WheelSlot>{config["wheel_slot"]}</WheelSlot>
-          <Group>{config["group"]}</Group>
-          <AmmoInfo ref="{config["ammo"]}" />
-          <AimingInfo ref="{aiming_info_name}" />
-
-          <ClipSize value="{clip_size}" />
-
-          <AccuracySpread value="{accuracy_spread}" />
-          <AccurateModeAccuracyModifier value="0.200000" />
-          <RunAndGunAccuracyModifier value="0.500000" />
-          <RunAndGunAccuracyMinOverride value="-1.000000" />
-          <RecoilAccuracyMax value="{recoil_accuracy_max}" />
-          <RecoilErrorTime value="0.350000" />
-          <RecoilRecoveryRate value="{recoil_recovery_rate}" />
-
-          <RecoilAccuracyToAllowHeadShotAI value="0.500000" />
-          <MinHeadShotDistanceAI value="3.000000" />
-          <MaxHeadShotDistanceAI value="50.000000" />
-          <HeadShotDamageModifierAI value="4.000000" />
-          <RecoilAccuracyToAllowHeadShotPlayer value="0.450000" />
-          <MinHeadShotDistancePlayer value="0.000000" />
-          <MaxHeadShotDistancePlayer value="50.000000" />
-          <HeadShotDamageModifierPlayer value="2.500000" />
-
-          <Damage value="{damage}" />
-          <DamageTime value="0.000000" />
-          <DamageTimeInVehicle value="0.000000" />
-          <DamageTimeInVehicleHeadShot value="0.000000" />
-          <HitLimbsDamageModifier value="0.500000" />
-          <NetworkHitLimbsDamageModifier value="0.800000" />
-          <LightlyArmouredDamageModifier value="0.600000" />
-
-          <Force value="{force}" />
-          <ForceHitPed value="{force_hit_ped}" />
-          <ForceHitVehicle value="{force_hit_vehicle}" />
-          <ForceHitFlyingHeli value="{force_hit_heli}" />
-          <OverrideForces />
-          <ForceMaxStrengthMult value="1.000000" />
-          <ForceFalloffRangeStart value="0.000000" />
-          <ForceFalloffRangeEnd value="80.000000" />
-          <ForceFalloffMin value="0.400000" />
-          <ProjectileForce value="0.000000" />
-          <FragImpulse value="200.000000" />
-
-          <Penetration value="{penetration}" />
-          <VerticalLaunchAdjustment value="0.000000" />
-          <DropForwardVelocity value="0.000000" />
-
-          <Speed value="{speed}" />
-
-          <BulletsInBatch value="1" />
-          <BatchSpread value="0.000000" />
-
-          <ReloadTimeMP value="2.200000" />
-          <ReloadTimeSP value="2.200000" />
-
-          <TimeBetweenShots value="{time_between_shots}" />
-
-          <DamageFallOffRangeMin value="{damage_falloff_min}" />
-          <DamageFallOffRangeMax value="{damage_falloff_max}" />
-          <DamageFallOffModifier value="{damage_falloff_modifier}" />
-
-          <NetworkPlayerDamageModifier value="1.000000" />
-          <NetworkPedDamageModifier value="1.000000" />
-          <NetworkHeadShotPlayerDamageModifier value="1.000000" />
-          <LockOnRange value="0.000000" />
-          <WeaponRange value="{weapon_range}" />
-
-          <BulletDirectionOffsetInDegrees value="{bullet_direction_offset}" />
-          <RecoilShakeAmplitude value="{recoil_shake_amplitude}" />
-          <RecoilShakeFrequency value="{recoil_shake_frequency}" />
-          <RecoilShakeRollMagnitude value="0.120000" />
-          <RecoilShakeDuration value="0.180000" />
-
-          <AiSoundRange value="140.000000" />
-          <AimingMod1 value="0.700000" />
-          <AimingModTime1 value="0.180000" />
-          <AimingMod2 value="0.450000" />
-          <AimingModTime2 value="0.300000" />
-
-          <Flags>WF_GUN, WF_GUN_2_HANDED, WF_NO_SHOOTING_BERSERK, WF_PED_GUN_2_HANDED, WF_WEAPON, WF_LOUDWEAPON, WF_TAKE_ARM_L_LONG_GUN_IMMEDIATE_DAMAGE_REACTIONS, WF_MAKE_PED_BACKUP</Flags>
-
-          <AltWheelSlot>WHEEL_UNARMED</AltWheelSlot>
-          <PickupGlowAsset />
-          <PickupTextRep />
-          <ModelHashKey>{config["model"]}</ModelHashKey>
-          <DefaultCameraHash>DEFAULT_FOLLOW_CAMERA</DefaultCameraHash>
-          <CoverCameraHash>DEFAULT_FOLLOW_CAMERA</CoverCameraHash>
-          <RunAndGunCameraHash>DEFAULT_FOLLOW_CAMERA</RunAndGunCameraHash>
-          <CinematicShootingCameraHash>DEFAULT_CINEMATIC_SHOOTING_CAMERA</CinematicShootingCameraHash>
-          <PickupHash>PICKUP_WEAPON_SMG</PickupHash>
-          <MPPickupHash>PICKUP_AMMO_BULLET_MP</MPPickupHash>
-          <NmShotTuningSet>Normal</NmShotTuningSet>
-'''
-
-    # Add FX block
-    content += SMG_FX_BLOCK.format(ammo=config["ammo"])
-
-    return content
-
-
 def process_weapon(folder_name: str, batch_path: str, dry_run: bool = True) -> bool:
     """Process a single weapon folder"""
     if folder_name not in SMG_CONFIGS:
@@ -567,27 +103,15 @@ def process_weapon(folder_name: str, batch_path: str, dry_run: bool = True) -> b
     # Extract existing values
     existing_values = extract_existing_values(content)
 
-    # Build new weapon info content
-    weapon_info_content = build_weapon_info_content(config, existing_values)
-
-    # Generate aiming info name
-    aiming_info_name = f"AI_{config['name'].replace('WEAPON_', '')}"
-
-    # Build complete weapons.meta
-    new_content = WEAPONS_META_TEMPLATE.format(
-        slot=config["slot"],
-        order_nav=config["order_nav"],
-        order_best=config["order_best"],
-        aiming_info_name=aiming_info_name,
-        weapon_info_content=weapon_info_content
-    )
+    # Render through the shared smg class template
+    spec = meta_generator.spec_from_config("smg", config, existing_values)
+    new_content = meta_generator.render_weapons_meta(spec, BASE_PATH)
 
     if dry_run:
         print(f"  Would rewrite: {os.path.basename(weapons_meta)}")
         return True
     else:
-        with open(weapons_meta, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+        meta_txn.write_text(weapons_meta, new_content)
         print(f"  Rewrote: {os.path.basename(weapons_meta)}")
         return True
 
@@ -606,8 +130,7 @@ def fix_other_meta(filepath: str, dry_run: bool = True) -> bool:
             print(f"    Would fix: {os.path.basename(filepath)}")
             return True
         else:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+            meta_txn.write_text(filepath, content)
             print(f"    Fixed: {os.path.basename(filepath)}")
             return True
     return False
@@ -627,8 +150,7 @@ def fix_weapon_names_lua(filepath: str, folder_name: str, dry_run: bool = True)
             print(f"    Would create: cl_weaponNames.lua")
             return True
         else:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            meta_txn.write_text(filepath, new_content)
             print(f"    Created: cl_weaponNames.lua")
             return True
 
@@ -640,8 +162,7 @@ def fix_weapon_names_lua(filepath: str, folder_name: str, dry_run: bool = True)
             print(f"    Would fix: cl_weaponNames.lua")
             return True
         else:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            meta_txn.write_text(filepath, new_content)
             print(f"    Fixed: cl_weaponNames.lua")
             return True
     return False
@@ -726,12 +247,19 @@ def main():
         "lua_files": 0,
     }
 
+    # Every file of the run lands in one journaled commit (meta_txn.py)
+    if not dry_run:
+        meta_txn.begin(BASE_PATH)
+
     for batch_name in batches:
         results = process_batch(batch_name, dry_run)
         total_results["weapons_meta"] += len(results["weapons_meta"])
         total_results["other_meta"] += len(results["other_meta"])
         total_results["lua_files"] += len(results["lua_files"])
 
+    if not dry_run:
+        print(f"\nCommitted {meta_txn.commit()} files")
+
     print("\n" + "=" * 60)
     print("SUMMARY")
     print("=" * 60)
@@ -1,89 +1,57 @@
 #!/usr/bin/env python3
 """
 Generate a summary chart of weapon handling values for review.
+
+Values come from the weapon stat snapshot (weapon_snapshot.py), so the
+chart can also be drawn for an older exported snapshot with --snapshot.
 """
 
-import os
-import re
-from pathlib import Path
-
-# Sample weapons from each category for diversity
-SAMPLE_WEAPONS = {
-    "batch12_weapons": [
-        ("weapon_psa_ar15", "PSA AR-15 (budget 5.56)"),
-        ("weapon_m16", "M16A4 (quality 5.56)"),
-    ],
-    "batch13_weapons": [
-        ("weapon_mini_ak47", "Mini AK-47 (standard 7.62x39)"),
-        ("weapon_mk47", "MK47 Mutant (match 7.62x39)"),
-    ],
-    "batch14_weapons": [
-        ("weapon_m7", "M7 (quality .308)"),
-        ("weapon_sig_spear", "SIG Spear (match 6.8x51)"),
-    ],
-    "batch15_weapons": [
-        ("weapon_tec9", "TEC-9 (budget 9mm)"),
-        ("weapon_sig_mpx", "SIG MPX (match 9mm)"),
-        ("weapon_mpa30", "MPA30 (standard 9mm)"),
-    ],
-    "batch16_weapons": [
-        ("weapon_mac10", "MAC-10 (standard .45)"),
-    ],
-    "batch17_weapons": [
-        ("weapon_arp_bumpstock", "ARP Bumpstock (budget PDW)"),
-        ("weapon_mk18", "MK18 (quality SBR)"),
-    ],
-    "batch18_shotguns": [
-        ("mossberg_shockwave", "Mossberg Shockwave"),
-        ("beretta_1301", "Beretta 1301"),
-        ("remington_870", "Remington 870"),
-    ],
-    "batch19_rifles": [
-        ("remington_700", "Remington 700"),
-        ("barrett_m82a1", "Barrett M82A1"),
-        ("victus_xmr", "Victus XMR"),
-    ],
-}
+import numpy as np
+
+import weapon_registry
+import weapon_snapshot
+
+# Sample weapons from each category for diversity (registry "summary_label" entries)
+SAMPLE_WEAPONS = {}
+for _entry in weapon_registry.load().select(has="summary_label"):
+    SAMPLE_WEAPONS.setdefault(_entry.folder.rsplit("/", 1)[0], []).append(
+        (_entry.folder_name, _entry.summary_label))
 
 BASE_PATH = "/home/user/project_pipes"
 
-def extract_value(content, tag):
-    """Extract a numeric value from XML tag."""
-    pattern = rf'<{tag}\s+value="([\d.-]+)"'
-    match = re.search(pattern, content)
-    if match:
-        return float(match.group(1))
-    return None
-
-def extract_weapon_data(file_path):
-    """Extract key handling values from weapon meta."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    data = {
-        'damage': extract_value(content, 'Damage'),
-        'range': extract_value(content, 'WeaponRange'),
-        'spread': extract_value(content, 'AccuracySpread'),
-        'recoil_max': extract_value(content, 'RecoilAccuracyMax'),
-        'recovery': extract_value(content, 'RecoilRecoveryRate'),
-        'shake': extract_value(content, 'RecoilShakeAmplitude'),
-        'fire_rate': extract_value(content, 'TimeBetweenShots'),
-    }
+# Chart column -> snapshot stat column
+CHART_COLUMNS = {
+    'damage': 'Damage',
+    'range': 'WeaponRange',
+    'spread': 'AccuracySpread',
+    'recoil_max': 'RecoilAccuracyMax',
+    'recovery': 'RecoilRecoveryRate',
+    'shake': 'RecoilShakeAmplitude',
+    'fire_rate': 'TimeBetweenShots',
+}
+
+def weapon_data(row):
+    """Key handling values of a snapshot row (None where the weapon has no value)."""
+    data = {}
+    for key, column in CHART_COLUMNS.items():
+        value = row.get(column, np.nan)
+        data[key] = None if np.isnan(value) else float(value)
     return data
 
-def find_meta_file(batch_path, weapon_folder):
-    """Find the weapons.meta file for a weapon."""
-    weapon_path = os.path.join(batch_path, weapon_folder, "meta")
-    if not os.path.exists(weapon_path):
-        return None
+def main():
+    import argparse
 
-    for f in os.listdir(weapon_path):
-        if f.endswith('.meta') and 'archetypes' not in f and 'animations' not in f and 'personality' not in f:
-            if 'weapons' in f or f.startswith('weapon_'):
-                return os.path.join(weapon_path, f)
-    return None
+    parser = argparse.ArgumentParser(description="Weapon handling summary chart")
+    parser.add_argument("--root", default=BASE_PATH, help="Project root")
+    parser.add_argument("--snapshot", help="Chart a saved snapshot file instead of the current tree")
+    args = parser.parse_args()
+
+    snapshot = weapon_snapshot.Snapshot.load(args.snapshot) if args.snapshot else weapon_snapshot.get_snapshot(args.root)
+
+    # One vectorized pass selects every sampled weapon's row
+    folders = [f"{batch}/{folder}" for batch, weapons in SAMPLE_WEAPONS.items() for folder, _ in weapons]
+    samples = snapshot.where(np.isin(snapshot["folder"], folders))
 
-def main():
     print("=" * 120)
     print("WEAPON HANDLING SUMMARY CHART")
     print("=" * 120)
@@ -94,9 +62,7 @@ def main():
     current_batch = None
 
     for batch_name, weapons in SAMPLE_WEAPONS.items():
-        batch_path = os.path.join(BASE_PATH, batch_name)
-
-        if not os.path.exists(batch_path):
+        if not np.any(np.char.startswith(samples["folder"].astype(str), batch_name + "/")):
             continue
 
         # Print batch header
@@ -108,13 +74,13 @@ def main():
             current_batch = batch_name
 
         for weapon_folder, display_name in weapons:
-            meta_file = find_meta_file(batch_path, weapon_folder)
+            row = samples.lookup("folder", f"{batch_name}/{weapon_folder}")
 
-            if not meta_file:
+            if row is None:
                 print(f"  {display_name:<28} [NOT FOUND]")
                 continue
 
-            data = extract_weapon_data(meta_file)
+            data = weapon_data(row)
 
             # Calculate RPM from fire rate
             rpm = int(60 / data['fire_rate']) if data['fire_rate'] and data['fire_rate'] > 0 else 0
@@ -0,0 +1,745 @@
+#!/usr/bin/env python3
+"""
+Lua Config Reader
+
+Reads the data tables the FiveM resources keep in shared/*.lua
+(Config.AmmoModifiers, Config.Weapons, Config.FireRates, ...) into
+Python dicts, so balance tools use the same numbers the server does.
+
+Supports the table-constructor subset those files use:
+- Config.X = { ... } / local x = ... assignments, Config = Config or {}
+- [key] = value, name = value and positional fields (pure arrays -> list)
+- Strings, numbers, booleans, nil, arithmetic and .. concatenation
+- Backtick hash keys ([`WEAPON_G17`]) - kept as the weapon name string
+Function definitions and control blocks are skipped; function calls
+evaluate to None.
+
+Parsed results are cached in a pickle next to the tree, keyed by a hash of
+the file contents, so repeat tool runs skip the parse entirely.
+
+Usage:
+    python lua_config.py                 # Warm the cache, list tables
+    python lua_config.py --show Config.AmmoModifiers.9mm_hp
+"""
+
+import os
+import re
+import hashlib
+import pickle
+import time
+from typing import Optional
+
+BASE_PATH = "/home/user/project_pipes"
+CACHE_FILENAME = ".lua_config_cache.pickle"
+CACHE_VERSION = 1
+
+# =============================================================================
+# TOKENIZER
+# =============================================================================
+TOKEN_PATTERN = re.compile(r'''
+    (?P<space>\s+)
+  | (?P<longcomment>--\[(?P<lceq>=*)\[.*?\](?P=lceq)\])
+  | (?P<comment>--[^\n]*)
+  | (?P<longstring>\[(?P<lseq>=*)\[.*?\](?P=lseq)\])
+  | (?P<string>"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*')
+  | (?P<hash>`[^`]*`)
+  | (?P<number>0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<name>[A-Za-z_]\w*)
+  | (?P<op>\.\.\.|\.\.|==|~=|<=|>=|//|::|[-+*/%^\#<>=(){}\[\];:,.])
+''', re.VERBOSE | re.DOTALL)
+
+KEYWORDS = {
+    "and", "break", "do", "else", "elseif", "end", "false", "for", "function",
+    "goto", "if", "in", "local", "nil", "not", "or", "repeat", "return", "then",
+    "true", "until", "while",
+}
+
+# Keywords that open a block closed by `end` (repeat is closed by `until`)
+BLOCK_OPENERS = {"function", "if", "do", "repeat"}
+
+ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "\\": "\\", '"': '"', "'": "'", "\n": "\n", "0": "\0"}
+
+
+class LuaParseError(ValueError):
+    pass
+
+
+def tokenize(source: str) -> list:
+    """List of (kind, value, line) tokens - comments and whitespace dropped"""
+    tokens = []
+    pos = 0
+    line = 1
+    while pos < len(source):
+        match = TOKEN_PATTERN.match(source, pos)
+        if not match:
+            raise LuaParseError(f"line {line}: unexpected character {source[pos]!r}")
+        kind = match.lastgroup
+        text = match.group()
+        if kind in ("lceq", "lseq"):
+            kind = "longcomment" if text.startswith("--") else "longstring"
+        if kind == "name" and text in KEYWORDS:
+            tokens.append(("kw", text, line))
+        elif kind == "longstring":
+            body = text[text.index("[", 1) + 1:len(text) - text.index("[", 1) - 1]
+            tokens.append(("string", body[1:] if body.startswith("\n") else body, line))
+        elif kind == "string":
+            tokens.append(("string", unescape(text[1:-1]), line))
+        elif kind == "hash":
+            tokens.append(("hash", text[1:-1], line))
+        elif kind == "number":
+            tokens.append(("number", parse_number(text), line))
+        elif kind in ("name", "op"):
+            tokens.append((kind, text, line))
+        line += text.count("\n")
+        pos = match.end()
+    tokens.append(("eof", None, line))
+    return tokens
+
+
+def unescape(text: str) -> str:
+    if "\\" not in text:
+        return text
+    out = []
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if ch == "\\" and i + 1 < len(text):
+            nxt = text[i + 1]
+            if nxt.isdigit():
+                digits = re.match(r'\d{1,3}', text[i + 1:]).group()
+                out.append(chr(int(digits)))
+                i += 1 + len(digits)
+                continue
+            out.append(ESCAPES.get(nxt, nxt))
+            i += 2
+            continue
+        out.append(ch)
+        i += 1
+    return "".join(out)
+
+
+def parse_number(text: str):
+    if text.lower().startswith("0x"):
+        return int(text, 16)
+    if any(c in text for c in ".eE"):
+        return float(text)
+    return int(text)
+
+
+def joaat(name: str) -> int:
+    """GTA's Jenkins one-at-a-time hash (what backtick literals compile to), signed 32-bit"""
+    h = 0
+    for ch in name.lower().encode():
+        h = (h + ch) & 0xFFFFFFFF
+        h = (h + (h << 10)) & 0xFFFFFFFF
+        h ^= h >> 6
+    h = (h + (h << 3)) & 0xFFFFFFFF
+    h ^= h >> 11
+    h = (h + (h << 15)) & 0xFFFFFFFF
+    return h - 0x100000000 if h >= 0x80000000 else h
+
+
+# =============================================================================
+# PARSER / EVALUATOR
+# =============================================================================
+BINARY_PRIORITY = {
+    "or": (1, 1), "and": (2, 2),
+    "<": (3, 3), ">": (3, 3), "<=": (3, 3), ">=": (3, 3), "~=": (3, 3), "==": (3, 3),
+    "..": (9, 8),                       # Right associative
+    "+": (10, 10), "-": (10, 10),
+    "*": (11, 11), "/": (11, 11), "//": (11, 11), "%": (11, 11),
+    "^": (14, 13),                      # Right associative
+}
+UNARY_PRIORITY = 12
+
+
+def truthy(value) -> bool:
+    return value is not None and value is not False
+
+
+def lua_str(value) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return f"{value:.1f}"
+    return str(value)
+
+
+class LuaReader:
+    """Evaluates the data-table statements of one chunk into a globals dict"""
+
+    def __init__(self, tokens: list, env: dict, source_name: str = "<lua>"):
+        self.tokens = tokens
+        self.pos = 0
+        self.env = env
+        self.locals: dict = {}
+        self.source_name = source_name
+
+    # -- token helpers --------------------------------------------------------
+    def peek(self, offset: int = 0):
+        return self.tokens[min(self.pos + offset, len(self.tokens) - 1)]
+
+    def next(self):
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def check(self, value: str, offset: int = 0) -> bool:
+        kind, text, _ = self.peek(offset)
+        return kind in ("op", "kw") and text == value
+
+    def accept(self, value: str) -> bool:
+        if self.check(value):
+            self.pos += 1
+            return True
+        return False
+
+    def expect(self, value: str):
+        if not self.accept(value):
+            kind, text, line = self.peek()
+            raise LuaParseError(f"{self.source_name}:{line}: expected {value!r}, got {text!r}")
+
+    # -- statements -----------------------------------------------------------
+    def run(self):
+        while self.peek()[0] != "eof":
+            self.statement()
+
+    def statement(self):
+        kind, text, _ = self.peek()
+        if kind == "op" and text == ";":
+            self.next()
+        elif kind == "kw" and text == "return":
+            self.pos = len(self.tokens) - 1
+        elif kind == "kw" and text == "local":
+            self.next()
+            if self.check("function"):
+                self.skip_block()
+            else:
+                self.local_assignment()
+        elif kind == "kw" and text in ("function", "if", "do", "repeat", "for", "while"):
+            self.skip_block()
+        elif kind == "op" and text == "::":
+            self.next(); self.next(); self.expect("::")
+        elif kind == "kw" and text in ("break", "goto"):
+            self.next()
+            if text == "goto":
+                self.next()
+        else:
+            self.expression_statement()
+
+    def skip_block(self):
+        """Skip one block statement up to its matching end/until"""
+        depth = 0
+        while True:
+            kind, text, line = self.next()
+            if kind == "eof":
+                raise LuaParseError(f"{self.source_name}: unterminated block")
+            if kind != "kw":
+                continue
+            if text in BLOCK_OPENERS:
+                depth += 1
+            elif text == "end":
+                depth -= 1
+            elif text == "until":
+                depth -= 1
+                self.expression()
+            if depth == 0 and text in ("end", "until"):
+                return
+
+    def local_assignment(self):
+        names = [self.next()[1]]
+        while self.accept(","):
+            names.append(self.next()[1])
+        values = self.expression_list() if self.accept("=") else []
+        for i, name in enumerate(names):
+            self.locals[name] = values[i] if i < len(values) else None
+
+    def expression_statement(self):
+        targets = [self.target()]
+        while self.accept(","):
+            targets.append(self.target())
+        if not self.accept("="):
+            return  # Function call statement - no data effect
+        values = self.expression_list()
+        for i, (container, key) in enumerate(targets):
+            if container is None:
+                continue
+            assign(container, key, values[i] if i < len(values) else None)
+
+    def target(self) -> tuple:
+        """Parse a prefix expression; returns (container, key) for its last index"""
+        kind, text, line = self.next()
+        if kind == "op" and text == "(":
+            value = self.expression()
+            self.expect(")")
+            container, key = None, None
+        elif kind == "name":
+            scope = self.locals if text in self.locals else self.env
+            container, key = scope, text
+            value = scope.get(text)
+        else:
+            raise LuaParseError(f"{self.source_name}:{line}: unexpected {text!r}")
+
+        while True:
+            if self.check("."):
+                self.next()
+                container, key = value, self.next()[1]
+                value = index(container, key)
+            elif self.check("["):
+                self.next()
+                key = self.expression()
+                self.expect("]")
+                container = value
+                value = index(container, key)
+            elif self.check(":"):
+                self.next(); self.next()
+                self.call_args()
+                container, key, value = None, None, None
+            elif self.check("(") or self.check("{") or self.peek()[0] == "string":
+                self.call_args()
+                container, key, value = None, None, None
+            else:
+                break
+        self.last_value = value
+        return container, key
+
+    def call_args(self):
+        if self.accept("("):
+            if not self.check(")"):
+                self.expression_list()
+            self.expect(")")
+        elif self.check("{"):
+            self.table()
+        else:
+            self.next()
+
+    # -- expressions ----------------------------------------------------------
+    def expression_list(self) -> list:
+        values = [self.expression()]
+        while self.accept(","):
+            values.append(self.expression())
+        return values
+
+    def expression(self, limit: int = 0):
+        kind, text, _ = self.peek()
+        if (kind == "op" and text in ("-", "#")) or (kind == "kw" and text == "not"):
+            self.next()
+            operand = self.expression(UNARY_PRIORITY)
+            if text == "-":
+                value = -operand if isinstance(operand, (int, float)) else None
+            elif text == "#":
+                value = len(operand) if isinstance(operand, (str, list)) else None
+            else:
+                value = not truthy(operand)
+        else:
+            value = self.simple_expression()
+
+        while True:
+            kind, op, _ = self.peek()
+            if kind not in ("op", "kw") or op not in BINARY_PRIORITY:
+                return value
+            left_priority, right_priority = BINARY_PRIORITY[op]
+            if left_priority <= limit:
+                return value
+            self.next()
+            right = self.expression(right_priority)
+            value = binary(op, value, right)
+
+    def simple_expression(self):
+        kind, text, line = self.peek()
+        if kind in ("number", "string"):
+            self.next()
+            return text
+        if kind == "hash":
+            self.next()
+            return text
+        if kind == "kw":
+            if text in ("true", "false", "nil"):
+                self.next()
+                return {"true": True, "false": False, "nil": None}[text]
+            if text == "function":
+                self.skip_block()
+                return None
+        if kind == "op" and text == "{":
+            return self.table()
+        if kind == "op" and text == "...":
+            self.next()
+            return None
+        self.target()
+        return self.last_value
+
+    def table(self):
+        self.expect("{")
+        fields = {}
+        array = []
+        keyed = False
+        while not self.accept("}"):
+            if self.check("["):
+                self.next()
+                key = self.expression()
+                self.expect("]")
+                self.expect("=")
+                fields[key] = self.expression()
+                keyed = True
+            elif self.peek()[0] == "name" and self.check("=", 1):
+                key = self.next()[1]
+                self.next()
+                fields[key] = self.expression()
+                keyed = True
+            else:
+                array.append(self.expression())
+            if not self.accept(",") and not self.accept(";"):
+                self.expect("}")
+                break
+
+        if not keyed:
+            return array if array else {}
+        for i, value in enumerate(array, start=1):
+            fields[i] = value
+        return fields
+
+
+def index(container, key):
+    if isinstance(container, dict):
+        return container.get(key)
+    if isinstance(container, list) and isinstance(key, int) and 1 <= key <= len(container):
+        return container[key - 1]
+    return None
+
+
+def assign(container, key, value):
+    if isinstance(container, dict):
+        container[key] = value
+    elif isinstance(container, list) and isinstance(key, int):
+        if 1 <= key <= len(container):
+            container[key - 1] = value
+        elif key == len(container) + 1:
+            container.append(value)
+
+
+def binary(op: str, left, right):
+    if op == "or":
+        return left if truthy(left) else right
+    if op == "and":
+        return right if truthy(left) else left
+    if op == "..":
+        if left is None or right is None:
+            return None
+        return lua_str(left) + lua_str(right)
+    if op == "==":
+        return left == right
+    if op == "~=":
+        return left != right
+    if not isinstance(left, (int, float)) or not isinstance(right, (int, float)):
+        return None
+    if op == "+":
+        return left + right
+    if op == "-":
+        return left - right
+    if op == "*":
+        return left * right
+    if op == "/":
+        return left / right if right else None
+    if op == "//":
+        return left // right if right else None
+    if op == "%":
+        return left % right if right else None
+    if op == "^":
+        return float(left) ** right
+    return {"<": left < right, ">": left > right, "<=": left <= right, ">=": left >= right}[op]
+
+
+# =============================================================================
+# LOADING
+# =============================================================================
+def read_lua(source: str, env: Optional[dict] = None, source_name: str = "<lua>") -> dict:
+    """Evaluate one Lua chunk's data statements into env (a globals dict)"""
+    env = {} if env is None else env
+    LuaReader(tokenize(source), env, source_name).run()
+    return env
+
+
+def load_lua_files(paths: list, env: Optional[dict] = None) -> dict:
+    """
+    Load files in order into one globals dict, like a resource's
+    shared_scripts sharing the global Config table.
+    """
+    env = {} if env is None else env
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            read_lua(f.read(), env, path)
+    return env
+
+
+def load_config(paths: list) -> dict:
+    """The Config table after loading the given files"""
+    return load_lua_files(paths).get("Config") or {}
+
+
+# =============================================================================
+# WRITING (generated Lua data files)
+# =============================================================================
+LUA_NAME = re.compile(r'^[A-Za-z_]\w*$')
+INLINE_WIDTH = 100
+
+
+class LuaExpr(str):
+    """Raw Lua expression emitted verbatim (e.g. a reference to a local)"""
+
+
+class LuaHash(str):
+    """Weapon name emitted as a backtick hash key/value ([`WEAPON_G17`])"""
+
+
+def lua_key(key) -> str:
+    if isinstance(key, LuaHash):
+        return f"[`{key}`]"
+    if isinstance(key, str) and LUA_NAME.match(key) and key not in KEYWORDS:
+        return key
+    return f"[{lua_value(key)}]"
+
+
+def lua_value(value) -> str:
+    """Scalar (or LuaExpr) as a Lua literal"""
+    if isinstance(value, LuaExpr):
+        return str(value)
+    if isinstance(value, LuaHash):
+        return f"`{value}`"
+    if value is None:
+        return "nil"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        return repr(value) if value == value and abs(value) != float('inf') else "0/0"
+    if isinstance(value, str):
+        escaped = value.replace("\\", "\\\\").replace("'", "\\'").replace("\n", "\\n")
+        return f"'{escaped}'"
+    raise TypeError(f"Cannot write {type(value).__name__} as Lua")
+
+
+def to_lua(value, indent: int = 0) -> str:
+    """
+    Python value as a Lua table constructor. Tables whose fields are all
+    scalars are kept on one line when short; others get one field per line.
+    """
+    if not isinstance(value, (dict, list, tuple)):
+        return lua_value(value)
+    if not value:
+        return "{}"
+
+    if isinstance(value, dict):
+        fields = [(lua_key(k) + " = ", v) for k, v in value.items()]
+    else:
+        fields = [("", v) for v in value]
+
+    pad = "    " * (indent + 1)
+    if all(not isinstance(v, (dict, list, tuple)) for _, v in fields):
+        parts = [prefix + lua_value(v) for prefix, v in fields]
+        inline = "{ " + ", ".join(parts) + " }"
+        if len(inline) + len(pad) <= INLINE_WIDTH:
+            return inline
+        if isinstance(value, (list, tuple)):
+            lines, line = [], []
+            for part in parts:
+                if line and len(pad) + len(", ".join(line + [part])) > INLINE_WIDTH:
+                    lines.append(pad + ", ".join(line) + ",")
+                    line = []
+                line.append(part)
+            lines.append(pad + ", ".join(line) + ",")
+            return "{\n" + "\n".join(lines) + "\n" + "    " * indent + "}"
+
+    lines = [pad + prefix + to_lua(v, indent + 1) + "," for prefix, v in fields]
+    return "{\n" + "\n".join(lines) + "\n" + "    " * indent + "}"
+
+
+def generated_source_hash(path: str) -> Optional[str]:
+    """'Source hash:' recorded in the header of a generated Lua file"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if "Source hash:" in line:
+                    return line.split("Source hash:", 1)[1].strip()
+    except OSError:
+        pass
+    return None
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+def content_key(paths: list) -> str:
+    """Hash of the file list and contents, in load order"""
+    digest = hashlib.sha1(f"v{CACHE_VERSION}".encode())
+    for path in paths:
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest.update(os.path.basename(path).encode())
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+class ConfigCache:
+    """Pickled parse results keyed by content hash, stored at the project root"""
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        self.cache_path = os.path.join(self.root, CACHE_FILENAME)
+        self.entries: dict = {}
+        self.dirty = False
+        self.load()
+
+    def load(self) -> bool:
+        """Load the cache file. Returns False if missing, unreadable or stale format."""
+        try:
+            with open(self.cache_path, 'rb') as f:
+                data = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            return False
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return False
+        self.entries = data.get("entries", {})
+        return True
+
+    def save(self):
+        """Write the cache if anything changed (silently skipped on read-only trees)"""
+        if not self.dirty:
+            return
+        temp_path = self.cache_path + ".tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                pickle.dump({"version": CACHE_VERSION, "entries": self.entries}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.cache_path)
+            self.dirty = False
+        except OSError:
+            pass
+
+    def globals_for(self, name: str, paths: list) -> dict:
+        """Globals after loading paths - from the cache when the contents match"""
+        key = content_key(paths)
+        entry = self.entries.get(name)
+        if entry and entry["key"] == key:
+            return pickle.loads(entry["data"])
+
+        env = load_lua_files(paths)
+        # Entries stay pickled so every caller gets its own copy
+        self.entries[name] = {"key": key, "data": pickle.dumps(env, protocol=pickle.HIGHEST_PROTOCOL)}
+        self.dirty = True
+        return env
+
+
+_CACHES: dict[str, ConfigCache] = {}
+
+
+def get_cache(root: str = BASE_PATH) -> ConfigCache:
+    """Config cache for a project root, once per process"""
+    root = os.path.abspath(root)
+    if root not in _CACHES:
+        _CACHES[root] = ConfigCache(root)
+    return _CACHES[root]
+
+
+# =============================================================================
+# RESOURCE CONFIGS (shared_scripts in fxmanifest load order)
+# =============================================================================
+FREE_BULLETS_SHARED = [
+    "free-bullets/shared/config.lua",
+    "free-bullets/shared/weapons.lua",
+    "free-bullets/shared/magazines.lua",
+    "free-bullets/shared/modifiers.lua",
+]
+
+SELECTIVEFIRE_SHARED = [
+    "free_selectivefire/shared/config.lua",
+]
+
+RESOURCES = {
+    "free-bullets": FREE_BULLETS_SHARED,
+    "free_selectivefire": SELECTIVEFIRE_SHARED,
+}
+
+
+def resource_config(resource: str, base_path: str = BASE_PATH, use_cache: bool = True) -> dict:
+    """Config table of one resource in RESOURCES"""
+    paths = [os.path.join(base_path, p) for p in RESOURCES[resource]]
+    if not use_cache:
+        return load_config(paths)
+    cache = get_cache(base_path)
+    env = cache.globals_for(resource, paths)
+    cache.save()
+    return env.get("Config") or {}
+
+
+def load_all(base_path: str = BASE_PATH, use_cache: bool = True) -> dict:
+    """{resource: Config} for every resource in RESOURCES"""
+    return {resource: resource_config(resource, base_path, use_cache) for resource in RESOURCES}
+
+
+def free_bullets_config(base_path: str = BASE_PATH, use_cache: bool = True) -> dict:
+    """Config table of the free-bullets resource"""
+    return resource_config("free-bullets", base_path, use_cache)
+
+
+def selectivefire_config(base_path: str = BASE_PATH, use_cache: bool = True) -> dict:
+    """Config table of the free_selectivefire resource"""
+    return resource_config("free_selectivefire", base_path, use_cache)
+
+
+def lookup_path(configs: dict, dotted: str):
+    """Resolve 'Config.AmmoModifiers.9mm_hp' across the loaded resources (keys may contain dots)"""
+    parts = dotted.split(".")
+    if parts[0] == "Config":
+        parts = parts[1:]
+
+    def resolve(value, rest):
+        if not rest:
+            return True, value
+        for size in range(len(rest), 0, -1):
+            key = ".".join(rest[:size])
+            if isinstance(value, dict) and key in value:
+                child = value[key]
+            elif isinstance(value, list) and key.isdigit() and 0 < int(key) <= len(value):
+                child = value[int(key) - 1]
+            else:
+                continue
+            found, result = resolve(child, rest[size:])
+            if found:
+                return True, result
+        return False, None
+
+    for config in configs.values():
+        found, value = resolve(config, parts)
+        if found:
+            return value
+    raise KeyError(dotted)
+
+
+def main():
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Load (and cache) the resources' shared Lua config")
+    parser.add_argument("--root", default=BASE_PATH, help="Project root")
+    parser.add_argument("--no-cache", action="store_true", help="Parse the Lua files without the cache")
+    parser.add_argument("--show", type=str, help="Print one table as JSON, e.g. Config.AmmoModifiers.jhp")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    configs = load_all(args.root, use_cache=not args.no_cache)
+    elapsed = time.perf_counter() - start
+
+    if args.show:
+        print(json.dumps(lookup_path(configs, args.show), indent=2, default=str))
+        return
+
+    print(f"Loaded in {elapsed * 1000:.1f}ms" + ("" if args.no_cache else f" (cache: {get_cache(args.root).cache_path})"))
+    for resource, config in configs.items():
+        print(f"  {resource}: {len(config)} tables")
+        for name, value in config.items():
+            size = f"{len(value)} entries" if isinstance(value, (dict, list)) else repr(value)
+            print(f"    Config.{name:<24} {size}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Magazine / Speedloader Compatibility Index Generator
+
+Inverts Config.Magazines / Config.Speedloaders (free-bullets/shared/
+magazines.lua) into shared/magazine_index.lua, so the compatibility
+helpers become single table reads instead of scanning every item:
+- MagazineIndex.magazinesByWeapon[`WEAPON_X`]    -> { item = true }
+- MagazineIndex.speedloadersByWeapon[`WEAPON_X`] -> { item = true }
+- MagazineIndex.*ByWeaponName['WEAPON_X']        -> same, for string lookups
+- MagazineIndex.weaponsByMagazine[item]          -> { [`WEAPON_X`] = true }
+- MagazineIndex.weaponsBySpeedloader[item]       -> { [`WEAPON_X`] = true }
+
+Hash keys follow IsMagazineCompatible(): a listed weapon name resolves
+through Config._WeaponNameToHash (componentBase COMPONENT_ -> WEAPON_),
+so names with no matching componentBase never match by hash - they are
+reported. Name keys are the listed names upper-cased, like the string
+path.
+
+Usage:
+    python magazine_index_gen.py
+    python magazine_index_gen.py --check
+"""
+
+import os
+import sys
+
+import lua_config
+from lua_config import LuaHash
+
+BASE_PATH = "/home/user/project_pipes"
+OUTPUT_PATH = "free-bullets/shared/magazine_index.lua"
+
+HEADER = """--[[
+    AUTO-GENERATED by scripts/magazine_index_gen.py - DO NOT EDIT
+    ===============================================================
+
+    Inverted magazine/speedloader compatibility index for magazines.lua.
+    Regenerate after changing free-bullets/shared/*.lua:
+
+        python scripts/magazine_index_gen.py
+
+    Source hash: {source_hash}
+]]
+"""
+
+
+# =============================================================================
+# INDEX BUILDING
+# =============================================================================
+def weapon_name_to_key(config: dict) -> dict:
+    """Config._WeaponNameToHash, with the Config.Weapons key name standing in for the hash"""
+    mapping = {}
+    for key, info in config["Weapons"].items():
+        if info.get("componentBase"):
+            mapping[info["componentBase"].replace("COMPONENT_", "WEAPON_")] = key
+    return mapping
+
+
+def listed_weapons(item: dict) -> list:
+    weapons = item.get("weapons")
+    if weapons is None:
+        return []
+    return weapons if isinstance(weapons, list) else [weapons]
+
+
+def invert(items: dict, name_to_key: dict) -> tuple:
+    """(by weapon key, by weapon name, by item, unresolved names) for one item table"""
+    by_weapon, by_name, by_item = {}, {}, {}
+    unresolved = set()
+    for item_name, item in items.items():
+        for weapon_name in listed_weapons(item):
+            by_name.setdefault(weapon_name.upper(), {})[item_name] = True
+            key = name_to_key.get(weapon_name)
+            if key is None:
+                unresolved.add(weapon_name)
+                continue
+            by_weapon.setdefault(LuaHash(key), {})[item_name] = True
+            by_item.setdefault(item_name, {})[LuaHash(key)] = True
+    return by_weapon, by_name, by_item, unresolved
+
+
+def sorted_tables(*tables) -> list:
+    """Stable output: outer and inner keys sorted"""
+    return [{k: dict(sorted(v.items())) for k, v in sorted(t.items())} for t in tables]
+
+
+def render(config: dict, source_hash: str) -> tuple:
+    """Generated Lua source plus a report dict"""
+    name_to_key = weapon_name_to_key(config)
+    mag_weapon, mag_name, mag_item, mag_unresolved = invert(config.get("Magazines") or {}, name_to_key)
+    sl_weapon, sl_name, sl_item, sl_unresolved = invert(config.get("Speedloaders") or {}, name_to_key)
+    mag_weapon, mag_name, mag_item, sl_weapon, sl_name, sl_item = sorted_tables(
+        mag_weapon, mag_name, mag_item, sl_weapon, sl_name, sl_item)
+
+    sections = [
+        HEADER.format(source_hash=source_hash),
+        "MagazineIndex = {}",
+        "",
+        f"MagazineIndex.magazinesByWeapon = {lua_config.to_lua(mag_weapon)}",
+        "",
+        f"MagazineIndex.speedloadersByWeapon = {lua_config.to_lua(sl_weapon)}",
+        "",
+        "-- Upper-cased weapon names (string lookups)",
+        f"MagazineIndex.magazinesByWeaponName = {lua_config.to_lua(mag_name)}",
+        "",
+        f"MagazineIndex.speedloadersByWeaponName = {lua_config.to_lua(sl_name)}",
+        "",
+        f"MagazineIndex.weaponsByMagazine = {lua_config.to_lua(mag_item)}",
+        "",
+        f"MagazineIndex.weaponsBySpeedloader = {lua_config.to_lua(sl_item)}",
+        "",
+    ]
+
+    report = {
+        "magazines": len(config.get("Magazines") or {}),
+        "speedloaders": len(config.get("Speedloaders") or {}),
+        "weapons": len(set(mag_weapon) | set(sl_weapon)),
+        "unresolved": sorted(mag_unresolved | sl_unresolved),
+    }
+    return "\n".join(sections), report
+
+
+def source_paths(base_path: str) -> list:
+    return [os.path.join(base_path, p) for p in lua_config.FREE_BULLETS_SHARED]
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate the magazine/speedloader compatibility index")
+    parser.add_argument("--root", default=BASE_PATH, help="Project root")
+    parser.add_argument("--output", type=str, help=f"Output path (default: <root>/{OUTPUT_PATH})")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the index is missing or stale")
+    args = parser.parse_args()
+
+    output = args.output or os.path.join(args.root, OUTPUT_PATH)
+    source_hash = lua_config.content_key(source_paths(args.root))
+
+    if args.check:
+        recorded = lua_config.generated_source_hash(output)
+        if recorded != source_hash:
+            print(f"STALE: {output} (recorded {recorded}, current {source_hash})")
+            sys.exit(1)
+        print(f"Up to date: {output}")
+        return
+
+    config = lua_config.free_bullets_config(args.root)
+    source, report = render(config, source_hash)
+
+    with open(output, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(source)
+
+    print(f"Written: {output}")
+    print(f"  Magazines:    {report['magazines']}")
+    print(f"  Speedloaders: {report['speedloaders']}")
+    print(f"  Weapons:      {report['weapons']}")
+    if report["unresolved"]:
+        print(f"  No componentBase match (never compatible by hash): {', '.join(report['unresolved'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1327 @@
+#!/usr/bin/env python3
+"""
+Weapon Meta Generator
+
+Renders a complete weapon resource from a declarative spec, using one
+template set per weapon class (pistol, pistol_auto, smg, rifle, shotgun,
+sniper) that is compiled once per run:
+- meta/weapons.meta           shared CWeaponInfo body + class defaults
+- meta/weaponcomponents.meta  magazine components (when the spec lists any)
+- meta/weaponarchetypes.meta  weapon and magazine models
+- meta/weaponanimations.meta  weapon_meta_package/weaponanimations_<class>.meta
+- meta/pedpersonality.meta    weapon_meta_package/pedpersonality_*.meta
+- fxmanifest.lua / cl_weaponNames.lua
+
+Compiling bakes the class constants (FX, flags, pickup hashes, animation
+clip sets) into the template text and splits the rest into literal and
+field parts, so rendering a weapon is a few string joins and the whole
+roster can be regenerated from specs on every build. Replaces the
+CWeaponInfo writers in fix_rifles_complete.py / fix_smgs_complete.py;
+weapon_meta_package/generate_weapon_metas.sh stays standalone (its
+compact two-file pistol output is not this layout).
+
+Spec files are JSON: a list of specs (or {"weapons": [...]}) with the
+WeaponSpec fields; "stats" takes any TUNABLE_DEFAULTS key.
+
+Usage:
+    python meta_generator.py --specs weapons.json
+    python meta_generator.py --from-roster --output generated
+    python meta_generator.py --from-roster --benchmark 20
+    python meta_generator.py --weapon G17 --class pistol --folder . --files archetypes,animations
+"""
+
+import os
+import re
+import json
+import time
+import string
+from dataclasses import dataclass, field
+from typing import Optional
+
+import meta_index
+import meta_scan
+import weapon_registry
+
+BASE_PATH = "/home/user/project_pipes"
+TEMPLATE_DIR = "weapon_meta_package"
+OUTPUT_DIR = "generated"
+TEMPLATE_WEAPON = "WEAPON_YOURWEAPON"
+
+# Folders that are not weapon resources
+SKIP_BATCHES = {TEMPLATE_DIR, "free-bullets", "free_selectivefire"}
+
+
+# =============================================================================
+# TEMPLATES
+# =============================================================================
+WEAPONS_META_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
+<CWeaponInfoBlob>
+  <SlotNavigateOrder>
+    <Item>
+      <WeaponSlots>
+        <Item>
+          <OrderNumber value="{order_nav}" />
+          <Entry>{slot}</Entry>
+        </Item>
+      </WeaponSlots>
+    </Item>
+    <Item>
+      <WeaponSlots>
+        <Item>
+          <OrderNumber value="{order_nav}" />
+          <Entry>{slot}</Entry>
+        </Item>
+      </WeaponSlots>
+    </Item>
+  </SlotNavigateOrder>
+  <SlotBestOrder>
+    <WeaponSlots>
+      <Item>
+        <OrderNumber value="{order_best}" />
+        <Entry>{slot}</Entry>
+      </Item>
+    </WeaponSlots>
+  </SlotBestOrder>
+  <TintSpecValues />
+  <FiringPatternAliases />
+  <UpperBodyFixupExpressionData />
+  <AimingInfos>
+    <Item type="CAimingInfo">
+      <Name>{aiming_info}</Name>
+      <HeadingLimit value="{heading_limit}" />
+      <SweepPitchMin value="{sweep_pitch_min}" />
+      <SweepPitchMax value="{sweep_pitch_max}" />
+    </Item>
+  </AimingInfos>
+  <Infos>
+    <Item>
+      <Infos />
+    </Item>
+    <Item>
+      <Infos>
+        <Item type="CWeaponInfo">
+{comment}
+          <Name>{name}</Name>
+          <Model>{model}</Model>
+          <Audio>{audio}</Audio>
+          <Slot>{slot}</Slot>
+          <HumanNameHash>{name}</HumanNameHash>
+          <DamageType>BULLET</DamageType>
+          <Explosion>
+            <Default>DONTCARE</Default>
+            <HitCar>DONTCARE</HitCar>
+            <HitTruck>DONTCARE</HitTruck>
+            <HitBike>DONTCARE</HitBike>
+            <HitBoat>DONTCARE</HitBoat>
+            <HitPlane>DONTCARE</HitPlane>
+          </Explosion>
+          <FireType>INSTANT_HIT</FireType>
+          <EffectGroup>{effect_group}</EffectGroup>
+          <PedDamageHash>{ped_damage_hash}</PedDamageHash>
+          <WheelSlot>{wheel_slot}</WheelSlot>
+          <Group>{group}</Group>
+          <AmmoInfo ref="{ammo}" />
+          <AimingInfo ref="{aiming_info}" />
+
+          <ClipSize value="{clip_size}" />
+
+          <AccuracySpread value="{accuracy_spread}" />
+          <AccurateModeAccuracyModifier value="{accurate_mode_accuracy_modifier}" />
+          <RunAndGunAccuracyModifier value="{run_and_gun_accuracy_modifier}" />
+          <RunAndGunAccuracyMinOverride value="-1.000000" />
+          <RecoilAccuracyMax value="{recoil_accuracy_max}" />
+          <RecoilErrorTime value="{recoil_error_time}" />
+          <RecoilRecoveryRate value="{recoil_recovery_rate}" />
+
+          <RecoilAccuracyToAllowHeadShotAI value="{headshot_ai_recoil_accuracy}" />
+          <MinHeadShotDistanceAI value="{headshot_ai_min_distance}" />
+          <MaxHeadShotDistanceAI value="{headshot_ai_max_distance}" />
+          <HeadShotDamageModifierAI value="{headshot_ai_damage_modifier}" />
+          <RecoilAccuracyToAllowHeadShotPlayer value="{headshot_player_recoil_accuracy}" />
+          <MinHeadShotDistancePlayer value="{headshot_player_min_distance}" />
+          <MaxHeadShotDistancePlayer value="{headshot_player_max_distance}" />
+          <HeadShotDamageModifierPlayer value="{headshot_player_damage_modifier}" />
+
+          <Damage value="{damage}" />
+          <DamageTime value="0.000000" />
+          <DamageTimeInVehicle value="0.000000" />
+          <DamageTimeInVehicleHeadShot value="0.000000" />
+          <HitLimbsDamageModifier value="{hit_limbs_damage_modifier}" />
+          <NetworkHitLimbsDamageModifier value="{network_hit_limbs_damage_modifier}" />
+          <LightlyArmouredDamageModifier value="{lightly_armoured_damage_modifier}" />
+
+          <Force value="{force}" />
+          <ForceHitPed value="{force_hit_ped}" />
+          <ForceHitVehicle value="{force_hit_vehicle}" />
+          <ForceHitFlyingHeli value="{force_hit_heli}" />
+          {override_forces}
+          <ForceMaxStrengthMult value="1.000000" />
+          <ForceFalloffRangeStart value="0.000000" />
+          <ForceFalloffRangeEnd value="{force_falloff_range_end}" />
+          <ForceFalloffMin value="{force_falloff_min}" />
+          <ProjectileForce value="0.000000" />
+          <FragImpulse value="{frag_impulse}" />
+
+          <Penetration value="{penetration}" />
+          <VerticalLaunchAdjustment value="0.000000" />
+          <DropForwardVelocity value="0.000000" />
+
+          <Speed value="{speed}" />
+
+          <BulletsInBatch value="{bullets_in_batch}" />
+          <BatchSpread value="{batch_spread}" />
+
+          <ReloadTimeMP value="{reload_time}" />
+          <ReloadTimeSP value="{reload_time}" />
+
+          <TimeBetweenShots value="{time_between_shots}" />
+
+          <DamageFallOffRangeMin value="{damage_falloff_min}" />
+          <DamageFallOffRangeMax value="{damage_falloff_max}" />
+          <DamageFallOffModifier value="{damage_falloff_modifier}" />
+
+          <NetworkPlayerDamageModifier value="1.000000" />
+          <NetworkPedDamageModifier value="1.000000" />
+          <NetworkHeadShotPlayerDamageModifier value="1.000000" />
+          <LockOnRange value="0.000000" />
+          <WeaponRange value="{weapon_range}" />
+
+          <BulletDirectionOffsetInDegrees value="{bullet_direction_offset}" />
+          <RecoilShakeAmplitude value="{recoil_shake_amplitude}" />
+          <RecoilShakeFrequency value="{recoil_shake_frequency}" />
+          <RecoilShakeRollMagnitude value="{recoil_shake_roll}" />
+          <RecoilShakeDuration value="{recoil_shake_duration}" />
+
+          <AiSoundRange value="{ai_sound_range}" />
+          <AimingMod1 value="{aiming_mod1}" />
+          <AimingModTime1 value="{aiming_mod_time1}" />
+          <AimingMod2 value="{aiming_mod2}" />
+          <AimingModTime2 value="{aiming_mod_time2}" />
+
+          <Flags>{flags}</Flags>
+
+          <AltWheelSlot>WHEEL_UNARMED</AltWheelSlot>
+          <PickupGlowAsset />
+          <PickupTextRep />
+          <ModelHashKey>{model}</ModelHashKey>
+          <DefaultCameraHash>DEFAULT_FOLLOW_CAMERA</DefaultCameraHash>
+          <CoverCameraHash>DEFAULT_FOLLOW_CAMERA</CoverCameraHash>
+          <RunAndGunCameraHash>DEFAULT_FOLLOW_CAMERA</RunAndGunCameraHash>
+          <CinematicShootingCameraHash>DEFAULT_CINEMATIC_SHOOTING_CAMERA</CinematicShootingCameraHash>
+          <PickupHash>{pickup_hash}</PickupHash>
+          <MPPickupHash>{mp_pickup_hash}</MPPickupHash>
+          <NmShotTuningSet>Normal</NmShotTuningSet>
+{attach_points}          <AimOffset>
+            <X value="0.000000" />
+            <Y value="{aim_offset_y}" />
+            <Z value="0.000000" />
+          </AimOffset>
+          <FirstPersonAimOffset>
+            <X value="0.000000" />
+            <Y value="0.000000" />
+            <Z value="0.000000" />
+          </FirstPersonAimOffset>
+          <FirstPersonScopeOffset>
+            <X value="0.000000" />
+            <Y value="0.000000" />
+            <Z value="0.000000" />
+          </FirstPersonScopeOffset>
+          <CrouchAimOffset>
+            <X value="0.000000" />
+            <Y value="0.000000" />
+            <Z value="0.000000" />
+          </CrouchAimOffset>
+          <FirstPersonCrouchAimOffset>
+            <X value="0.000000" />
+            <Y value="0.000000" />
+            <Z value="0.000000" />
+          </FirstPersonCrouchAimOffset>
+          <ZoomFactorForAccurateMode value="1.000000" />
+          <ReticuleMinSizeStanding value="0.000000" />
+          <ReticuleMinSizeDucked value="0.000000" />
+          <ReticuleScale value="{reticule_scale}" />
+          <IronSightCameraZoomFactor value="1.000000" />
+          <WeaponSoundBoneTag />
+          <Hud>
+            <FlashColor value="0xFFFFFFFF" />
+            <ScrollSelect>true</ScrollSelect>
+          </Hud>
+          <AmmoPickup>
+            <AmmoType>{ammo}</AmmoType>
+            <Amount value="{ammo_pickup}" />
+          </AmmoPickup>
+          <AmmoPickup2>
+            <AmmoType>{ammo}</AmmoType>
+            <Amount value="{ammo_pickup2}" />
+          </AmmoPickup2>
+          <FireFx>
+            <Direction>
+              <X value="0.000000" />
+              <Y value="5.000000" />
+              <Z value="0.000000" />
+            </Direction>
+            <Rotation>
+              <X value="0.000000" />
+              <Y value="0.000000" />
+              <Z value="0.000000" />
+            </Rotation>
+            <Scale value="1.000000" />
+            <EffectName>{fire_fx}</EffectName>
+            <FxBone>Gun_Muzzle</FxBone>
+          </FireFx>
+          <MuzzleFx>
+            <Direction>
+              <X value="0.000000" />
+              <Y value="5.000000" />
+              <Z value="0.000000" />
+            </Direction>
+            <Rotation>
+              <X value="0.000000" />
+              <Y value="0.000000" />
+              <Z value="0.000000" />
+            </Rotation>
+            <Scale value="{muzzle_fx_scale}" />
+            <EffectName>{muzzle_fx}</EffectName>
+            <FxBone>Gun_Muzzle</FxBone>
+          </MuzzleFx>
+          <ShellFx>
+            <Direction>
+              <X value="0.000000" />
+              <Y value="0.000000" />
+              <Z value="0.000000" />
+            </Direction>
+            <Rotation>
+              <X value="0.000000" />
+              <Y value="0.000000" />
+              <Z value="0.000000" />
+            </Rotation>
+            <Scale value="1.000000" />
+            <EffectName>{shell_fx}</EffectName>
+            <FxBone>Gun_Shell</FxBone>
+          </ShellFx>
+          <TracerFx>
+            <Direction>
+              <X value="0.000000" />
+              <Y value="0.000000" />
+              <Z value="0.000000" />
+            </Direction>
+            <Rotation>
+              <X value="0.000000" />
+              <Y value="0.000000" />
+              <Z value="0.000000" />
+            </Rotation>
+            <Scale value="1.000000" />
+            <EffectName>proj_tracer</EffectName>
+            <FxBone />
+          </TracerFx>
+          <FlashFxLightEnabled value="true" />
+          <FlashFxLightCastsShadows value="false" />
+          <FlashFxLightOffsetDistance value="{flash_light_offset}" />
+          <FlashFxLightRGBAMax value="0xFFFFE4C9" />
+          <FlashFxLightIntensityMax value="{flash_light_intensity}" />
+          <FlashFxLightFallOffMax value="{flash_light_falloff}" />
+          <FlashFxFadeOutTime value="{flash_fade_out}" />
+          <FlashFxAltBone />
+          <ReloadUpperBodyFixupExpression></ReloadUpperBodyFixupExpression>
+        </Item>
+      </Infos>
+    </Item>
+  </Infos>
+</CWeaponInfoBlob>
+'''
+
+ATTACH_POINTS_TEMPLATE = '''          <AttachPoints>
+            <Item>
+              <AttachBone>WAPClip</AttachBone>
+              <Components>
+{items}              </Components>
+            </Item>
+          </AttachPoints>
+'''
+
+ATTACH_ITEM_TEMPLATE = '''                <Item>
+                  <Name>{component}</Name>
+                  <Default value="{default}" />
+                </Item>
+'''
+
+COMPONENTS_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
+<CWeaponComponentInfoBlob>
+\t<Infos>
+{items}\t</Infos>
+\t<InfoBlobName/>
+</CWeaponComponentInfoBlob>
+'''
+
+COMPONENT_ITEM_TEMPLATE = '''\t\t<!-- {label} -->
+\t\t<Item type="CWeaponComponentClipInfo">
+\t\t\t<Name>{component}</Name>
+\t\t\t<Model>{model}</Model>
+\t\t\t<LocName>{loc_name}</LocName>
+\t\t\t<LocDesc>{loc_desc}</LocDesc>
+\t\t\t<AttachBone>AAPClip</AttachBone>
+\t\t\t<WeaponAttachBone>WAPClip</WeaponAttachBone>
+\t\t\t<AccuracyModifier type="NULL"/>
+\t\t\t<DamageModifier type="NULL"/>
+\t\t\t<bShownOnWheel value="false"/>
+\t\t\t<CreateObject value="true"/>
+\t\t\t<HudDamage value="0"/>
+\t\t\t<HudSpeed value="0"/>
+\t\t\t<HudCapacity value="0"/>
+\t\t\t<HudAccuracy value="0"/>
+\t\t\t<HudRange value="0"/>
+\t\t\t<ClipSize value="{clip_size}"/>
+\t\t\t<AmmoInfo ref="{ammo}"/>
+\t\t\t<ReloadData ref="RELOAD_DEFAULT_WITH_EMPTIES"/>
+\t\t</Item>
+'''
+
+ARCHETYPES_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
+<CWeaponModelInfo__InitDataList>
+\t<InitDatas>
+{items}\t</InitDatas>
+</CWeaponModelInfo__InitDataList>
+'''
+
+ARCHETYPE_ITEM_TEMPLATE = '''\t\t<Item>
+\t\t\t<modelName>{model}</modelName>
+\t\t\t<txdName>{model}</txdName>
+\t\t\t<ptfxAssetName>NULL</ptfxAssetName>
+\t\t\t<lodDist value="{lod_dist}"/>
+\t\t</Item>
+'''
+
+MANIFEST_TEMPLATE = '''fx_version 'cerulean'
+game 'gta5'
+
+author 'Weapon Meta Development Project'
+description '{folder} Addon Weapon'
+version '1.0.0'
+
+client_script 'cl_weaponNames.lua'
+
+files {{
+{files}    'stream/*',
+}}
+
+--[[
+    DATA FILE LOAD ORDER (CRITICAL!)
+    Components must load BEFORE weapons.meta
+]]
+
+{data_files}'''
+
+# Output files: key -> (path in the resource, data_file type)
+OUTPUT_FILES = {
+    "components": ("meta/weaponcomponents.meta", "WEAPONCOMPONENTSINFO_FILE"),
+    "archetypes": ("meta/weaponarchetypes.meta", "WEAPON_METADATA_FILE"),
+    "animations": ("meta/weaponanimations.meta", "WEAPON_ANIMATIONS_FILE"),
+    "weapons": ("meta/weapons.meta", "WEAPONINFO_FILE"),
+    "personality": ("meta/pedpersonality.meta", "PED_PERSONALITY_FILE"),
+    "manifest": ("fxmanifest.lua", None),
+    "names": ("cl_weaponNames.lua", None),
+}
+
+WEAPON_LOD_DIST = 500
+MAGAZINE_LOD_DIST = 300
+
+
+# =============================================================================
+# WEAPON CLASSES
+# =============================================================================
+# Tunable CWeaponInfo values (spec "stats"); the rifle numbers from the
+# original fix_rifles_complete.py writer are the base every class overrides
+TUNABLE_DEFAULTS = {
+    "heading_limit": "90.000000",
+    "sweep_pitch_min": "-45.000000",
+    "sweep_pitch_max": "45.000000",
+    "clip_size": "30",
+    "accuracy_spread": "0.80",
+    "accurate_mode_accuracy_modifier": "0.150000",
+    "run_and_gun_accuracy_modifier": "0.550000",
+    "recoil_accuracy_max": "1.80",
+    "recoil_error_time": "0.400000",
+    "recoil_recovery_rate": "0.55",
+    "headshot_ai_recoil_accuracy": "0.450000",
+    "headshot_ai_min_distance": "5.000000",
+    "headshot_ai_max_distance": "200.000000",
+    "headshot_ai_damage_modifier": "4.000000",
+    "headshot_player_recoil_accuracy": "0.450000",
+    "headshot_player_min_distance": "0.000000",
+    "headshot_player_max_distance": "200.000000",
+    "headshot_player_damage_modifier": "2.500000",
+    "damage": "42.0",
+    "hit_limbs_damage_modifier": "0.500000",
+    "network_hit_limbs_damage_modifier": "0.800000",
+    "lightly_armoured_damage_modifier": "0.700000",
+    "force": "120.0",
+    "force_hit_ped": "100.000000",
+    "force_hit_vehicle": "50.000000",
+    "force_hit_heli": "35.000000",
+    "force_falloff_range_end": "200.000000",
+    "force_falloff_min": "0.400000",
+    "frag_impulse": "350.000000",
+    "penetration": "0.40",
+    "speed": "900.0",
+    "bullets_in_batch": "1",
+    "batch_spread": "0.000000",
+    "reload_time": "2.500000",
+    "time_between_shots": "0.085",
+    "damage_falloff_min": "70.0",
+    "damage_falloff_max": "200.0",
+    "damage_falloff_modifier": "0.40",
+    "weapon_range": "400.0",
+    "bullet_direction_offset": "0.080000",
+    "recoil_shake_amplitude": "0.25",
+    "recoil_shake_frequency": "0.50",
+    "recoil_shake_roll": "0.150000",
+    "recoil_shake_duration": "0.200000",
+    "ai_sound_range": "180.000000",
+    "aiming_mod1": "0.650000",
+    "aiming_mod_time1": "0.200000",
+    "aiming_mod2": "0.400000",
+    "aiming_mod_time2": "0.350000",
+    "aim_offset_y": "0.020000",
+    "reticule_scale": "0.400000",
+    "ammo_pickup": "30",
+    "ammo_pickup2": "60",
+    "flash_light_offset": "4.000000",
+    "flash_light_intensity": "1.500000",
+    "flash_light_falloff": "8.000000",
+    "flash_fade_out": "0.050000",
+}
+
+LONG_GUN_FLAGS = ("WF_GUN, WF_GUN_2_HANDED, WF_NO_SHOOTING_BERSERK, WF_PED_GUN_2_HANDED, WF_WEAPON, "
+                  "WF_LOUDWEAPON, WF_TAKE_ARM_L_LONG_GUN_IMMEDIATE_DAMAGE_REACTIONS, WF_MAKE_PED_BACKUP")
+PISTOL_FLAGS = "WF_GUN, WF_NO_SHOOTING_BERSERK, WF_WEAPON, WF_LOUDWEAPON, WF_MAKE_PED_BACKUP"
+
+SHOTGUN_OVERRIDE_FORCES = '''<OverrideForces>
+            <Item>
+              <BoneTag>BONETAG_HEAD</BoneTag>
+              <ForceFront value="35.000000" />
+              <ForceBack value="28.000000" />
+            </Item>
+            <Item>
+              <BoneTag>BONETAG_NECK</BoneTag>
+              <ForceFront value="55.000000" />
+              <ForceBack value="28.000000" />
+            </Item>
+            <Item>
+              <BoneTag>BONETAG_R_CLAVICLE</BoneTag>
+              <ForceFront value="28.000000" />
+              <ForceBack value="28.000000" />
+            </Item>
+            <Item>
+              <BoneTag>BONETAG_L_CLAVICLE</BoneTag>
+              <ForceFront value="28.000000" />
+              <ForceBack value="28.000000" />
+            </Item>
+          </OverrideForces>'''
+
+
+@dataclass
+class WeaponClass:
+    """Per-class template inputs: baked-in constants plus spec defaults"""
+    name: str
+    group: str
+    wheel_slot: str
+    ammo: str
+    audio: str
+    model_prefix: str
+    order_nav: int
+    order_best: int
+    animations: str                        # Template file in weapon_meta_package/
+    personality: str                       # Template file in weapon_meta_package/
+    constants: dict                        # Baked into weapons.meta at compile time
+    defaults: dict = field(default_factory=dict)     # TUNABLE_DEFAULTS overrides
+    anim_substitutions: tuple = ()         # (old, new) applied to the animations template
+
+
+def long_gun_constants(**overrides) -> dict:
+    constants = {
+        "effect_group": "WEAPON_EFFECT_GROUP_RIFLE",
+        "ped_damage_hash": "BulletLarge",
+        "flags": LONG_GUN_FLAGS,
+        "pickup_hash": "PICKUP_WEAPON_ASSAULTRIFLE",
+        "mp_pickup_hash": "PICKUP_AMMO_BULLET_MP",
+        "override_forces": "<OverrideForces />",
+        "fire_fx": "muz_assault_rifle_fp",
+        "muzzle_fx": "muz_assault_rifle",
+        "muzzle_fx_scale": "1.200000",
+        "shell_fx": "weap_sh_ar",
+    }
+    constants.update(overrides)
+    return constants
+
+
+PISTOL_DEFAULTS = {
+    "clip_size": "17",
+    "accuracy_spread": "1.500000",
+    "accurate_mode_accuracy_modifier": "0.500000",
+    "run_and_gun_accuracy_modifier": "2.000000",
+    "recoil_accuracy_max": "1.200000",
+    "recoil_recovery_rate": "0.300000",
+    "headshot_ai_recoil_accuracy": "0.650000",
+    "headshot_ai_min_distance": "1.200000",
+    "headshot_ai_max_distance": "45.000000",
+    "headshot_ai_damage_modifier": "1.500000",
+    "headshot_player_recoil_accuracy": "0.500000",
+    "headshot_player_max_distance": "7.000000",
+    "headshot_player_damage_modifier": "2.900000",
+    "damage": "34.000000",
+    "lightly_armoured_damage_modifier": "1.000000",
+    "force": "50.000000",
+    "force_hit_ped": "40.000000",
+    "force_hit_vehicle": "30.000000",
+    "force_hit_heli": "10.000000",
+    "force_falloff_range_end": "30.000000",
+    "force_falloff_min": "0.500000",
+    "frag_impulse": "150.000000",
+    "penetration": "0.150000",
+    "speed": "355.000000",
+    "reload_time": "-1.000000",
+    "time_between_shots": "0.170000",
+    "damage_falloff_min": "15.000000",
+    "damage_falloff_max": "50.000000",
+    "damage_falloff_modifier": "0.380000",
+    "weapon_range": "100.000000",
+    "bullet_direction_offset": "0.150000",
+    "recoil_shake_amplitude": "0.200000",
+    "recoil_shake_frequency": "0.400000",
+    "recoil_shake_roll": "0.100000",
+    "recoil_shake_duration": "0.150000",
+    "ai_sound_range": "100.000000",
+    "aim_offset_y": "0.000000",
+    "reticule_scale": "0.300000",
+    "ammo_pickup": "24",
+    "ammo_pickup2": "48",
+    "flash_light_offset": "2.000000",
+    "flash_light_intensity": "1.000000",
+    "flash_light_falloff": "5.000000",
+    "flash_fade_out": "0.040000",
+}
+
+PISTOL_CONSTANTS = long_gun_constants(
+    effect_group="WEAPON_EFFECT_GROUP_PISTOL_SMALL",
+    ped_damage_hash="BulletSmall",
+    flags=PISTOL_FLAGS,
+    pickup_hash="PICKUP_WEAPON_PISTOL",
+    fire_fx="muz_pistol_fp",
+    muzzle_fx="muz_pistol",
+    muzzle_fx_scale="1.000000",
+    shell_fx="weap_sh_pistol",
+)
+
+WEAPON_CLASSES = {
+    "pistol": WeaponClass(
+        name="pistol", group="GROUP_PISTOL", wheel_slot="WHEEL_PISTOL",
+        ammo="AMMO_PISTOL", audio="AUDIO_ITEM_PISTOL", model_prefix="w_pi_",
+        order_nav=100, order_best=50,
+        animations="weaponanimations_pistol_complete.meta",
+        personality="pedpersonality_pistol.meta",
+        constants=PISTOL_CONSTANTS,
+        defaults=PISTOL_DEFAULTS,
+    ),
+    "pistol_auto": WeaponClass(
+        name="pistol_auto", group="GROUP_PISTOL", wheel_slot="WHEEL_PISTOL",
+        ammo="AMMO_PISTOL", audio="AUDIO_ITEM_APPISTOL", model_prefix="w_pi_",
+        order_nav=100, order_best=50,
+        animations="weaponanimations_pistol_auto.meta",
+        personality="pedpersonality_pistol.meta",
+        constants=PISTOL_CONSTANTS,
+        defaults=dict(PISTOL_DEFAULTS, clip_size="33", time_between_shots="0.050000",
+                      accuracy_spread="2.500000", recoil_accuracy_max="2.000000"),
+    ),
+    "smg": WeaponClass(
+        name="smg", group="GROUP_SMG", wheel_slot="WHEEL_SMG",
+        ammo="AMMO_SMG", audio="AUDIO_ITEM_SMG", model_prefix="w_sb_",
+        order_nav=400, order_best=200,
+        animations="weaponanimations_smg.meta",
+        personality="pedpersonality_longarm.meta",
+        constants=long_gun_constants(
+            effect_group="WEAPON_EFFECT_GROUP_SMG",
+            ped_damage_hash="BulletSmall",
+            pickup_hash="PICKUP_WEAPON_SMG",
+            fire_fx="muz_smg_fp",
+            muzzle_fx="muz_smg",
+            muzzle_fx_scale="1.000000",
+            shell_fx="weap_sh_smg",
+        ),
+        defaults={
+            "damage": "25.0",
+            "accuracy_spread": "1.50",
+            "recoil_accuracy_max": "2.00",
+            "weapon_range": "80.0",
+            "speed": "370.0",
+            "force": "65.0",
+            "penetration": "0.25",
+            "damage_falloff_min": "25.0",
+            "damage_falloff_max": "70.0",
+            "damage_falloff_modifier": "0.35",
+            "recoil_shake_amplitude": "0.18",
+            "recoil_shake_frequency": "0.45",
+            "force_hit_ped": "55.0",
+            "force_hit_vehicle": "28.0",
+            "force_hit_heli": "18.0",
+            "bullet_direction_offset": "0.12",
+            "accurate_mode_accuracy_modifier": "0.200000",
+            "run_and_gun_accuracy_modifier": "0.500000",
+            "recoil_error_time": "0.350000",
+            "headshot_ai_recoil_accuracy": "0.500000",
+            "headshot_ai_min_distance": "3.000000",
+            "headshot_ai_max_distance": "50.000000",
+            "headshot_player_max_distance": "50.000000",
+            "lightly_armoured_damage_modifier": "0.600000",
+            "force_falloff_range_end": "80.000000",
+            "frag_impulse": "200.000000",
+            "reload_time": "2.200000",
+            "recoil_shake_roll": "0.120000",
+            "recoil_shake_duration": "0.180000",
+            "ai_sound_range": "140.000000",
+            "aiming_mod1": "0.700000",
+            "aiming_mod_time1": "0.180000",
+            "aiming_mod2": "0.450000",
+            "aiming_mod_time2": "0.300000",
+            "aim_offset_y": "0.015000",
+            "flash_light_offset": "3.000000",
+            "flash_light_intensity": "1.200000",
+            "flash_light_falloff": "6.000000",
+            "flash_fade_out": "0.040000",
+        },
+    ),
+    "rifle": WeaponClass(
+        name="rifle", group="GROUP_RIFLE", wheel_slot="WHEEL_RIFLE",
+        ammo="AMMO_RIFLE", audio="AUDIO_ITEM_CARBINERIFLE", model_prefix="w_ar_",
+        order_nav=300, order_best=150,
+        animations="weaponanimations_rifle.meta",
+        personality="pedpersonality_longarm.meta",
+        constants=long_gun_constants(),
+    ),
+    "shotgun": WeaponClass(
+        name="shotgun", group="GROUP_SHOTGUN", wheel_slot="WHEEL_SHOTGUN",
+        ammo="AMMO_SHOTGUN", audio="AUDIO_ITEM_PUMPSHOTGUN", model_prefix="w_sg_",
+        order_nav=280, order_best=140,
+        animations="weaponanimations_rifle.meta",
+        personality="pedpersonality_longarm.meta",
+        constants=long_gun_constants(
+            effect_group="WEAPON_EFFECT_GROUP_SHOTGUN",
+            ped_damage_hash="ShotgunLarge",
+            flags=("WF_GUN, WF_GUN_2_HANDED, WF_BULLETSPREAD, WF_PROJECTILE_DIRECTION_RANDOM, "
+                   "WF_NO_SHOOTING_BERSERK, WF_PED_GUN_2_HANDED, WF_WEAPON, WF_LOUDWEAPON, "
+                   "WF_TAKE_ARM_L_LONG_GUN_IMMEDIATE_DAMAGE_REACTIONS, WF_PERFECT_ACCURACY_NOT_SUPPORTED, "
+                   "WF_MAKE_PED_BACKUP, WF_DEFAULT_SCOPE_ON, WF_SUPPRESS_SECONDARY_ACCURACY_SP, "
+                   "WF_PUMP_ACTION_FIRE, WF_SLOW_PROJECTILE"),
+            pickup_hash="PICKUP_WEAPON_PUMPSHOTGUN",
+            override_forces=SHOTGUN_OVERRIDE_FORCES,
+            fire_fx="muz_smg_fp",
+            muzzle_fx="muz_shotgun",
+            muzzle_fx_scale="1.000000",
+            shell_fx="weap_sh_shotgun",
+        ),
+        defaults={
+            "heading_limit": "60.000000",
+            "sweep_pitch_min": "-77.500000",
+            "sweep_pitch_max": "47.500000",
+            "clip_size": "5",
+            "accuracy_spread": "2.800000",
+            "accurate_mode_accuracy_modifier": "0.500000",
+            "run_and_gun_accuracy_modifier": "2.200000",
+            "recoil_accuracy_max": "1.200000",
+            "recoil_error_time": "0.000000",
+            "recoil_recovery_rate": "0.850000",
+            "headshot_ai_recoil_accuracy": "1000.000000",
+            "headshot_ai_min_distance": "1000.000000",
+            "headshot_ai_max_distance": "1000.000000",
+            "headshot_ai_damage_modifier": "1000.000000",
+            "headshot_player_recoil_accuracy": "0.200000",
+            "headshot_player_max_distance": "25.000000",
+            "headshot_player_damage_modifier": "1.800000",
+            "damage": "37.38",
+            "hit_limbs_damage_modifier": "0.700000",
+            "network_hit_limbs_damage_modifier": "0.850000",
+            "lightly_armoured_damage_modifier": "0.600000",
+            "force": "180.000000",
+            "force_hit_ped": "95.000000",
+            "force_hit_vehicle": "400.000000",
+            "force_hit_heli": "150.000000",
+            "force_falloff_range_end": "50.000000",
+            "force_falloff_min": "1.000000",
+            "frag_impulse": "550.000000",
+            "penetration": "0.120000",
+            "speed": "366.000000",
+            "bullets_in_batch": "9",
+            "batch_spread": "0.055000",
+            "reload_time": "-1.000000",
+            "time_between_shots": "1.090000",
+            "damage_falloff_min": "10.000000",
+            "damage_falloff_max": "35.000000",
+            "damage_falloff_modifier": "0.180000",
+            "weapon_range": "60.000000",
+            "bullet_direction_offset": "0.000000",
+            "recoil_shake_amplitude": "3.20",
+            "recoil_shake_frequency": "0.00",
+            "recoil_shake_roll": "0.550",
+            "recoil_shake_duration": "0.600",
+            "ai_sound_range": "150.000000",
+            "aiming_mod_time1": "0.300000",
+            "aiming_mod_time2": "0.450000",
+            "aim_offset_y": "0.020000",
+            "reticule_scale": "0.500000",
+            "ammo_pickup": "4",
+            "ammo_pickup2": "6",
+            "flash_light_intensity": "2.000000",
+            "flash_light_falloff": "10.000000",
+            "flash_fade_out": "0.070000",
+        },
+        anim_substitutions=(
+            ("weapons@rifle@hi@assault_rifle", "weapons@rifle@lo@pump"),
+            ("Cover_Wpn_Rifle<", "Cover_Wpn_RifleLo<"),
+            ("generic@assault_rifle@compact_rifle@", "generic@shotgun@pump_shotgun@"),
+            ("generic@assault_rifle@", "generic@shotgun@"),
+        ),
+    ),
+    "sniper": WeaponClass(
+        name="sniper", group="GROUP_SNIPER", wheel_slot="WHEEL_SNIPERRIFLE",
+        ammo="AMMO_SNIPER", audio="AUDIO_ITEM_SNIPERRIFLE", model_prefix="w_sr_",
+        order_nav=500, order_best=250,
+        animations="weaponanimations_rifle.meta",
+        personality="pedpersonality_longarm.meta",
+        constants=long_gun_constants(
+            effect_group="WEAPON_EFFECT_GROUP_SNIPER",
+            flags=LONG_GUN_FLAGS + ", WF_DEFAULT_SCOPE_ON",
+            pickup_hash="PICKUP_WEAPON_SNIPERRIFLE",
+            muzzle_fx_scale="1.000000",
+        ),
+        defaults={
+            "clip_size": "5",
+            "accuracy_spread": "0.300000",
+            "accurate_mode_accuracy_modifier": "0.180000",
+            "run_and_gun_accuracy_modifier": "4.200000",
+            "recoil_error_time": "0.300000",
+            "headshot_ai_recoil_accuracy": "0.550000",
+            "headshot_ai_max_distance": "450.000000",
+            "headshot_ai_damage_modifier": "2.400000",
+            "headshot_player_recoil_accuracy": "0.180000",
+            "headshot_player_max_distance": "450.000000",
+            "headshot_player_damage_modifier": "2.100000",
+            "damage": "101.0",
+            "hit_limbs_damage_modifier": "0.620000",
+            "network_hit_limbs_damage_modifier": "0.780000",
+            "lightly_armoured_damage_modifier": "0.800000",
+            "force_hit_ped": "165.000000",
+            "force_hit_vehicle": "550.000000",
+            "force_hit_heli": "320.000000",
+            "force_falloff_range_end": "450.000000",
+            "frag_impulse": "750.000000",
+            "penetration": "0.60",
+            "time_between_shots": "1.200",
+            "reload_time": "3.000000",
+            "weapon_range": "800.0",
+            "bullet_direction_offset": "0.000000",
+            "recoil_shake_roll": "0.220000",
+            "recoil_shake_duration": "0.380000",
+            "ai_sound_range": "280.000000",
+            "aiming_mod1": "0.520000",
+            "aiming_mod_time1": "0.320000",
+            "aiming_mod2": "0.220000",
+            "aiming_mod_time2": "0.480000",
+            "reticule_scale": "0.350000",
+            "ammo_pickup": "5",
+            "ammo_pickup2": "10",
+            "flash_light_offset": "5.000000",
+        },
+        anim_substitutions=(
+            ("weapons@rifle@hi@assault_rifle", "weapons@rifle@hi@sniper_rifle"),
+            ("generic@assault_rifle@compact_rifle@", "generic@sniper_rifle@sniper_rifle@"),
+            ("generic@assault_rifle@", "generic@sniper_rifle@"),
+        ),
+    ),
+}
+
+# CWeaponInfo <Group> -> class, for --from-roster
+GROUP_CLASSES = {
+    "GROUP_PISTOL": "pistol",
+    "GROUP_SMG": "smg",
+    "GROUP_RIFLE": "rifle",
+    "GROUP_ASSAULTRIFLE": "rifle",
+    "GROUP_SHOTGUN": "shotgun",
+    "GROUP_SNIPER": "sniper",
+    "GROUP_SNIPERRIFLE": "sniper",
+}
+
+
+# =============================================================================
+# TEMPLATE COMPILER
+# =============================================================================
+class CompiledTemplate:
+    """
+    str.format-style template split once into literal and field parts.
+    Fields named in `constants` are substituted at compile time; render()
+    only fills the remaining fields.
+    """
+
+    def __init__(self, text: str, constants: Optional[dict] = None):
+        constants = constants or {}
+        literals, fields, pending = [], [], []
+        for literal, field_name, _, _ in string.Formatter().parse(text):
+            pending.append(literal)
+            if field_name is None:
+                continue
+            if field_name in constants:
+                pending.append(str(constants[field_name]))
+                continue
+            literals.append("".join(pending))
+            fields.append(field_name)
+            pending = []
+        literals.append("".join(pending))
+        self.head = literals[0]
+        self.parts = tuple(zip(fields, literals[1:]))
+        self.fields = frozenset(fields)
+
+    def render(self, values: dict) -> str:
+        out = [self.head]
+        try:
+            for field_name, literal in self.parts:
+                out.append(values[field_name])
+                out.append(literal)
+        except KeyError as e:
+            raise KeyError(f"template field {e} has no value") from None
+        return "".join(out)
+
+
+def template_text(root: str, file_name: str) -> str:
+    """A weapon_meta_package template as format text: usage comment dropped, weapon -> {name}"""
+    with open(os.path.join(root, TEMPLATE_DIR, file_name), 'r', encoding='utf-8') as f:
+        text = f.read()
+    text = re.sub(r'^(<\?xml[^>]*\?>\s*)<!--.*?-->\s*', r'\1', text, count=1, flags=re.DOTALL)
+    text = text.replace("{", "{{").replace("}", "}}")
+    return text.replace(TEMPLATE_WEAPON, "{name}")
+
+
+@dataclass
+class ClassTemplates:
+    weapon_class: WeaponClass
+    weapons: CompiledTemplate
+    animations: CompiledTemplate
+    personality: CompiledTemplate
+    defaults: dict
+
+
+_COMPILED = {}
+
+
+def compile_class(name: str, root: str = BASE_PATH) -> ClassTemplates:
+    """Compile (once per root) the template set for one weapon class"""
+    key = (root, name)
+    if key not in _COMPILED:
+        if name not in WEAPON_CLASSES:
+            raise ValueError(f"Unknown weapon class '{name}' (expected one of {', '.join(WEAPON_CLASSES)})")
+        weapon_class = WEAPON_CLASSES[name]
+        animations = template_text(root, weapon_class.animations)
+        for old, new in weapon_class.anim_substitutions:
+            animations = animations.replace(old, new)
+        _COMPILED[key] = ClassTemplates(
+            weapon_class=weapon_class,
+            weapons=CompiledTemplate(WEAPONS_META_TEMPLATE, weapon_class.constants),
+            animations=CompiledTemplate(animations),
+            personality=CompiledTemplate(template_text(root, weapon_class.personality)),
+            defaults=dict(TUNABLE_DEFAULTS, **weapon_class.defaults),
+        )
+    return _COMPILED[key]
+
+
+# CWeaponInfo tag -> tunable key, for tags that map to exactly one tunable
+TUNABLE_TAGS = {}
+for _tag, _key in re.findall(r'<(\w+) value="\{(\w+)\}"', WEAPONS_META_TEMPLATE):
+    if _key in TUNABLE_DEFAULTS:
+        TUNABLE_TAGS.setdefault(_tag, set()).add(_key)
+TUNABLE_TAGS = {tag: keys.pop() for tag, keys in TUNABLE_TAGS.items()
+                if len(keys) == 1 and tag not in ("X", "Y", "Z", "Amount")}
+
+
+# =============================================================================
+# SPECS
+# =============================================================================
+@dataclass
+class WeaponSpec:
+    """Declarative description of one weapon resource"""
+    name: str                                  # WEAPON_X
+    weapon_class: str
+    display: str = ""
+    model: str = ""                            # Default: <class prefix><short name>
+    folder: str = ""                           # Default: weapon_<short name>
+    slot: str = ""                             # Default: SLOT_<short name>
+    order_nav: int = 0                         # 0: class default
+    order_best: int = 0
+    ammo: str = ""                             # Empty: class default
+    audio: str = ""
+    group: str = ""
+    wheel_slot: str = ""
+    comment: str = ""                          # Research comment block for CWeaponInfo
+    stats: dict = field(default_factory=dict)  # TUNABLE_DEFAULTS overrides
+    magazines: list = field(default_factory=list)
+
+    @property
+    def short(self) -> str:
+        return self.name[len("WEAPON_"):]
+
+
+def format_value(value) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        return f"{value:.6f}"
+    return str(value)
+
+
+def spec_from_dict(data: dict) -> WeaponSpec:
+    """Validated WeaponSpec from a JSON object"""
+    known = set(WeaponSpec.__dataclass_fields__)
+    unknown = set(data) - known
+    if unknown:
+        raise ValueError(f"{data.get('name', '?')}: unknown spec fields {sorted(unknown)}")
+    spec = WeaponSpec(**data)
+    if not spec.name.startswith("WEAPON_"):
+        raise ValueError(f"{spec.name}: weapon name must start with WEAPON_")
+    if spec.weapon_class not in WEAPON_CLASSES:
+        raise ValueError(f"{spec.name}: unknown weapon class '{spec.weapon_class}'")
+    bad_stats = set(spec.stats) - set(TUNABLE_DEFAULTS)
+    if bad_stats:
+        raise ValueError(f"{spec.name}: unknown stats {sorted(bad_stats)}")
+    for magazine in spec.magazines:
+        if "name" not in magazine or "clip_size" not in magazine:
+            raise ValueError(f"{spec.name}: magazines need 'name' and 'clip_size'")
+    return spec
+
+
+def load_specs(path: str) -> list:
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get("weapons", [])
+    return [spec_from_dict(item) for item in data]
+
+
+def spec_from_config(weapon_class: str, config: dict, existing_values: dict) -> WeaponSpec:
+    """WeaponSpec from a fix_*_complete.py config entry plus values read from the old meta"""
+    return WeaponSpec(
+        name=config["name"],
+        weapon_class=weapon_class,
+        display=config["display"],
+        model=config["model"],
+        slot=config["slot"],
+        order_nav=config["order_nav"],
+        order_best=config["order_best"],
+        ammo=config["ammo"],
+        audio=config["audio"],
+        group=config["group"],
+        wheel_slot=config["wheel_slot"],
+        comment=existing_values.get("comment", ""),
+        stats={k: v for k, v in existing_values.items() if k in TUNABLE_DEFAULTS},
+    )
+
+
+# =============================================================================
+# RENDERING
+# =============================================================================
+def component_name(spec: WeaponSpec, magazine: dict) -> str:
+    return f"COMPONENT_{spec.short}_{magazine['name']}"
+
+
+def weapon_values(spec: WeaponSpec, templates: ClassTemplates) -> dict:
+    """Field values for weapons.meta"""
+    weapon_class = templates.weapon_class
+    values = dict(templates.defaults)
+    values.update((k, format_value(v)) for k, v in spec.stats.items())
+
+    attach_points = ""
+    if spec.magazines:
+        items = "".join(ATTACH_ITEM_TEMPLATE.format(
+            component=component_name(spec, magazine),
+            default=format_value(bool(magazine.get("default", i == 0))))
+            for i, magazine in enumerate(spec.magazines))
+        attach_points = ATTACH_POINTS_TEMPLATE.format(items=items)
+
+    values.update(
+        name=spec.name,
+        model=spec.model or f"{weapon_class.model_prefix}{spec.short.lower()}",
+        slot=spec.slot or f"SLOT_{spec.short}",
+        order_nav=str(spec.order_nav or weapon_class.order_nav),
+        order_best=str(spec.order_best or weapon_class.order_best),
+        ammo=spec.ammo or weapon_class.ammo,
+        audio=spec.audio or weapon_class.audio,
+        group=spec.group or weapon_class.group,
+        wheel_slot=spec.wheel_slot or weapon_class.wheel_slot,
+        aiming_info=f"AI_{spec.short}",
+        comment=spec.comment or f"          <!-- {spec.display or spec.name} -->",
+        attach_points=attach_points,
+    )
+    return values
+
+
+def render_components(spec: WeaponSpec, ammo: str) -> str:
+    items = []
+    for magazine in spec.magazines:
+        items.append(COMPONENT_ITEM_TEMPLATE.format(
+            label=magazine.get("label", f"{magazine['name']} - {magazine['clip_size']} round"),
+            component=component_name(spec, magazine),
+            model=magazine.get("model", ""),
+            loc_name=magazine.get("loc_name", "WCT_CLIP1"),
+            loc_desc=magazine.get("loc_desc", "WCD_CP_CLIP1"),
+            clip_size=magazine["clip_size"],
+            ammo=magazine.get("ammo", ammo),
+        ))
+    return COMPONENTS_TEMPLATE.format(items="\n".join(items))
+
+
+def render_archetypes(spec: WeaponSpec, model: str) -> str:
+    models = [(model, WEAPON_LOD_DIST)]
+    for magazine in spec.magazines:
+        mag_model = magazine.get("model")
+        if mag_model and all(mag_model != m for m, _ in models):
+            models.insert(len(models) - 1, (mag_model, MAGAZINE_LOD_DIST))
+    items = "".join(ARCHETYPE_ITEM_TEMPLATE.format(model=m, lod_dist=lod) for m, lod in models)
+    return ARCHETYPES_TEMPLATE.format(items=items)
+
+
+def render_manifest(spec: WeaponSpec, folder: str, keys: list) -> str:
+    meta_keys = [k for k in OUTPUT_FILES if OUTPUT_FILES[k][1] and k in keys]
+    files = "".join(f"    '{OUTPUT_FILES[k][0]}',\n" for k in meta_keys)
+    data_files = "".join(f"data_file '{OUTPUT_FILES[k][1]}' '{OUTPUT_FILES[k][0]}'\n" for k in meta_keys)
+    return MANIFEST_TEMPLATE.format(folder=folder, files=files, data_files=data_files)
+
+
+def render_names(spec: WeaponSpec) -> str:
+    lines = [f'AddTextEntry("{spec.name}", "{spec.display or spec.name}")']
+    for magazine in spec.magazines:
+        if magazine.get("loc_name") and magazine.get("display"):
+            lines.append(f'AddTextEntry("{magazine["loc_name"]}", "{magazine["display"]}")')
+    return "\n".join(lines) + "\n"
+
+
+def resource_keys(spec: WeaponSpec) -> list:
+    """Output file keys for a spec (components only when it has magazines)"""
+    return [k for k in OUTPUT_FILES if k != "components" or spec.magazines]
+
+
+def render_resource(spec: WeaponSpec, root: str = BASE_PATH, keys: Optional[list] = None) -> dict:
+    """{path in the resource: text} for the requested output keys"""
+    templates = compile_class(spec.weapon_class, root)
+    all_keys = resource_keys(spec)
+    keys = [k for k in all_keys if keys is None or k in keys]
+    folder = spec.folder or f"weapon_{spec.short.lower()}"
+    values = weapon_values(spec, templates)
+
+    files = {}
+    for key in keys:
+        path = OUTPUT_FILES[key][0]
+        if key == "weapons":
+            files[path] = templates.weapons.render(values)
+        elif key == "animations":
+            files[path] = templates.animations.render(values)
+        elif key == "personality":
+            files[path] = templates.personality.render(values)
+        elif key == "components":
+            files[path] = render_components(spec, values["ammo"])
+        elif key == "archetypes":
+            files[path] = render_archetypes(spec, values["model"])
+        elif key == "manifest":
+            files[path] = render_manifest(spec, os.path.basename(os.path.abspath(folder)), all_keys)
+        elif key == "names":
+            files[path] = render_names(spec)
+    return files
+
+
+def render_weapons_meta(spec: WeaponSpec, root: str = BASE_PATH) -> str:
+    return render_resource(spec, root, ["weapons"])[OUTPUT_FILES["weapons"][0]]
+
+
+def write_resource(spec: WeaponSpec, output: str, root: str = BASE_PATH, keys: Optional[list] = None) -> list:
+    folder = os.path.join(output, spec.folder or f"weapon_{spec.short.lower()}")
+    written = []
+    for rel_path, text in render_resource(spec, root, keys).items():
+        path = os.path.join(folder, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(text)
+        written.append(path)
+    return written
+
+
+# =============================================================================
+# ROSTER
+# =============================================================================
+TEXT_ENTRY_PATTERN = re.compile(r'AddTextEntry\(\s*["\']([^"\']+)["\']\s*,\s*["\']([^"\']*)["\']')
+CLIP_COMPONENT_PATTERN = re.compile(
+    r'<Item type="CWeaponComponentClipInfo">.*?<Name>COMPONENT_[A-Z0-9_]*?_((?:EXT)?CLIP[A-Z0-9_]*)</Name>'
+    r'.*?<Model>([^<]*)</Model>.*?<ClipSize value="(\d+)"', re.DOTALL)
+# Element texts a WeaponSpec is read back from (one pass per resource)
+SPEC_TEXT_TAGS = ("Group", "Model", "Slot", "AmmoInfo", "Audio", "WheelSlot")
+TUNABLE_VALUE_TAGS = {key: tag for tag, key in TUNABLE_TAGS.items()}
+
+
+def read_text(path: str) -> str:
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return f.read()
+
+
+def registry_class(name: str) -> Optional[str]:
+    """Template class of a registry weapon (None if unknown or not templated)"""
+    entry = weapon_registry.load().by_name.get(name)
+    if entry is None:
+        return None
+    if entry.weapon_class == "pistol" and entry.fire_mode == "auto":
+        return "pistol_auto"
+    return entry.weapon_class if entry.weapon_class in WEAPON_CLASSES else None
+
+
+def spec_from_resource(index, entry, siblings: list) -> Optional[WeaponSpec]:
+    """WeaponSpec read back from an existing weapon resource (None if unsupported)"""
+    scan = meta_scan.scan_file(index.abspath(entry.path))
+    info = scan.item("CWeaponInfo") or scan
+    fields = info.texts(SPEC_TEXT_TAGS)
+    name = entry.weapon_names[0]
+    folder_dir = index.abspath(entry.folder)
+    weapon_class = registry_class(name)
+    if not weapon_class:
+        # Not in the registry: infer from the weapon group and animations
+        weapon_class = GROUP_CLASSES.get(fields["Group"])
+        if not weapon_class:
+            return None
+        animations = "".join(read_text(index.abspath(e.path)) for e in siblings if e.kind == "animations")
+        if weapon_class == "pistol" and "ap_pistol" in animations:
+            weapon_class = "pistol_auto"
+
+    display = ""
+    names_path = os.path.join(folder_dir, "cl_weaponNames.lua")
+    if os.path.exists(names_path):
+        for key, text in TEXT_ENTRY_PATTERN.findall(read_text(names_path)):
+            if key in (name, name.replace("WEAPON_", "WT_")):
+                display = text
+                break
+
+    magazines = []
+    for e in siblings:
+        if e.kind == "components":
+            for suffix, model, clip_size in CLIP_COMPONENT_PATTERN.findall(read_text(index.abspath(e.path))):
+                magazines.append({"name": suffix, "model": model, "clip_size": int(clip_size)})
+
+    stats = info.values(TUNABLE_VALUE_TAGS)
+    comment = info.leading_comment
+
+    return WeaponSpec(
+        name=name,
+        weapon_class=weapon_class,
+        display=display,
+        model=fields["Model"],
+        folder=os.path.basename(folder_dir),
+        slot=fields["Slot"] if fields["Slot"].startswith("SLOT_") else "",
+        ammo=fields["AmmoInfo"],
+        audio=fields["Audio"],
+        group=fields["Group"],
+        wheel_slot=fields["WheelSlot"],
+        comment=f"          {comment}" if comment else "",
+        stats=stats,
+        magazines=magazines,
+    )
+
+
+def roster_specs(root: str) -> tuple:
+    """(specs, skipped) for every weapon resource in the tree; first copy of a name wins"""
+    index = meta_index.get_index(root)
+    entries = sorted((e for e in index.entries.values()
+                      if e.kind == "weapons" and e.batch and e.batch not in SKIP_BATCHES),
+                     key=lambda e: (e.path.count("/"), e.path))
+    by_folder = {}
+    for e in index.entries.values():
+        by_folder.setdefault(e.folder, []).append(e)
+    specs, skipped, seen = [], [], set()
+    for entry in entries:
+        name = entry.weapon_names[0]
+        if name in seen:
+            continue
+        seen.add(name)
+        spec = spec_from_resource(index, entry, by_folder[entry.folder])
+        if spec is None:
+            skipped.append(entry.path)
+        else:
+            specs.append(spec)
+    return specs, skipped
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+def benchmark(specs: list, root: str, rounds: int) -> float:
+    """Weapons rendered per second (templates already compiled)"""
+    for spec in specs:
+        compile_class(spec.weapon_class, root)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for spec in specs:
+            render_resource(spec, root)
+    elapsed = time.perf_counter() - start
+    return len(specs) * rounds / elapsed if elapsed else float("inf")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Render weapon resources from declarative specs")
+    parser.add_argument("--root", default=BASE_PATH, help="Project root (templates are read from here)")
+    parser.add_argument("--specs", type=str, help="JSON spec file")
+    parser.add_argument("--from-roster", action="store_true", help="Derive specs from the existing weapon folders")
+    parser.add_argument("--weapon", type=str, help="Single weapon short name (e.g. G17)")
+    parser.add_argument("--class", dest="weapon_class", default="pistol", choices=list(WEAPON_CLASSES),
+                        help="Weapon class for --weapon")
+    parser.add_argument("--display", type=str, default="", help="Display name for --weapon")
+    parser.add_argument("--folder", type=str, default="", help="Resource folder for --weapon ('.' for in place)")
+    parser.add_argument("--files", type=str, help=f"Comma-separated subset of: {', '.join(OUTPUT_FILES)}")
+    parser.add_argument("--output", type=str, help=f"Output directory (default: <root>/{OUTPUT_DIR})")
+    parser.add_argument("--benchmark", type=int, metavar="ROUNDS", help="Time rendering instead of writing")
+    args = parser.parse_args()
+
+    specs, skipped = [], []
+    if args.specs:
+        specs.extend(load_specs(args.specs))
+    if args.from_roster:
+        roster, skipped = roster_specs(args.root)
+        specs.extend(roster)
+    if args.weapon:
+        short = args.weapon.upper()
+        short = short[len("WEAPON_"):] if short.startswith("WEAPON_") else short
+        specs.append(spec_from_dict({"name": f"WEAPON_{short}", "weapon_class": args.weapon_class,
+                                     "display": args.display, "folder": args.folder}))
+    if not specs:
+        parser.error("nothing to render: pass --specs, --from-roster or --weapon")
+
+    keys = None
+    if args.files:
+        keys = [k.strip() for k in args.files.split(",")]
+        unknown = [k for k in keys if k not in OUTPUT_FILES]
+        if unknown:
+            parser.error(f"unknown --files entries: {', '.join(unknown)}")
+
+    by_class = {}
+    for spec in specs:
+        by_class[spec.weapon_class] = by_class.get(spec.weapon_class, 0) + 1
+    print(f"Specs: {len(specs)} ({', '.join(f'{k} {v}' for k, v in sorted(by_class.items()))})")
+    for path in skipped:
+        print(f"  Skipped {path}: no generator class for its <Group>")
+
+    if args.benchmark:
+        rate = benchmark(specs, args.root, args.benchmark)
+        print(f"Rendered {len(specs) * args.benchmark} weapons: {rate:,.0f} weapons/s")
+        return
+
+    output = args.output or (os.getcwd() if args.weapon else os.path.join(args.root, OUTPUT_DIR))
+    start = time.perf_counter()
+    written = 0
+    for spec in specs:
+        written += len(write_resource(spec, output, args.root, keys))
+    elapsed = time.perf_counter() - start
+    print(f"Written {written} files for {len(specs)} weapons to {output} ({elapsed * 1000:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Persistent Weapon-Meta Index
+
+One on-disk index of every .meta file in the project:
+- Weapon folder, <Name> hash string and batch -> weapon meta path
+- File size, mtime and content hash per file
+
+Built once by walking the tree, then refreshed incrementally: only files
+whose size/mtime changed are re-read. All tuning scripts resolve weapon
+meta paths through it with dict lookups instead of their own glob rules.
+"""
+
+import os
+import re
+import json
+import hashlib
+from dataclasses import dataclass, field, asdict
+from typing import Optional
+
+BASE_PATH = "/home/user/project_pipes"
+
+INDEX_FILENAME = ".meta_index.json"
+INDEX_VERSION = 1
+
+# Matches the <Name> of each CWeaponInfo item (comments may sit in between).
+# Older templates still use the <n> shorthand fixed by the fix_* scripts.
+WEAPON_INFO_NAME_PATTERN = re.compile(
+    r'<Item type="CWeaponInfo">\s*(?:<!--.*?-->\s*)*<(?:Name|n)>([^<]+)</(?:Name|n)>', re.DOTALL)
+
+# Filename keywords for non-weapon meta kinds
+META_KINDS = ["components", "animations", "archetypes", "personality"]
+
+
+@dataclass
+class MetaEntry:
+    """One indexed .meta file (path relative to the index root)"""
+    path: str
+    batch: str
+    folder: str
+    kind: str
+    size: int
+    mtime_ns: int
+    sha1: str
+    weapon_names: list = field(default_factory=list)
+
+
+def classify_meta(file_name: str, weapon_names: list) -> str:
+    """Classify a meta file: weapons (has CWeaponInfo), components, animations, ..."""
+    if weapon_names:
+        return "weapons"
+    lower = file_name.lower()
+    for kind in META_KINDS:
+        if kind in lower:
+            return kind
+    return "other"
+
+
+def read_meta_entry(root: str, rel_path: str, stat: os.stat_result) -> MetaEntry:
+    """Read, hash and parse one meta file into an index entry"""
+    with open(os.path.join(root, rel_path), 'rb') as f:
+        data = f.read()
+
+    content = data.decode('utf-8', errors='replace')
+    weapon_names = WEAPON_INFO_NAME_PATTERN.findall(content)
+    parts = rel_path.split("/")
+
+    # <batch>/.../<folder>/meta/<file>.meta
+    folder = "/".join(parts[:-2]) if len(parts) >= 3 and parts[-2] == "meta" else "/".join(parts[:-1])
+
+    return MetaEntry(
+        path=rel_path,
+        batch=parts[0] if len(parts) > 1 else "",
+        folder=folder,
+        kind=classify_meta(parts[-1], weapon_names),
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        sha1=hashlib.sha1(data).hexdigest(),
+        weapon_names=[name.strip() for name in weapon_names],
+    )
+
+
+def walk_meta_files(root: str):
+    """Yield (rel_path, stat) for every .meta file under root (hidden dirs skipped)"""
+    for dir_path, dir_names, file_names in os.walk(root):
+        dir_names[:] = sorted(d for d in dir_names if not d.startswith('.'))
+        for file_name in sorted(file_names):
+            if not file_name.endswith('.meta'):
+                continue
+            full_path = os.path.join(dir_path, file_name)
+            rel_path = os.path.relpath(full_path, root).replace(os.sep, "/")
+            yield rel_path, os.stat(full_path)
+
+
+def weapon_meta_priority(entry: MetaEntry) -> tuple:
+    """Sort key choosing the canonical weapon meta when a folder/name has several"""
+    file_name = entry.path.rsplit("/", 1)[-1]
+    folder_name = entry.folder.rsplit("/", 1)[-1]
+    if file_name == f"{folder_name}.meta":
+        rank = 0
+    elif file_name == "weapons.meta":
+        rank = 1
+    else:
+        rank = 2
+    return (entry.path.count("/"), rank, entry.path)
+
+
+class MetaIndex:
+    """Weapon-meta index rooted at a project directory"""
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        self.index_path = os.path.join(self.root, INDEX_FILENAME)
+        self.entries: dict[str, MetaEntry] = {}
+        self.by_folder: dict[str, str] = {}
+        self.by_name: dict[str, str] = {}
+        self.by_batch: dict[str, list[str]] = {}
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+    def load(self) -> bool:
+        """Load the on-disk index. Returns False if missing or stale format."""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        if data.get("version") != INDEX_VERSION:
+            return False
+
+        self.entries = {e["path"]: MetaEntry(**e) for e in data.get("entries", [])}
+        return True
+
+    def save(self):
+        """Write the index next to the tree it describes"""
+        data = {
+            "version": INDEX_VERSION,
+            "entries": [asdict(self.entries[p]) for p in sorted(self.entries)],
+        }
+        with open(self.index_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=1)
+
+    def refresh(self) -> dict:
+        """
+        Bring the index up to date with the tree. Only files whose size or
+        mtime changed are re-read. Returns counts of added/changed/removed.
+        """
+        stats = {"added": 0, "changed": 0, "removed": 0}
+        seen = set()
+
+        for rel_path, stat in walk_meta_files(self.root):
+            seen.add(rel_path)
+            entry = self.entries.get(rel_path)
+            if entry and entry.size == stat.st_size and entry.mtime_ns == stat.st_mtime_ns:
+                continue
+            stats["changed" if entry else "added"] += 1
+            self.entries[rel_path] = read_meta_entry(self.root, rel_path, stat)
+
+        for rel_path in list(self.entries):
+            if rel_path not in seen:
+                del self.entries[rel_path]
+                stats["removed"] += 1
+
+        self._build_lookups()
+        return stats
+
+    def _build_lookups(self):
+        """Rebuild the O(1) lookup tables from the entries"""
+        self.by_folder = {}
+        self.by_name = {}
+        self.by_batch = {}
+
+        weapon_entries = sorted((e for e in self.entries.values() if e.kind == "weapons"),
+                                key=weapon_meta_priority)
+        for entry in weapon_entries:
+            self.by_folder.setdefault(entry.folder, entry.path)
+            for name in entry.weapon_names:
+                self.by_name.setdefault(name.upper(), entry.path)
+            self.by_batch.setdefault(entry.batch, []).append(entry.path)
+
+        for paths in self.by_batch.values():
+            paths.sort()
+
+    # -------------------------------------------------------------------------
+    # Lookups (all return absolute paths)
+    # -------------------------------------------------------------------------
+    def abspath(self, rel_path: str) -> str:
+        return os.path.join(self.root, *rel_path.split("/"))
+
+    def relpath(self, path: str) -> str:
+        return os.path.relpath(os.path.abspath(path), self.root).replace(os.sep, "/")
+
+    def find(self, batch_path: str, weapon_name: str) -> Optional[str]:
+        """Weapon meta for `weapon_name` (with or without weapon_ prefix) in a batch"""
+        batch_rel = self.relpath(batch_path)
+        for folder_name in (weapon_name, f"weapon_{weapon_name}"):
+            rel_path = self.by_folder.get(f"{batch_rel}/{folder_name}")
+            if rel_path:
+                return self.abspath(rel_path)
+        return None
+
+    def find_by_name(self, weapon_hash: str) -> Optional[str]:
+        """Weapon meta declaring <Name>weapon_hash</Name>"""
+        rel_path = self.by_name.get(weapon_hash.upper())
+        return self.abspath(rel_path) if rel_path else None
+
+    def batch_weapon_metas(self, batch_path: str) -> list:
+        """All weapon metas under a top-level batch directory (nested copies included)"""
+        return [self.abspath(p) for p in self.by_batch.get(self.relpath(batch_path), [])]
+
+    def entry(self, path: str) -> Optional[MetaEntry]:
+        return self.entries.get(self.relpath(path))
+
+
+_INDEXES: dict[str, MetaIndex] = {}
+
+
+def get_index(root: str = BASE_PATH) -> MetaIndex:
+    """Load (or build) and refresh the index for a root, once per process"""
+    root = os.path.abspath(root)
+    index = _INDEXES.get(root)
+    if index is None:
+        index = MetaIndex(root)
+        index.load()
+        stats = index.refresh()
+        if any(stats.values()) or not os.path.exists(index.index_path):
+            try:
+                index.save()
+            except OSError:
+                pass  # Read-only tree - the in-memory index is still valid
+        _INDEXES[root] = index
+    return index
+
+
+def find_weapon_meta(batch_path: str, weapon_name: str) -> Optional[str]:
+    """Resolve a weapon's meta file via the index rooted above its batch"""
+    batch_path = os.path.abspath(batch_path)
+    return get_index(os.path.dirname(batch_path)).find(batch_path, weapon_name)
+
+
+def find_batch_weapon_metas(batch_path: str) -> list:
+    """All weapon metas in a batch via the index rooted above it"""
+    batch_path = os.path.abspath(batch_path)
+    return get_index(os.path.dirname(batch_path)).batch_weapon_metas(batch_path)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build/refresh the weapon-meta index")
+    parser.add_argument("--root", default=BASE_PATH, help="Project root to index")
+    parser.add_argument("--rebuild", action="store_true", help="Discard the existing index first")
+    args = parser.parse_args()
+
+    index = MetaIndex(args.root)
+    if not args.rebuild:
+        index.load()
+    stats = index.refresh()
+    index.save()
+
+    print(f"Index: {index.index_path}")
+    print(f"  Meta files:     {len(index.entries)}")
+    print(f"  Weapon metas:   {sum(len(p) for p in index.by_batch.values())}")
+    print(f"  Weapon names:   {len(index.by_name)}")
+    print(f"  Added: {stats['added']} | Changed: {stats['changed']} | Removed: {stats['removed']}")
+
+
+if __name__ == "__main__":
+    main()
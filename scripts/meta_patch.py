@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Single-Pass Meta Patch Engine
+
+Shared by the tuning scripts to rewrite <Tag value="..."/> parameters:
+- One tokenizing pass collects every value span in the file
+- Edits are queued per tag with per-parameter format rules
+- All edits are applied in a single splice
+
+Replaces the old pattern of compiling one regex and rescanning the whole
+file for every parameter written.
+"""
+
+import re
+from typing import Callable, Optional, Union
+
+import meta_txn
+
+# =============================================================================
+# TOKENIZER
+# =============================================================================
+# Matches <Tag value="..."  - group 1 is the tag, group 2 the value text.
+# <DamageTime value=...> is its own tag, so <Damage> edits never touch it.
+VALUE_TAG_PATTERN = re.compile(r'<([A-Za-z_]\w*)\s+value="([^"]*)"')
+
+DEFAULT_FORMAT = ".6f"
+
+
+def format_value(param: str, value: Union[float, int, str],
+                 format_rules: Optional[dict] = None,
+                 default_format: str = DEFAULT_FORMAT) -> str:
+    """Format a value for a parameter using its rule (or the default)"""
+    if isinstance(value, str):
+        return value
+    fmt = (format_rules or {}).get(param, default_format)
+    return format(value, fmt)
+
+
+class MetaPatcher:
+    """Index of every <Tag value="..."/> span in a meta file, built in one pass"""
+
+    def __init__(self, content: str):
+        self.content = content
+        self.spans: dict[str, list[tuple[int, int]]] = {}
+        self._edits: dict[int, tuple[int, str]] = {}
+
+        for match in VALUE_TAG_PATTERN.finditer(content):
+            self.spans.setdefault(match.group(1), []).append(match.span(2))
+
+    def has(self, tag: str) -> bool:
+        """True if the tag appears with a value attribute"""
+        return tag in self.spans
+
+    def get(self, tag: str) -> Optional[str]:
+        """Raw value text of the first occurrence of a tag"""
+        spans = self.spans.get(tag)
+        if not spans:
+            return None
+        start, end = spans[0]
+        return self.content[start:end]
+
+    def get_float(self, tag: str) -> Optional[float]:
+        """First occurrence of a tag as a float (None if missing/non-numeric)"""
+        text = self.get(tag)
+        if text is None:
+            return None
+        try:
+            return float(text)
+        except ValueError:
+            return None
+
+    def set(self, tag: str, value: Union[float, int, str],
+            fmt: Optional[str] = None) -> int:
+        """Queue a new value for every occurrence of a tag. Returns span count."""
+        text = value if isinstance(value, str) else format(value, fmt or DEFAULT_FORMAT)
+        return self.transform(tag, lambda _old: text)
+
+    def transform(self, tag: str, func: Callable[[str], Optional[str]]) -> int:
+        """
+        Queue an edit computed from each occurrence's current value text.
+        func returns the new text, or None to leave that occurrence alone.
+        """
+        count = 0
+        for start, end in self.spans.get(tag, []):
+            new_text = func(self.content[start:end])
+            if new_text is None:
+                continue
+            self._edits[start] = (end, new_text)
+            count += 1
+        return count
+
+    def update(self, values: dict, format_rules: Optional[dict] = None,
+               default_format: str = DEFAULT_FORMAT) -> int:
+        """Queue edits for a dict of param -> value using per-parameter format rules"""
+        count = 0
+        for param, value in values.items():
+            count += self.set(param, format_value(param, value, format_rules, default_format))
+        return count
+
+    def apply(self) -> str:
+        """Splice all queued edits into the content in one pass"""
+        if not self._edits:
+            return self.content
+
+        parts = []
+        cursor = 0
+        for start in sorted(self._edits):
+            end, text = self._edits[start]
+            parts.append(self.content[cursor:start])
+            parts.append(text)
+            cursor = end
+        parts.append(self.content[cursor:])
+        return "".join(parts)
+
+
+def patch_content(content: str, values: dict, format_rules: Optional[dict] = None,
+                  default_format: str = DEFAULT_FORMAT) -> str:
+    """Apply a dict of param -> value to meta content in a single pass"""
+    patcher = MetaPatcher(content)
+    patcher.update(values, format_rules, default_format)
+    return patcher.apply()
+
+
+def patched_file_content(file_path: str, values: dict, format_rules: Optional[dict] = None,
+                         default_format: str = DEFAULT_FORMAT) -> Optional[str]:
+    """New content of a meta file with values applied, or None if nothing changes"""
+    content = meta_txn.read_text(file_path)
+    new_content = patch_content(content, values, format_rules, default_format)
+    return new_content if new_content != content else None
+
+
+def patch_meta_file(file_path: str, values: dict, format_rules: Optional[dict] = None,
+                    default_format: str = DEFAULT_FORMAT, dry_run: bool = False) -> bool:
+    """
+    Patch a meta file (staged into the active meta_txn transaction, else
+    replaced atomically). Returns True if the content changed (and was
+    written, unless dry_run).
+    """
+    new_content = patched_file_content(file_path, values, format_rules, default_format)
+
+    if new_content is None:
+        return False
+
+    if not dry_run:
+        meta_txn.write_text(file_path, new_content)
+    return True
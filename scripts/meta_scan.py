@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Single-Pass Meta Extractor
+
+Shared by the scripts that read values out of meta files:
+- One pass per lookup batch: every tag asked for in a batch goes into a
+  single compiled alternation (<(Damage|ClipSize|...) value="...") that
+  walks the file once, instead of one re.search per tag (N passes for N
+  tags). Compiled patterns are cached per tag set
+- <Tag value="..."/>, <Tag>text</Tag> / <Tag ref="..."/> and
+  <Item type="..."> boundaries each have their own lookup; the item tree
+  is only built on first access
+- Lookups are keyed by tag, for the whole file or one item (an item
+  covers its nested items, like searching the item's text)
+- Results are cached per view and decoding is lazy: raw strings are kept
+  and only the values a caller asks for are converted
+
+Use meta_patch.MetaPatcher to rewrite values; this module only reads.
+
+Usage:
+    python meta_scan.py --benchmark               # Per-tag regex vs single pass over all weapon metas
+    python meta_scan.py --dump path/to/weapon.meta
+"""
+
+import re
+import time
+from functools import lru_cache
+from typing import Iterable, Optional
+
+BASE_PATH = "/home/user/project_pipes"
+
+ITEM_PATTERN = re.compile(r'<(/?)Item(?: type="([^"]*)")?>')
+COMMENT_PATTERN = re.compile(r'<!--.*?-->', re.DOTALL)
+LEADING_COMMENT_PATTERN = re.compile(r'\s*(<!--.*?-->)', re.DOTALL)
+ANY_VALUE_PATTERN = re.compile(r'<(\w+) value="([^"]*)"')
+INT_PATTERN = re.compile(r'[-+]?\d+')
+
+
+def _alternation(tags: tuple) -> str:
+    # Longest first so a tag never shadows a longer one sharing its prefix
+    return "|".join(re.escape(tag) for tag in sorted(tags, key=len, reverse=True))
+
+
+@lru_cache(maxsize=256)
+def value_pattern(tags: tuple) -> re.Pattern:
+    """(tag, value) pattern for <Tag value="..."> of any of the tags"""
+    return re.compile(rf'<({_alternation(tags)}) value="([^"]*)"')
+
+
+@lru_cache(maxsize=256)
+def text_pattern(tags: tuple) -> re.Pattern:
+    """Pattern for <Tag>text</Tag>, <Tag ref="...">text</Tag> and <Tag ref="..." of any of the tags"""
+    names = _alternation(tags)
+    return re.compile(rf'<({names})(?: ref="[^"]*")?>([^<]*)</\1>|<({names}) ref="([^"]*)"')
+
+
+def convert(text: str):
+    """Typed value of attribute/element text: bool, int, float or the string itself"""
+    if text == "true":
+        return True
+    if text == "false":
+        return False
+    if INT_PATTERN.fullmatch(text):
+        return int(text)
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+class FieldView:
+    """Tag lookups over a span of a meta file (whole file or one item)"""
+
+    def __init__(self, content: str, start: int = 0, end: Optional[int] = None):
+        self.content = content
+        self.start = start
+        self.end = len(content) if end is None else end
+        self._values: dict = {}     # Tag -> raw value (None = looked up, absent)
+        self._texts: dict = {}
+
+    def _lookup(self, cache: dict, tags: Iterable, pattern_for, pick):
+        missing = tuple(dict.fromkeys(tag for tag in tags if tag not in cache))
+        if not missing:
+            return
+        found = {}
+        for match in pattern_for(missing).findall(self.content, self.start, self.end):
+            tag, value = pick(match)
+            if tag not in found:
+                found[tag] = value
+        for tag in missing:
+            cache[tag] = found.get(tag)
+
+    def _load_values(self, tags: Iterable):
+        self._lookup(self._values, tags, value_pattern, lambda m: m)
+
+    def _load_texts(self, tags: Iterable):
+        self._lookup(self._texts, tags, text_pattern, lambda m: (m[0], m[1]) if m[0] else (m[2], m[3]))
+
+    def raw(self, tag: str) -> Optional[str]:
+        """value="..." text of the first occurrence of a tag carrying one"""
+        self._load_values((tag,))
+        return self._values[tag]
+
+    def get(self, tag: str, default=None):
+        """First value="..." of a tag converted to bool/int/float (str if not numeric)"""
+        text = self.raw(tag)
+        return default if text is None else convert(text)
+
+    def get_float(self, tag: str) -> Optional[float]:
+        """First value="..." as a float (None if missing/non-numeric)"""
+        text = self.raw(tag)
+        try:
+            return float(text) if text is not None else None
+        except ValueError:
+            return None
+
+    def values(self, tags: dict) -> dict:
+        """{key: raw value} for a {key: tag} map in one pass, skipping missing/empty values"""
+        self._load_values(tags.values())
+        return {key: self._values[tag] for key, tag in tags.items() if self._values[tag]}
+
+    def text(self, tag: str) -> str:
+        """Stripped text of the first <Tag>text</Tag> or <Tag ref="..."/> ("" if none)"""
+        self._load_texts((tag,))
+        return (self._texts[tag] or "").strip()
+
+    def texts(self, tags: Iterable) -> dict:
+        """{tag: stripped text} for several tags in one pass ("" if none)"""
+        tags = list(tags)
+        self._load_texts(tags)
+        return {tag: (self._texts[tag] or "").strip() for tag in tags}
+
+    def comments(self) -> list:
+        """Every comment, delimiters included, in document order"""
+        return COMMENT_PATTERN.findall(self.content, self.start, self.end)
+
+    def first_comment(self) -> str:
+        match = COMMENT_PATTERN.search(self.content, self.start, self.end)
+        return match.group(0) if match else ""
+
+    @property
+    def leading_comment(self) -> str:
+        """Comment the view opens with, only whitespace before it ("" if none)"""
+        match = LEADING_COMMENT_PATTERN.match(self.content, self.start, self.end)
+        return match.group(1) if match else ""
+
+
+class ItemBlock(FieldView):
+    """Body of one <Item type="..."> ... </Item> block (nested items included)"""
+
+    def __init__(self, content: str, item_type: str, start: int, depth: int):
+        super().__init__(content, start, start)
+        self.type = item_type
+        self.depth = depth
+
+    @property
+    def name(self) -> str:
+        """<Name> (or legacy <n>) of the item"""
+        names = self.texts(("Name", "n"))
+        return names["Name"] or names["n"]
+
+
+class MetaScan(FieldView):
+    """Whole-file view that also knows the file's item tree"""
+
+    def __init__(self, content: str):
+        super().__init__(content)
+        self._items: Optional[list] = None
+
+    @property
+    def items(self) -> list:
+        """Every <Item type="..."> block, in document order (built on first access)"""
+        if self._items is None:
+            items, stack = [], []
+            for match in ITEM_PATTERN.finditer(self.content):
+                if match.group(1):
+                    item = stack.pop() if stack else None
+                    if item is not None:
+                        item.end = match.start()
+                    continue
+                item = None     # Untyped <Item>text</Item> entries only balance the stack
+                if match.group(2) is not None:
+                    item = ItemBlock(self.content, match.group(2), match.end(),
+                                     sum(1 for i in stack if i is not None))
+                    items.append(item)
+                stack.append(item)
+            for item in stack:
+                if item is not None:
+                    item.end = len(self.content)    # Unclosed items run to the end of the file
+            self._items = items
+        return self._items
+
+    def items_of(self, item_type: str) -> list:
+        return [item for item in self.items if item.type == item_type]
+
+    def item(self, item_type: str, name: Optional[str] = None) -> Optional[ItemBlock]:
+        """First item of a type (optionally with a given <Name>, case-insensitive)"""
+        for item in self.items:
+            if item.type == item_type and (name is None or item.name.upper() == name.upper()):
+                return item
+        return None
+
+
+def scan(content: str) -> MetaScan:
+    return MetaScan(content)
+
+
+def scan_file(path: str) -> MetaScan:
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return MetaScan(f.read())
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+# The tags fix_smgs_complete.extract_existing_values reads
+BENCHMARK_TAGS = [
+    "Damage", "ClipSize", "AccuracySpread", "RecoilAccuracyMax", "RecoilRecoveryRate",
+    "TimeBetweenShots", "WeaponRange", "Speed", "Force", "Penetration",
+    "DamageFallOffRangeMin", "DamageFallOffRangeMax", "DamageFallOffModifier",
+    "RecoilShakeAmplitude", "RecoilShakeFrequency", "ForceHitPed", "ForceHitVehicle",
+    "ForceHitFlyingHeli", "ArmorPenetration", "AimingTime", "BulletDirectionOffsetInDegrees",
+]
+
+
+def regex_values(content: str, tags: list) -> dict:
+    """The old way: one search per tag"""
+    values = {}
+    for tag in tags:
+        match = re.search(rf'<{tag} value="([^"]+)"', content)
+        if match:
+            values[tag] = match.group(1)
+    return values
+
+
+def main():
+    import argparse
+    import meta_index
+
+    parser = argparse.ArgumentParser(description="Single-pass meta extractor")
+    parser.add_argument("--root", default=BASE_PATH, help="Project root")
+    parser.add_argument("--benchmark", action="store_true", help="Compare against per-tag regex on every weapon meta")
+    parser.add_argument("--repeat", type=int, default=20, help="Passes over the tree per timing")
+    parser.add_argument("--dump", metavar="META", help="Print the items and values of one meta file")
+    args = parser.parse_args()
+
+    if args.dump:
+        result = scan_file(args.dump)
+        for item in result.items:
+            print(f"{'  ' * item.depth}{item.type} {item.name}")
+        tags = list(dict.fromkeys(tag for tag, _ in ANY_VALUE_PATTERN.findall(result.content)))
+        for tag, value in result.values({tag: tag for tag in tags}).items():
+            print(f"  {tag:<40} {value}")
+        return
+
+    if not args.benchmark:
+        parser.print_help()
+        return
+
+    index = meta_index.get_index(args.root)
+    contents = []
+    for rel_path in sorted(index.entries):
+        if index.entries[rel_path].kind == "weapons":
+            with open(index.abspath(rel_path), 'r', encoding='utf-8', errors='replace') as f:
+                contents.append(f.read())
+
+    print(f"Weapon metas: {len(contents)} x {args.repeat}")
+    for count in (5, 10, len(BENCHMARK_TAGS)):
+        tags = BENCHMARK_TAGS[:count]
+        subset = {tag: tag for tag in tags}
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            expected = [regex_values(c, tags) for c in contents]
+        regex_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            actual = [scan(c).values(subset) for c in contents]
+        scan_time = time.perf_counter() - start
+
+        print(f"  {count:>2} tags - per-tag regex: {regex_time:6.3f}s  single pass: {scan_time:6.3f}s  "
+              f"(x{regex_time / scan_time:.2f}, {'identical' if actual == expected else 'DIFFER'})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Journaled Multi-File Apply
+
+Transaction layer for the --apply paths of the tuning scripts. New file
+contents are staged in memory while a script runs; nothing touches the
+tree until commit, which:
+1. Writes a journal (.meta_txn/<id>.json) listing every target
+2. Writes each new content to a temp file next to its target and
+   hard-links the original to a backup
+3. Fsyncs each temp file and backup, then each directory they are in
+4. Marks the journal prepared, then renames every temp over its target
+5. Fsyncs each touched directory once, then drops backups and journal
+
+An exception before commit leaves the tree untouched. A crash during
+commit leaves a journal behind; --recover completes it (or rolls it back
+from the backups with --rollback), and new transactions refuse to start
+until it is resolved.
+
+Outside a transaction, write_text() still replaces files atomically
+(temp file + rename), just without the journal.
+
+Usage:
+    python meta_txn.py                    # List interrupted applies
+    python meta_txn.py --recover          # Complete them
+    python meta_txn.py --recover --rollback
+"""
+
+import os
+import json
+import time
+import shutil
+import hashlib
+from typing import Callable, Optional
+
+BASE_PATH = "/home/user/project_pipes"
+
+TXN_DIRNAME = ".meta_txn"
+JOURNAL_VERSION = 1
+TEMP_SUFFIX = ".txn-{id}.new"
+BACKUP_SUFFIX = ".txn-{id}.bak"
+
+# Journal states
+STAGING = "staging"        # Temps/backups being written - targets untouched
+PREPARED = "prepared"      # Temps flushed - renames may be partly done
+COMMITTED = "committed"    # Every rename done - only cleanup left
+
+
+def sha1_text(content: str) -> str:
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+def write_temp(path: str, content: str, like: Optional[str] = None):
+    """Write content to path (no fsync), copying like's permissions if it exists"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    if like and os.path.exists(like):
+        shutil.copymode(like, path)
+
+
+def fsync_path(path: str, directory: bool = False):
+    """fsync a file or directory (directories are skipped where unsupported)"""
+    if directory and os.name == "nt":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def flush_staged(paths: list):
+    """Make staged files durable: fsync each file, then each directory holding them once"""
+    for path in paths:
+        fsync_path(path)
+    for directory in sorted({os.path.dirname(path) for path in paths}):
+        fsync_path(directory, directory=True)
+
+
+def journal_dir(root: str) -> str:
+    return os.path.join(os.path.abspath(root), TXN_DIRNAME)
+
+
+def write_journal(path: str, data: dict):
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=1)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+    fsync_path(os.path.dirname(path), directory=True)
+
+
+def pending_journals(root: str) -> list:
+    """Journal paths of interrupted applies under a root, oldest first"""
+    directory = journal_dir(root)
+    if not os.path.isdir(directory):
+        return []
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(".json"))
+
+
+# =============================================================================
+# TRANSACTION
+# =============================================================================
+class MetaTransaction:
+    """Set of file writes that land together (or not at all)"""
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        pending = pending_journals(self.root)
+        if pending:
+            raise RuntimeError(f"Interrupted apply found ({os.path.basename(pending[0])}) - "
+                               f"run meta_txn.py --root {self.root} --recover first")
+        self.id = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        self.pid = os.getpid()
+        self.staged: dict[str, str] = {}       # Target path -> new content
+        self.hooks: list[Callable] = []
+        self.closed = False
+
+    def write(self, path: str, content: str):
+        """Stage new content for a file (last write to a path wins)"""
+        if os.getpid() != self.pid:
+            raise RuntimeError("Transaction writes must come from the process that opened it "
+                               "(return content from pool workers instead)")
+        if self.closed:
+            raise RuntimeError("Transaction already committed or discarded")
+        self.staged[os.path.abspath(path)] = content
+
+    def read(self, path: str) -> str:
+        """Current content of a file as this transaction will leave it"""
+        path = os.path.abspath(path)
+        if path in self.staged:
+            return self.staged[path]
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def after_commit(self, func: Callable):
+        """Run func once the commit has landed (e.g. build-graph records)"""
+        self.hooks.append(func)
+
+    def discard(self):
+        self.staged.clear()
+        self.hooks.clear()
+        self.closed = True
+
+    def commit(self) -> int:
+        """Land every staged write atomically; returns the number of files written"""
+        if self.closed:
+            raise RuntimeError("Transaction already committed or discarded")
+        self.closed = True
+        targets = sorted(self.staged)
+        if targets:
+            self._commit(targets)
+        for hook in self.hooks:
+            hook()
+        return len(targets)
+
+    def _commit(self, targets: list):
+        os.makedirs(journal_dir(self.root), exist_ok=True)
+        journal_path = os.path.join(journal_dir(self.root), f"{self.id}.json")
+        entries = [{
+            "target": target,
+            "temp": target + TEMP_SUFFIX.format(id=self.id),
+            "backup": target + BACKUP_SUFFIX.format(id=self.id) if os.path.exists(target) else None,
+            "sha1": sha1_text(self.staged[target]),
+        } for target in targets]
+        journal = {"version": JOURNAL_VERSION, "id": self.id, "state": STAGING, "entries": entries}
+        write_journal(journal_path, journal)
+
+        # Stage temps next to their targets and keep the originals reachable
+        for entry in entries:
+            write_temp(entry["temp"], self.staged[entry["target"]], like=entry["target"])
+            if entry["backup"]:
+                try:
+                    os.link(entry["target"], entry["backup"])
+                except OSError:
+                    shutil.copy2(entry["target"], entry["backup"])
+        flush_staged([e["temp"] for e in entries] + [e["backup"] for e in entries if e["backup"]])
+
+        journal["state"] = PREPARED
+        write_journal(journal_path, journal)
+        for entry in entries:
+            os.replace(entry["temp"], entry["target"])
+        for directory in sorted({os.path.dirname(t) for t in targets}):
+            fsync_path(directory, directory=True)
+
+        journal["state"] = COMMITTED
+        write_journal(journal_path, journal)
+        cleanup(journal_path, entries)
+
+
+def cleanup(journal_path: str, entries: list):
+    for entry in entries:
+        for key in ("temp", "backup"):
+            if entry.get(key) and os.path.exists(entry[key]):
+                os.remove(entry[key])
+    os.remove(journal_path)
+
+
+# =============================================================================
+# ACTIVE TRANSACTION
+# =============================================================================
+_ACTIVE: Optional[MetaTransaction] = None
+
+
+def begin(root: str) -> MetaTransaction:
+    """Open the process-wide transaction that write_text() stages into"""
+    global _ACTIVE
+    if _ACTIVE is not None and not _ACTIVE.closed:
+        raise RuntimeError("A transaction is already open")
+    _ACTIVE = MetaTransaction(root)
+    return _ACTIVE
+
+
+def commit() -> int:
+    """Commit and close the active transaction; returns files written"""
+    global _ACTIVE
+    txn, _ACTIVE = _ACTIVE, None
+    return txn.commit() if txn is not None else 0
+
+
+def active() -> Optional[MetaTransaction]:
+    return _ACTIVE if _ACTIVE is not None and not _ACTIVE.closed else None
+
+
+def read_text(path: str) -> str:
+    """File content as the active transaction will leave it (disk in pool workers)"""
+    txn = active()
+    if txn is not None and txn.pid == os.getpid():
+        return txn.read(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def write_text(path: str, content: str):
+    """Stage into the active transaction, or replace the file atomically right away"""
+    txn = active()
+    if txn is not None:
+        txn.write(path, content)
+        return
+    temp_path = path + TEMP_SUFFIX.format(id=os.getpid())
+    write_temp(temp_path, content, like=path)
+    os.replace(temp_path, path)
+
+
+def after_commit(func: Callable):
+    """Run func after the active transaction commits (immediately if none is open)"""
+    txn = active()
+    if txn is not None:
+        txn.after_commit(func)
+    else:
+        func()
+
+
+# =============================================================================
+# RECOVERY
+# =============================================================================
+def recover(root: str, rollback: bool = False) -> list:
+    """
+    Resolve every interrupted apply under root. Staging journals are always
+    rolled back (no target was touched); prepared ones are completed from
+    their temps, or restored from backups with rollback=True; committed
+    ones only need their temps/backups removed. Returns report lines.
+    """
+    report = []
+    for journal_path in pending_journals(root):
+        with open(journal_path, 'r', encoding='utf-8') as f:
+            journal = json.load(f)
+        entries = journal.get("entries", [])
+        state = journal.get("state")
+        name = os.path.basename(journal_path)
+
+        if state == PREPARED and not rollback:
+            missing = []
+            for entry in entries:
+                if os.path.exists(entry["temp"]):
+                    os.replace(entry["temp"], entry["target"])
+                with open(entry["target"], 'r', encoding='utf-8') as f:
+                    if sha1_text(f.read()) != entry["sha1"]:
+                        missing.append(entry["target"])
+            if missing:
+                report.append(f"{name}: cannot complete - {len(missing)} targets match neither "
+                              f"state (e.g. {missing[0]}); use --rollback")
+                continue
+            report.append(f"{name}: completed {len(entries)} files")
+        elif state == PREPARED:
+            for entry in entries:
+                if entry["backup"] and os.path.exists(entry["backup"]):
+                    os.replace(entry["backup"], entry["target"])
+                elif not entry["backup"] and not os.path.exists(entry["temp"]) \
+                        and os.path.exists(entry["target"]):
+                    os.remove(entry["target"])    # File the apply created
+            report.append(f"{name}: rolled back {len(entries)} files")
+        elif state == COMMITTED:
+            report.append(f"{name}: committed - leftovers cleaned up")
+        else:
+            report.append(f"{name}: {state} - targets untouched, cleaned up")
+
+        for directory in sorted({os.path.dirname(e["target"]) for e in entries}):
+            if os.path.isdir(directory):
+                fsync_path(directory, directory=True)
+        cleanup(journal_path, entries)
+    return report
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect and recover interrupted --apply runs")
+    parser.add_argument("--root", default=BASE_PATH, help="Project root")
+    parser.add_argument("--recover", action="store_true", help="Complete interrupted applies")
+    parser.add_argument("--rollback", action="store_true", help="With --recover: restore the originals instead")
+    args = parser.parse_args()
+
+    journals = pending_journals(args.root)
+    if not journals:
+        print(f"No interrupted applies under {args.root}")
+        return
+
+    if not args.recover:
+        for journal_path in journals:
+            with open(journal_path, 'r', encoding='utf-8') as f:
+                journal = json.load(f)
+            print(f"  {os.path.basename(journal_path)}: {journal.get('state')}, "
+                  f"{len(journal.get('entries', []))} files")
+        print("\nRun with --recover (or --recover --rollback)")
+        return
+
+    for line in recover(args.root, rollback=args.rollback):
+        print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main()
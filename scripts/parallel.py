@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Deterministic Process-Pool Executor
+
+Shared by the tuning scripts to spread per-file work (read, regex, write)
+across cores:
+- One process pool per run, reused across batches
+- A bounded number of tasks in flight, so at most that many files are
+  being read/written at once and results never pile up in memory
+- Results come back in submission order, so console output and reports
+  match a serial run line for line
+- workers=1 (or a single task) runs inline with no pool at all
+
+Worker functions must be module-level (picklable) and should return their
+report data rather than print it; the caller prints in order. On Linux the
+pool forks, so workers see the caller's already-loaded meta index and any
+constants it overrode.
+
+Usage:
+    python parallel.py --benchmark                # Scaling of a full-tree meta scan
+    python parallel.py --benchmark --repeat 20 --workers 1,2,4,8
+"""
+
+import os
+import time
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional
+
+BASE_PATH = "/home/user/project_pipes"
+
+DEFAULT_WORKERS = os.cpu_count() or 1
+IN_FLIGHT_PER_WORKER = 4    # Tasks queued per worker (bounds concurrent file I/O)
+
+
+def _run_chunk(func: Callable, chunk: list) -> list:
+    return [func(item) for item in chunk]
+
+
+class _StarCall:
+    """Picklable func(*args) adapter for starmap"""
+
+    def __init__(self, func: Callable):
+        self.func = func
+
+    def __call__(self, args: tuple):
+        return self.func(*args)
+
+
+class OrderedExecutor:
+    """Process pool returning results in submission order"""
+
+    def __init__(self, workers: Optional[int] = None, max_in_flight: Optional[int] = None,
+                 chunksize: int = 1):
+        self.workers = max(1, workers or DEFAULT_WORKERS)
+        self.max_in_flight = max(1, max_in_flight or self.workers * IN_FLIGHT_PER_WORKER)
+        self.chunksize = max(1, chunksize)
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("fork" if "fork" in methods else None)
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+        return self._pool
+
+    def imap(self, func: Callable, items: Iterable) -> Iterator:
+        """Yield func(item) for each item, in order"""
+        items = list(items)
+        if self.workers == 1 or len(items) < 2:
+            for item in items:
+                yield func(item)
+            return
+
+        pool = self._get_pool()
+        chunks = iter([items[i:i + self.chunksize] for i in range(0, len(items), self.chunksize)])
+        in_flight = max(1, self.max_in_flight // self.chunksize)
+        pending = deque(pool.submit(_run_chunk, func, chunk) for chunk in islice(chunks, in_flight))
+        while pending:
+            results = pending.popleft().result()
+            chunk = next(chunks, None)
+            if chunk is not None:
+                pending.append(pool.submit(_run_chunk, func, chunk))
+            yield from results
+
+    def map(self, func: Callable, items: Iterable) -> list:
+        """[func(item) for item in items], computed in the pool"""
+        return list(self.imap(func, items))
+
+    def starmap(self, func: Callable, arg_tuples: Iterable) -> list:
+        """[func(*args) for args in arg_tuples], computed in the pool"""
+        return self.map(_StarCall(func), arg_tuples)
+
+
+def add_workers_argument(parser):
+    """Standard --workers option for the tuning scripts"""
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Worker processes (default: {DEFAULT_WORKERS}; 1 = serial)")
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+def scan_meta(path: str) -> int:
+    """Read and tokenize one meta file (the per-file work every tuning script does)"""
+    from meta_patch import MetaPatcher
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return sum(len(spans) for spans in MetaPatcher(f.read()).spans.values())
+
+
+def main():
+    import argparse
+    import meta_index
+
+    parser = argparse.ArgumentParser(description="Benchmark the ordered process-pool executor")
+    parser.add_argument("--root", default=BASE_PATH, help="Project root")
+    parser.add_argument("--benchmark", action="store_true", help="Time a full-tree meta scan per worker count")
+    parser.add_argument("--workers", type=str, default="", help="Comma-separated worker counts")
+    parser.add_argument("--repeat", type=int, default=10, help="Scan the tree this many times per run")
+    parser.add_argument("--chunksize", type=int, default=4, help="Files per task")
+    args = parser.parse_args()
+
+    if not args.benchmark:
+        parser.print_help()
+        return
+
+    index = meta_index.get_index(args.root)
+    paths = [index.abspath(p) for p in sorted(index.entries)] * args.repeat
+    counts = [int(n) for n in args.workers.split(",") if n] or sorted({1, 2, 4, DEFAULT_WORKERS})
+
+    print(f"Files per run: {len(paths)} ({len(index.entries)} metas x {args.repeat})")
+    baseline, baseline_time = None, None
+    for workers in counts:
+        with OrderedExecutor(workers, chunksize=args.chunksize) as executor:
+            executor.map(scan_meta, paths[:workers * 2])    # Start the pool outside the timing
+            start = time.perf_counter()
+            results = executor.map(scan_meta, paths)
+            elapsed = time.perf_counter() - start
+        if baseline is None:
+            baseline, baseline_time = results, elapsed
+        status = "same results" if results == baseline else "RESULTS DIFFER"
+        print(f"  {workers:>3} workers: {elapsed:7.3f}s  {len(paths) / elapsed:8.0f} files/s  "
+              f"x{baseline_time / elapsed:5.2f}  ({status})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo Recoil & Spread Simulator
+
+Hit probability on a standard target versus distance and shot index, for
+every weapon and each fire mode it has:
+- AccuracySpread, RecoilAccuracyMax, RecoilRecoveryRate, RecoilErrorTime,
+  TimeBetweenShots and ClipSize from each weapon's meta (weapon snapshot)
+- Config.FireRates, Config.BurstDelay, Config.DefaultBurstCount and the
+  per-weapon modes/burstCount from free_selectivefire/shared/config.lua;
+  weapons not in that config fire their registry fire mode (semi if none)
+
+Shot model (a tuning aid, not the engine's exact recoil code):
+- Shot cadence per mode is max(TimeBetweenShots, FireRates[mode]); bursts
+  of burstCount shots are separated by max(TimeBetweenShots, BurstDelay).
+  SEMI strings are fired as fast as allowed unless --semi-interval paces
+  the trigger pulls
+- A recoil state r in [0, 1] starts at 0. Each shot leaves the barrel
+  inside a cone of half-angle AccuracySpread + r * RecoilAccuracyMax
+  (degrees), uniformly over its disc, then adds a random kick
+  (KICK_PER_SHOT +/- KICK_JITTER)
+- Between shots r recovers at RecoilRecoveryRate per second, once
+  RecoilErrorTime has passed since the shot
+- The shooter holds the aim on the centre of a TARGET_WIDTH x
+  TARGET_HEIGHT torso target; a shot hits if it lands inside it
+
+All trials of all weapon/mode rows step through the string together as
+NumPy arrays; rows are split across the process pool. Each row has its
+own seed (from --seed, weapon and mode), so results do not depend on the
+worker count or roster filter.
+
+Usage:
+    python recoil_sim.py                              # Summary at 25 m for the roster
+    python recoil_sim.py --weapon WEAPON_MICRO_MP5 --distance 15
+    python recoil_sim.py --trials 20000 --output recoil.npz
+
+Requires NumPy.
+"""
+
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+import lua_config
+import parallel
+import weapon_snapshot
+
+BASE_PATH = "/home/user/project_pipes"
+
+# =============================================================================
+# MODEL CONSTANTS
+# =============================================================================
+DISTANCES = (5.0, 10.0, 15.0, 25.0, 35.0, 50.0, 75.0, 100.0)    # m
+TARGET_WIDTH = 0.45       # Standard torso target (m), aimed at its centre
+TARGET_HEIGHT = 0.60
+
+DEFAULT_TRIALS = 4000
+DEFAULT_SHOTS = 30        # Longest string simulated (capped at ClipSize)
+
+KICK_PER_SHOT = 0.25      # Recoil state added per shot (4 shots to full bloom)
+KICK_JITTER = 0.5         # Kick drawn uniformly from KICK_PER_SHOT * (1 +/- KICK_JITTER)
+
+MODES = ("SEMI", "BURST", "FULL")
+# Registry fire_mode -> mode for weapons the selective-fire config does not list
+REGISTRY_MODES = {"auto": "FULL", "auto_fast": "FULL", "burst": "BURST"}
+
+STAT_COLUMNS = ["AccuracySpread", "RecoilAccuracyMax", "RecoilRecoveryRate", "RecoilErrorTime",
+                "TimeBetweenShots", "ClipSize"]
+
+
+@dataclass
+class SimRow:
+    """One weapon in one fire mode"""
+    weapon: str
+    mode: str
+    spread: float               # AccuracySpread (deg)
+    recoil_max: float           # RecoilAccuracyMax (deg at full recoil)
+    recovery_rate: float        # RecoilRecoveryRate (recoil state per s)
+    error_time: float           # RecoilErrorTime (s before recovery starts)
+    shots: int                  # String length (min of --shots and ClipSize)
+    gaps: np.ndarray            # Seconds from shot i to shot i+1
+
+
+# =============================================================================
+# ROSTER
+# =============================================================================
+def shot_gaps(mode: str, time_between_shots: float, fire: dict, burst_count: int, shots: int,
+              semi_interval: float = 0.0) -> np.ndarray:
+    """Time from each shot to the next in a string, per the fire-control rules"""
+    rates = fire["FireRates"]
+    interval = max(time_between_shots, rates[mode] / 1000.0)
+    if mode == "SEMI":
+        interval = max(interval, semi_interval)
+    gaps = np.full(max(shots - 1, 0), interval)
+    if mode == "BURST" and burst_count > 0:
+        pause = max(time_between_shots, fire["BurstDelay"] / 1000.0)
+        gaps[burst_count - 1::burst_count] = pause
+    return gaps
+
+
+def weapon_modes(name: str, fire_mode: Optional[str], weapons: dict, modified: bool) -> tuple:
+    """(modes, burst count) for a weapon from the selective-fire config (registry fire mode otherwise)"""
+    entry = weapons.get(name)
+    if entry is None:
+        return [REGISTRY_MODES.get(fire_mode or "", "SEMI")], None
+    modes = (modified and entry.get("modesWhenModified")) or entry.get("modes") or ["SEMI"]
+    return [m for m in MODES if m in modes], entry.get("burstCount")
+
+
+def build_rows(root: str, max_shots: int, names: Optional[list] = None, modes: Optional[list] = None,
+               modified: bool = False, semi_interval: float = 0.0) -> list:
+    """SimRow for every weapon x available mode (optionally filtered)"""
+    snapshot = weapon_snapshot.get_snapshot(root)
+    fire = lua_config.selectivefire_config(root)
+    weapons = fire.get("Weapons") or {}
+    wanted = {n.upper() for n in names} if names else None
+
+    rows = []
+    for i in np.argsort(snapshot["name"].astype(str), kind="stable"):
+        name = snapshot["name"][i]
+        if wanted and name.upper() not in wanted:
+            continue
+        stats = {c: float(snapshot[c][i]) for c in STAT_COLUMNS}
+        if any(np.isnan(v) for v in stats.values()):
+            continue
+        weapon_mode_list, burst_count = weapon_modes(name, snapshot["fire_mode"][i], weapons, modified)
+        burst_count = int(burst_count or fire["DefaultBurstCount"])
+        shots = max(1, min(max_shots, int(stats["ClipSize"])))
+        for mode in weapon_mode_list:
+            if modes and mode not in modes:
+                continue
+            rows.append(SimRow(
+                weapon=name, mode=mode,
+                spread=stats["AccuracySpread"],
+                recoil_max=stats["RecoilAccuracyMax"],
+                recovery_rate=stats["RecoilRecoveryRate"],
+                error_time=stats["RecoilErrorTime"],
+                shots=shots,
+                gaps=shot_gaps(mode, stats["TimeBetweenShots"], fire, burst_count, shots, semi_interval),
+            ))
+    return rows
+
+
+# =============================================================================
+# SIMULATION
+# =============================================================================
+def row_seed(seed: int, row: SimRow) -> list:
+    return [seed, zlib.crc32(f"{row.weapon}:{row.mode}".encode())]
+
+
+def simulate_rows(rows: list, trials: int, max_shots: int, distances: np.ndarray, seed: int) -> np.ndarray:
+    """
+    P(hit) for a chunk of rows, shape (rows, max_shots, distances); NaN past
+    each row's string length. All rows and trials advance shot by shot as
+    (rows, trials) arrays.
+    """
+    n = len(rows)
+    # Per-row random draws (kick, disc radius, disc angle), shot-major so a
+    # row's first shots see the same numbers whatever its string length
+    draws = np.zeros((max_shots, 3, n, trials))
+    for i, row in enumerate(rows):
+        draws[:row.shots, :, i] = np.random.default_rng(row_seed(seed, row)).random((row.shots, 3, trials))
+    kick = KICK_PER_SHOT * (1.0 + KICK_JITTER * (2.0 * draws[:, 0] - 1.0))
+    radius = np.sqrt(draws[:, 1])
+    angle = 2.0 * np.pi * draws[:, 2]
+
+    spread = np.array([r.spread for r in rows])[:, None]
+    recoil_max = np.array([r.recoil_max for r in rows])[:, None]
+    recovery = np.array([r.recovery_rate for r in rows])[:, None]
+    error_time = np.array([r.error_time for r in rows])[:, None]
+    lengths = np.array([r.shots for r in rows])
+    gaps = np.zeros((n, max_shots))
+    for i, row in enumerate(rows):
+        gaps[i, :len(row.gaps)] = row.gaps
+    recovered = recovery * np.maximum(gaps - error_time, 0.0)    # (rows, shots)
+
+    # Half-extent of the target as an angle at each distance (deg)
+    half_w = np.degrees(np.arctan(TARGET_WIDTH / 2 / distances))
+    half_h = np.degrees(np.arctan(TARGET_HEIGHT / 2 / distances))
+
+    p_hit = np.full((n, max_shots, len(distances)), np.nan)
+    state = np.zeros((n, trials))
+    for shot in range(max_shots):
+        cone = spread + state * recoil_max
+        x = np.abs(cone * radius[shot] * np.cos(angle[shot]))
+        y = np.abs(cone * radius[shot] * np.sin(angle[shot]))
+        hits = (x[..., None] <= half_w) & (y[..., None] <= half_h)    # (rows, trials, distances)
+        active = shot < lengths
+        p_hit[active, shot] = hits[active].mean(axis=1)
+        state = np.minimum(state + kick[shot], 1.0)
+        state = np.maximum(state - recovered[:, shot, None], 0.0)
+    return p_hit
+
+
+def _simulate_chunk(args: tuple) -> np.ndarray:
+    rows, trials, max_shots, distances, seed = args
+    return simulate_rows(rows, trials, max_shots, distances, seed)
+
+
+def simulate(rows: list, trials: int = DEFAULT_TRIALS, distances=DISTANCES, seed: int = 0,
+             workers: Optional[int] = None, chunk_rows: int = 8) -> np.ndarray:
+    """P(hit) for every row, shape (rows, longest string, distances)"""
+    distances = np.asarray(distances, dtype=float)
+    max_shots = max((r.shots for r in rows), default=0)
+    chunks = [(rows[i:i + chunk_rows], trials, max_shots, distances, seed)
+              for i in range(0, len(rows), chunk_rows)]
+    with parallel.OrderedExecutor(workers) as executor:
+        results = executor.map(_simulate_chunk, chunks)
+    if not results:
+        return np.zeros((0, max_shots, len(distances)))
+    return np.concatenate(results)
+
+
+# =============================================================================
+# OUTPUT
+# =============================================================================
+def expected_hits(p_hit: np.ndarray) -> np.ndarray:
+    """Expected hits over each row's full string, per distance"""
+    return np.nansum(p_hit, axis=1)
+
+
+def print_summary(rows: list, p_hit: np.ndarray, distances: np.ndarray, distance: float):
+    d = int(np.argmin(np.abs(distances - distance)))
+    picks = [1, 3, 5, 10]
+    print(f"\nP(hit) at {distances[d]:g} m on a {TARGET_WIDTH:g} x {TARGET_HEIGHT:g} m target")
+    print(f"  {'Weapon':<26} {'Mode':<6} {'Shots':>5} {'Cadence':>8}  "
+          + " ".join(f"{'#' + str(s):>6}" for s in picks) + f" {'Last':>6} {'Hits':>6}")
+    totals = expected_hits(p_hit)
+    for i, row in enumerate(rows):
+        cadence = row.gaps[0] if len(row.gaps) else 0.0
+        cells = [p_hit[i, s - 1, d] if s <= row.shots else np.nan for s in picks]
+        print(f"  {row.weapon:<26} {row.mode:<6} {row.shots:>5} {cadence:>7.3f}s  "
+              + " ".join("     -" if np.isnan(c) else f"{c:6.2f}" for c in cells)
+              + f" {p_hit[i, row.shots - 1, d]:6.2f} {totals[i, d]:6.1f}")
+
+
+def write_results(rows: list, p_hit: np.ndarray, distances: np.ndarray, path: str):
+    np.savez_compressed(
+        path,
+        weapon=np.array([r.weapon for r in rows]),
+        mode=np.array([r.mode for r in rows]),
+        shots=np.array([r.shots for r in rows], dtype=np.int16),
+        distances=distances.astype(np.float32),
+        p_hit=p_hit.astype(np.float32),
+    )
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Monte Carlo recoil/spread hit-probability simulator")
+    parser.add_argument("--root", default=BASE_PATH, help="Project root")
+    parser.add_argument("--weapon", type=str, help="Comma-separated weapon names (default: whole roster)")
+    parser.add_argument("--mode", type=str, help="Comma-separated fire modes (SEMI,BURST,FULL)")
+    parser.add_argument("--modified", action="store_true", help="Use modesWhenModified (switch/bump stock fitted)")
+    parser.add_argument("--semi-interval", type=float, default=0.0,
+                        help="Shooter's pace for SEMI trigger pulls in s (default: as fast as allowed)")
+    parser.add_argument("--trials", type=int, default=DEFAULT_TRIALS, help="Strings simulated per weapon/mode")
+    parser.add_argument("--shots", type=int, default=DEFAULT_SHOTS, help="Longest string (capped at ClipSize)")
+    parser.add_argument("--distances", type=str, help="Comma-separated distances in m")
+    parser.add_argument("--distance", type=float, default=25.0, help="Distance for the printed summary")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", type=str, help="Write p_hit curves to .npz")
+    parallel.add_workers_argument(parser)
+    args = parser.parse_args()
+
+    distances = np.array([float(d) for d in args.distances.split(",")] if args.distances else DISTANCES)
+    if args.distance not in distances:
+        distances = np.sort(np.append(distances, args.distance))
+    names = [n.strip() for n in args.weapon.split(",")] if args.weapon else None
+    modes = [m.strip().upper() for m in args.mode.split(",")] if args.mode else None
+
+    rows = build_rows(args.root, args.shots, names, modes, args.modified, args.semi_interval)
+    if not rows:
+        print("No weapons matched")
+        return
+
+    start = time.perf_counter()
+    p_hit = simulate(rows, args.trials, distances, args.seed, args.workers)
+    elapsed = time.perf_counter() - start
+
+    weapons = len({r.weapon for r in rows})
+    print(f"Recoil sim: {weapons} weapons, {len(rows)} weapon/mode rows, {args.trials:,} trials, "
+          f"{len(distances)} distances in {elapsed:.2f}s")
+
+    print_summary(rows, p_hit, distances, args.distance)
+
+    if args.output:
+        write_results(rows, p_hit, distances, args.output)
+        print(f"\nWritten: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
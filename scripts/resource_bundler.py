@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Weapon Resource Bundler
+
+Merges the per-weapon FiveM resources (batch*/weapon_*/) into a few packed
+resources, so server start and client join stop scaling with weapon count:
+- One merged meta per data_file type (components, archetypes, animations,
+  weapon info, ped personality), declared components-before-weapons
+- One fxmanifest.lua and one cl_weaponNames.lua per bundle
+- Stream assets copied under stream/<weapon resource>/
+
+Metas that don't parse as XML (the game is more forgiving) are shipped
+unchanged inside the bundle and declared with their original type.
+Duplicate entries keep the first resource's version and are reported.
+
+Usage:
+    python resource_bundler.py                     # One bundle for every weapon
+    python resource_bundler.py --group batch       # One bundle per batch folder
+    python resource_bundler.py --dry-run
+"""
+
+import os
+import re
+import copy
+import shutil
+import textwrap
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+
+BASE_PATH = "/home/user/project_pipes"
+OUTPUT_DIR = "bundles"
+BUNDLE_PREFIX = "weapons_bundle"
+
+# Resources and folders that are not addon weapons
+SKIP_DIRS = {"free-bullets", "free_selectivefire", "weapon_meta_package", "scripts", "docs", OUTPUT_DIR}
+
+# data_file declaration order in the bundle manifest (components before weapons)
+LOAD_ORDER = [
+    "WEAPONCOMPONENTSINFO_FILE",
+    "WEAPON_COMPONENTS_FILE",
+    "WEAPON_METADATA_FILE",
+    "WEAPON_ANIMATIONS_FILE",
+    "WEAPONINFO_FILE",
+    "PED_PERSONALITY_FILE",
+]
+
+# How each type merges: {tag: LIST | KEYED(subspec) | {sub tag: ...}}
+LIST = "list"
+
+
+@dataclass
+class Keyed:
+    """Items matched by their key="" attribute, then merged by subspec"""
+    spec: dict
+
+
+MERGE_SPECS = {
+    "WEAPONCOMPONENTSINFO_FILE": {"Infos": LIST},
+    "WEAPON_METADATA_FILE": {"InitDatas": LIST},
+    "WEAPON_ANIMATIONS_FILE": {"WeaponAnimationsSets": Keyed({"WeaponAnimations": LIST})},
+    "WEAPONINFO_FILE": {
+        "SlotNavigateOrder": {"Item": {"WeaponSlots": LIST}},
+        "SlotBestOrder": {"WeaponSlots": LIST},
+        "Infos": {"Item": {"Infos": LIST}},
+    },
+    "PED_PERSONALITY_FILE": {"PersonalityData": LIST},
+}
+
+MERGED_NAMES = {
+    "WEAPONCOMPONENTSINFO_FILE": "weaponcomponents",
+    "WEAPON_METADATA_FILE": "weaponarchetypes",
+    "WEAPON_ANIMATIONS_FILE": "weaponanimations",
+    "WEAPONINFO_FILE": "weapons",
+    "PED_PERSONALITY_FILE": "pedpersonality",
+}
+
+DATA_FILE_PATTERN = re.compile(r'''^\s*data_file\s+['"]([^'"]+)['"]\s+['"]([^'"]+)['"]''', re.MULTILINE)
+TEXT_ENTRY_PATTERN = re.compile(r'''AddTextEntry\(\s*(['"])(.+?)\1\s*,\s*(['"])(.*?)\3\s*\)''')
+
+MANIFEST_TEMPLATE = """fx_version 'cerulean'
+game 'gta5'
+
+author 'Weapon Meta Development Project'
+description '{description}'
+version '1.0.0'
+
+--[[
+    GENERATED by scripts/resource_bundler.py - DO NOT EDIT
+    Bundled resources ({resource_count}):
+{resource_names}
+]]
+
+client_script 'cl_weaponNames.lua'
+
+files {{
+{files}
+    'stream/**',
+}}
+
+--[[
+    DATA FILE LOAD ORDER (CRITICAL!)
+    Components must load BEFORE weapons.meta
+]]
+
+{data_files}
+"""
+
+
+# =============================================================================
+# DISCOVERY
+# =============================================================================
+@dataclass
+class WeaponResource:
+    """One per-weapon resource folder"""
+    name: str
+    path: str
+    batch: str
+    data_files: list = field(default_factory=list)   # [(type, rel_path)]
+
+
+def find_resources(root: str) -> tuple:
+    """All weapon resources (shallowest copy of each folder name wins) and skipped duplicates"""
+    found = {}
+    duplicates = []
+    for dir_path, dir_names, file_names in os.walk(root):
+        dir_names[:] = sorted(d for d in dir_names if not d.startswith('.') and d not in SKIP_DIRS)
+        if "fxmanifest.lua" not in file_names or dir_path == root:
+            continue
+        dir_names[:] = []
+
+        with open(os.path.join(dir_path, "fxmanifest.lua"), 'r', encoding='utf-8') as f:
+            data_files = DATA_FILE_PATTERN.findall(f.read())
+        if not any(kind == "WEAPONINFO_FILE" for kind, _ in data_files):
+            continue
+
+        name = os.path.basename(dir_path)
+        rel = os.path.relpath(dir_path, root).replace(os.sep, "/")
+        resource = WeaponResource(name, dir_path, rel.split("/")[0], data_files)
+        if name in found:
+            keep = min(found[name], resource, key=lambda r: (r.path.count(os.sep), r.path))
+            duplicates.append((resource if keep is found[name] else found[name]).path)
+            found[name] = keep
+        else:
+            found[name] = resource
+
+    return sorted(found.values(), key=lambda r: (batch_sort_key(r.batch), r.name)), duplicates
+
+
+def batch_sort_key(batch: str) -> tuple:
+    """batch1 < batch2 < ... < batch20 (folders named Batch1_/batch_ alike)"""
+    match = re.search(r'(\d+)', batch)
+    return (int(match.group(1)) if match else 999, batch.lower())
+
+
+# =============================================================================
+# META MERGING
+# =============================================================================
+def item_identity(item: ET.Element) -> str:
+    for tag in ("Name", "modelName", "Entry"):
+        value = item.findtext(tag)
+        if value:
+            return f"{tag}:{value.strip().upper()}"
+    if item.get("key"):
+        return f"key:{item.get('key')}"
+    return ET.tostring(item, encoding="unicode")
+
+
+def merge_element(base: ET.Element, other: ET.Element, spec, source: str, report: dict):
+    """Merge other's list items into base following spec"""
+    if spec == LIST:
+        seen = {item_identity(item): item for item in base}
+        for item in other:
+            identity = item_identity(item)
+            if identity in seen:
+                if ET.tostring(seen[identity]) != ET.tostring(item):
+                    report["conflicts"].append(f"{identity} ({source})")
+                continue
+            seen[identity] = item
+            base.append(copy.deepcopy(item))
+        return
+
+    if isinstance(spec, Keyed):
+        for item in other:
+            match = next((b for b in base if b.get("key") == item.get("key")), None)
+            if match is None:
+                base.append(copy.deepcopy(item))
+            else:
+                merge_element(match, item, spec.spec, source, report)
+        return
+
+    for tag, sub_spec in spec.items():
+        target = base.find(tag)
+        for child in other.findall(tag):
+            if target is None:
+                base.append(copy.deepcopy(child))
+                target = base.find(tag)
+            else:
+                merge_element(target, child, sub_spec, source, report)
+
+
+class BundleBuilder:
+    """Accumulates resources into one bundle"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.resources = []
+        self.merged = {}         # (type, root tag) -> root element
+        self.passthrough = []    # (type, source path, resource name)
+        self.text_entries = {}
+        self.stream = []         # (source path, bundle-relative path)
+        self.report = {"conflicts": [], "unparsed": [], "text_conflicts": [], "missing": []}
+
+    def add(self, resource: WeaponResource):
+        self.resources.append(resource)
+        for kind, rel_path in resource.data_files:
+            path = os.path.join(resource.path, rel_path)
+            if not os.path.exists(path):
+                self.report["missing"].append(path)
+                continue
+            if kind not in MERGE_SPECS:
+                self.passthrough.append((kind, path, resource.name))
+                continue
+            try:
+                root = ET.parse(path).getroot()
+            except ET.ParseError as e:
+                self.report["unparsed"].append(f"{path} ({e})")
+                self.passthrough.append((kind, path, resource.name))
+                continue
+
+            key = (kind, root.tag)
+            if key not in self.merged:
+                self.merged[key] = copy.deepcopy(root)
+            else:
+                merge_element(self.merged[key], root, MERGE_SPECS[kind], resource.name, self.report)
+
+        self.add_text_entries(resource)
+        self.add_stream(resource)
+
+    def add_text_entries(self, resource: WeaponResource):
+        path = os.path.join(resource.path, "cl_weaponNames.lua")
+        if not os.path.exists(path):
+            return
+        with open(path, 'r', encoding='utf-8') as f:
+            for match in TEXT_ENTRY_PATTERN.finditer(f.read()):
+                key, label = match.group(2), match.group(4)
+                existing = self.text_entries.get(key)
+                if existing is None:
+                    self.text_entries[key] = label
+                elif existing != label:
+                    self.report["text_conflicts"].append(f"{key}: '{existing}' kept, '{label}' ({resource.name})")
+
+    def add_stream(self, resource: WeaponResource):
+        stream_dir = os.path.join(resource.path, "stream")
+        for dir_path, _, file_names in os.walk(stream_dir):
+            for file_name in sorted(file_names):
+                if file_name.startswith('.'):
+                    continue
+                source = os.path.join(dir_path, file_name)
+                rel = os.path.relpath(source, stream_dir)
+                self.stream.append((source, os.path.join("stream", resource.name, rel)))
+
+    # -------------------------------------------------------------------------
+    # Output
+    # -------------------------------------------------------------------------
+    def meta_files(self) -> list:
+        """[(type, bundle-relative path, element or source path)] in load order"""
+        files = []
+        counts = {}
+        for (kind, _), root in self.merged.items():
+            counts[kind] = counts.get(kind, 0) + 1
+            suffix = "" if counts[kind] == 1 else f"_{counts[kind]}"
+            files.append((kind, f"meta/{MERGED_NAMES[kind]}{suffix}.meta", root))
+        for kind, path, resource_name in self.passthrough:
+            files.append((kind, f"meta/{resource_name}/{os.path.basename(path)}", path))
+
+        weapon_rank = LOAD_ORDER.index("WEAPONINFO_FILE")
+        return sorted(files, key=lambda f: LOAD_ORDER.index(f[0]) if f[0] in LOAD_ORDER else weapon_rank - 0.5)
+
+    def write(self, output_dir: str):
+        bundle_dir = os.path.join(output_dir, self.name)
+        if os.path.isdir(bundle_dir):
+            shutil.rmtree(bundle_dir)
+        os.makedirs(os.path.join(bundle_dir, "meta"))
+
+        files = self.meta_files()
+        for kind, rel_path, content in files:
+            target = os.path.join(bundle_dir, rel_path)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            if isinstance(content, ET.Element):
+                tree = ET.ElementTree(content)
+                ET.indent(tree, space="  ")
+                tree.write(target, encoding="UTF-8", xml_declaration=True)
+            else:
+                shutil.copyfile(content, target)
+
+        for source, rel_path in self.stream:
+            target = os.path.join(bundle_dir, rel_path)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copy2(source, target)
+
+        manifest = MANIFEST_TEMPLATE.format(
+            description=f"{len(self.resources)} bundled addon weapons",
+            resource_count=len(self.resources),
+            resource_names=textwrap.fill(", ".join(r.name for r in self.resources), width=80,
+                                         initial_indent="        ", subsequent_indent="        "),
+            files="\n".join(f"    '{rel_path}'," for _, rel_path, _ in files),
+            data_files="\n".join(f"data_file '{kind}' '{rel_path}'" for kind, rel_path, _ in files),
+        )
+        with open(os.path.join(bundle_dir, "fxmanifest.lua"), 'w', encoding='utf-8', newline='\n') as f:
+            f.write(manifest)
+
+        with open(os.path.join(bundle_dir, "cl_weaponNames.lua"), 'w', encoding='utf-8', newline='\n') as f:
+            f.write("-- GENERATED by scripts/resource_bundler.py - DO NOT EDIT\n\n")
+            f.write("local TextEntries = {\n")
+            for key, label in self.text_entries.items():
+                f.write(f"    {{ {lua_string(key)}, {lua_string(label)} }},\n")
+            f.write("}\n\n")
+            f.write("for _, entry in ipairs(TextEntries) do\n")
+            f.write("    AddTextEntry(entry[1], entry[2])\n")
+            f.write("end\n")
+
+
+def lua_string(text: str) -> str:
+    return '"' + text.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+def plan_bundles(resources: list, group: str) -> dict:
+    """{bundle name: [resources]}"""
+    if group == "all":
+        return {BUNDLE_PREFIX: resources}
+    bundles = {}
+    for resource in resources:
+        slug = re.sub(r'[^a-z0-9]+', '_', resource.batch.lower()).strip('_')
+        bundles.setdefault(f"{BUNDLE_PREFIX}_{slug}", []).append(resource)
+    return bundles
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Bundle per-weapon resources into packed resources")
+    parser.add_argument("--root", default=BASE_PATH, help="Project root")
+    parser.add_argument("--output", type=str, help=f"Output folder (default: <root>/{OUTPUT_DIR})")
+    parser.add_argument("--group", choices=["all", "batch"], default="all", help="Bundle grouping")
+    parser.add_argument("--dry-run", action="store_true", help="Plan and report without writing")
+    args = parser.parse_args()
+
+    output_dir = args.output or os.path.join(args.root, OUTPUT_DIR)
+    resources, duplicates = find_resources(args.root)
+    bundles = plan_bundles(resources, args.group)
+
+    print(f"Weapon resources: {len(resources)} -> {len(bundles)} bundle(s)")
+    for path in duplicates:
+        print(f"  Skipped duplicate resource: {os.path.relpath(path, args.root)}")
+
+    for name, members in bundles.items():
+        builder = BundleBuilder(name)
+        for resource in members:
+            builder.add(resource)
+
+        files = builder.meta_files()
+        print(f"\n{name}: {len(members)} resources, {len(files)} data files, "
+              f"{len(builder.text_entries)} text entries, {len(builder.stream)} stream files")
+        for label, key in [("Unparsed metas shipped as-is", "unparsed"),
+                           ("Duplicate entries (first kept)", "conflicts"),
+                           ("Text entry conflicts", "text_conflicts"),
+                           ("Missing data files", "missing")]:
+            if builder.report[key]:
+                print(f"  {label}: {len(builder.report[key])}")
+                for line in builder.report[key]:
+                    print(f"    {line}")
+
+        if not args.dry_run:
+            builder.write(output_dir)
+            print(f"  Written: {os.path.join(output_dir, name)}")
+
+    if not args.dry_run:
+        print("\nserver.cfg (replace the individual weapon ensures):")
+        for name in bundles:
+            print(f"  ensure {name}")
+
+
+if __name__ == "__main__":
+    main()
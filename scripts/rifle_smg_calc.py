@@ -18,10 +18,16 @@ Uses same aggressive tuning philosophy as handgun weapon_calc.py:
 """
 
 import os
-import re
+from functools import partial
 from dataclasses import dataclass
 from typing import Optional
-import glob
+
+import build_graph
+import meta_index
+import meta_txn
+import parallel
+import weapon_registry
+from meta_patch import patched_file_content, format_value
 
 BASE_PATH = "/home/user/project_pipes"
 
@@ -54,6 +60,17 @@ VALUE_CEILINGS = {
     "RecoilAccuracyMax": 6.00,      # Maximum accuracy loss
 }
 
+# =============================================================================
+# META OUTPUT FORMATS - Decimal places written per parameter
+# =============================================================================
+META_FORMATS = {
+    "TimeBetweenShots": ".3f",
+    "IkRecoilDisplacement": ".3f",
+    "DamageFallOffModifier": ".2f",
+    "Penetration": ".2f",
+}
+META_DEFAULT_FORMAT = ".2f"
+
 # =============================================================================
 # REAL-WORLD CALIBER DATA
 # =============================================================================
@@ -249,86 +266,16 @@ class RifleSMGSpec:
 
 
 # =============================================================================
-# BATCH 12 - 5.56x45mm NATO Assault Rifles
-# =============================================================================
-BATCH12_RIFLES = [
-    RifleSMGSpec("cz_bren", "CZ Bren 2", "5.56x45", 14.0, 5.86, "quality", "auto", 850,
-                 "Czech modular rifle, competition-tuned gas piston, lowest recoil"),
-    RifleSMGSpec("desert_ar15", "Desert AR-15", "5.56x45", 16.0, 6.5, "standard", "semi", 0,
-                 "Standard AR-15 pattern, semi-auto civilian"),
-    RifleSMGSpec("m16", "M16A4", "5.56x45", 20.0, 7.5, "quality", "burst", 800,
-                 "Benchmark military rifle, longest barrel, best accuracy"),
-    RifleSMGSpec("psa_ar15", "PSA AR-15", "5.56x45", 16.0, 6.7, "budget", "semi", 0,
-                 "Budget AR-15, functional but basic"),
-    RifleSMGSpec("ram7knight", "RAM-7 Knight", "5.56x45", 14.5, 6.8, "quality", "auto", 800,
-                 "Compact bullpup, good ergonomics"),
-    RifleSMGSpec("red_aug", "Steyr AUG", "5.56x45", 16.0, 7.9, "quality", "auto", 680,
-                 "Austrian bullpup, integrated optic, reliable"),
-]
-
-# =============================================================================
-# BATCH 13 - 7.62x39mm AK Variants
-# =============================================================================
-BATCH13_RIFLES = [
-    RifleSMGSpec("mini_ak47", "Mini AK-47", "7.62x39", 10.5, 5.5, "standard", "auto", 600,
-                 "Compact AK pistol, difficult control, loud"),
-    RifleSMGSpec("mk47", "MK47 Mutant", "7.62x39", 16.1, 7.0, "match", "semi", 0,
-                 "AR-15 ergonomics + AK caliber, best 7.62x39 accuracy"),
-]
-
-# =============================================================================
-# BATCH 14 - .308/6.8mm Battle Rifles
-# =============================================================================
-BATCH14_RIFLES = [
-    RifleSMGSpec("m7", "M7", "7.62x51", 16.0, 8.5, "quality", "semi", 0,
-                 "Modern .308 battle rifle"),
-    RifleSMGSpec("mcx300", "SIG MCX .300", "300_blk", 9.0, 6.8, "quality", "auto", 700,
-                 ".300 Blackout PDW, optimized for suppressed use"),
-    RifleSMGSpec("sig_spear", "SIG MCX Spear", "6.8x51", 16.0, 9.2, "match", "semi", 0,
-                 "NGSW winner, highest damage rifle, 80,000 PSI chamber"),
-]
-
-# =============================================================================
-# BATCH 15 - 9mm SMGs
+# WEAPON DEFINITIONS (weapon_registry.json)
 # =============================================================================
-BATCH15_SMGS = [
-    RifleSMGSpec("micro_mp5", "Micro MP5", "9mm_smg", 4.5, 4.4, "quality", "auto", 800,
-                 "HK quality, compact, reliable"),
-    RifleSMGSpec("mpa30", "MPA30", "9mm_smg", 6.0, 5.5, "standard", "auto", 750,
-                 "Masterpiece Arms, MAC clone improved"),
-    RifleSMGSpec("ram9_desert", "RAM-9 Desert", "9mm_smg", 8.0, 5.8, "quality", "auto", 800,
-                 "Modern 9mm carbine, good ergonomics"),
-    RifleSMGSpec("scorpion", "CZ Scorpion", "9mm_smg", 7.7, 5.0, "quality", "auto", 850,
-                 "Czech PDW, excellent trigger, low recoil"),
-    RifleSMGSpec("sig_mpx", "SIG MPX", "9mm_smg", 4.5, 5.0, "match", "auto", 850,
-                 "Gas-piston 9mm, smoothest recoil, suppressor-ready"),
-    RifleSMGSpec("sub2000", "SUB-2000", "9mm_smg", 16.0, 4.0, "standard", "semi", 0,
-                 "Folding carbine, Glock mag compatible, long barrel"),
-    RifleSMGSpec("tec9", "TEC-9", "9mm_smg", 5.0, 3.1, "budget", "semi", 0,
-                 "Budget machine pistol, worst accuracy, unreliable"),
-]
-
-# =============================================================================
-# BATCH 16 - .45 ACP SMGs
-# =============================================================================
-BATCH16_SMGS = [
-    RifleSMGSpec("mac10", "MAC-10", "45_acp_smg", 5.75, 6.26, "standard", "auto_fast", 1090,
-                 "Classic machine pistol, extreme fire rate, uncontrollable"),
-    RifleSMGSpec("mac4a1", "MAC-4A1", "45_acp_smg", 5.0, 5.8, "standard", "auto_fast", 1000,
-                 "Compact MAC variant, similar characteristics"),
-]
-
-# =============================================================================
-# BATCH 17 - PDWs/Short Barrel Rifles
-# =============================================================================
-BATCH17_PDWS = [
-    RifleSMGSpec("arp_bumpstock", "ARP Bumpstock", "9mm_smg", 6.0, 5.2, "budget", "auto", 900,
-                 "Budget PDW, high rate of fire"),
-    RifleSMGSpec("mk18", "MK18", "5.56x45", 10.3, 6.0, "quality", "auto", 700,
-                 "Navy SEAL CQB rifle, short barrel 5.56, loud"),
-    RifleSMGSpec("sbr9", "SBR9", "9mm_smg", 5.5, 4.8, "standard", "auto", 850,
-                 "9mm SBR, compact package"),
-]
+def registry_specs(batch: Optional[int] = None) -> list:
+    """RifleSMGSpecs for the registry's long-gun-calculator weapons, in batch order"""
+    registry = weapon_registry.load()
+    return [
+        RifleSMGSpec(e.key, e.display, e.handling_caliber, e.barrel_in, e.weight_lbs,
+                     e.tier, e.fire_mode, e.rpm, e.notes)
+        for e in registry.select(batch=batch, calculator="long_gun")
+    ]
 
 
 def calculate_weapon_stats(spec: RifleSMGSpec) -> dict:
@@ -466,76 +413,107 @@ def calculate_weapon_stats(spec: RifleSMGSpec) -> dict:
     }
 
 
-def find_weapon_meta(batch_path: str, weapon_name: str) -> Optional[str]:
-    """Find the weapon meta file"""
-    path1 = os.path.join(batch_path, f"weapon_{weapon_name}", "meta", f"weapon_{weapon_name}.meta")
-    if os.path.exists(path1):
-        return path1
+# =============================================================================
+# BUILD GRAPH INPUTS (build_graph.py)
+# =============================================================================
+BUILD_TOOL = "rifle_smg_calc"
 
-    path2 = os.path.join(batch_path, f"weapon_{weapon_name}", "meta", "weapons.meta")
-    if os.path.exists(path2):
-        return path2
+# Scalar constants every weapon's calculation reads
+SHARED_CONSTANTS = [
+    "PERCEPTION_MULTIPLIER", "SHAKE_OFFSET_BASE", "SHAKE_TIER_SCALE",
+    "FLIP_OFFSET_BASE", "FLIP_TIER_SCALE", "FLIP_GLOBAL_MULTIPLIER",
+]
 
-    pattern = os.path.join(batch_path, f"weapon_{weapon_name}", "meta", "*.meta")
-    matches = glob.glob(pattern)
-    for m in matches:
-        if "weapon" in os.path.basename(m).lower():
-            return m
 
-    return None
+def build_inputs(spec: RifleSMGSpec) -> dict:
+    """Hashed inputs of a weapon's values: spec row, the constants it reads, formula version"""
+    constants = {
+        "shared": {name: globals()[name] for name in SHARED_CONSTANTS},
+        "floors": VALUE_FLOORS,
+        "ceilings": VALUE_CEILINGS,
+        "caliber": CALIBER_DATA.get(spec.caliber),
+        "quality": QUALITY_TIERS.get(spec.quality, QUALITY_TIERS["standard"]),
+        "fire_mode": FIRE_MODES.get(spec.fire_mode, FIRE_MODES["semi"]),
+    }
+    return {
+        "spec": build_graph.digest([spec.caliber, spec.barrel_inches, spec.weight_lbs,
+                                    spec.quality, spec.fire_mode, spec.rpm]),
+        "constants": build_graph.digest(constants),
+        "template": build_graph.digest([
+            build_graph.source_digest(calculate_weapon_stats, calculate_barrel_modifier, clamp),
+            META_FORMATS, META_DEFAULT_FORMAT,
+        ]),
+    }
 
 
-def update_weapon_meta(file_path: str, values: dict) -> bool:
-    """Update weapon meta file with new values"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        original = content
-
-        for param, value in values.items():
-            if isinstance(value, float):
-                if param == "TimeBetweenShots":
-                    pattern = rf'(<{param} value=")[^"]*(")'
-                    replacement = rf'\g<1>{value:.3f}\2'
-                elif param == "IkRecoilDisplacement":
-                    pattern = rf'(<{param} value=")[^"]*(")'
-                    replacement = rf'\g<1>{value:.3f}\2'
-                elif param in ["DamageFallOffModifier", "Penetration"]:
-                    pattern = rf'(<{param} value=")[^"]*(")'
-                    replacement = rf'\g<1>{value:.2f}\2'
-                else:
-                    pattern = rf'(<{param} value=")[^"]*(")'
-                    replacement = rf'\g<1>{value:.2f}\2'
-                content = re.sub(pattern, replacement, content)
-
-        if content != original:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            return True
-        return False
-    except Exception as e:
-        print(f"  ERROR: {e}")
-        return False
+def find_weapon_meta(batch_path: str, weapon_name: str) -> Optional[str]:
+    """Find the weapon meta file (via the persistent meta index)"""
+    return meta_index.find_weapon_meta(batch_path, weapon_name)
 
 
-def process_batch(batch_path: str, weapons: list, batch_name: str, dry_run: bool = True):
-    """Process all weapons in a batch"""
+def apply_weapon(spec: RifleSMGSpec, meta_path: str, dry_run: bool) -> tuple:
+    """
+    Worker: (values, new content or None, error) for one weapon. The
+    caller stages the write, so pool workers never touch the tree.
+    """
+    values = calculate_weapon_stats(spec)
+    if dry_run:
+        return values, None, None
+    try:
+        float_values = {k: v for k, v in values.items() if isinstance(v, float)}
+        return values, patched_file_content(meta_path, float_values, META_FORMATS, META_DEFAULT_FORMAT), None
+    except Exception as e:
+        return values, None, str(e)
+
+
+def record_weapon(graph: build_graph.BuildGraph, spec: RifleSMGSpec, meta_path: str,
+                  inputs: dict, values: dict):
+    """Store a written weapon in the build graph (runs once its write has landed)"""
+    expected = {p: format_value(p, v, META_FORMATS, META_DEFAULT_FORMAT)
+                for p, v in values.items() if isinstance(v, float)}
+    if not graph.record(BUILD_TOOL, meta_path, spec.name, inputs, expected):
+        print(f"  ⚠ {spec.display_name}: values not written")
+
+
+def process_batch(batch_path: str, weapons: list, batch_name: str, dry_run: bool = True,
+                  force: bool = False, executor: Optional[parallel.OrderedExecutor] = None):
+    """
+    Process all weapons in a batch (skipping weapons the build graph marks
+    up to date). Per-weapon work runs on the executor (serial if None) and
+    is printed in roster order; writes are staged into the open meta_txn
+    transaction if there is one.
+    """
     print(f"\n{'='*70}")
     print(f"Processing {batch_name}")
     print(f"Path: {batch_path}")
     print(f"Mode: {'DRY RUN' if dry_run else 'APPLYING'}")
     print('='*70)
 
+    graph = build_graph.get_graph(os.path.dirname(os.path.abspath(batch_path)))
+
+    plan = []
     for spec in weapons:
+        meta_path = find_weapon_meta(batch_path, spec.name)
+        inputs = build_inputs(spec)
+        current = bool(meta_path) and not force and not graph.stale(BUILD_TOOL, meta_path, spec.name, inputs)
+        plan.append((spec, meta_path, inputs, current))
+
+    tasks = [(spec, meta_path, dry_run) for spec, meta_path, _, current in plan if meta_path and not current]
+    executor = executor or parallel.OrderedExecutor(workers=1)
+    outcomes = iter(executor.starmap(apply_weapon, tasks))
+
+    for spec, meta_path, inputs, current in plan:
         print(f"\n  {spec.display_name} ({spec.caliber}, {spec.quality} tier)")
 
-        meta_path = find_weapon_meta(batch_path, spec.name)
         if not meta_path:
             print(f"    ERROR: Meta file not found for weapon_{spec.name}")
             continue
 
-        values = calculate_weapon_stats(spec)
+        if current:
+            print("    Up to date")
+            continue
+
+        values, new_content, error = next(outcomes)
 
         print(f"    Damage: {values['Damage']} | Range: {values['WeaponRange']}m")
         print(f"    Fire Rate: {values['TimeBetweenShots']}s ({int(60/values['TimeBetweenShots'])} RPM)")
@@ -544,29 +522,42 @@ def process_batch(batch_path: str, weapons: list, batch_name: str, dry_run: bool
         print(f"    Recovery: {values['RecoilRecoveryRate']}")
 
         if not dry_run:
-            if update_weapon_meta(meta_path, values):
+            if error:
+                print(f"  ERROR: {error}")
+                continue
+            if new_content is not None:
+                meta_txn.write_text(meta_path, new_content)
+            meta_txn.after_commit(partial(record_weapon, graph, spec, meta_path, inputs, values))
+            if new_content is not None:
                 print(f"    ✓ Updated")
             else:
                 print(f"    - No changes")
 
+    meta_txn.after_commit(graph.save)
+
 
 def main():
     import argparse
 
     parser = argparse.ArgumentParser(description="Rifle & SMG Damage/Handling Calculator")
     parser.add_argument("--apply", action="store_true", help="Apply changes")
-    parser.add_argument("--batch", type=int, help="Process specific batch (12-17)")
+    parser.add_argument("--batch", type=int, help="Process specific batch (registry batch id)")
+    parser.add_argument("--force", action="store_true", help="Recompute weapons the build graph marks up to date")
+    parser.add_argument("--root", default=BASE_PATH, help="Project root")
+    parallel.add_workers_argument(parser)
     args = parser.parse_args()
 
     dry_run = not args.apply
+    executor = parallel.OrderedExecutor(args.workers)
+    if not dry_run:
+        meta_txn.begin(args.root)
 
+    registry = weapon_registry.load()
     batch_configs = {
-        12: (os.path.join(BASE_PATH, "batch12_weapons"), BATCH12_RIFLES, "Batch 12 - 5.56 NATO Rifles"),
-        13: (os.path.join(BASE_PATH, "batch13_weapons"), BATCH13_RIFLES, "Batch 13 - 7.62x39 AK Variants"),
-        14: (os.path.join(BASE_PATH, "batch14_weapons"), BATCH14_RIFLES, "Batch 14 - .308/6.8mm Battle Rifles"),
-        15: (os.path.join(BASE_PATH, "batch15_weapons"), BATCH15_SMGS, "Batch 15 - 9mm SMGs"),
-        16: (os.path.join(BASE_PATH, "batch16_weapons"), BATCH16_SMGS, "Batch 16 - .45 ACP SMGs"),
-        17: (os.path.join(BASE_PATH, "batch17_weapons"), BATCH17_PDWS, "Batch 17 - PDWs/SBRs"),
+        batch_id: (registry.batch_path(batch_id, args.root), registry_specs(batch_id),
+                   registry.batches[batch_id].title)
+        for batch_id in sorted(registry.batches)
+        if registry.select(batch=batch_id, calculator="long_gun")
     }
 
     print("="*70)
@@ -578,13 +569,16 @@ def main():
     if args.batch:
         if args.batch in batch_configs:
             path, weapons, name = batch_configs[args.batch]
-            process_batch(path, weapons, name, dry_run)
+            process_batch(path, weapons, name, dry_run, args.force, executor)
         else:
             print(f"Unknown batch: {args.batch}")
     else:
         for batch_num in sorted(batch_configs.keys()):
             path, weapons, name = batch_configs[batch_num]
-            process_batch(path, weapons, name, dry_run)
+            process_batch(path, weapons, name, dry_run, args.force, executor)
+    executor.shutdown()
+    if not dry_run:
+        print(f"\nCommitted {meta_txn.commit()} files")
 
     if dry_run:
         print("\n" + "="*70)
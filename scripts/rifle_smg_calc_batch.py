@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Vectorized Rifle & SMG Stat Kernel
+
+Batch mode for rifle_smg_calc.calculate_weapon_stats:
+- Columns of caliber, barrel length, weight, quality, fire mode and RPM
+- All 15 outputs (damage, falloff, speed, force, penetration, recoil...)
+  computed in one call with NumPy array operations
+- Matches the scalar function exactly, so thousands of barrel/weight
+  variants can be evaluated for balance passes
+
+Tuning constants are read from rifle_smg_calc at call time, and may be
+overridden (scalars or broadcastable arrays) per call.
+
+Requires NumPy.
+"""
+
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+import rifle_smg_calc as rc
+from weapon_calc_batch import lookup, python_round
+
+# Output parameters and decimal places (same order as calculate_weapon_stats)
+ROUND_DIGITS = {
+    "Damage": 1,
+    "DamageFallOffRangeMin": 1,
+    "DamageFallOffRangeMax": 1,
+    "DamageFallOffModifier": 2,
+    "Speed": 1,
+    "Force": 1,
+    "Penetration": 2,
+    "WeaponRange": 1,
+    "TimeBetweenShots": 3,
+    "AccuracySpread": 2,
+    "RecoilAccuracyMax": 2,
+    "RecoilRecoveryRate": 2,
+    "RecoilShakeAmplitude": 2,
+    "RecoilShakeFrequency": 2,
+    "IkRecoilDisplacement": 3,
+}
+PARAMS = list(ROUND_DIGITS)
+
+# Integer clamp bounds for Force - the scalar path returns an int when hit
+FORCE_FLOOR = 50
+FORCE_CEILING = 180
+
+# Module-level constants the kernel reads (override any of them per call)
+CONSTANT_NAMES = [
+    "PERCEPTION_MULTIPLIER",
+    "SHAKE_OFFSET_BASE",
+    "SHAKE_TIER_SCALE",
+    "FLIP_OFFSET_BASE",
+    "FLIP_TIER_SCALE",
+    "FLIP_GLOBAL_MULTIPLIER",
+    "VALUE_FLOORS",
+    "VALUE_CEILINGS",
+    "CALIBER_DATA",
+    "QUALITY_TIERS",
+    "FIRE_MODES",
+]
+
+
+def current_constants() -> dict:
+    """Snapshot of the tuning constants as currently set in rifle_smg_calc"""
+    return {name: getattr(rc, name) for name in CONSTANT_NAMES}
+
+
+# =============================================================================
+# STRUCTURE-OF-ARRAYS COLUMNS
+# =============================================================================
+@dataclass
+class RifleColumns:
+    """RifleSMGSpec list as parallel arrays"""
+    names: list
+    calibers: list          # Caliber per lookup index
+    qualities: list         # Quality tier per lookup index
+    fire_modes: list        # Fire mode per lookup index
+    caliber_idx: np.ndarray
+    quality_idx: np.ndarray
+    fire_idx: np.ndarray
+    barrel_inches: np.ndarray
+    weight_lbs: np.ndarray
+    rpm: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def build_columns(specs: list, constants: dict = None) -> RifleColumns:
+    """Convert RifleSMGSpecs into structure-of-arrays columns"""
+    constants = constants or current_constants()
+    calibers = list(constants["CALIBER_DATA"])
+    qualities = list(constants["QUALITY_TIERS"])
+    fire_modes = list(constants["FIRE_MODES"])
+    caliber_lookup = {c: i for i, c in enumerate(calibers)}
+    quality_lookup = {q: i for i, q in enumerate(qualities)}
+    fire_lookup = {f: i for i, f in enumerate(fire_modes)}
+
+    caliber_idx = np.empty(len(specs), dtype=np.int32)
+    for i, spec in enumerate(specs):
+        if spec.caliber not in caliber_lookup:
+            raise ValueError(f"Unknown caliber: {spec.caliber}")
+        caliber_idx[i] = caliber_lookup[spec.caliber]
+
+    # Unknown tiers/modes fall back to standard/semi like the scalar path
+    return RifleColumns(
+        names=[spec.name for spec in specs],
+        calibers=calibers,
+        qualities=qualities,
+        fire_modes=fire_modes,
+        caliber_idx=caliber_idx,
+        quality_idx=np.array([quality_lookup.get(s.quality, quality_lookup["standard"]) for s in specs],
+                             dtype=np.int32),
+        fire_idx=np.array([fire_lookup.get(s.fire_mode, fire_lookup["semi"]) for s in specs],
+                          dtype=np.int32),
+        barrel_inches=np.array([s.barrel_inches for s in specs], dtype=np.float64),
+        weight_lbs=np.array([s.weight_lbs for s in specs], dtype=np.float64),
+        rpm=np.array([s.rpm for s in specs], dtype=np.float64),
+    )
+
+
+def roster_specs() -> list:
+    """Every RifleSMGSpec in the weapon registry, in batch order"""
+    return rc.registry_specs()
+
+
+# =============================================================================
+# KERNEL
+# =============================================================================
+def _clamp(value, floor, ceiling):
+    return np.maximum(floor, np.minimum(ceiling, value))
+
+
+def calculate_barrel_modifier_batch(barrel_inches, baseline) -> dict:
+    """Vectorized calculate_barrel_modifier"""
+    ratio = barrel_inches / baseline
+    short = ratio < 1.0
+
+    velocity_mult = np.where(short, 0.88 + (0.12 * ratio), 1.0 + (0.03 * (ratio - 1.0)))
+    damage_mult = np.where(short, 0.82 + (0.18 * ratio), 1.0 + (0.05 * (ratio - 1.0)))
+    recoil_mult = np.where(short, 1.30 - (0.30 * ratio), 1.0 - (0.08 * (ratio - 1.0)))
+
+    return {
+        "velocity_mult": _clamp(velocity_mult, 0.75, 1.15),
+        "damage_mult": _clamp(damage_mult, 0.75, 1.12),
+        "recoil_mult": _clamp(recoil_mult, 0.85, 1.40),
+    }
+
+
+def calculate_stats_batch(columns: RifleColumns, constants: dict = None,
+                          rounded: bool = True, **overrides) -> dict:
+    """
+    Vectorized calculate_weapon_stats over every spec in `columns`.
+
+    Scalar overrides - and the numeric leaves of the table constants - may
+    be arrays (e.g. shape (K, 1)) to evaluate K constant sets at once;
+    outputs then broadcast to (K, n_specs).
+    Returns {param: ndarray}.
+    """
+    c = dict(constants or current_constants())
+    c.update(overrides)
+    floors = c["VALUE_FLOORS"]
+    ceilings = c["VALUE_CEILINGS"]
+
+    cal = columns.caliber_idx
+    qual = columns.quality_idx
+    fire = columns.fire_idx
+
+    def cal_field(name):
+        return lookup(cal, [c["CALIBER_DATA"][k][name] for k in columns.calibers])
+
+    def quality_field(name):
+        return lookup(qual, [c["QUALITY_TIERS"][k][name] for k in columns.qualities])
+
+    def fire_field(name):
+        return lookup(fire, [c["FIRE_MODES"][k][name] for k in columns.fire_modes])
+
+    is_smg = np.array(["smg" in name for name in columns.calibers])[cal]
+    is_budget = np.array([name == "budget" for name in columns.qualities])[qual]
+    is_auto = np.array([name in ["auto", "auto_fast"] for name in columns.fire_modes])[fire]
+
+    barrel = calculate_barrel_modifier_batch(columns.barrel_inches, cal_field("barrel_baseline"))
+    tier_offset = quality_field("tier_offset")
+    fire_recoil = fire_field("recoil_mult")
+    fire_accuracy = fire_field("accuracy_mult")
+
+    # Weight factor: lighter = more felt recoil
+    weight_factor = _clamp(7.0 / columns.weight_lbs, 0.75, 1.40)
+
+    # Damage
+    base_damage = cal_field("base_damage") * barrel["damage_mult"]
+
+    # Recoil shake amplitude
+    shake = cal_field("recoil_base") * c["PERCEPTION_MULTIPLIER"]
+    shake = shake * barrel["recoil_mult"]
+    shake = shake * quality_field("shake_mult")
+    shake = shake * fire_recoil
+    shake = shake * weight_factor
+    shake = shake + (c["SHAKE_OFFSET_BASE"] + (tier_offset * c["SHAKE_TIER_SCALE"]))
+    shake = _clamp(shake, floors["RecoilShakeAmplitude"], ceilings["RecoilShakeAmplitude"])
+
+    # IK recoil displacement (flip)
+    flip = cal_field("flip_base") * c["PERCEPTION_MULTIPLIER"]
+    flip = flip * barrel["recoil_mult"]
+    flip = flip * quality_field("flip_mult")
+    flip = flip * fire_recoil
+    flip = flip * weight_factor
+    flip = (flip + (c["FLIP_OFFSET_BASE"] + (tier_offset * c["FLIP_TIER_SCALE"]))) * c["FLIP_GLOBAL_MULTIPLIER"]
+    flip = _clamp(flip, floors["IkRecoilDisplacement"], ceilings["IkRecoilDisplacement"])
+
+    # Accuracy spread (budget tier gets extra penalty)
+    spread = np.where(is_smg, 1.20, 0.80) * quality_field("accuracy_mult") * fire_accuracy
+    spread = np.where(is_budget, spread * 1.30, spread)
+    spread = _clamp(spread, floors["AccuracySpread"], ceilings["AccuracySpread"])
+
+    # Recoil accuracy max (full-auto degrades more)
+    acc_max = np.where(is_smg, 2.50, 2.00) * quality_field("recoil_mult") * fire_accuracy
+    acc_max = np.where(is_auto, acc_max * 1.40, acc_max)
+    acc_max = _clamp(acc_max, floors["RecoilAccuracyMax"], ceilings["RecoilAccuracyMax"])
+
+    # Recoil recovery rate
+    recovery = 0.50 * quality_field("recovery_mult")
+    recovery = recovery + fire_field("recovery_bonus")
+    recovery = recovery / (weight_factor * 0.7 + 0.3)
+    recovery = _clamp(recovery, floors["RecoilRecoveryRate"], ceilings["RecoilRecoveryRate"])
+
+    # Shake frequency and fire rate from RPM
+    rpm = np.where(columns.rpm > 0, columns.rpm, fire_field("rpm_max"))
+    shake_freq = _clamp(0.40 + (rpm / 1800), 0.40, 0.95)
+    with np.errstate(divide="ignore"):
+        time_between = np.where(rpm > 0, 60.0 / rpm, 0.12)
+
+    # Other values
+    velocity_ms = cal_field("velocity_fps") * barrel["velocity_mult"] * 0.3048
+    eff_range = cal_field("effective_range")
+    force = 40 + (cal_field("energy_ftlbs") / 20)
+    penetration = cal_field("penetration") * (0.95 + (0.05 * barrel["velocity_mult"]))
+
+    raw = {
+        "Damage": base_damage,
+        "DamageFallOffRangeMin": eff_range * 0.15,
+        "DamageFallOffRangeMax": eff_range * 0.50,
+        "DamageFallOffModifier": np.where(is_smg, 0.35, 0.40),
+        "Speed": velocity_ms,
+        "Force": _clamp(force, FORCE_FLOOR, FORCE_CEILING),
+        "Penetration": _clamp(penetration, 0.20, 0.75),
+        "WeaponRange": eff_range * 0.60,
+        "TimeBetweenShots": time_between,
+        "AccuracySpread": spread,
+        "RecoilAccuracyMax": acc_max,
+        "RecoilRecoveryRate": recovery,
+        "RecoilShakeAmplitude": shake,
+        "RecoilShakeFrequency": shake_freq,
+        "IkRecoilDisplacement": flip,
+    }
+
+    if not rounded:
+        return raw
+    return {param: python_round(np.asarray(value, dtype=np.float64), ROUND_DIGITS[param])
+            for param, value in raw.items()}
+
+
+def stats_for(values: dict, index) -> dict:
+    """
+    Scalar dict for one weapon, in calculate_weapon_stats' shape.
+    A clamped Force comes back as an int, as in the scalar path
+    (apply_weapon only writes float values).
+    """
+    stats = {param: float(values[param][index]) for param in PARAMS}
+    if stats["Force"] in (FORCE_FLOOR, FORCE_CEILING):
+        stats["Force"] = int(stats["Force"])
+    return stats
+
+
+def verify_against_scalar(specs: list) -> list:
+    """Return names of specs whose batch result differs from the scalar path"""
+    values = calculate_stats_batch(build_columns(specs))
+    mismatches = []
+    for i, spec in enumerate(specs):
+        batch = stats_for(values, i)
+        scalar = rc.calculate_weapon_stats(spec)
+        if batch != scalar or any(type(batch[p]) is not type(scalar[p]) for p in PARAMS):
+            mismatches.append(spec.name)
+    return mismatches
+
+
+def random_specs(count: int, seed: int = 0) -> list:
+    """Barrel/weight variants of random calibers, tiers and fire modes"""
+    rng = np.random.default_rng(seed)
+    calibers = list(rc.CALIBER_DATA)
+    qualities = list(rc.QUALITY_TIERS)
+    fire_modes = list(rc.FIRE_MODES)
+    cal = rng.integers(len(calibers), size=count)
+    qual = rng.integers(len(qualities), size=count)
+    fire = rng.integers(len(fire_modes), size=count)
+    barrel = np.round(rng.uniform(3.0, 26.0, size=count), 1)
+    weight = np.round(rng.uniform(2.5, 12.0, size=count), 2)
+    rpm = np.where(rng.random(count) < 0.3, 0, rng.integers(400, 1300, size=count))
+    return [
+        rc.RifleSMGSpec(f"spec{i}", f"Spec {i}", calibers[cal[i]], float(barrel[i]), float(weight[i]),
+                        qualities[qual[i]], fire_modes[fire[i]], int(rpm[i]))
+        for i in range(count)
+    ]
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Vectorized rifle/SMG stat calculator")
+    parser.add_argument("--verify", action="store_true", help="Check batch results against the scalar path")
+    parser.add_argument("--bench", type=int, default=0, help="Time N random barrel/weight variants")
+    args = parser.parse_args()
+
+    specs = roster_specs()
+
+    start = time.perf_counter()
+    columns = build_columns(specs)
+    values = calculate_stats_batch(columns)
+    elapsed = time.perf_counter() - start
+
+    print(f"Roster: {len(specs)} weapons in {elapsed * 1000:.2f} ms")
+
+    if args.verify:
+        mismatches = verify_against_scalar(specs)
+        if mismatches:
+            print(f"MISMATCH: {', '.join(mismatches)}")
+        else:
+            print("Batch results match the scalar path for every weapon")
+
+    if args.bench:
+        bench = random_specs(args.bench)
+        columns = build_columns(bench)
+        start = time.perf_counter()
+        calculate_stats_batch(columns)
+        batch_time = time.perf_counter() - start
+
+        sample = bench[:min(len(bench), 20000)]
+        start = time.perf_counter()
+        for spec in sample:
+            rc.calculate_weapon_stats(spec)
+        scalar_time = (time.perf_counter() - start) * len(bench) / len(sample)
+
+        print(f"Bench: {len(bench)} specs - batch {batch_time * 1000:.1f} ms, "
+              f"scalar ~{scalar_time * 1000:.1f} ms")
+        mismatches = verify_against_scalar(sample)
+        print(f"  Sample mismatches: {len(mismatches)}")
+
+    if not args.verify and not args.bench:
+        for i, name in enumerate(columns.names):
+            row = stats_for(values, i)
+            print(f"  {name:<16} DMG {row['Damage']:>5} | TBS {row['TimeBetweenShots']:>6} | "
+                  f"Shake {row['RecoilShakeAmplitude']:>4} | Flip {row['IkRecoilDisplacement']:>5} | "
+                  f"Spread {row['AccuracySpread']:>4} | Rec {row['RecoilRecoveryRate']:>4}")
+
+
+if __name__ == "__main__":
+    main()
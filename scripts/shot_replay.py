@@ -0,0 +1,751 @@
+#!/usr/bin/env python3
+"""
+Shot-Log Replay for sv_firevalidation Thresholds
+
+Replays timestamped shot logs through ValidateShot() from
+free_selectivefire/server/sv_firevalidation.lua for a whole grid of
+threshold settings at once, to measure violation/warn/kick rates before
+changing ValidationConfig:
+- LuaValidator is a line-by-line port of ValidateShot (5-slot circular
+  buffer, 1-based indices, violation decay) plus the mode-change, death
+  and disconnect handlers - the reference
+- GridReplay evaluates every setting in one pass over the log: the shot
+  buffer only depends on the log, so each player keeps one buffer and
+  per-setting arrays (violations, last violation, shots since a kick
+  cleared the state)
+- Logs are streamed line by line (plain or .gz), so size is unbounded
+- Results are broken down per weapon and per mode
+- ValidateBatch (Config.Telemetry) is ported too; --check-batches regroups
+  the log into the client's shot batches, delivers them with network
+  jitter and checks that every shot gets the validity per-shot
+  ValidateShot gives it and that no batch trips the batch-level checks
+  (oversize, span vs server time, client clock ahead of arrivals)
+- Per-weapon limits from the generated sv_fire_thresholds.lua are applied
+  like the validator does (the grid then only moves the global fallbacks);
+  --no-thresholds replays the globals alone
+
+Kicks are counted as if EnableKick were on: reaching KickThreshold clears
+the player's state, like DropPlayer -> playerDropped -> ClearState.
+
+Log format (CSV with header, server GetGameTimer() order):
+    time_ms,player,event,weapon,mode
+    event: shot | mode | died | unload | drop   (weapon: name or hash)
+
+Usage:
+    python shot_replay.py --synthesize legit.csv --players 200      # Legit traffic from fire-control rules
+    python shot_replay.py legit.csv --grid SemiAutoMinInterval=150,180,210 --grid BurstWindow=300,400
+    python shot_replay.py legit.csv --check                         # Grid replay vs LuaValidator
+    python shot_replay.py legit.csv --check-batches                 # ValidateBatch vs per-shot ValidateShot
+
+Requires NumPy.
+"""
+
+import os
+import csv
+import gzip
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+import numpy as np
+
+import lua_config
+
+BASE_PATH = "/home/user/project_pipes"
+
+VALIDATION_LUA = "free_selectivefire/server/sv_firevalidation.lua"
+THRESHOLDS_LUA = "free_selectivefire/server/sv_fire_thresholds.lua"
+BUFFER_SLOTS = 5
+
+# ValidationConfig fields a grid can vary
+GRID_PARAMS = ["SemiAutoMinInterval", "BurstWindow", "BurstMaxShots", "ViolationDecay",
+               "ViolationThreshold", "KickThreshold"]
+
+GRID_LABELS = {"SemiAutoMinInterval": "SemiMin", "BurstWindow": "BWin", "BurstMaxShots": "BMax",
+               "ViolationDecay": "Decay", "ViolationThreshold": "VThr", "KickThreshold": "KThr"}
+
+LOG_FIELDS = ["time_ms", "player", "event", "weapon", "mode"]
+EVENTS = {"shot", "mode", "died", "unload", "drop"}
+
+
+def read_validation_config(root: str) -> dict:
+    """The local ValidationConfig table of sv_firevalidation.lua"""
+    path = os.path.join(root, VALIDATION_LUA)
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = lua_config.LuaReader(lua_config.tokenize(f.read()), {}, path)
+    reader.run()
+    return dict(reader.locals["ValidationConfig"])
+
+
+def read_fire_thresholds(root: str) -> dict:
+    """FireThresholds (weapon name -> limits) from the generated table, {} if not generated"""
+    path = os.path.join(root, THRESHOLDS_LUA)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return dict(lua_config.read_lua(f.read(), {}, path).get("FireThresholds") or {})
+
+
+# =============================================================================
+# LOG STREAMING
+# =============================================================================
+@dataclass
+class LogEvent:
+    time_ms: int
+    player: str
+    event: str
+    weapon: str
+    mode: str
+
+
+def weapon_hash_names(root: str) -> dict:
+    """Signed and unsigned joaat hash (as text) -> weapon name for selective-fire weapons"""
+    names = {}
+    for name in (lua_config.selectivefire_config(root).get("Weapons") or {}):
+        value = lua_config.joaat(name)
+        names[str(value)] = name
+        names[str(value & 0xFFFFFFFF)] = name
+    return names
+
+
+def open_log(path: str, mode: str = 'r'):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + 't', encoding='utf-8', newline='')
+    return open(path, mode, encoding='utf-8', newline='')
+
+
+def read_log(path: str, hash_names: Optional[dict] = None) -> Iterator[LogEvent]:
+    """Stream a shot log (weapon hashes resolved to names where known)"""
+    hash_names = hash_names or {}
+    with open_log(path) as f:
+        for row in csv.DictReader(f):
+            event = (row.get("event") or "shot").strip()
+            if event not in EVENTS:
+                raise ValueError(f"{path}: unknown event {event!r}")
+            weapon = (row.get("weapon") or "").strip()
+            yield LogEvent(int(float(row["time_ms"])), row["player"].strip(), event,
+                           hash_names.get(weapon, weapon), (row.get("mode") or "").strip().upper())
+
+
+# =============================================================================
+# REFERENCE (line-by-line port of sv_firevalidation.lua)
+# =============================================================================
+@dataclass
+class BatchClock:
+    """GetState().batch: the client-clock shot buffer of ValidateBatch"""
+    recent_shots: dict = field(default_factory=dict)
+    shot_index: int = 1
+    last_shot: Optional[int] = None
+    received: Optional[int] = None
+    floor: Optional[int] = None
+
+
+@dataclass
+class PlayerState:
+    """GetState() table"""
+    recent_shots: dict = field(default_factory=dict)    # 1-based slot -> time (nil = absent)
+    shot_index: int = 1
+    violations: int = 0
+    last_violation: int = 0
+    last_shot: int = 0
+    batch: BatchClock = field(default_factory=BatchClock)
+
+
+class LuaValidator:
+    """ValidateShot and the state handlers for one ValidationConfig"""
+
+    def __init__(self, config: dict, thresholds: Optional[dict] = None):
+        self.config = config
+        self.thresholds = thresholds or {}
+        self.states: dict = {}
+
+    def get_state(self, source: str) -> PlayerState:
+        if source not in self.states:
+            self.states[source] = PlayerState()
+        return self.states[source]
+
+    def decay_violations(self, state: PlayerState, now: int):
+        if (now - state.last_violation) > self.config["ViolationDecay"]:
+            state.violations = 0
+
+    def check_shot(self, clock, limits: dict, mode: str, now: int) -> bool:
+        """CheckShot: record the shot in clock's buffer (PlayerState or BatchClock) and test it"""
+        cfg = self.config
+        clock.recent_shots[clock.shot_index] = now
+        clock.shot_index = (clock.shot_index % BUFFER_SLOTS) + 1
+        clock.last_shot = now
+
+        if mode == "SEMI":
+            prev_index = clock.shot_index - 2
+            if prev_index < 1:
+                prev_index += BUFFER_SLOTS
+            prev_shot = clock.recent_shots.get(prev_index)
+            if prev_shot is not None and (now - prev_shot) < limits.get("semi", cfg["SemiAutoMinInterval"]):
+                return False
+        elif mode == "BURST":
+            window = limits.get("burstWindow", cfg["BurstWindow"])
+            count = 0
+            for i in range(1, BUFFER_SLOTS + 1):
+                t = clock.recent_shots.get(i)
+                if t is not None and (now - t) < window:
+                    count += 1
+            if count > limits.get("burstMax", cfg["BurstMaxShots"]):
+                return False
+        return True
+
+    def add_violation(self, state: PlayerState, now: int) -> bool:
+        """AddViolation: True once violations reach ViolationThreshold"""
+        state.violations += 1
+        state.last_violation = now
+        return state.violations >= self.config["ViolationThreshold"]
+
+    def validate_shot(self, source: str, weapon: str, mode: str, now: int) -> tuple:
+        """(is_valid, warned, kicked) for one shotFired event"""
+        state = self.get_state(source)
+        self.decay_violations(state, now)
+        is_valid = self.check_shot(state, self.thresholds.get(weapon) or {}, mode, now)
+
+        warned = kicked = False
+        if not is_valid and self.add_violation(state, now):
+            warned = True
+            if state.violations >= self.config["KickThreshold"]:
+                kicked = True
+                self.clear_state(source)    # DropPlayer -> playerDropped
+        return is_valid, warned, kicked
+
+    def validate_batch(self, source: str, weapon: str, mode: str, first_shot: int, gaps: list,
+                       received: int, telemetry: dict) -> tuple:
+        """
+        ValidateBatch at server time `received`: (batch_ok, verdicts) with
+        (is_valid, warned, kicked) for each shot checked, stopping at a kick
+        """
+        cfg = self.config
+        state = self.get_state(source)
+        clock = state.batch
+        limits = self.thresholds.get(weapon) or {}
+        interval, max_batch = int(telemetry["FlushInterval"]), int(telemetry["MaxBatch"])
+        shots = min(len(gaps) + 1, max_batch)
+        gaps = [max(gap, 0) for gap in gaps[:shots - 1]]
+        warned = False
+
+        self.decay_violations(state, received)
+
+        span = sum(gaps)
+        elapsed = received - clock.received if clock.received is not None else interval
+        delay = received - (first_shot + span)
+        suspect = (len(gaps) + 1 > max_batch or span > elapsed + cfg["BatchJitter"]
+                   or (clock.floor is not None and delay < clock.floor))
+        if suspect:
+            warned = self.add_violation(state, received)
+
+        floor = delay - interval - cfg["BatchJitter"]
+        if clock.floor is None:
+            clock.floor = floor
+        elif not suspect:
+            clock.floor = max(clock.floor, floor)
+        clock.received = received
+
+        now = max(first_shot, clock.last_shot if clock.last_shot is not None else first_shot)
+        verdicts = []
+        for i in range(shots):
+            if i > 0:
+                now += gaps[i - 1]
+            is_valid = self.check_shot(clock, limits, mode, now)
+            kicked = False
+            if not is_valid and self.add_violation(state, received):
+                warned = True
+                kicked = state.violations >= cfg["KickThreshold"]
+            verdicts.append((is_valid, warned, kicked))
+            if kicked:
+                break
+        if warned and state.violations >= cfg["KickThreshold"]:
+            self.clear_state(source)
+        return not suspect, verdicts
+
+    def mode_changed(self, source: str):
+        state = self.get_state(source)
+        state.recent_shots = {}
+        state.shot_index = 1
+        state.batch.recent_shots = {}
+        state.batch.shot_index = 1
+
+    def reset_violations(self, source: str):
+        state = self.states.get(source)
+        if state:
+            state.violations = 0
+            state.recent_shots = {}
+            state.shot_index = 1
+            state.batch.recent_shots = {}
+            state.batch.shot_index = 1
+
+    def clear_state(self, source: str):
+        self.states.pop(source, None)
+
+    def handle(self, event: LogEvent) -> Optional[tuple]:
+        """Apply one log event; returns validate_shot's result for shots"""
+        if event.event == "shot":
+            return self.validate_shot(event.player, event.weapon, event.mode, event.time_ms)
+        if event.event == "mode":
+            self.mode_changed(event.player)
+        elif event.event == "died":
+            if self.config.get("ResetOnDeath", True):
+                self.reset_violations(event.player)
+        elif event.event == "unload":
+            if self.config.get("ResetOnCharacterSwitch", True):
+                self.clear_state(event.player)
+        elif event.event == "drop":
+            self.clear_state(event.player)
+        return None
+
+
+# =============================================================================
+# BATCHED TELEMETRY
+# =============================================================================
+@dataclass
+class ShotBatch:
+    """One selectivefire:shotBatch event"""
+    player: str
+    weapon: str
+    mode: str
+    first_shot: int
+    gaps: list = field(default_factory=list)   # ms from each shot to the next
+    last_shot: int = 0
+    sent: int = 0                              # Client time of the flush
+
+    @property
+    def times(self) -> list:
+        return list(itertools.accumulate(self.gaps, initial=self.first_shot))
+
+
+def client_batches(events, flush_interval: int, max_batch: int) -> Iterator:
+    """
+    Regroup a per-shot log the way cl_firecontrol batches it (Config.Telemetry):
+    a batch is flushed on a weapon/mode change, at MaxBatch shots, once
+    FlushInterval old, and before any other event of the player. Yields
+    ShotBatch (with its flush time) and the other LogEvents in send order.
+    """
+    pending = {}
+    for event in events:
+        batch = pending.get(event.player)
+        now = event.time_ms
+        if batch is not None and now - batch.first_shot > flush_interval:
+            batch.sent = batch.first_shot + flush_interval
+            yield pending.pop(event.player)
+            batch = None
+
+        if event.event != "shot":
+            if batch is not None:
+                batch.sent = now
+                yield pending.pop(event.player)
+            yield event
+            continue
+
+        if batch is not None and (batch.weapon, batch.mode) != (event.weapon, event.mode):
+            batch.sent = now
+            yield pending.pop(event.player)
+            batch = None
+        if batch is None:
+            batch = pending[event.player] = ShotBatch(event.player, event.weapon, event.mode, now)
+        else:
+            batch.gaps.append(now - batch.last_shot)
+        batch.last_shot = now
+
+        if len(batch.gaps) + 1 >= max_batch or now - batch.first_shot >= flush_interval:
+            batch.sent = now
+            yield pending.pop(event.player)
+    for batch in pending.values():
+        batch.sent = batch.first_shot + flush_interval
+        yield batch
+
+
+def check_batches(path: str, grid: dict, config: dict, telemetry: dict, hash_names: Optional[dict] = None,
+                  thresholds: Optional[dict] = None, jitter_ms: float = 25.0, seed: int = 0) -> tuple:
+    """
+    Replay the log per shot (ValidateShot) and batched (ValidateBatch, each
+    batch arriving with random network delay, order kept) for every
+    setting. A setting differs if any player's shot validity differs up to
+    their first kick, or any batch trips a batch-level check.
+    Returns (settings that differ, shot events, batch events, flagged batches).
+    """
+    mismatches = shot_events = batch_events = flagged = 0
+    for g in range(len(grid[GRID_PARAMS[0]])):
+        settings = dict(config, **{p: int(grid[p][g]) for p in GRID_PARAMS})
+        rng = np.random.default_rng(seed)
+
+        per_shot, validator = {}, LuaValidator(settings, thresholds)
+        shot_events = 0
+        for event in read_log(path, hash_names):
+            result = validator.handle(event)
+            if result is not None:
+                per_shot.setdefault(event.player, []).append(result)
+                shot_events += 1
+
+        batched, validator, arrivals = {}, LuaValidator(settings, thresholds), {}
+        batch_events = setting_flagged = 0
+        for item in client_batches(read_log(path, hash_names), int(telemetry["FlushInterval"]),
+                                   int(telemetry["MaxBatch"])):
+            if isinstance(item, ShotBatch):
+                received = max(arrivals.get(item.player, 0), int(item.sent + abs(rng.normal(0.0, jitter_ms))))
+                arrivals[item.player] = received
+                batch_ok, verdicts = validator.validate_batch(item.player, item.weapon, item.mode,
+                                                              item.first_shot, item.gaps, received, telemetry)
+                batched.setdefault(item.player, []).extend(verdicts)
+                batch_events += 1
+                setting_flagged += not batch_ok
+            else:
+                validator.handle(item)
+
+        def first_kick(verdicts: list) -> int:
+            return next((i for i, verdict in enumerate(verdicts) if verdict[2]), len(verdicts))
+
+        differ = []
+        for player, shots in per_shot.items():
+            batches = batched.get(player, [])
+            end = min(first_kick(shots), first_kick(batches)) + 1
+            if [v[0] for v in shots[:end]] != [v[0] for v in batches[:end]]:
+                differ.append(player)
+        flagged += setting_flagged
+        if differ or setting_flagged:
+            mismatches += 1
+            print(f"  ✗ setting {g}: {len(differ)} players differ"
+                  f"{f' (e.g. {differ[0]})' if differ else ''}, {setting_flagged} batches flagged")
+    return mismatches, shot_events, batch_events, flagged
+
+
+# =============================================================================
+# GRID REPLAY
+# =============================================================================
+def build_grid(base: dict, overrides: dict) -> dict:
+    """{param: (G,) int64 array} for the cartesian product of overrides over base values"""
+    values = [overrides.get(p) or [base[p]] for p in GRID_PARAMS]
+    combos = list(itertools.product(*values))
+    return {p: np.array([c[i] for c in combos], dtype=np.int64) for i, p in enumerate(GRID_PARAMS)}
+
+
+class GridPlayer:
+    """One player's buffer (setting-independent) and per-setting counters"""
+
+    __slots__ = ("buffer", "violations", "last_violation", "since_clear")
+
+    def __init__(self, size: int):
+        self.buffer: list = []                                      # Last BUFFER_SLOTS shots since reset
+        self.violations = np.zeros(size, dtype=np.int64)
+        self.last_violation = np.zeros(size, dtype=np.int64)
+        self.since_clear = np.zeros(size, dtype=np.int64)          # Shots since a kick cleared the state
+
+
+class GridReplay:
+    """Every grid setting replayed in one pass; counts per (weapon, mode)"""
+
+    def __init__(self, grid: dict, config: dict, thresholds: Optional[dict] = None):
+        self.grid = grid
+        self.thresholds = {}    # weapon -> (semi, window (1, 1), burst max) overriding the grid
+        for weapon, limits in (thresholds or {}).items():
+            self.thresholds[weapon] = (limits.get("semi", grid["SemiAutoMinInterval"]),
+                                       np.reshape(limits.get("burstWindow", grid["BurstWindow"]), (-1, 1)),
+                                       limits.get("burstMax", grid["BurstMaxShots"]))
+        self._globals = (grid["SemiAutoMinInterval"], grid["BurstWindow"][:, None], grid["BurstMaxShots"])
+        self.size = len(grid["SemiAutoMinInterval"])
+        self.reset_on_death = config.get("ResetOnDeath", True)
+        self.reset_on_switch = config.get("ResetOnCharacterSwitch", True)
+        self.players: dict = {}
+        self.shots: dict = {}           # (weapon, mode) -> shot count
+        self.violations: dict = {}      # (weapon, mode) -> (G,) counts
+        self.warns: dict = {}
+        self.kicks: dict = {}
+        self.kicked_players = np.zeros(self.size, dtype=np.int64)
+        self._kicked_seen: dict = {}    # player -> (G,) bool
+        self._slots = np.arange(BUFFER_SLOTS)
+
+    def _counts(self, key: tuple) -> tuple:
+        if key not in self.shots:
+            self.shots[key] = 0
+            self.violations[key] = np.zeros(self.size, dtype=np.int64)
+            self.warns[key] = np.zeros(self.size, dtype=np.int64)
+            self.kicks[key] = np.zeros(self.size, dtype=np.int64)
+        return self.violations[key], self.warns[key], self.kicks[key]
+
+    def shot(self, event: LogEvent):
+        grid = self.grid
+        player = self.players.get(event.player)
+        if player is None:
+            player = self.players[event.player] = GridPlayer(self.size)
+        now = event.time_ms
+
+        player.violations[(now - player.last_violation) > grid["ViolationDecay"]] = 0
+
+        buffer = player.buffer
+        buffer.append(now)
+        if len(buffer) > BUFFER_SLOTS:
+            del buffer[0]
+        np.minimum(player.since_clear + 1, BUFFER_SLOTS, out=player.since_clear)
+        available = np.minimum(player.since_clear, len(buffer))    # Buffer entries each setting still has
+
+        semi_min, burst_window, burst_max = self.thresholds.get(event.weapon, self._globals)
+        if event.mode == "SEMI" and len(buffer) >= 2:
+            invalid = (available >= 2) & ((now - buffer[-2]) < semi_min)
+        elif event.mode == "BURST":
+            ages = now - np.array(buffer[::-1], dtype=np.int64)      # Newest first
+            in_window = (ages[None, :] < burst_window) & (self._slots[None, :len(buffer)] < available[:, None])
+            invalid = in_window.sum(axis=1) > burst_max
+        else:
+            invalid = None
+
+        key = (event.weapon, event.mode)
+        violations, warns, kicks = self._counts(key)
+        self.shots[key] += 1
+        if invalid is None or not invalid.any():
+            return
+
+        player.violations += invalid
+        player.last_violation[invalid] = now
+        violations += invalid
+        warned = invalid & (player.violations >= grid["ViolationThreshold"])
+        warns += warned
+        kicked = warned & (player.violations >= grid["KickThreshold"])
+        if kicked.any():
+            kicks += kicked
+            seen = self._kicked_seen.setdefault(event.player, np.zeros(self.size, dtype=bool))
+            self.kicked_players += kicked & ~seen
+            seen |= kicked
+            # ClearState for those settings
+            player.violations[kicked] = 0
+            player.last_violation[kicked] = 0
+            player.since_clear[kicked] = 0
+
+    def handle(self, event: LogEvent):
+        if event.event == "shot":
+            self.shot(event)
+            return
+        player = self.players.get(event.player)
+        if event.event == "mode":
+            if player is None:
+                player = self.players[event.player] = GridPlayer(self.size)
+            player.buffer = []
+        elif event.event == "died":
+            if player is not None and self.reset_on_death:
+                player.violations[:] = 0
+                player.buffer = []
+        elif event.event == "drop" or (event.event == "unload" and self.reset_on_switch):
+            self.players.pop(event.player, None)
+
+    def totals(self) -> dict:
+        """Grid-wide totals: shots (int) and (G,) violations/warns/kicks/kicked_players"""
+        zero = np.zeros(self.size, dtype=np.int64)
+        return {
+            "shots": sum(self.shots.values()),
+            "violations": sum(self.violations.values(), zero),
+            "warns": sum(self.warns.values(), zero),
+            "kicks": sum(self.kicks.values(), zero),
+            "kicked_players": self.kicked_players,
+        }
+
+
+def replay(path: str, grid: dict, config: dict, hash_names: Optional[dict] = None,
+           thresholds: Optional[dict] = None) -> GridReplay:
+    engine = GridReplay(grid, config, thresholds)
+    for event in read_log(path, hash_names):
+        engine.handle(event)
+    return engine
+
+
+def check_against_reference(path: str, grid: dict, config: dict, engine: GridReplay,
+                            hash_names: Optional[dict] = None, thresholds: Optional[dict] = None) -> int:
+    """Replay the log through LuaValidator for every setting; returns settings that differ"""
+    mismatches = 0
+    for g in range(engine.size):
+        settings = dict(config, **{p: int(grid[p][g]) for p in GRID_PARAMS})
+        validator = LuaValidator(settings, thresholds)
+        counts = {}
+        for event in read_log(path, hash_names):
+            result = validator.handle(event)
+            if result is None:
+                continue
+            valid, warned, kicked = result
+            c = counts.setdefault((event.weapon, event.mode), [0, 0, 0])
+            c[0] += not valid
+            c[1] += warned
+            c[2] += kicked
+        expected = {k: c for k, c in counts.items() if any(c)}
+        actual = {k: [int(engine.violations[k][g]), int(engine.warns[k][g]), int(engine.kicks[k][g])]
+                  for k in engine.shots}
+        actual = {k: c for k, c in actual.items() if any(c)}
+        if expected != actual:
+            mismatches += 1
+            print(f"  ✗ setting {g}: reference {sum(c[0] for c in expected.values())} violations, "
+                  f"grid {sum(c[0] for c in actual.values())}")
+    return mismatches
+
+
+# =============================================================================
+# SYNTHETIC LEGIT TRAFFIC
+# =============================================================================
+def synthesize_log(path: str, root: str, players: int = 100, strings: int = 40, seed: int = 0,
+                   latency_ms: float = 40.0, jitter_ms: float = 25.0) -> int:
+    """
+    Write a log of legitimate play: each player fires strings with weapons
+    and modes from the selective-fire config at the fastest cadence the
+    client allows (recoil_sim.shot_gaps), received with random network
+    delay (order kept, as on a reliable channel). Returns event count.
+    """
+    import recoil_sim
+
+    rng = np.random.default_rng(seed)
+    rows = [r for r in recoil_sim.build_rows(root, recoil_sim.DEFAULT_SHOTS)
+            if r.weapon in (lua_config.selectivefire_config(root).get("Weapons") or {})]
+
+    def player_events(player: str):
+        clock, received, current = float(rng.uniform(0, 5000)), 0, None
+        for _ in range(strings):
+            row = rows[rng.integers(len(rows))]
+            if (row.weapon, row.mode) != current:
+                current = (row.weapon, row.mode)
+                clock += rng.uniform(500, 2000)
+                received = max(received, int(clock + latency_ms))
+                yield received, player, "mode", row.weapon, row.mode
+            length = int(rng.integers(1, row.shots + 1))
+            send = clock + np.concatenate([[0.0], np.cumsum(row.gaps[:length - 1] * 1000.0)])
+            delay = latency_ms + np.abs(rng.normal(0.0, jitter_ms, length))
+            for t in send + delay:
+                received = max(received, int(t))
+                yield received, player, "shot", row.weapon, row.mode
+            clock = float(send[-1]) + rng.uniform(300, 3000)
+            if rng.random() < 0.05:
+                received = max(received, int(clock))
+                yield received, player, "died", "", ""
+
+    streams = [list(player_events(f"player{p}")) for p in range(players)]
+    count = 0
+    with open_log(path, 'w') as f:
+        writer = csv.writer(f)
+        writer.writerow(LOG_FIELDS)
+        for event in heapq.merge(*streams, key=lambda e: e[0]):
+            writer.writerow(event)
+            count += 1
+    return count
+
+
+# =============================================================================
+# REPORT
+# =============================================================================
+def setting_label(grid: dict, g: int) -> str:
+    return " ".join(f"{int(grid[p][g]):>7}" for p in GRID_PARAMS)
+
+
+def print_report(engine: GridReplay, grid: dict, baseline: int, top: int):
+    totals = engine.totals()
+    shots = max(totals["shots"], 1)
+    print(f"\n{'Setting':>7}  " + " ".join(f"{GRID_LABELS[p]:>7}" for p in GRID_PARAMS)
+          + f"  {'Viol/1k':>8} {'Warns':>7} {'Kicks':>6} {'Kicked':>6}")
+    order = np.lexsort((totals["violations"], totals["kicks"]))
+    for g in order:
+        marker = "*" if g == baseline else " "
+        print(f"{g:>6}{marker}  {setting_label(grid, g)}  {1000 * totals['violations'][g] / shots:8.2f} "
+              f"{totals['warns'][g]:7d} {totals['kicks'][g]:6d} {totals['kicked_players'][g]:6d}")
+
+    print(f"\nPer weapon/mode at setting {baseline} (* = current ValidationConfig)")
+    keys = sorted(engine.shots, key=lambda k: (-engine.violations[k][baseline], k))
+    print(f"  {'Weapon':<26} {'Mode':<6} {'Shots':>8} {'Viol/1k':>8} {'Warns':>6} {'Kicks':>6}")
+    for key in keys[:top]:
+        n = engine.shots[key]
+        print(f"  {key[0]:<26} {key[1]:<6} {n:8d} {1000 * engine.violations[key][baseline] / max(n, 1):8.2f} "
+              f"{engine.warns[key][baseline]:6d} {engine.kicks[key][baseline]:6d}")
+
+
+def write_report(engine: GridReplay, grid: dict, path: str):
+    """CSV: one row per setting x weapon x mode"""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["setting"] + GRID_PARAMS + ["weapon", "mode", "shots", "violations", "warns", "kicks"])
+        for g in range(engine.size):
+            params = [int(grid[p][g]) for p in GRID_PARAMS]
+            for key in sorted(engine.shots):
+                writer.writerow([g] + params + [key[0], key[1], engine.shots[key], int(engine.violations[key][g]),
+                                                int(engine.warns[key][g]), int(engine.kicks[key][g])])
+
+
+def parse_grid_args(values: list) -> dict:
+    overrides = {}
+    for item in values or []:
+        param, _, numbers = item.partition("=")
+        if param not in GRID_PARAMS:
+            raise SystemExit(f"Unknown grid parameter {param!r} (one of {', '.join(GRID_PARAMS)})")
+        overrides[param] = [int(float(n)) for n in numbers.split(",") if n]
+    return overrides
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Replay shot logs through ValidateShot over a threshold grid")
+    parser.add_argument("log", nargs="?", help="Shot log (.csv or .csv.gz)")
+    parser.add_argument("--root", default=BASE_PATH, help="Project root")
+    parser.add_argument("--grid", action="append", metavar="PARAM=V1,V2",
+                        help=f"Values to try for one of: {', '.join(GRID_PARAMS)} (repeatable)")
+    parser.add_argument("--no-thresholds", action="store_true",
+                        help="Ignore the generated per-weapon limits (globals for every weapon)")
+    parser.add_argument("--check", action="store_true", help="Verify the grid replay against the line-by-line port")
+    parser.add_argument("--check-batches", action="store_true",
+                        help="Verify batched telemetry verdicts against per-shot ValidateShot")
+    parser.add_argument("--top", type=int, default=20, help="Weapon/mode rows to print")
+    parser.add_argument("--output", type=str, help="Write per setting x weapon x mode CSV")
+    parser.add_argument("--synthesize", metavar="LOG", help="Write a synthetic legit-play log and exit")
+    parser.add_argument("--players", type=int, default=100, help="Players for --synthesize")
+    parser.add_argument("--strings", type=int, default=40, help="Strings per player for --synthesize")
+    parser.add_argument("--jitter", type=float, default=25.0,
+                        help="Network jitter (ms) for --synthesize and --check-batches")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for --synthesize and --check-batches")
+    args = parser.parse_args()
+
+    if args.synthesize:
+        count = synthesize_log(args.synthesize, args.root, args.players, args.strings, args.seed,
+                               jitter_ms=args.jitter)
+        print(f"Written: {args.synthesize} ({count:,} events)")
+        return
+    if not args.log:
+        parser.print_help()
+        return
+
+    config = read_validation_config(args.root)
+    grid = build_grid(config, parse_grid_args(args.grid))
+    current = np.all([grid[p] == config[p] for p in GRID_PARAMS], axis=0)
+    baseline = int(np.argmax(current)) if current.any() else 0
+    hash_names = weapon_hash_names(args.root)
+    thresholds = {} if args.no_thresholds else read_fire_thresholds(args.root)
+    if thresholds:
+        print(f"Per-weapon limits: {len(thresholds)} weapons ({THRESHOLDS_LUA})")
+
+    start = time.perf_counter()
+    engine = replay(args.log, grid, config, hash_names, thresholds)
+    elapsed = time.perf_counter() - start
+    totals = engine.totals()
+    print(f"Replay: {totals['shots']:,} shots, {len(engine.shots)} weapon/mode pairs, "
+          f"{engine.size} settings in {elapsed:.2f}s")
+    print_report(engine, grid, baseline, args.top)
+
+    if args.output:
+        write_report(engine, grid, args.output)
+        print(f"\nWritten: {args.output}")
+
+    if args.check:
+        print("\nChecking against the line-by-line ValidateShot port...")
+        mismatches = check_against_reference(args.log, grid, config, engine, hash_names, thresholds)
+        print(f"  {'✓ all' if not mismatches else f'✗ {mismatches} of'} {engine.size} settings "
+              f"{'match' if not mismatches else 'differ'}")
+
+    if args.check_batches:
+        telemetry = lua_config.selectivefire_config(args.root)["Telemetry"]
+        print(f"\nChecking batched telemetry (FlushInterval {telemetry['FlushInterval']} ms, "
+              f"MaxBatch {telemetry['MaxBatch']}) against per-shot ValidateShot...")
+        mismatches, shot_events, batch_events, flagged = check_batches(
+            args.log, grid, config, telemetry, hash_names, thresholds, args.jitter, args.seed)
+        print(f"  {'✓ all' if not mismatches else f'✗ {mismatches} of'} {engine.size} settings "
+              f"{'give identical shot verdicts, no batch flagged' if not mismatches else 'differ'}")
+        print(f"  Shot events: {shot_events:,} per shot -> {batch_events:,} batched "
+              f"(x{shot_events / max(batch_events, 1):.1f} fewer, {flagged} batches flagged)")
+
+
+if __name__ == "__main__":
+    main()
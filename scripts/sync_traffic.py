@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Ammo-Type Sync Traffic Model (free-bullets cl_sync.lua)
+
+Estimates the network and state-bag load of ammo-type replication per
+player count, for the legacy sync path and the current one, so the
+difference can be checked before rollout:
+- Legacy: SetAmmoType wrote the replicated ammo_<hash> key from the client
+  AND sent ammo:setAmmoType (the server then wrote the key again); a 500 ms
+  loop re-wrote keys on weapon change; a 250 ms loop set currentCaliber /
+  currentAmmoType every tick; one AddStateBagChangeHandler(nil, 'player')
+  ran for every key of every player
+- Current: ammo:setAmmoType is the only upstream message and the server's
+  key write the only replicated copy; all writes are change-only and the
+  handlers are filtered to our own ammo keys (one poll loop, interval read
+  from cl_sync.lua)
+
+Per-player behaviour (ammo changes, weapon switches, first equips) is an
+input; message sizes are built from the real event/key names, the weapon
+hashes and the ammo type names in the free-bullets config. Packet overhead
+is an estimate (PACKET_OVERHEAD); relative savings do not depend on it.
+
+Usage:
+    python sync_traffic.py
+    python sync_traffic.py --players 32 64 128 --changes-per-min 2 --switches-per-min 4
+"""
+
+import os
+import re
+from dataclasses import dataclass
+
+import lua_config
+
+BASE_PATH = "/home/user/project_pipes"
+
+SYNC_LUA = "free-bullets/client/cl_sync.lua"
+POLL_INTERVAL_PATTERN = re.compile(r'WEAPON_POLL_INTERVAL\s*=\s*(\d+)')
+
+# Legacy loop intervals (ms)
+LEGACY_EQUIP_INTERVAL = 500
+LEGACY_CURRENT_INTERVAL = 250
+LEGACY_CURRENT_KEYS = 2           # currentCaliber + currentAmmoType per tick
+
+PACKET_OVERHEAD = 40              # IP/UDP + ENet command + message type (estimate, bytes)
+EVENT_NAME = "ammo:setAmmoType"
+
+DEFAULT_PLAYERS = [16, 32, 64, 128, 256]
+
+
+# =============================================================================
+# MESSAGE SIZES
+# =============================================================================
+def msgpack_str(length: int) -> int:
+    return length + (1 if length < 32 else 2 if length < 256 else 3)
+
+
+def msgpack_int(value: int) -> int:
+    return 1 if -32 <= value < 128 else 3 if -32768 <= value < 32768 else 5
+
+
+@dataclass
+class MessageSizes:
+    event: float          # ammo:setAmmoType (client -> server)
+    bag_update: float     # ammo_<hash> state bag update (either direction)
+
+
+def message_sizes(root: str, server_id_digits: int = 3) -> MessageSizes:
+    """Average on-wire sizes for the tree's weapons and ammo types"""
+    config = lua_config.free_bullets_config(root)
+    hashes = [lua_config.joaat(name) for name in config.get("Weapons") or {}] or [0]
+    ammo_types = [t for types in (config.get("AmmoTypes") or {}).values() for t in types] or ["fmj"]
+
+    hash_int = sum(msgpack_int(h) for h in hashes) / len(hashes)
+    hash_text = sum(len(str(h)) for h in hashes) / len(hashes)
+    ammo = sum(msgpack_str(len(t)) for t in ammo_types) / len(ammo_types)
+
+    event = PACKET_OVERHEAD + msgpack_str(len(EVENT_NAME)) + 1 + hash_int + ammo
+    bag_name = msgpack_str(len("player:") + server_id_digits)
+    key = msgpack_str(int(len("ammo_") + hash_text))
+    return MessageSizes(event=event, bag_update=PACKET_OVERHEAD + bag_name + key + ammo)
+
+
+# =============================================================================
+# MODEL
+# =============================================================================
+@dataclass
+class Behaviour:
+    changes: float        # Ammo-type changes per player per second
+    switches: float       # Weapon switches per player per second
+    first_equips: float   # Equips of a weapon the server has no type for, per second
+
+
+@dataclass
+class Traffic:
+    upstream: float       # Messages/s into the server
+    downstream: float     # Messages/s out of the server
+    bytes: float          # Bytes/s, both directions
+    handler_calls: float  # Lua state-bag handler calls/s per client
+    local_writes: float   # Non-replicated state-bag writes/s per client
+
+
+def legacy_traffic(players: int, b: Behaviour, sizes: MessageSizes) -> Traffic:
+    n = players
+    # Per change: client key write (-> server -> other clients) + event + server key write (-> all)
+    up = n * (b.changes * 2 + b.first_equips)
+    down = n * (b.changes * ((n - 1) + n) + b.first_equips * (n - 1))
+    up_bytes = n * (b.changes * (sizes.bag_update + sizes.event) + b.first_equips * sizes.bag_update)
+    local_writes = 1000.0 / LEGACY_CURRENT_INTERVAL * LEGACY_CURRENT_KEYS
+    # The unfiltered handler sees every player-bag update this client receives, plus its own local writes
+    handler = local_writes + (down / n) + b.changes + b.first_equips
+    return Traffic(up, down, up_bytes + down * sizes.bag_update, handler, local_writes)
+
+
+def current_traffic(players: int, b: Behaviour, sizes: MessageSizes) -> Traffic:
+    n = players
+    requests = b.changes + b.first_equips
+    up = n * requests
+    down = n * requests * n
+    # Switches change caliber and type at most; ammo changes only the type
+    local_writes = b.switches * LEGACY_CURRENT_KEYS + b.changes
+    # Only our own watched ammo_ keys reach Lua
+    return Traffic(up, down, up * sizes.event + down * sizes.bag_update, requests, local_writes)
+
+
+def read_poll_interval(root: str) -> int:
+    """WEAPON_POLL_INTERVAL of cl_sync.lua (ms)"""
+    with open(os.path.join(root, SYNC_LUA), 'r', encoding='utf-8') as f:
+        match = POLL_INTERVAL_PATTERN.search(f.read())
+    if not match:
+        raise ValueError(f"{SYNC_LUA}: WEAPON_POLL_INTERVAL not found")
+    return int(match.group(1))
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Estimate ammo-type sync traffic, legacy vs current")
+    parser.add_argument("--root", default=BASE_PATH, help="Project root")
+    parser.add_argument("--players", type=int, nargs="+", default=DEFAULT_PLAYERS, help="Player counts")
+    parser.add_argument("--changes-per-min", type=float, default=1.0, help="Ammo-type changes per player")
+    parser.add_argument("--switches-per-min", type=float, default=3.0, help="Weapon switches per player")
+    parser.add_argument("--first-equips-per-min", type=float, default=0.2,
+                        help="Equips of a weapon without a synced type, per player")
+    args = parser.parse_args()
+
+    behaviour = Behaviour(args.changes_per_min / 60.0, args.switches_per_min / 60.0,
+                          min(args.first_equips_per_min, args.switches_per_min) / 60.0)
+    sizes = message_sizes(args.root)
+    poll = read_poll_interval(args.root)
+
+    print("Ammo-type sync traffic model")
+    print(f"  Loops:     legacy {LEGACY_EQUIP_INTERVAL} ms equip + {LEGACY_CURRENT_INTERVAL} ms current-ammo; "
+          f"current one {poll} ms poll (change-only)")
+    print(f"  Per player/min: {args.changes_per_min:g} ammo changes, {args.switches_per_min:g} switches, "
+          f"{args.first_equips_per_min:g} first equips")
+    print(f"  Message sizes: event {sizes.event:.0f} B, state bag update {sizes.bag_update:.0f} B "
+          f"(incl. {PACKET_OVERHEAD} B overhead)")
+
+    print(f"\n  {'Players':>7}  {'':<8} {'Up msg/s':>9} {'Down msg/s':>11} {'KiB/s':>8} "
+          f"{'Handler/s':>10} {'Local/s':>8}")
+    for n in args.players:
+        legacy = legacy_traffic(n, behaviour, sizes)
+        current = current_traffic(n, behaviour, sizes)
+        for label, t in (("legacy", legacy), ("current", current)):
+            print(f"  {n if label == 'legacy' else '':>7}  {label:<8} {t.upstream:9.2f} {t.downstream:11.1f} "
+                  f"{t.bytes / 1024:8.2f} {t.handler_calls:10.2f} {t.local_writes:8.2f}")
+        saved = 1 - current.bytes / legacy.bytes if legacy.bytes else 0.0
+        print(f"  {'':>7}  {'saved':<8} {1 - current.upstream / legacy.upstream:9.0%} "
+              f"{1 - current.downstream / legacy.downstream:11.0%} {saved:8.0%} "
+              f"{1 - current.handler_calls / legacy.handler_calls:10.0%} "
+              f"{1 - current.local_writes / legacy.local_writes:8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Offline TTK Matrix Engine
+
+Time-to-kill for every weapon x ammo type x distance x armor level x hit
+region, computed offline from the same data the server uses:
+- Damage, TimeBetweenShots and BulletsInBatch from each weapon's meta
+- Config.AmmoModifiers, RangeFalloff, LimbDamage, ArmorDegradation and
+  SuppressorSynergy from free-bullets/shared/*.lua
+- Per-hit damage mirrors CalculateDamage in free-bullets/server/sv_damage.lua
+  (ammo mult -> range falloff -> limb mult -> suppressor -> armor, rounded)
+
+Target model: TARGET_HEALTH usable health plus an armor pool that absorbs
+damage first. While the pool is at or above the server's ArmorThreshold
+the armor multiplier applies, and every armored hit degrades integrity
+like DegradeArmor(). Shotgun pellets (BulletsInBatch) are separate damage
+events and all of them are assumed to hit, so shotgun TTK is a best case.
+
+The whole grid (millions of cells) is evaluated with NumPy array ops and
+written as a columnar .npz (or CSV for small grids).
+
+Usage:
+    python ttk_matrix.py --output ttk.npz
+    python ttk_matrix.py --distance 30 --armor 100 --ammo jhp
+
+Requires NumPy.
+"""
+
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+import lua_config
+import meta_index
+import weapon_meta
+from damage_model import (FULL_INTEGRITY, get_ammo_modifier, range_falloff, suppressor_damage_modifier,
+                          armor_degradation, effectiveness_table)
+
+BASE_PATH = "/home/user/project_pipes"
+
+# =============================================================================
+# SERVER CONSTANTS (DamageConfig in sv_damage.lua)
+# =============================================================================
+ARMOR_THRESHOLD = 10          # Minimum armor to count as "armored"
+
+# Target model
+TARGET_HEALTH = 100           # Usable player health (GTA 200 max, dead at 100)
+MAX_SHOTS = 40                # Cells needing more shots report -1
+
+# Default grid
+DISTANCES = np.arange(0, 201, 1, dtype=np.float64)
+ARMOR_LEVELS = [0, 25, 50, 75, 100]
+
+
+# =============================================================================
+# WEAPON DATA
+# =============================================================================
+@dataclass
+class WeaponRow:
+    """One weapon x ammo combination (the grid's first axis)"""
+    weapon: str
+    caliber: str
+    ammo: str
+    damage: float
+    time_between_shots: float
+    pellets: int
+    damage_mult: float
+    armor_mult: float
+    armor_bypass: bool
+    no_damage: bool
+    degradation: int
+    suppressor_mult: float
+    modifier_matched: bool
+
+
+def read_weapon_item(content: str, weapon_name: str) -> dict:
+    """Damage/TimeBetweenShots/BulletsInBatch of one CWeaponInfo item"""
+    info = weapon_meta.WeaponMetaFile(content).weapon(weapon_name)
+    if info is None:
+        return {}
+    values = {}
+    for tag in ("Damage", "TimeBetweenShots", "BulletsInBatch"):
+        value = info.get_float(tag)
+        if value is not None:
+            values[tag] = value
+    return values
+
+
+def load_weapon_rows(base_path: str, config: dict, verbose: bool = True) -> list:
+    """Every Config.Weapons entry with a meta, expanded over its caliber's ammo types"""
+    index = meta_index.get_index(base_path)
+    rows = []
+    missing = []
+    unmapped = set()
+
+    for weapon, info in config["Weapons"].items():
+        meta_path = index.find_by_name(weapon)
+        if not meta_path:
+            missing.append(weapon)
+            continue
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            stats = read_weapon_item(f.read(), weapon)
+        if "Damage" not in stats or "TimeBetweenShots" not in stats:
+            missing.append(weapon)
+            continue
+
+        caliber = info["caliber"]
+        for ammo_type in (config["AmmoTypes"].get(caliber) or {}):
+            modifier, matched = get_ammo_modifier(config, ammo_type, caliber)
+            if not matched:
+                unmapped.add(f"{caliber} {ammo_type}")
+            rows.append(WeaponRow(
+                weapon=weapon,
+                caliber=caliber,
+                ammo=ammo_type,
+                damage=stats["Damage"],
+                time_between_shots=stats["TimeBetweenShots"],
+                pellets=max(1, int(stats.get("BulletsInBatch", 1))),
+                damage_mult=modifier["damageMult"],
+                armor_mult=modifier["armorMult"],
+                armor_bypass=bool(modifier.get("armorBypass")),
+                no_damage=bool((modifier.get("effects") or {}).get("noDamage")),
+                degradation=armor_degradation(config, caliber, ammo_type),
+                suppressor_mult=suppressor_damage_modifier(config, caliber, ammo_type),
+                modifier_matched=matched,
+            ))
+
+    if verbose:
+        if missing:
+            print(f"  No meta/stats for: {', '.join(missing)}")
+        if unmapped:
+            print(f"  Ammo types using the generic modifier (no CaliberAmmoMap entry): "
+                  f"{', '.join(sorted(unmapped))}")
+    return rows
+
+
+# =============================================================================
+# GRID ENGINE
+# =============================================================================
+def hit_damage(pre_armor: np.ndarray, armored: np.ndarray, armor_mult: np.ndarray,
+               bypass: np.ndarray, effectiveness: np.ndarray) -> np.ndarray:
+    """Armor step + math.floor(damage + 0.5) of CalculateDamage()"""
+    effective_mult = 1.0 - ((1.0 - armor_mult) * effectiveness)
+    damage = np.where(armored & ~bypass, pre_armor * effective_mult, pre_armor)
+    return np.floor(damage + 0.5)
+
+
+def compute_matrix(rows: list, config: dict, distances: np.ndarray = DISTANCES,
+                   armor_levels: list = ARMOR_LEVELS, suppressed: bool = False) -> dict:
+    """
+    Evaluate the full grid. Returns columns (flattened, C order over
+    row x distance x armor x region) plus the axis labels.
+    """
+    regions = list(config["LimbDamage"]["damageMultipliers"])
+    limb_enabled = config["LimbDamage"].get("enabled")
+    region_mult = np.array([config["LimbDamage"]["damageMultipliers"][r] if limb_enabled else 1.0
+                            for r in regions])
+    effectiveness = effectiveness_table(config)
+    armor_levels = np.asarray(armor_levels, dtype=np.int64)
+
+    n_rows, n_dist, n_armor, n_region = len(rows), len(distances), len(armor_levels), len(regions)
+    shape = (n_rows, n_dist, n_armor, n_region)
+
+    def per_row(values):
+        return np.asarray(values)[:, None, None, None]
+
+    # Pre-armor damage in CalculateDamage() order
+    base = per_row([r.damage for r in rows]) * per_row([r.damage_mult for r in rows])
+    falloff = np.array([range_falloff(config, r.caliber, r.ammo, distances) for r in rows])
+    falloff = np.where(distances > 0, falloff, 1.0)[:, :, None, None]
+    pre_armor = base * falloff
+    pre_armor = pre_armor * region_mult[None, None, None, :]
+    if suppressed:
+        pre_armor = pre_armor * per_row([r.suppressor_mult for r in rows])
+    pre_armor = np.broadcast_to(pre_armor, shape)
+
+    armor_mult = per_row([r.armor_mult for r in rows])
+    bypass = per_row([r.armor_bypass for r in rows])
+    degradation = per_row([r.degradation for r in rows])
+    pellets = np.array([r.pellets for r in rows])
+    no_damage = per_row([r.no_damage for r in rows])
+
+    first_damage = hit_damage(pre_armor, (armor_levels >= ARMOR_THRESHOLD)[None, None, :, None],
+                              armor_mult, bypass, effectiveness[FULL_INTEGRITY])
+    first_damage = np.where(no_damage, 0.0, first_damage)
+
+    shots = np.full(shape, -1, dtype=np.int16)
+
+    # Simulate hit by hit; rows grouped by pellets per shot
+    for pellet_count in sorted(set(pellets)):
+        group = np.nonzero(pellets == pellet_count)[0]
+        pre = pre_armor[group]
+        g_armor_mult, g_bypass, g_degradation = armor_mult[group], bypass[group], degradation[group]
+        g_no_damage = no_damage[group]
+
+        health = np.full(pre.shape, float(TARGET_HEALTH))
+        armor = np.broadcast_to(armor_levels[None, None, :, None].astype(np.float64), pre.shape).copy()
+        integrity = np.full(pre.shape, FULL_INTEGRITY, dtype=np.int64)
+        group_shots = np.full(pre.shape, -1, dtype=np.int16)
+
+        for hit in range(pellet_count * MAX_SHOTS):
+            alive = group_shots < 0
+            if not alive.any():
+                break
+            armored = (armor >= ARMOR_THRESHOLD) & (armor > 0)
+            damage = hit_damage(pre, armored, g_armor_mult, g_bypass, effectiveness[integrity])
+            damage = np.where(g_no_damage | ~alive, 0.0, damage)
+
+            absorbed = np.minimum(armor, damage)
+            armor = armor - absorbed
+            health = health - (damage - absorbed)
+            integrity = np.where(armored & alive, np.maximum(0, integrity - g_degradation), integrity)
+
+            killed = alive & (health <= 0)
+            group_shots[killed] = hit // pellet_count + 1
+
+        shots[group] = group_shots
+
+    tbs = per_row([r.time_between_shots for r in rows])
+    ttk = np.where(shots > 0, (shots - 1) * tbs, np.nan).astype(np.float32)
+
+    row_idx, dist_idx, armor_idx, region_idx = np.indices(shape).reshape(4, -1)
+    weapons = sorted({r.weapon for r in rows})
+    ammo_types = sorted({r.ammo for r in rows})
+    weapon_code = np.array([weapons.index(r.weapon) for r in rows], dtype=np.int16)
+    ammo_code = np.array([ammo_types.index(r.ammo) for r in rows], dtype=np.int16)
+
+    return {
+        "weapon": weapon_code[row_idx],
+        "ammo": ammo_code[row_idx],
+        "distance": distances[dist_idx].astype(np.float32),
+        "armor": armor_levels[armor_idx].astype(np.int16),
+        "region": region_idx.astype(np.int8),
+        "damage": first_damage.reshape(-1).astype(np.int16),
+        "shots": shots.reshape(-1),
+        "ttk": ttk.reshape(-1),
+        "weapon_names": np.array(weapons),
+        "ammo_names": np.array(ammo_types),
+        "region_names": np.array(regions),
+    }
+
+
+def write_matrix(matrix: dict, path: str):
+    """Columnar .npz (codes + label arrays) or a flat CSV"""
+    if path.endswith(".csv"):
+        import csv
+        weapons, ammo, regions = matrix["weapon_names"], matrix["ammo_names"], matrix["region_names"]
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(["weapon", "ammo", "distance", "armor", "region", "damage", "shots", "ttk"])
+            for i in range(len(matrix["weapon"])):
+                writer.writerow([weapons[matrix["weapon"][i]], ammo[matrix["ammo"][i]],
+                                 f"{matrix['distance'][i]:g}", matrix["armor"][i],
+                                 regions[matrix["region"][i]], matrix["damage"][i],
+                                 matrix["shots"][i], f"{matrix['ttk'][i]:.3f}"])
+    else:
+        np.savez_compressed(path, **matrix)
+
+
+def print_slice(matrix: dict, distance: float, armor: int, ammo: str = None):
+    """Shots-to-kill table for one distance/armor level"""
+    names = matrix["weapon_names"]
+    ammo_names = matrix["ammo_names"]
+    regions = list(matrix["region_names"])
+    show = [r for r in ("head", "torso", "arm_right", "leg_right") if r in regions]
+
+    mask = (matrix["distance"] == distance) & (matrix["armor"] == armor)
+    if ammo:
+        if ammo not in ammo_names:
+            print(f"Unknown ammo type: {ammo}")
+            return
+        mask &= matrix["ammo"] == list(ammo_names).index(ammo)
+
+    table = {}
+    for i in np.nonzero(mask)[0]:
+        key = (names[matrix["weapon"][i]], ammo_names[matrix["ammo"][i]])
+        table.setdefault(key, {})[regions[matrix["region"][i]]] = (matrix["shots"][i], matrix["ttk"][i])
+
+    print(f"\nShots to kill @ {distance:g}m, armor {armor}" + (f", {ammo}" if ammo else ""))
+    print(f"  {'Weapon':<24} {'Ammo':<14}" + "".join(f"{r:>16}" for r in show))
+    for (weapon, ammo_type), cells in sorted(table.items()):
+        parts = []
+        for region in show:
+            shots, ttk = cells.get(region, (-1, np.nan))
+            parts.append(f"{'-' if shots < 0 else shots:>6} ({'' if shots < 0 else f'{ttk:.2f}s':>6})  ")
+        print(f"  {weapon:<24} {ammo_type:<14}" + "".join(parts))
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Offline TTK matrix from metas + free-bullets modifiers")
+    parser.add_argument("--root", default=BASE_PATH, help="Project root")
+    parser.add_argument("--output", type=str, help="Write the matrix (.npz columnar or .csv)")
+    parser.add_argument("--max-distance", type=float, default=DISTANCES[-1], help="Distance grid end (m)")
+    parser.add_argument("--step", type=float, default=1.0, help="Distance grid step (m)")
+    parser.add_argument("--suppressed", action="store_true", help="Weapons fitted with a suppressor")
+    parser.add_argument("--distance", type=float, help="Print shots-to-kill at this distance")
+    parser.add_argument("--armor", type=int, default=100, help="Armor level for --distance")
+    parser.add_argument("--ammo", type=str, help="Ammo type filter for --distance")
+    args = parser.parse_args()
+
+    config = lua_config.free_bullets_config(args.root)
+    rows = load_weapon_rows(args.root, config)
+
+    distances = np.arange(0, args.max_distance + args.step / 2, args.step)
+    if args.distance is not None and args.distance not in distances:
+        distances = np.sort(np.append(distances, args.distance))
+    armor_levels = sorted(set(ARMOR_LEVELS) | {args.armor})
+
+    start = time.perf_counter()
+    matrix = compute_matrix(rows, config, distances, armor_levels, args.suppressed)
+    elapsed = time.perf_counter() - start
+
+    cells = len(matrix["weapon"])
+    print(f"TTK matrix: {len(matrix['weapon_names'])} weapons, {len(rows)} weapon/ammo rows, "
+          f"{cells:,} cells in {elapsed:.2f}s")
+
+    if args.output:
+        write_matrix(matrix, args.output)
+        print(f"Written: {args.output}")
+
+    if args.distance is not None:
+        print_slice(matrix, args.distance, args.armor, args.ammo)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,13 +10,19 @@ Calculates weapon handling values based on:
 """
 
 import os
-import re
-import glob
 import xml.etree.ElementTree as ET
+from functools import partial
 from dataclasses import dataclass
 from typing import Optional
 import json
 
+import build_graph
+import meta_txn
+import parallel
+import weapon_registry
+from meta_patch import patched_file_content, format_value
+from meta_index import find_weapon_meta
+
 # =============================================================================
 # CALIBER MULTIPLIERS
 # =============================================================================
@@ -82,6 +88,14 @@ FLIP_TIER_SCALE = 0.10       # Additional per tier deviation
 FLIP_GLOBAL_MULTIPLIER = 1.50  # Global multiplier for flip - more dramatic muzzle rise
 FIRE_RATE_BASE_OFFSET = 0.30 # Base offset for fire rate
 
+# Tier deviation from standard: standard = 0, quality/match = negative, worn = positive
+TIER_OFFSETS = {
+    "worn": 1.0,
+    "standard": 0.0,
+    "quality": -0.4,
+    "match": -0.6,
+}
+
 # =============================================================================
 # FLOOR/CEILING VALUES - Ensures values stay in perceptible/reasonable range
 # =============================================================================
@@ -115,6 +129,11 @@ RECOVERY_BASELINE = 1.50           # Recovery value considered "normal"
 ACCURACY_RECOVERY_FACTOR = 0.80    # How much recovery affects accuracy spread
 ACCURACY_MAX_RECOVERY_FACTOR = 1.20  # How much recovery affects max accuracy penalty
 
+# =============================================================================
+# META OUTPUT FORMAT - All handgun handling values are written at full precision
+# =============================================================================
+META_FORMAT = ".6f"
+
 # =============================================================================
 # PARAMETER RANGES BY CALIBER (with 4x perception multiplier applied)
 # =============================================================================
@@ -296,150 +315,29 @@ class WeaponSpec:
 
 
 # =============================================================================
-# WEAPON DEFINITIONS - BATCH 1 (Compact 9mm)
+# WEAPON DEFINITIONS (weapon_registry.json)
 # =============================================================================
-BATCH1_WEAPONS = [
-    WeaponSpec("g26", "9mm", "standard", False, 26.0, "Glock 26 subcompact"),
-    WeaponSpec("g26_switch", "9mm", "standard", True, 26.0, "Glock 26 with auto sear"),
-    WeaponSpec("g43x", "9mm", "quality", False, 23.0, "Glock 43X slim"),
-    WeaponSpec("gx4", "9mm", "standard", False, 22.0, "Taurus GX4"),
-    WeaponSpec("hellcat", "9mm", "quality", False, 18.0, "Springfield Hellcat"),
-]
-
-# =============================================================================
-# WEAPON DEFINITIONS - BATCH 3 (.45 ACP)
-# =============================================================================
-BATCH3_WEAPONS = [
-    WeaponSpec("g21", "45_acp", "standard", False, 38.0, "Glock 21 full size"),
-    WeaponSpec("g30", "45_acp", "standard", False, 34.0, "Glock 30 compact"),
-    WeaponSpec("g41", "45_acp", "quality", False, 36.0, "Glock 41 competition"),
-    WeaponSpec("junk1911", "45_acp", "worn", False, 39.0, "Worn/neglected 1911"),
-    WeaponSpec("kimber1911", "45_acp", "quality", False, 38.0, "Kimber Custom"),
-    WeaponSpec("kimber_eclipse", "45_acp", "match", False, 38.0, "Kimber Eclipse Target"),
-    WeaponSpec("m45a1", "45_acp", "match", False, 40.0, "USMC M45A1 MEUSOC"),
-]
-
-# =============================================================================
-# WEAPON DEFINITIONS - BATCH 2 (Full-Size 9mm)
-# =============================================================================
-BATCH2_WEAPONS = [
-    WeaponSpec("fn509", "9mm", "quality", False, 26.9, "FN 509"),
-    WeaponSpec("g17", "9mm", "standard", False, 32.0, "Glock 17 Gen4"),
-    WeaponSpec("g17_blk", "9mm", "standard", False, 32.0, "Glock 17 Black"),
-    WeaponSpec("g17_gen5", "9mm", "quality", False, 32.0, "Glock 17 Gen5"),
-    WeaponSpec("g19", "9mm", "standard", False, 30.0, "Glock 19"),
-    WeaponSpec("g19x", "9mm", "quality", False, 31.0, "Glock 19X"),
-    WeaponSpec("g19x_switch", "9mm", "quality", True, 31.0, "Glock 19X with auto sear"),
-    WeaponSpec("g19xd", "9mm", "quality", False, 31.0, "Glock 19X Desert"),
-    WeaponSpec("g45", "9mm", "quality", False, 30.0, "Glock 45"),
-    WeaponSpec("g45_tan", "9mm", "quality", False, 30.0, "Glock 45 Tan"),
-    WeaponSpec("m9", "9mm", "standard", False, 33.0, "Beretta M9"),
-    WeaponSpec("m9a3", "9mm", "quality", False, 33.0, "Beretta M9A3"),
-    WeaponSpec("p320", "9mm", "quality", False, 29.5, "Sig P320"),
-    WeaponSpec("px4", "9mm", "standard", False, 27.0, "Beretta PX4 Storm"),
-    WeaponSpec("tp9sf", "9mm", "standard", False, 28.0, "Canik TP9SF"),
-]
-
-# =============================================================================
-# WEAPON DEFINITIONS - BATCH 4 (.40 S&W)
-# =============================================================================
-BATCH4_WEAPONS = [
-    WeaponSpec("bg_menace", "40_sw", "worn", False, 26.0, "Budget .40 pistol"),
-    WeaponSpec("g22_gen4", "40_sw", "standard", False, 34.0, "Glock 22 Gen4"),
-    WeaponSpec("g22_gen5", "40_sw", "quality", False, 34.0, "Glock 22 Gen5"),
-]
-
-# =============================================================================
-# WEAPON DEFINITIONS - BATCH 5 (.357 Magnum)
-# =============================================================================
-BATCH5_WEAPONS = [
-    WeaponSpec("kingcobra", "357_mag", "quality", False, 42.0, "Colt King Cobra"),
-    WeaponSpec("kingcobra_snub", "357_mag", "standard", False, 28.0, "Colt King Cobra Snub"),
-    WeaponSpec("kingcobra_target", "357_mag", "match", False, 45.0, "Colt King Cobra Target"),
-    WeaponSpec("python", "357_mag", "match", False, 46.0, "Colt Python"),
-    WeaponSpec("sw_model15", "357_mag", "worn", False, 36.0, "S&W Model 15 worn"),
-]
-
-# =============================================================================
-# WEAPON DEFINITIONS - BATCH 6 (Heavy Magnums - .44 Mag / .500 S&W)
-# =============================================================================
-BATCH6_WEAPONS = [
-    WeaponSpec("ragingbull", "44_mag", "standard", False, 53.0, "Taurus Raging Bull .44"),
-    WeaponSpec("sw500", "500_sw", "standard", False, 72.0, "S&W 500"),
-    WeaponSpec("sw_657", "44_mag", "quality", False, 48.0, "S&W 657 .41 Mag"),
-    WeaponSpec("sw_model29", "44_mag", "match", False, 47.0, "S&W Model 29"),
-]
-
-# =============================================================================
-# WEAPON DEFINITIONS - BATCH 7 (5.7x28mm)
-# =============================================================================
-BATCH7_WEAPONS = [
-    WeaponSpec("fn57", "5.7x28", "quality", False, 22.9, "FN Five-seveN"),
-    WeaponSpec("ruger57", "5.7x28", "standard", False, 24.5, "Ruger-57"),
-]
-
-# =============================================================================
-# WEAPON DEFINITIONS - BATCH 8 (.22 LR)
-# =============================================================================
-BATCH8_WEAPONS = [
-    WeaponSpec("fn502", "22_lr", "quality", False, 24.0, "FN 502"),
-    WeaponSpec("p22", "22_lr", "standard", False, 17.0, "Walther P22"),
-    WeaponSpec("pmr30", "22_lr", "quality", False, 19.0, "Kel-Tec PMR-30"),
-    WeaponSpec("sig_p22", "22_lr", "standard", False, 18.0, "Sig P22"),
-]
+def registry_specs(batch: Optional[int] = None) -> list:
+    """WeaponSpecs for the registry's handgun-calculator weapons, in batch order"""
+    registry = weapon_registry.load()
+    return [
+        WeaponSpec(e.key, e.handling_caliber, e.tier, e.fire_mode == "auto", e.weight_oz, e.notes)
+        for e in registry.select(batch=batch, calculator="handgun")
+    ]
 
-# =============================================================================
-# WEAPON DEFINITIONS - BATCH 9 (Pocket Pistols - .25/.380)
-# =============================================================================
-BATCH9_WEAPONS = [
-    WeaponSpec("coltjunior", "380_acp", "worn", False, 12.0, "Colt Junior .25"),
-    WeaponSpec("sigp238", "380_acp", "quality", False, 15.0, "Sig P238"),
-    WeaponSpec("waltherp88", "9mm", "quality", False, 31.0, "Walther P88"),
-    WeaponSpec("waltherppk", "380_acp", "standard", False, 21.0, "Walther PPK"),
-]
 
-# =============================================================================
-# WEAPON DEFINITIONS - BATCH 10 (10mm)
-# =============================================================================
-BATCH10_WEAPONS = [
-    WeaponSpec("glock20", "10mm", "standard", False, 39.0, "Glock 20"),
-]
-
-# =============================================================================
-# WEAPON DEFINITIONS - BATCH 11 (Mixed 9mm / .45 ACP)
-# =============================================================================
-BATCH11_WEAPONS = [
-    WeaponSpec("bluearp", "9mm", "quality", False, 29.0, "Blue ARP"),
-    WeaponSpec("psadagger", "9mm", "standard", False, 27.0, "PSA Dagger"),
-    WeaponSpec("px4storm", "9mm", "standard", False, 27.5, "Beretta PX4 Storm"),
-    WeaponSpec("rugersr9", "9mm", "standard", False, 27.0, "Ruger SR9"),
-    WeaponSpec("sigp210", "9mm", "match", False, 37.0, "Sig P210"),
-    WeaponSpec("sigp220", "45_acp", "quality", False, 35.0, "Sig P220"),
-    WeaponSpec("sigp226", "9mm", "quality", False, 34.0, "Sig P226"),
-    WeaponSpec("sigp226elite", "9mm", "match", False, 34.0, "Sig P226 Elite"),
-    WeaponSpec("sigp226mk25", "9mm", "quality", False, 34.0, "Sig P226 MK25"),
-    WeaponSpec("sigp229", "9mm", "quality", False, 32.0, "Sig P229"),
-    WeaponSpec("sigp320", "9mm", "quality", False, 29.5, "Sig P320"),
-    WeaponSpec("udp9", "9mm", "quality", False, 26.0, "Angstadt UDP-9"),
-]
-
-# =============================================================================
-# WEAPON DEFINITIONS - BATCH 20 (.38 Special Revolvers)
-# =============================================================================
-BATCH20_WEAPONS = [
-    # S&W Model 60 - 3" J-Frame, premium with adjustable sights
-    WeaponSpec("sw_model60", "38_special", "quality", False, 24.5, "S&W Model 60"),
-    # S&W Model 10 - 4" K-Frame, police service revolver
-    WeaponSpec("sw_model10", "38_special", "quality", False, 34.4, "S&W Model 10"),
-    # S&W Model 442 - Airweight DAO snub, black
-    WeaponSpec("sw_model442", "38_special", "standard", False, 14.7, "S&W Model 442"),
-    # S&W Model 642 - Airweight DAO snub, stainless
-    WeaponSpec("sw_model642", "38_special", "standard", False, 14.6, "S&W Model 642"),
-    # Ruger LCR - Modern polymer/aluminum DAO, lightest
-    WeaponSpec("ruger_lcr", "38_special", "quality", False, 13.5, "Ruger LCR"),
-    # Taurus Defender 856 - Budget 6-shot, night sights
-    WeaponSpec("taurus_defender856", "38_special", "standard", False, 23.5, "Taurus Defender 856"),
-]
+def load_batch_configs(base_path: str) -> dict:
+    """{batch: {path, weapons, name}} for every batch with handgun-calculator weapons"""
+    registry = weapon_registry.load()
+    return {
+        batch_id: {
+            "path": registry.batch_path(batch_id, base_path),
+            "weapons": registry_specs(batch_id),
+            "name": registry.batches[batch_id].title,
+        }
+        for batch_id in sorted(registry.batches)
+        if registry.select(batch=batch_id, calculator="handgun")
+    }
 
 
 def normalize_caliber(caliber: str) -> str:
@@ -498,9 +396,7 @@ def clamp_value(value: float, param: str) -> float:
 
 def calculate_tier_offset(quality_tier: str) -> float:
     """Calculate how far from standard this tier is (for proportional offsets)"""
-    # standard = 0, quality/match = negative, worn = positive
-    tier_values = {"worn": 1.0, "standard": 0.0, "quality": -0.4, "match": -0.6}
-    return tier_values.get(quality_tier, 0.0)
+    return TIER_OFFSETS.get(quality_tier, 0.0)
 
 
 def calculate_weapon_values(spec: WeaponSpec) -> dict:
@@ -616,86 +512,97 @@ def generate_reference_table(weapons: list[WeaponSpec], batch_name: str) -> str:
     return "\n".join(lines)
 
 
-def update_weapon_meta(file_path: str, values: dict) -> bool:
-    """Update a weapon meta file with new handling values"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        original_content = content
-
-        # Update each parameter
-        for param, value in values.items():
-            # Handle different value formats
-            if param == "TimeBetweenShots":
-                pattern = rf'(<{param} value=")[^"]*(")'
-                replacement = rf'\g<1>{value:.6f}\2'
-            elif param == "IkRecoilDisplacement":
-                pattern = rf'(<{param} value=")[^"]*(")'
-                replacement = rf'\g<1>{value:.6f}\2'
-            else:
-                pattern = rf'(<{param} value=")[^"]*(")'
-                replacement = rf'\g<1>{value:.6f}\2'
-
-            content = re.sub(pattern, replacement, content)
-
-        if content != original_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            return True
-        return False
-    except Exception as e:
-        print(f"Error updating {file_path}: {e}")
-        return False
+# =============================================================================
+# BUILD GRAPH INPUTS (build_graph.py)
+# =============================================================================
+BUILD_TOOL = "weapon_calc"
+
+# Scalar constants every weapon's calculation reads
+SHARED_CONSTANTS = [
+    "SHAKE_BASE_OFFSET", "SHAKE_TIER_SCALE", "FLIP_BASE_OFFSET", "FLIP_TIER_SCALE",
+    "FLIP_GLOBAL_MULTIPLIER", "FIRE_RATE_BASE_OFFSET", "RECOVERY_FIRE_RATE_FACTOR",
+    "RECOVERY_BASELINE", "ACCURACY_RECOVERY_FACTOR", "ACCURACY_MAX_RECOVERY_FACTOR",
+]
+
+
+def build_inputs(spec: WeaponSpec) -> dict:
+    """Hashed inputs of a weapon's values: spec row, the constants it reads, formula version"""
+    caliber = normalize_caliber(spec.caliber)
+    switch = spec.is_switch and caliber in SWITCH_RANGES
+    constants = {
+        "shared": {name: globals()[name] for name in SHARED_CONSTANTS},
+        "floors": VALUE_FLOORS,
+        "ceilings": VALUE_CEILINGS,
+        "ranges": SWITCH_RANGES[caliber] if switch else PARAMETER_RANGES.get(caliber),
+        "quality": QUALITY_TIERS.get(spec.quality_tier),
+        "tier_offset": TIER_OFFSETS.get(spec.quality_tier, 0.0),
+    }
+    if spec.quality_tier == "worn" and not switch:
+        constants["worn"] = WORN_ACCURACY_MULTIPLIER
+    return {
+        "spec": build_graph.digest([spec.caliber, spec.quality_tier, spec.is_switch, spec.weight_oz]),
+        "constants": build_graph.digest(constants),
+        "template": build_graph.digest([
+            build_graph.source_digest(calculate_weapon_values, normalize_caliber, calculate_weight_factor,
+                                      interpolate_value, clamp_value, calculate_tier_offset),
+            META_FORMAT,
+        ]),
+    }
 
 
 def find_weapon_meta_file(base_path: str, weapon_name: str) -> Optional[str]:
     """Find the weapon meta file for a given weapon.
 
-    Handles naming variations:
+    Resolved through the persistent meta index (meta_index.py), which covers
+    every naming variation:
     - weapon_{name}/meta/weapon_{name}.meta (standard)
     - weapon_{name}/meta/weapon_{name_no_underscores}.meta
     - {name}/meta/weapons.meta (batch 20 style)
     """
-    # Try standard format: weapon_{name}/meta/weapon_{name}.meta
-    weapon_dir = f"weapon_{weapon_name}"
-    meta_file = f"weapon_{weapon_name}.meta"
-    full_path = os.path.join(base_path, weapon_dir, "meta", meta_file)
-
-    if os.path.exists(full_path):
-        return full_path
-
-    # Fallback 1: search for any weapon_*.meta file in weapon_{name} directory
-    meta_dir = os.path.join(base_path, weapon_dir, "meta")
-    if os.path.isdir(meta_dir):
-        matches = glob.glob(os.path.join(meta_dir, "weapon_*.meta"))
-        if len(matches) == 1:
-            return matches[0]
-
-    # Fallback 2: try {name}/meta/weapons.meta (batch 20 style without weapon_ prefix)
-    alt_dir = weapon_name
-    alt_path = os.path.join(base_path, alt_dir, "meta", "weapons.meta")
-    if os.path.exists(alt_path):
-        return alt_path
-
-    # Fallback 3: search for any .meta file in {name}/meta directory
-    alt_meta_dir = os.path.join(base_path, alt_dir, "meta")
-    if os.path.isdir(alt_meta_dir):
-        matches = glob.glob(os.path.join(alt_meta_dir, "weapon*.meta"))
-        if len(matches) == 1:
-            return matches[0]
-
-    return None
-
-
-def process_batch(batch_path: str, weapons: list[WeaponSpec], dry_run: bool = True) -> dict:
-    """Process all weapons in a batch"""
+    return find_weapon_meta(base_path, weapon_name)
+
+
+def apply_weapon(spec: WeaponSpec, meta_path: str, dry_run: bool) -> tuple:
+    """
+    Worker: (values, new content or None, error) for one weapon. The
+    caller stages the write, so pool workers never touch the tree.
+    """
+    values = calculate_weapon_values(spec)
+    if dry_run:
+        return values, None, None
+    try:
+        return values, patched_file_content(meta_path, values, default_format=META_FORMAT), None
+    except Exception as e:
+        return values, None, f"Error updating {meta_path}: {e}"
+
+
+def record_weapon(graph: build_graph.BuildGraph, spec: WeaponSpec, meta_path: str,
+                  inputs: dict, values: dict):
+    """Store a written weapon in the build graph (runs once its write has landed)"""
+    expected = {p: format_value(p, v, default_format=META_FORMAT) for p, v in values.items()}
+    if not graph.record(BUILD_TOOL, meta_path, spec.name, inputs, expected):
+        print(f"  ⚠ {spec.name}: values not written")
+
+
+def process_batch(batch_path: str, weapons: list[WeaponSpec], dry_run: bool = True,
+                  force: bool = False, executor: Optional[parallel.OrderedExecutor] = None) -> dict:
+    """
+    Process all weapons in a batch. Weapons whose build-graph inputs and
+    written values are unchanged are listed under "current" and skipped
+    (force=True recomputes everything). Per-weapon work runs on the
+    executor (serial if None); results are collected in roster order.
+    Writes go through meta_txn: staged into the open transaction (graph
+    records follow its commit), else each file is replaced atomically.
+    """
     results = {
         "updated": [],
+        "current": [],
         "skipped": [],
         "errors": [],
     }
+    graph = build_graph.get_graph(os.path.dirname(os.path.abspath(batch_path)))
 
+    tasks = []
     for spec in weapons:
         meta_path = find_weapon_meta_file(batch_path, spec.name)
 
@@ -703,24 +610,41 @@ def process_batch(batch_path: str, weapons: list[WeaponSpec], dry_run: bool = Tr
             results["errors"].append(f"{spec.name}: meta file not found")
             continue
 
-        values = calculate_weapon_values(spec)
+        inputs = build_inputs(spec)
+        if not force and not graph.stale(BUILD_TOOL, meta_path, spec.name, inputs):
+            results["current"].append(spec.name)
+            continue
+        tasks.append((spec, meta_path, inputs))
 
+    executor = executor or parallel.OrderedExecutor(workers=1)
+    outcomes = executor.starmap(apply_weapon, [(spec, meta_path, dry_run) for spec, meta_path, _ in tasks])
+
+    for (spec, meta_path, inputs), (values, new_content, error) in zip(tasks, outcomes):
+        if error:
+            print(error)
+            results["errors"].append(f"{spec.name}: values not written")
+            continue
         if dry_run:
             results["updated"].append({
                 "weapon": spec.name,
                 "path": meta_path,
                 "values": values,
             })
+            continue
+
+        if new_content is not None:
+            meta_txn.write_text(meta_path, new_content)
+        meta_txn.after_commit(partial(record_weapon, graph, spec, meta_path, inputs, values))
+        if new_content is not None:
+            results["updated"].append({
+                "weapon": spec.name,
+                "path": meta_path,
+                "values": values,
+            })
         else:
-            if update_weapon_meta(meta_path, values):
-                results["updated"].append({
-                    "weapon": spec.name,
-                    "path": meta_path,
-                    "values": values,
-                })
-            else:
-                results["skipped"].append(f"{spec.name}: no changes made")
+            results["skipped"].append(f"{spec.name}: no changes made")
 
+    meta_txn.after_commit(graph.save)
     return results
 
 
@@ -729,76 +653,18 @@ def main():
     import argparse
 
     parser = argparse.ArgumentParser(description="Weapon Handling Calculator")
-    parser.add_argument("--batch", type=int, help="Process specific batch (1 or 3)")
+    parser.add_argument("--batch", type=int, help="Process specific batch (registry batch id)")
     parser.add_argument("--apply", action="store_true", help="Apply changes (default is dry-run)")
     parser.add_argument("--reference", action="store_true", help="Generate reference tables only")
     parser.add_argument("--weapon", type=str, help="Calculate values for specific weapon")
+    parser.add_argument("--force", action="store_true", help="Recompute weapons the build graph marks up to date")
+    parser.add_argument("--root", default="/home/user/project_pipes", help="Project root")
+    parallel.add_workers_argument(parser)
     args = parser.parse_args()
 
-    base_path = "/home/user/project_pipes"
-
-    batch_configs = {
-        1: {
-            "path": os.path.join(base_path, "Batch1_Compact_9mm_Pistols"),
-            "weapons": BATCH1_WEAPONS,
-            "name": "Batch 1 - Compact 9mm Pistols",
-        },
-        2: {
-            "path": os.path.join(base_path, "Batch2_FullSize_9mm_Pistols"),
-            "weapons": BATCH2_WEAPONS,
-            "name": "Batch 2 - Full-Size 9mm Pistols",
-        },
-        3: {
-            "path": os.path.join(base_path, "batch3_45acp"),
-            "weapons": BATCH3_WEAPONS,
-            "name": "Batch 3 - .45 ACP Pistols",
-        },
-        4: {
-            "path": os.path.join(base_path, "batch4_40sw"),
-            "weapons": BATCH4_WEAPONS,
-            "name": "Batch 4 - .40 S&W Pistols",
-        },
-        5: {
-            "path": os.path.join(base_path, "batch5_357mag"),
-            "weapons": BATCH5_WEAPONS,
-            "name": "Batch 5 - .357 Magnum Revolvers",
-        },
-        6: {
-            "path": os.path.join(base_path, "batch6_magnums"),
-            "weapons": BATCH6_WEAPONS,
-            "name": "Batch 6 - Heavy Magnums",
-        },
-        7: {
-            "path": os.path.join(base_path, "batch7_57x28"),
-            "weapons": BATCH7_WEAPONS,
-            "name": "Batch 7 - 5.7x28mm Pistols",
-        },
-        8: {
-            "path": os.path.join(base_path, "batch8_22lr"),
-            "weapons": BATCH8_WEAPONS,
-            "name": "Batch 8 - .22 LR Pistols",
-        },
-        9: {
-            "path": os.path.join(base_path, "batch9_pocket_pistols"),
-            "weapons": BATCH9_WEAPONS,
-            "name": "Batch 9 - Pocket Pistols",
-        },
-        10: {
-            "path": os.path.join(base_path, "batch10_10mm"),
-            "weapons": BATCH10_WEAPONS,
-            "name": "Batch 10 - 10mm Pistols",
-        },
-        11: {
-            "path": os.path.join(base_path, "batch11"),
-            "weapons": BATCH11_WEAPONS,
-            "name": "Batch 11 - Mixed Pistols",
-        },
-        20: {
-            "path": os.path.join(base_path, "batch20_special"),
-            "weapons": BATCH20_WEAPONS,
-            "name": "Batch 20 - .38 Special Revolvers",
-        },
-    }
+    base_path = args.root
+
+    batch_configs = load_batch_configs(base_path)
 
     if args.reference:
         print("# Weapon Handling Reference Tables\n")
@@ -820,6 +686,12 @@ def main():
         print(f"Weapon '{args.weapon}' not found")
         return
 
+    # One pool for every batch (started lazily, only if there is work to spread)
+    executor = parallel.OrderedExecutor(args.workers)
+    # One transaction for the whole run: every meta lands together at the end
+    if args.apply:
+        meta_txn.begin(base_path)
+
     if args.batch:
         if args.batch not in batch_configs:
             print(f"Unknown batch: {args.batch}")
@@ -830,8 +702,11 @@ def main():
         print(f"Path: {config['path']}")
         print(f"Dry run: {not args.apply}\n")
 
-        results = process_batch(config["path"], config["weapons"], dry_run=not args.apply)
+        results = process_batch(config["path"], config["weapons"], dry_run=not args.apply,
+                                force=args.force, executor=executor)
 
+        if results["current"]:
+            print(f"Up to date: {len(results['current'])} weapons")
         if results["updated"]:
             print("Updated weapons:")
             for item in results["updated"]:
@@ -852,8 +727,11 @@ def main():
             print(f"Dry run: {not args.apply}")
             print('='*60)
 
-            results = process_batch(config["path"], config["weapons"], dry_run=not args.apply)
+            results = process_batch(config["path"], config["weapons"], dry_run=not args.apply,
+                                force=args.force, executor=executor)
 
+            if results["current"]:
+                print(f"\nUp to date: {len(results['current'])} weapons")
             if results["updated"]:
                 print("\nUpdated weapons:")
                 for item in results["updated"]:
@@ -866,6 +744,10 @@ def main():
                 for err in results["errors"]:
                     print(f"  - {err}")
 
+    executor.shutdown()
+    if args.apply:
+        print(f"\nCommitted {meta_txn.commit()} files")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Vectorized Handgun Handling Engine
+
+Batch mode for weapon_calc.calculate_weapon_values:
+- Turns WeaponSpec lists into structure-of-arrays columns
+  (caliber index, tier index, switch flag, weight)
+- Computes all six handling outputs with NumPy array operations,
+  including floor/ceiling clamps and recovery-linked penalties
+- Matches the scalar path bit for bit (rounding follows Python's round())
+
+Tuning constants are read from weapon_calc at call time, and may be
+overridden (scalars or broadcastable arrays) for parameter sweeps.
+
+Requires NumPy.
+"""
+
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+import weapon_calc as wc
+
+# Output parameters in table column order
+PARAMS = [
+    "RecoilShakeAmplitude",
+    "IkRecoilDisplacement",
+    "RecoilRecoveryRate",
+    "TimeBetweenShots",
+    "AccuracySpread",
+    "RecoilAccuracyMax",
+]
+
+# Decimal places per parameter (same as calculate_weapon_values)
+ROUND_DIGITS = {
+    "RecoilShakeAmplitude": 2,
+    "IkRecoilDisplacement": 4,
+    "RecoilRecoveryRate": 2,
+    "TimeBetweenShots": 3,
+    "AccuracySpread": 2,
+    "RecoilAccuracyMax": 2,
+}
+
+# Tier used for names missing from QUALITY_TIERS (factor 1.0, offset 0.0)
+UNKNOWN_TIER = "<unknown>"
+
+# Module-level constants the kernel reads (override any of them per call)
+CONSTANT_NAMES = [
+    "PERCEPTION_MULTIPLIER",
+    "CALIBER_MULTIPLIERS",
+    "QUALITY_TIERS",
+    "WORN_ACCURACY_MULTIPLIER",
+    "PARAMETER_RANGES",
+    "SWITCH_RANGES",
+    "VALUE_FLOORS",
+    "VALUE_CEILINGS",
+    "SHAKE_BASE_OFFSET",
+    "SHAKE_TIER_SCALE",
+    "FLIP_BASE_OFFSET",
+    "FLIP_TIER_SCALE",
+    "FLIP_GLOBAL_MULTIPLIER",
+    "FIRE_RATE_BASE_OFFSET",
+    "RECOVERY_FIRE_RATE_FACTOR",
+    "RECOVERY_BASELINE",
+    "ACCURACY_RECOVERY_FACTOR",
+    "ACCURACY_MAX_RECOVERY_FACTOR",
+    "TIER_OFFSETS",
+]
+
+
+def current_constants() -> dict:
+    """Snapshot of the tuning constants as currently set in weapon_calc"""
+    return {name: getattr(wc, name) for name in CONSTANT_NAMES if hasattr(wc, name)}
+
+
+# =============================================================================
+# STRUCTURE-OF-ARRAYS COLUMNS
+# =============================================================================
+@dataclass
+class SpecColumns:
+    """WeaponSpec list as parallel arrays"""
+    names: list
+    calibers: list          # Normalized caliber per lookup index
+    tiers: list             # Tier name per lookup index
+    caliber_idx: np.ndarray
+    tier_idx: np.ndarray
+    is_switch: np.ndarray
+    weight_oz: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def build_columns(specs: list, constants: dict = None) -> SpecColumns:
+    """Convert WeaponSpecs into structure-of-arrays columns"""
+    constants = constants or current_constants()
+    calibers = list(constants["PARAMETER_RANGES"])
+    tiers = list(constants["QUALITY_TIERS"]) + [UNKNOWN_TIER]
+    caliber_lookup = {c: i for i, c in enumerate(calibers)}
+    tier_lookup = {t: i for i, t in enumerate(tiers)}
+
+    caliber_idx = np.empty(len(specs), dtype=np.int32)
+    tier_idx = np.empty(len(specs), dtype=np.int32)
+    for i, spec in enumerate(specs):
+        caliber = wc.normalize_caliber(spec.caliber)
+        if caliber not in caliber_lookup:
+            raise ValueError(f"Unknown caliber: {caliber}")
+        caliber_idx[i] = caliber_lookup[caliber]
+        tier_idx[i] = tier_lookup.get(spec.quality_tier, tier_lookup[UNKNOWN_TIER])
+
+    return SpecColumns(
+        names=[spec.name for spec in specs],
+        calibers=calibers,
+        tiers=tiers,
+        caliber_idx=caliber_idx,
+        tier_idx=tier_idx,
+        is_switch=np.array([spec.is_switch for spec in specs], dtype=bool),
+        weight_oz=np.array([spec.weight_oz for spec in specs], dtype=np.float64),
+    )
+
+
+def roster_specs() -> list:
+    """Every handgun WeaponSpec in the weapon registry, in batch order"""
+    return wc.registry_specs()
+
+
+# =============================================================================
+# KERNEL
+# =============================================================================
+def python_round(values: np.ndarray, digits: int) -> np.ndarray:
+    """
+    Elementwise round() with Python's exact semantics.
+    np.round scales in floating point and can differ from round() on values
+    near a half; those few are re-rounded with round() itself.
+    """
+    scale = 10.0 ** digits
+    scaled = values * scale
+    result = np.rint(scaled) / scale
+
+    frac = np.abs(scaled - np.trunc(scaled))
+    ambiguous = np.abs(frac - 0.5) < 1e-6
+    if ambiguous.any():
+        result[ambiguous] = [round(float(v), digits) for v in values[ambiguous]]
+    return result
+
+
+def lookup(idx: np.ndarray, choices: list) -> np.ndarray:
+    """
+    choices[idx] elementwise. Choices may be scalars or broadcastable arrays
+    (e.g. (K, 1) candidate columns), giving a (K, n_specs) result.
+    """
+    return np.select([idx == i for i in range(len(choices))], choices)
+
+
+def calculate_values_batch(columns: SpecColumns, constants: dict = None,
+                           rounded: bool = True, **overrides) -> dict:
+    """
+    Vectorized calculate_weapon_values over every spec in `columns`.
+
+    Scalar overrides - and the numeric leaves of the table constants - may
+    be arrays (e.g. shape (K, 1)) to evaluate K constant sets at once;
+    outputs then broadcast to (K, n_specs).
+    Returns {param: ndarray}.
+    """
+    c = dict(constants or current_constants())
+    c.update(overrides)
+
+    cal = columns.caliber_idx
+    tier = columns.tier_idx
+    tiers = columns.tiers
+
+    # Per-caliber tables
+    ranges = c["PARAMETER_RANGES"]
+    switches = c["SWITCH_RANGES"]
+    has_switch = np.array([cal_name in switches for cal_name in columns.calibers])
+
+    # Per-tier tables
+    quality_factor = lookup(tier, [c["QUALITY_TIERS"].get(t, 1.0) for t in tiers])
+    tier_offset = lookup(tier, [c["TIER_OFFSETS"].get(t, 0.0) for t in tiers])
+    is_worn = np.array([t == "worn" for t in tiers])[tier]
+
+    is_switch = columns.is_switch
+    use_switch = is_switch & has_switch[cal]
+    weight_factor = 30.0 / columns.weight_oz
+
+    # Interpolate between min and max by quality factor
+    normalized = (quality_factor - 0.40) / (2.00 - 0.40)
+    normalized = np.maximum(0.0, np.minimum(1.0, normalized))
+
+    # Shake/flip ranges have PERCEPTION_MULTIPLIER baked in - rescale when overridden
+    perception = c["PERCEPTION_MULTIPLIER"] / wc.PERCEPTION_MULTIPLIER
+
+    def base(j):
+        lo = lookup(cal, [ranges[name][PARAMS[j]][0] for name in columns.calibers])
+        hi = lookup(cal, [ranges[name][PARAMS[j]][1] for name in columns.calibers])
+        return lo + (hi - lo) * normalized
+
+    shake = base(0) * perception * weight_factor
+    flip = base(1) * perception * weight_factor
+    recovery = base(2) / weight_factor
+    fire_rate = base(3)
+    spread = base(4)
+    acc_max = base(5)
+
+    # Option D: worn accuracy penalty (not for switch weapons)
+    worn = is_worn & ~use_switch
+    spread = np.where(worn, spread * c["WORN_ACCURACY_MULTIPLIER"], spread)
+    acc_max = np.where(worn, acc_max * c["WORN_ACCURACY_MULTIPLIER"], acc_max)
+
+    # Switch weapons use their fixed full-auto values
+    def switch(j):
+        return lookup(cal, [switches.get(name, {}).get(PARAMS[j], 0.0) for name in columns.calibers])
+
+    shake = np.where(use_switch, switch(0) * perception, shake)
+    flip = np.where(use_switch, switch(1) * perception, flip)
+    recovery = np.where(use_switch, switch(2), recovery)
+    fire_rate = np.where(use_switch, switch(3), fire_rate)
+    spread = np.where(use_switch, switch(4), spread)
+    acc_max = np.where(use_switch, switch(5), acc_max)
+
+    # Proportional offsets based on tier
+    shake = shake + (c["SHAKE_BASE_OFFSET"] + (tier_offset * c["SHAKE_TIER_SCALE"]))
+    flip = flip + (c["FLIP_BASE_OFFSET"] + (tier_offset * c["FLIP_TIER_SCALE"]))
+    flip = flip * c["FLIP_GLOBAL_MULTIPLIER"]
+    fire_rate = fire_rate + c["FIRE_RATE_BASE_OFFSET"]
+
+    # Fire rate linked to recovery (switch weapons bypass)
+    deficit = c["RECOVERY_BASELINE"] - recovery
+    recovery_penalty = np.maximum(0.0, deficit * c["RECOVERY_FIRE_RATE_FACTOR"])
+    fire_rate = np.where(is_switch, fire_rate, fire_rate + recovery_penalty)
+
+    # Follow-up accuracy linked to recovery
+    poor_recovery = recovery < c["RECOVERY_BASELINE"]
+    spread = np.where(poor_recovery, spread + deficit * c["ACCURACY_RECOVERY_FACTOR"], spread)
+    acc_max = np.where(poor_recovery, acc_max + deficit * c["ACCURACY_MAX_RECOVERY_FACTOR"], acc_max)
+
+    raw = dict(zip(PARAMS, [shake, flip, recovery, fire_rate, spread, acc_max]))
+
+    values = {}
+    for param, value in raw.items():
+        floor = c["VALUE_FLOORS"].get(param, 0.0)
+        ceiling = c["VALUE_CEILINGS"].get(param, float('inf'))
+        value = np.maximum(floor, np.minimum(ceiling, value))
+        values[param] = python_round(value, ROUND_DIGITS[param]) if rounded else value
+
+    return values
+
+
+def values_for(values: dict, index) -> dict:
+    """Scalar dict for one weapon, in calculate_weapon_values' shape"""
+    return {param: float(values[param][index]) for param in PARAMS}
+
+
+def verify_against_scalar(specs: list) -> list:
+    """Return names of specs whose batch result differs from the scalar path"""
+    columns = build_columns(specs)
+    values = calculate_values_batch(columns)
+    mismatches = []
+    for i, spec in enumerate(specs):
+        if values_for(values, i) != wc.calculate_weapon_values(spec):
+            mismatches.append(spec.name)
+    return mismatches
+
+
+def random_specs(count: int, seed: int = 0) -> list:
+    """Hypothetical specs for benchmarking (random caliber/tier/weight)"""
+    rng = np.random.default_rng(seed)
+    calibers = list(wc.PARAMETER_RANGES)
+    tiers = list(wc.QUALITY_TIERS)
+    cal = rng.integers(len(calibers), size=count)
+    tier = rng.integers(len(tiers), size=count)
+    switch = rng.random(count) < 0.05
+    weight = rng.uniform(10.0, 75.0, size=count)
+    return [
+        wc.WeaponSpec(f"spec{i}", calibers[cal[i]], tiers[tier[i]], bool(switch[i]), float(weight[i]))
+        for i in range(count)
+    ]
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Vectorized handgun handling calculator")
+    parser.add_argument("--verify", action="store_true", help="Check batch results against the scalar path")
+    parser.add_argument("--bench", type=int, default=0, help="Time N random hypothetical specs")
+    args = parser.parse_args()
+
+    specs = roster_specs()
+
+    start = time.perf_counter()
+    columns = build_columns(specs)
+    values = calculate_values_batch(columns)
+    elapsed = time.perf_counter() - start
+
+    print(f"Roster: {len(specs)} weapons in {elapsed * 1000:.2f} ms")
+
+    if args.verify:
+        mismatches = verify_against_scalar(specs)
+        if mismatches:
+            print(f"MISMATCH: {', '.join(mismatches)}")
+        else:
+            print("Batch results match the scalar path for every weapon")
+
+    if args.bench:
+        bench = random_specs(args.bench)
+        columns = build_columns(bench)
+        start = time.perf_counter()
+        calculate_values_batch(columns)
+        batch_time = time.perf_counter() - start
+
+        sample = bench[:min(len(bench), 20000)]
+        start = time.perf_counter()
+        for spec in sample:
+            wc.calculate_weapon_values(spec)
+        scalar_time = (time.perf_counter() - start) * len(bench) / len(sample)
+
+        print(f"Bench: {len(bench)} specs - batch {batch_time * 1000:.1f} ms, "
+              f"scalar ~{scalar_time * 1000:.1f} ms")
+        mismatches = verify_against_scalar(sample)
+        print(f"  Sample mismatches: {len(mismatches)}")
+
+    if not args.verify and not args.bench:
+        for i, name in enumerate(columns.names):
+            row = values_for(values, i)
+            print(f"  {name:<20} " + " ".join(f"{row[p]:>8}" for p in PARAMS))
+
+
+if __name__ == "__main__":
+    main()
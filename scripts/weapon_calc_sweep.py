@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Handgun Tuning Constant Sweep
+
+Evaluates the whole handgun roster for every combination of candidate
+weapon_calc constants, without touching any meta file:
+- Grids/ranges for any scalar constant (PERCEPTION_MULTIPLIER,
+  SHAKE_BASE_OFFSET, FLIP_GLOBAL_MULTIPLIER, RECOVERY_FIRE_RATE_FACTOR, ...)
+- Combinations are evaluated in batched passes of the vectorized engine
+- Per combination: per-caliber spread, clamp-hit counts and tier ordering
+  violations, streamed to a CSV or collected into a columnar .npz
+
+Usage:
+    python weapon_calc_sweep.py --param SHAKE_BASE_OFFSET=1.4:2.2:9 \\
+        --param FLIP_GLOBAL_MULTIPLIER=1.2,1.35,1.5 --output sweep.csv
+
+Requires NumPy.
+"""
+
+import csv
+import itertools
+import time
+
+import numpy as np
+
+import weapon_calc as wc
+import weapon_calc_batch as batch
+
+# Scalar constants that can be swept
+SWEEPABLE = [
+    "PERCEPTION_MULTIPLIER",
+    "SHAKE_BASE_OFFSET",
+    "SHAKE_TIER_SCALE",
+    "FLIP_BASE_OFFSET",
+    "FLIP_TIER_SCALE",
+    "FLIP_GLOBAL_MULTIPLIER",
+    "FIRE_RATE_BASE_OFFSET",
+    "RECOVERY_FIRE_RATE_FACTOR",
+    "RECOVERY_BASELINE",
+    "ACCURACY_RECOVERY_FACTOR",
+    "ACCURACY_MAX_RECOVERY_FACTOR",
+    "WORN_ACCURACY_MULTIPLIER",
+]
+
+# Tier rank (higher = better built) used for ordering checks
+TIER_RANK = {"worn": 0, "standard": 1, "quality": 2, "match": 3}
+
+# +1: a better tier should have a LOWER value, -1: a HIGHER value
+BETTER_DIRECTION = {
+    "RecoilShakeAmplitude": 1,
+    "IkRecoilDisplacement": 1,
+    "RecoilRecoveryRate": -1,
+    "TimeBetweenShots": 1,
+    "AccuracySpread": 1,
+    "RecoilAccuracyMax": 1,
+}
+
+COMBOS_PER_PASS = 4096
+
+
+# =============================================================================
+# GRID PARSING
+# =============================================================================
+def parse_grid(text: str) -> np.ndarray:
+    """
+    Parse a value grid:
+    - "a:b:n"  -> n evenly spaced values from a to b
+    - "a,b,c"  -> explicit values
+    """
+    if ":" in text:
+        start, stop, count = text.split(":")
+        return np.linspace(float(start), float(stop), int(count))
+    return np.array([float(v) for v in text.split(",")])
+
+
+def parse_params(param_args: list) -> dict:
+    """Parse NAME=grid arguments into {name: values}"""
+    grids = {}
+    for arg in param_args:
+        name, _, grid = arg.partition("=")
+        name = name.strip().upper()
+        if name not in SWEEPABLE:
+            raise ValueError(f"Not a sweepable constant: {name} (choose from {', '.join(SWEEPABLE)})")
+        grids[name] = parse_grid(grid)
+    return grids
+
+
+def iter_combo_blocks(grids: dict, block_size: int = COMBOS_PER_PASS):
+    """Yield {name: (K, 1) array} blocks covering the cartesian product of the grids"""
+    names = list(grids)
+    combos = itertools.product(*(grids[name] for name in names))
+    while True:
+        block = list(itertools.islice(combos, block_size))
+        if not block:
+            return
+        columns = np.array(block, dtype=np.float64).reshape(len(block), len(names))
+        yield {name: columns[:, i:i + 1] for i, name in enumerate(names)}
+
+
+# =============================================================================
+# SUMMARY STATISTICS
+# =============================================================================
+class RosterSummary:
+    """Precomputed roster groupings for the per-combination statistics"""
+
+    def __init__(self, columns: batch.SpecColumns, specs: list):
+        self.columns = columns
+        cal = columns.caliber_idx
+        self.caliber_names = [columns.calibers[i] for i in sorted(set(cal))]
+        self.caliber_masks = [cal == columns.calibers.index(name) for name in self.caliber_names]
+
+        # Same-caliber, non-switch pairs where weapon j is a better tier than weapon i
+        rank = np.array([TIER_RANK.get(spec.quality_tier, 1) for spec in specs])
+        eligible = ~columns.is_switch
+        i_idx, j_idx = np.nonzero(
+            (cal[:, None] == cal[None, :]) & (rank[:, None] < rank[None, :])
+            & eligible[:, None] & eligible[None, :]
+        )
+        self.pair_worse = i_idx
+        self.pair_better = j_idx
+
+    def compute(self, raw: dict, rounded: dict, constants: dict) -> dict:
+        """Stats for a block of combinations. raw/rounded are {param: (K, N)}"""
+        stats = {}
+        for param in batch.PARAMS:
+            floor = constants["VALUE_FLOORS"].get(param, 0.0)
+            ceiling = constants["VALUE_CEILINGS"].get(param, float('inf'))
+            value = raw[param]
+            # Only values the clamp actually moves (a value sitting on the floor is legitimate)
+            stats[f"clamp_hits.{param}"] = ((value < floor) | (value > ceiling)).sum(axis=1)
+
+            delta = rounded[param][:, self.pair_better] - rounded[param][:, self.pair_worse]
+            stats[f"order_violations.{param}"] = (delta * BETTER_DIRECTION[param] > 0).sum(axis=1)
+
+        for caliber, mask in zip(self.caliber_names, self.caliber_masks):
+            for param in batch.PARAMS:
+                values = rounded[param][:, mask]
+                stats[f"spread.{caliber}.{param}"] = values.max(axis=1) - values.min(axis=1)
+        return stats
+
+
+# =============================================================================
+# SWEEP
+# =============================================================================
+def run_sweep(grids: dict, specs: list = None, block_size: int = COMBOS_PER_PASS):
+    """
+    Evaluate every combination of the grids over the roster.
+    Yields (combo_columns, stats) per block, each {name: (K,) array}.
+    """
+    specs = specs or batch.roster_specs()
+    constants = batch.current_constants()
+    columns = batch.build_columns(specs, constants)
+    summary = RosterSummary(columns, specs)
+
+    for combo in iter_combo_blocks(grids, block_size):
+        raw = batch.calculate_values_batch(columns, constants, rounded=False, **combo)
+        shape = (len(next(iter(combo.values()))), len(columns))
+        raw = {param: np.broadcast_to(value, shape) for param, value in raw.items()}
+        rounded = {param: batch.python_round(np.array(value), batch.ROUND_DIGITS[param])
+                   for param, value in raw.items()}
+        stats = summary.compute(raw, rounded, constants)
+        yield {name: values[:, 0] for name, values in combo.items()}, stats
+
+
+class CsvSink:
+    """Streams sweep rows to a CSV file block by block"""
+
+    def __init__(self, path: str):
+        self.file = open(path, 'w', newline='', encoding='utf-8')
+        self.writer = csv.writer(self.file)
+        self.header = None
+
+    def write(self, combo: dict, stats: dict):
+        if self.header is None:
+            self.header = list(combo) + list(stats)
+            self.writer.writerow(self.header)
+        data = np.column_stack(list(combo.values()) + list(stats.values()))
+        self.writer.writerows([f"{v:.6g}" for v in row] for row in data)
+
+    def close(self):
+        self.file.close()
+
+
+class NpzSink:
+    """Collects sweep columns and saves them as one compressed .npz"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.columns = {}
+
+    def write(self, combo: dict, stats: dict):
+        for name, values in list(combo.items()) + list(stats.items()):
+            self.columns.setdefault(name, []).append(np.asarray(values))
+
+    def close(self):
+        np.savez_compressed(self.path, **{name: np.concatenate(parts) for name, parts in self.columns.items()})
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Sweep weapon_calc tuning constants (no meta writes)")
+    parser.add_argument("--param", action="append", default=[],
+                        help="NAME=start:stop:count or NAME=v1,v2,... (repeatable)")
+    parser.add_argument("--output", type=str, help="Write stats to .csv (streamed) or .npz (columnar)")
+    parser.add_argument("--top", type=int, default=10, help="Show N combos with fewest ordering violations")
+    args = parser.parse_args()
+
+    try:
+        grids = parse_params(args.param)
+    except ValueError as e:
+        parser.error(f"--param: {e}")
+    if not grids:
+        grids = {"SHAKE_BASE_OFFSET": np.array([wc.SHAKE_BASE_OFFSET])}
+    total = int(np.prod([len(v) for v in grids.values()]))
+
+    print(f"Sweeping {total} combinations over {', '.join(grids)}")
+    for name, values in grids.items():
+        print(f"  {name}: {len(values)} values [{values.min():g} .. {values.max():g}] "
+              f"(current {getattr(wc, name)})")
+
+    sink = None
+    if args.output:
+        sink = NpzSink(args.output) if args.output.endswith(".npz") else CsvSink(args.output)
+
+    best = []
+    start = time.perf_counter()
+    for combo, stats in run_sweep(grids):
+        if sink:
+            sink.write(combo, stats)
+        violations = sum(stats[f"order_violations.{p}"] for p in batch.PARAMS)
+        clamps = sum(stats[f"clamp_hits.{p}"] for p in batch.PARAMS)
+        for k in np.argsort(violations, kind="stable")[:args.top]:
+            best.append((int(violations[k]), int(clamps[k]), {n: float(v[k]) for n, v in combo.items()}))
+        best = sorted(best, key=lambda b: (b[0], b[1]))[:args.top]
+    elapsed = time.perf_counter() - start
+
+    if sink:
+        sink.close()
+        print(f"Stats written: {args.output}")
+
+    print(f"Evaluated {total} combinations in {elapsed:.2f}s")
+    print(f"\nTop {len(best)} by ordering violations (then clamp hits):")
+    for violations, clamps, combo in best:
+        settings = " ".join(f"{n}={v:g}" for n, v in combo.items())
+        print(f"  violations {violations:>4} | clamps {clamps:>4} | {settings}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+CWeaponInfo Object Model
+
+Item-scoped access to weapons.meta files without an XML parser:
+- WeaponMetaFile keeps the file text and the offsets of its
+  <Item type="CWeaponInfo"> blocks (found on first access)
+- Each CWeaponInfo is a __slots__ object holding only its offsets; its
+  value-tag index is built on the first field read and only covers that
+  item, so <Damage> of one weapon never matches another item's
+- Writes are queued per item and spliced into the original text, so every
+  untouched byte (formatting, comments, other items) is preserved
+- Common stats are typed attributes (info.damage, info.clip_size, ...);
+  any other tag goes through get()/set()
+
+Holding every meta in the tree costs little more than the file texts
+themselves (see --memory).
+
+Usage:
+    python weapon_meta.py --show WEAPON_G26          # Fields of one weapon
+    python weapon_meta.py --memory                   # Load every meta, report size
+"""
+
+import os
+import re
+from typing import Callable, Optional, Union
+
+import meta_txn
+from meta_patch import VALUE_TAG_PATTERN, DEFAULT_FORMAT
+
+BASE_PATH = "/home/user/project_pipes"
+
+# An item ends at the </Item> followed by the next CWeaponInfo or </Infos>,
+# so nested <Item>s inside it stay part of its body
+WEAPON_ITEM_PATTERN = re.compile(r'<Item type="CWeaponInfo">(.*?)</Item>\s*(?=<Item type="CWeaponInfo">|</Infos>)',
+                                 re.DOTALL)
+NAME_PATTERN = re.compile(r'<(?:Name|n)>([^<]+)</(?:Name|n)>')
+
+BOOL_VALUES = {"true": 1, "false": 0}
+
+
+# =============================================================================
+# FIELDS
+# =============================================================================
+class MetaField:
+    """Typed attribute for one value tag of a CWeaponInfo (None if absent)"""
+
+    def __init__(self, tag: str, kind: type = float, fmt: Optional[str] = None):
+        self.tag = tag
+        self.kind = kind
+        self.fmt = fmt
+
+    def __get__(self, info, owner=None):
+        if info is None:
+            return self
+        text = info.get(self.tag)
+        if text is None:
+            return None
+        if self.kind is bool:
+            return text == "true"
+        try:
+            return self.kind(float(text)) if self.kind is int else self.kind(text)
+        except ValueError:
+            return None
+
+    def __set__(self, info, value):
+        if self.kind is bool:
+            value = "true" if value else "false"
+        elif self.kind is int and not isinstance(value, str):
+            value = int(round(value))
+        info.set(self.tag, value, self.fmt)
+
+
+# =============================================================================
+# MODEL
+# =============================================================================
+class CWeaponInfo:
+    """One <Item type="CWeaponInfo"> block, addressed by offsets into its file's text"""
+
+    __slots__ = ("file", "start", "end", "_name", "_offsets", "_repeated", "_edits")
+
+    damage = MetaField("Damage", float, ".6f")
+    hud_damage = MetaField("HudDamage", int, "d")
+    time_between_shots = MetaField("TimeBetweenShots", float, ".6f")
+    bullets_in_batch = MetaField("BulletsInBatch", int, "d")
+    clip_size = MetaField("ClipSize", int, "d")
+    accuracy_spread = MetaField("AccuracySpread", float, ".6f")
+    weapon_range = MetaField("WeaponRange", float, ".6f")
+    force = MetaField("Force", float, ".6f")
+    penetration = MetaField("Penetration", float, ".6f")
+    speed = MetaField("Speed", float, ".6f")
+    recoil_accuracy_max = MetaField("RecoilAccuracyMax", float, ".6f")
+    recoil_recovery_rate = MetaField("RecoilRecoveryRate", float, ".6f")
+    recoil_shake_amplitude = MetaField("RecoilShakeAmplitude", float, ".6f")
+    armor_penetration = MetaField("ArmorPenetration", float, ".6f")
+
+    def __init__(self, file: "WeaponMetaFile", start: int, end: int):
+        self.file = file
+        self.start = start      # Offsets of the item body in file.content
+        self.end = end
+        self._name: Optional[str] = None
+        self._offsets: Optional[dict] = None
+        self._repeated: frozenset = frozenset()
+        self._edits: Optional[dict] = None
+
+    def __repr__(self):
+        return f"CWeaponInfo({self.name!r})"
+
+    @property
+    def name(self) -> str:
+        """<Name> (or legacy <n>) of the weapon, "" if missing"""
+        if self._name is None:
+            match = NAME_PATTERN.search(self.file.content, self.start, self.end)
+            self._name = match.group(1).strip() if match else ""
+        return self._name
+
+    @property
+    def offsets(self) -> dict:
+        """tag -> offset of the item's first value="..." text for it, built on first use"""
+        if self._offsets is None:
+            offsets, repeated = {}, set()
+            for match in VALUE_TAG_PATTERN.finditer(self.file.content, self.start, self.end):
+                if match.group(1) in offsets:
+                    repeated.add(match.group(1))
+                else:
+                    offsets[match.group(1)] = match.start(2)
+            self._offsets = offsets
+            self._repeated = frozenset(repeated)
+        return self._offsets
+
+    def _span(self, tag: str) -> Optional[tuple]:
+        start = self.offsets.get(tag)
+        if start is None:
+            return None
+        return start, self.file.content.index('"', start)
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._edits)
+
+    def has(self, tag: str) -> bool:
+        return tag in self.offsets
+
+    def get(self, tag: str) -> Optional[str]:
+        """Value text of the tag as it will be written (first occurrence in the item)"""
+        span = self._span(tag)
+        if span is None:
+            return None
+        start, end = span
+        if self._edits and start in self._edits:
+            return self._edits[start][1]
+        return self.file.content[start:end]
+
+    def get_float(self, tag: str) -> Optional[float]:
+        text = self.get(tag)
+        try:
+            return float(text) if text is not None else None
+        except ValueError:
+            return None
+
+    def set(self, tag: str, value: Union[float, int, str], fmt: Optional[str] = None) -> bool:
+        """Queue a new value for the item's own tag (first occurrence). False if the tag is absent."""
+        text = value if isinstance(value, str) else format(value, fmt or DEFAULT_FORMAT)
+        return self.transform(tag, lambda _old: text)
+
+    def transform(self, tag: str, func: Callable[[str], Optional[str]]) -> bool:
+        """Queue func(current text) for the item's own tag; func returns None to leave it"""
+        span = self._span(tag)
+        if span is None:
+            return False
+        new_text = func(self.get(tag))
+        if new_text is None:
+            return False
+        if self._edits is None:
+            self._edits = {}
+        self._edits[span[0]] = (span[1], new_text)
+        return True
+
+    def scalars(self) -> dict:
+        """Tags appearing once in the item: tag -> float (0/1 for flags); hashes/colours skipped"""
+        values = {}
+        for tag in self.offsets:
+            if tag in self._repeated:
+                continue
+            text = self.get(tag)
+            if text in BOOL_VALUES:
+                values[tag] = BOOL_VALUES[text]
+                continue
+            try:
+                values[tag] = float(text)
+            except ValueError:
+                pass
+        return values
+
+
+class WeaponMetaFile:
+    """A weapons.meta text and its CWeaponInfo items"""
+
+    __slots__ = ("path", "content", "_items")
+
+    def __init__(self, content: str, path: Optional[str] = None):
+        self.path = path
+        self.content = content
+        self._items: Optional[list] = None
+
+    @property
+    def items(self) -> list:
+        """Every CWeaponInfo in the file, in order (located on first access)"""
+        if self._items is None:
+            self._items = [CWeaponInfo(self, *match.span(1)) for match in WEAPON_ITEM_PATTERN.finditer(self.content)]
+        return self._items
+
+    def weapon(self, name: str) -> Optional[CWeaponInfo]:
+        """The CWeaponInfo named name (case-insensitive), None if absent"""
+        for info in self.items:
+            if info.name.upper() == name.upper():
+                return info
+        return None
+
+    @property
+    def dirty(self) -> bool:
+        return self._items is not None and any(info.dirty for info in self._items)
+
+    def render(self) -> str:
+        """File text with every queued edit spliced in (untouched text kept byte for byte)"""
+        edits = {}
+        for info in self._items or []:
+            edits.update(info._edits or {})
+        if not edits:
+            return self.content
+        parts, cursor = [], 0
+        for start in sorted(edits):
+            end, text = edits[start]
+            parts.append(self.content[cursor:start])
+            parts.append(text)
+            cursor = end
+        parts.append(self.content[cursor:])
+        return "".join(parts)
+
+    def save(self, path: Optional[str] = None) -> bool:
+        """Write the edits (into the open meta_txn transaction, else atomically). False if unchanged."""
+        new_content = self.render()
+        if new_content == self.content:
+            return False
+        meta_txn.write_text(path or self.path, new_content)
+        return True
+
+
+def load(path: str) -> WeaponMetaFile:
+    """Meta file as the active meta_txn transaction will leave it"""
+    return WeaponMetaFile(meta_txn.read_text(path), path)
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+def main():
+    import argparse
+    import tracemalloc
+    import meta_index
+
+    parser = argparse.ArgumentParser(description="CWeaponInfo object model")
+    parser.add_argument("--root", default=BASE_PATH, help="Project root")
+    parser.add_argument("--show", metavar="WEAPON", help="Print the typed fields and scalars of one weapon")
+    parser.add_argument("--memory", action="store_true", help="Load every meta in the index and report memory")
+    args = parser.parse_args()
+
+    index = meta_index.get_index(args.root)
+
+    if args.show:
+        path = index.find_by_name(args.show)
+        info = load(path).weapon(args.show) if path else None
+        if info is None:
+            print(f"✗ {args.show} not found")
+            return
+        print(f"{info.name}  ({os.path.relpath(path, args.root)})")
+        for attr, field in vars(CWeaponInfo).items():
+            if isinstance(field, MetaField):
+                print(f"  {attr:<24} {getattr(info, attr)}")
+        print(f"  {len(info.scalars())} scalar tags")
+        return
+
+    if not args.memory:
+        parser.print_help()
+        return
+
+    paths = [index.abspath(p) for p in sorted(index.entries)]
+    tracemalloc.start()
+    files = [load(p) for p in paths]
+    text_size, _ = tracemalloc.get_traced_memory()
+    items = [info for f in files for info in f.items]
+    for info in items:
+        info.name
+    located, _ = tracemalloc.get_traced_memory()
+    for info in items:
+        info.offsets
+    indexed, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"Metas: {len(files)}  CWeaponInfo items: {len(items)}")
+    print(f"  File texts:               {text_size / 1024:8.0f} KiB")
+    print(f"  + items located/named:    {located / 1024:8.0f} KiB")
+    print(f"  + every item's tag index: {indexed / 1024:8.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
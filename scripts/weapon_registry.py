@@ -0,0 +1,480 @@
+#!/usr/bin/env python3
+"""
+Weapon Registry
+
+Single source of truth for per-weapon facts, kept in weapon_registry.json
+next to this script: caliber, handling caliber, quality tier, weight,
+barrel, fire modes, RPM, clip size, component base, folder, plus the
+optional per-tool blocks (meta slots for the fix_* writers, heavy recoil
+overrides, summary chart labels).
+
+The file is validated once and compiled into a Registry with lookup
+indexes (name, key, folder, batch, class, caliber, component base,
+calculator). The compiled form is pickled next to the registry, keyed by
+a hash of the file, so tools only pay for a pickle load.
+
+Consumers:
+- weapon_calc.py / rifle_smg_calc.py       handling specs per batch
+- fix_rifles_complete.py / fix_smgs_complete.py   meta slot configs
+- boost_heavy_recoil.py / generate_summary_chart.py   recoil / samples
+- meta_generator.py                        weapon class for --from-roster
+- free-bullets/shared/weapons.lua          Config.Weapons (--write-lua)
+
+clip_size is authoritative: it becomes Config.Weapons[...].clipSize, the
+physical capacity magazine_client.lua caps every loaded magazine at
+(GetWeaponClipSize), and matches weapons.lua as it was before the
+registry. A weapons.meta ClipSize is only the engine's default clip,
+replaced by the clip component given on magazine equip, so --check
+reports a difference as a warning (a meta to fix), never as drift.
+
+Usage:
+    python weapon_registry.py                      # Summary
+    python weapon_registry.py --show WEAPON_G17
+    python weapon_registry.py --check              # Drift vs weapons.lua / selectivefire / metas
+    python weapon_registry.py --write-lua          # Regenerate Config.Weapons
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import hashlib
+import pickle
+from dataclasses import dataclass, field
+from typing import Optional
+
+BASE_PATH = "/home/user/project_pipes"
+REGISTRY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "weapon_registry.json")
+CACHE_SUFFIX = ".cache.pickle"
+CACHE_VERSION = 1
+REGISTRY_VERSION = 1
+
+WEAPONS_LUA = "free-bullets/shared/weapons.lua"
+
+# =============================================================================
+# SCHEMA
+# =============================================================================
+CLASSES = {"pistol", "smg", "rifle", "shotgun", "sniper", "special"}
+TIERS = {"worn", "budget", "standard", "quality", "match"}
+FIRE_MODE_PROFILES = {"semi", "burst", "auto", "auto_fast"}   # rifle_smg_calc FIRE_MODES
+SELECT_FIRE_MODES = {"SEMI", "BURST", "FULL"}                 # free_selectivefire modes
+META_FIELDS = {"model", "slot", "order_nav", "order_best", "ammo", "group", "wheel_slot", "audio"}
+RECOIL_FIELDS = {"shake", "roll", "duration", "frequency"}
+
+# Handling calculator -> weapon classes it covers (entries need a handling_caliber)
+CALCULATORS = {
+    "handgun": {"pistol"},            # weapon_calc.py
+    "long_gun": {"smg", "rifle"},     # rifle_smg_calc.py
+}
+
+
+@dataclass
+class Batch:
+    id: int
+    dir: str
+    title: str
+    lua_header: list = field(default_factory=list)
+
+
+@dataclass
+class WeaponEntry:
+    """One registry weapon (optional facts are None when unknown)"""
+    name: str                                  # WEAPON_X
+    key: str                                   # Calculator / folder short name
+    weapon_class: str
+    batch: int
+    display: str = ""
+    folder: Optional[str] = None               # Resource folder relative to the project root
+    caliber: Optional[str] = None              # free-bullets Config.AmmoTypes key
+    handling_caliber: Optional[str] = None     # weapon_calc / rifle_smg_calc caliber key
+    tier: Optional[str] = None
+    fire_mode: Optional[str] = None            # Handling profile (FIRE_MODE_PROFILES)
+    fire_modes: Optional[list] = None          # Selectable modes (SELECT_FIRE_MODES)
+    rpm: int = 0
+    clip_size: Optional[int] = None
+    weight_oz: Optional[float] = None
+    barrel_in: Optional[float] = None
+    component_base: Optional[str] = None
+    notes: str = ""
+    comment: list = field(default_factory=list)    # Comment lines above the weapons.lua entry
+    meta: Optional[dict] = None
+    recoil: Optional[dict] = None
+    summary_label: Optional[str] = None
+
+    @property
+    def short(self) -> str:
+        return self.name[len("WEAPON_"):]
+
+    @property
+    def folder_name(self) -> Optional[str]:
+        return self.folder.rsplit("/", 1)[-1] if self.folder else None
+
+    @property
+    def calculator(self) -> Optional[str]:
+        if not self.handling_caliber:
+            return None
+        for calculator, classes in CALCULATORS.items():
+            if self.weapon_class in classes:
+                return calculator
+        return None
+
+    @property
+    def weight_lbs(self) -> Optional[float]:
+        return self.weight_oz / 16 if self.weight_oz is not None else None
+
+
+# JSON field -> WeaponEntry attribute
+FIELD_NAMES = {"class": "weapon_class"}
+ENTRY_FIELDS = set(WeaponEntry.__dataclass_fields__)
+
+
+# =============================================================================
+# VALIDATION
+# =============================================================================
+def check_number(errors: list, label: str, value, kind=(int, float), positive: bool = True):
+    if value is None:
+        return
+    if isinstance(value, bool) or not isinstance(value, kind) or (positive and value <= 0):
+        errors.append(f"{label}: expected a positive number, got {value!r}")
+
+
+def validate_entry(data: dict, batches: dict, errors: list) -> Optional[WeaponEntry]:
+    name = data.get("name", "?")
+    fields = {FIELD_NAMES.get(k, k): v for k, v in data.items()}
+    unknown = set(fields) - ENTRY_FIELDS
+    if unknown:
+        errors.append(f"{name}: unknown fields {sorted(unknown)}")
+        return None
+    missing = {"name", "key", "weapon_class", "batch"} - set(fields)
+    if missing:
+        errors.append(f"{name}: missing {sorted(FIELD_NAMES.get(m, m) for m in missing)}")
+        return None
+    entry = WeaponEntry(**fields)
+
+    if not entry.name.startswith("WEAPON_") or entry.name != entry.name.upper():
+        errors.append(f"{name}: name must be upper case and start with WEAPON_")
+    if entry.weapon_class not in CLASSES:
+        errors.append(f"{name}: unknown class '{entry.weapon_class}'")
+    batch = batches.get(entry.batch)
+    if batch is None:
+        errors.append(f"{name}: unknown batch {entry.batch}")
+    elif entry.folder and not entry.folder.startswith(batch.dir + "/"):
+        errors.append(f"{name}: folder '{entry.folder}' is outside batch dir '{batch.dir}'")
+    if entry.tier is not None and entry.tier not in TIERS:
+        errors.append(f"{name}: unknown tier '{entry.tier}'")
+    if entry.fire_mode is not None and entry.fire_mode not in FIRE_MODE_PROFILES:
+        errors.append(f"{name}: unknown fire_mode '{entry.fire_mode}'")
+    if entry.fire_modes is not None and not set(entry.fire_modes) <= SELECT_FIRE_MODES:
+        errors.append(f"{name}: unknown fire_modes {sorted(set(entry.fire_modes) - SELECT_FIRE_MODES)}")
+
+    check_number(errors, f"{name}.rpm", entry.rpm, int, positive=False)
+    check_number(errors, f"{name}.clip_size", entry.clip_size, int)
+    check_number(errors, f"{name}.weight_oz", entry.weight_oz)
+    check_number(errors, f"{name}.barrel_in", entry.barrel_in)
+
+    if entry.handling_caliber:
+        calculator = entry.calculator
+        if calculator is None:
+            errors.append(f"{name}: class '{entry.weapon_class}' has no handling calculator")
+        required = ["tier", "fire_mode", "weight_oz"] + (["barrel_in"] if calculator == "long_gun" else [])
+        for attr in required:
+            if getattr(entry, attr) is None:
+                errors.append(f"{name}: handling weapons need '{attr}'")
+    if entry.component_base:
+        if not entry.component_base.startswith("COMPONENT_"):
+            errors.append(f"{name}: component_base must start with COMPONENT_")
+        if not entry.caliber or not entry.clip_size:
+            errors.append(f"{name}: component_base needs caliber and clip_size")
+    if entry.meta is not None and set(entry.meta) != META_FIELDS:
+        errors.append(f"{name}: meta fields must be {sorted(META_FIELDS)}")
+    if entry.recoil is not None and set(entry.recoil) != RECOIL_FIELDS:
+        errors.append(f"{name}: recoil fields must be {sorted(RECOIL_FIELDS)}")
+    return entry
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+class Registry:
+    """Validated weapons with lookup indexes (entries are in registry file order)"""
+
+    def __init__(self, batches: list, weapons: list):
+        self.batches = {b.id: b for b in batches}
+        self.weapons = tuple(weapons)
+        self.by_name = {}
+        self.by_key = {}
+        self.by_folder = {}
+        self.by_component_base = {}
+        self.by_batch = {}
+        self.by_class = {}
+        self.by_caliber = {}
+        self.by_calculator = {}
+        for entry in self.weapons:
+            self.by_name[entry.name] = entry
+            self.by_key[entry.key] = entry
+            if entry.folder:
+                self.by_folder[entry.folder] = entry
+            if entry.component_base:
+                self.by_component_base[entry.component_base] = entry
+            self.by_batch.setdefault(entry.batch, []).append(entry)
+            self.by_class.setdefault(entry.weapon_class, []).append(entry)
+            if entry.caliber:
+                self.by_caliber.setdefault(entry.caliber, []).append(entry)
+            if entry.calculator:
+                self.by_calculator.setdefault(entry.calculator, []).append(entry)
+
+    def __len__(self) -> int:
+        return len(self.weapons)
+
+    def get(self, name: str) -> Optional[WeaponEntry]:
+        """Entry by weapon name (WEAPON_X, any case), key or folder path"""
+        return (self.by_name.get(name.upper()) or self.by_key.get(name)
+                or self.by_folder.get(name.replace(os.sep, "/")))
+
+    def select(self, batch: Optional[int] = None, weapon_class: Optional[str] = None,
+               caliber: Optional[str] = None, calculator: Optional[str] = None,
+               has: Optional[str] = None) -> list:
+        """Entries matching every given filter, in registry order"""
+        candidates = [index.get(value, []) for index, value in (
+            (self.by_batch, batch), (self.by_class, weapon_class),
+            (self.by_caliber, caliber), (self.by_calculator, calculator)) if value is not None]
+        if not candidates:
+            candidates = [self.weapons]
+        smallest = min(candidates, key=len)
+        others = [set(map(id, c)) for c in candidates if c is not smallest]
+        return [e for e in smallest
+                if all(id(e) in ids for ids in others) and (has is None or getattr(e, has))]
+
+    def batch_path(self, batch: int, root: str = BASE_PATH) -> str:
+        return os.path.join(root, self.batches[batch].dir)
+
+    def meta_configs(self, weapon_class: str) -> dict:
+        """{folder name: fix_*_complete.py config} for entries with a meta block"""
+        return {e.folder_name: {"name": e.name, "display": e.display, **e.meta}
+                for e in self.select(weapon_class=weapon_class, has="meta")}
+
+
+def compile_registry(data: dict) -> Registry:
+    """Validate parsed registry JSON; raises ValueError listing every problem"""
+    errors = []
+    if data.get("version") != REGISTRY_VERSION:
+        errors.append(f"registry version {data.get('version')!r}, expected {REGISTRY_VERSION}")
+    batches = {}
+    for item in data.get("batches", []):
+        batch = Batch(**item)
+        if batch.id in batches:
+            errors.append(f"batch {batch.id}: duplicate")
+        batches[batch.id] = batch
+
+    weapons = []
+    seen = {"name": set(), "key": set(), "folder": set(), "component_base": set()}
+    for item in data.get("weapons", []):
+        entry = validate_entry(item, batches, errors)
+        if entry is None:
+            continue
+        for attr, values in seen.items():
+            value = getattr(entry, attr)
+            if value is None:
+                continue
+            if value in values:
+                errors.append(f"{entry.name}: duplicate {attr} '{value}'")
+            values.add(value)
+        weapons.append(entry)
+
+    if errors:
+        raise ValueError("Invalid weapon registry:\n  " + "\n  ".join(errors))
+    return Registry(list(batches.values()), weapons)
+
+
+_REGISTRIES = {}
+
+
+def load(path: str = REGISTRY_PATH, use_cache: bool = True) -> Registry:
+    """Compiled registry, once per process; from the pickle cache when the file is unchanged"""
+    path = os.path.abspath(path)
+    if path in _REGISTRIES:
+        return _REGISTRIES[path]
+
+    with open(path, 'rb') as f:
+        raw = f.read()
+    key = hashlib.sha1(f"v{CACHE_VERSION}".encode() + raw).hexdigest()
+    cache_path = os.path.join(os.path.dirname(path), "." + os.path.basename(path) + CACHE_SUFFIX)
+
+    registry = None
+    if use_cache:
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get("key") == key:
+                registry = cached["registry"]
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError, KeyError):
+            pass
+
+    if registry is None:
+        registry = compile_registry(json.loads(raw.decode("utf-8")))
+        if use_cache:
+            temp_path = cache_path + ".tmp"
+            try:
+                with open(temp_path, 'wb') as f:
+                    pickle.dump({"key": key, "registry": registry}, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, cache_path)
+            except OSError:
+                pass  # Read-only tree - the in-memory registry is still valid
+
+    _REGISTRIES[path] = registry
+    return registry
+
+
+# =============================================================================
+# weapons.lua
+# =============================================================================
+LUA_TABLE_PATTERN = re.compile(r'^Config\.Weapons = \{\n.*?^\}\n', re.DOTALL | re.MULTILINE)
+LUA_RULE = "    -- " + "=" * 70
+
+
+def render_lua_weapons(registry: Registry) -> str:
+    """Config.Weapons table for free-bullets/shared/weapons.lua"""
+    lines = ["Config.Weapons = {"]
+    for batch_id in sorted(registry.batches):
+        entries = [e for e in registry.by_batch.get(batch_id, []) if e.component_base]
+        if not entries:
+            continue
+        header = registry.batches[batch_id].lua_header or [registry.batches[batch_id].title.upper()]
+        lines += [LUA_RULE] + [f"    -- {line}" for line in header] + [LUA_RULE, ""]
+        for entry in entries:
+            lines += [f"    -- {line}" for line in entry.comment]
+            lines += [
+                f"    [`{entry.name}`] = {{",
+                f"        caliber = '{entry.caliber}',",
+                f"        componentBase = '{entry.component_base}',",
+                f"        clipSize = {entry.clip_size},",
+                "    },",
+                "",
+            ]
+    if lines[-1] == "":
+        lines.pop()
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def write_lua(registry: Registry, root: str) -> bool:
+    """Replace the Config.Weapons table in weapons.lua; returns True if the file changed"""
+    path = os.path.join(root, WEAPONS_LUA)
+    with open(path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    if not LUA_TABLE_PATTERN.search(source):
+        raise ValueError(f"{path}: no top-level 'Config.Weapons = {{ ... }}' table")
+    updated = LUA_TABLE_PATTERN.sub(lambda _: render_lua_weapons(registry), source, count=1)
+    if updated == source:
+        return False
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(updated)
+    return True
+
+
+# =============================================================================
+# CHECKS
+# =============================================================================
+def check(registry: Registry, root: str) -> tuple:
+    """(errors, warnings): errors = weapons.lua drift, warnings = other sources"""
+    import lua_config
+    import meta_index
+
+    errors, warnings = [], []
+    lua_weapons = lua_config.free_bullets_config(root, use_cache=False).get("Weapons") or {}
+    expected = {e.name: {"caliber": e.caliber, "componentBase": e.component_base, "clipSize": e.clip_size}
+                for e in registry.weapons if e.component_base}
+    for name in sorted(set(lua_weapons) | set(expected)):
+        if lua_weapons.get(name) != expected.get(name):
+            errors.append(f"weapons.lua {name}: {lua_weapons.get(name)} != registry {expected.get(name)}")
+
+    selectivefire = lua_config.selectivefire_config(root).get("Weapons") or {}
+    for name, info in sorted(selectivefire.items()):
+        entry = registry.by_name.get(name)
+        if entry is None:
+            warnings.append(f"selectivefire {name}: not in the registry")
+        elif list(info.get("modes") or []) != (entry.fire_modes or []):
+            warnings.append(f"selectivefire {name}: modes {info.get('modes')} != registry {entry.fire_modes}")
+
+    index = meta_index.get_index(root)
+    for entry in registry.weapons:
+        if not entry.folder:
+            continue
+        if not os.path.isdir(os.path.join(root, entry.folder)):
+            warnings.append(f"{entry.name}: folder {entry.folder} missing")
+            continue
+        meta_path = index.find_by_name(entry.name)
+        if meta_path and entry.clip_size:
+            with open(meta_path, 'r', encoding='utf-8', errors='replace') as f:
+                match = re.search(r'<ClipSize value="(\d+)"', f.read())
+            if match and int(match.group(1)) != entry.clip_size:
+                warnings.append(f"{entry.name}: weapons.meta ClipSize {match.group(1)} != registry {entry.clip_size} "
+                                f"(registry is authoritative - fix the meta)")
+    return errors, warnings
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Weapon registry: summary, checks and weapons.lua generation")
+    parser.add_argument("--root", default=BASE_PATH, help="Project root")
+    parser.add_argument("--registry", default=REGISTRY_PATH, help="Registry JSON file")
+    parser.add_argument("--show", type=str, help="Print one entry (name, key or folder)")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if weapons.lua drifted from the registry")
+    parser.add_argument("--write-lua", action="store_true", help="Regenerate Config.Weapons in weapons.lua")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    with open(args.registry, 'r', encoding='utf-8') as f:
+        compiled = compile_registry(json.load(f))
+    compile_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    registry = load(args.registry)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    if args.show:
+        entry = registry.get(args.show)
+        if entry is None:
+            print(f"Not in registry: {args.show}")
+            sys.exit(1)
+        for attr, value in vars(entry).items():
+            if value not in (None, "", [], 0):
+                print(f"  {attr:<17} {value}")
+        return
+
+    if args.write_lua:
+        changed = write_lua(registry, args.root)
+        print(f"{'Written' if changed else 'Up to date'}: {os.path.join(args.root, WEAPONS_LUA)}")
+        return
+
+    if args.check:
+        errors, warnings = check(registry, args.root)
+        for warning in warnings:
+            print(f"  WARN  {warning}")
+        for error in errors:
+            print(f"  DRIFT {error}")
+        if errors:
+            print(f"\n{len(errors)} weapons.lua entries differ - run with --write-lua")
+            sys.exit(1)
+        print(f"weapons.lua matches the registry ({len(warnings)} warnings)")
+        return
+
+    print(f"Registry: {args.registry}")
+    print(f"  Weapons: {len(compiled)} in {len(compiled.batches)} batches "
+          f"(validate + compile {compile_ms:.1f} ms, cached load {load_ms:.1f} ms)")
+    for weapon_class, entries in sorted(registry.by_class.items()):
+        print(f"  {weapon_class:<8} {len(entries):>3}")
+    print(f"  Handling calculators: "
+          f"{', '.join(f'{k} {len(v)}' for k, v in sorted(registry.by_calculator.items()))}")
+    print(f"  free-bullets Config.Weapons entries: {len(registry.by_component_base)}")
+    print("\nBatches:")
+    for batch_id, batch in sorted(registry.batches.items()):
+        print(f"  {batch_id:>2} {batch.title:<40} {len(registry.by_batch.get(batch_id, [])):>3} weapons")
+
+
+if __name__ == "__main__":
+    main()
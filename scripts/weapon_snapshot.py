@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Columnar Weapon Stat Snapshot
+
+Parses every weapon's CWeaponInfo once and stores the result as a single
+SQLite file, one row per weapon:
+- Registry facts: name, key, display, batch, class, caliber, tier, fire mode
+- Source: resource folder, meta path and the meta's content hash
+- One typed column per scalar <Tag value="..."/> field (REAL, or INTEGER
+  for true/false flags); tags that occur more than once in a weapon's
+  CWeaponInfo (nested struct fields like X/Y/Z) are NULL for that weapon;
+  spellings differing only in case (LockonRange/LockOnRange) share the
+  first-seen column, as SQLite column names are case-insensitive
+
+The snapshot lives next to the tree in .weapon_snapshot.sqlite and is
+refreshed incrementally: only metas whose hash changed in the meta index
+are re-parsed. Charts, diffs and balance queries load it into NumPy
+columns (Snapshot) and filter with boolean masks, or query it with SQL.
+
+Usage:
+    python weapon_snapshot.py                            # Refresh and summarize
+    python weapon_snapshot.py --output stats.sqlite      # Export a copy
+    python weapon_snapshot.py --group caliber --stat Damage
+    python weapon_snapshot.py --diff old_stats.sqlite    # Stat changes since a copy
+    python weapon_snapshot.py --query "SELECT name, Damage FROM weapons WHERE tier = 'worn'"
+
+Requires NumPy.
+"""
+
+import os
+import shutil
+import sqlite3
+from typing import Optional
+
+import numpy as np
+
+import meta_index
+import weapon_meta
+import weapon_registry
+
+BASE_PATH = "/home/user/project_pipes"
+
+SNAPSHOT_FILENAME = ".weapon_snapshot.sqlite"
+SNAPSHOT_VERSION = 1
+TABLE = "weapons"
+
+# Fixed leading columns (name, SQL type); stat columns follow in tag order
+KEY_COLUMNS = [
+    ("name", "TEXT"),
+    ("key", "TEXT"),
+    ("display", "TEXT"),
+    ("batch", "INTEGER"),
+    ("weapon_class", "TEXT"),
+    ("caliber", "TEXT"),
+    ("tier", "TEXT"),
+    ("fire_mode", "TEXT"),
+    ("folder", "TEXT"),
+    ("path", "TEXT"),
+    ("sha1", "TEXT"),
+]
+KEY_NAMES = [name for name, _ in KEY_COLUMNS]
+INDEXED_COLUMNS = ["batch", "weapon_class", "caliber", "tier"]
+
+
+# =============================================================================
+# PARSING
+# =============================================================================
+def parse_weapon_stats(content: str, weapon_name: str) -> dict:
+    """Scalar fields of one CWeaponInfo item: tag -> float (or 0/1 for flags)"""
+    info = weapon_meta.WeaponMetaFile(content).weapon(weapon_name)
+    return info.scalars() if info else {}
+
+
+def weapon_sources(index: meta_index.MetaIndex, registry: weapon_registry.Registry) -> list:
+    """(name, registry entry or None, meta rel path) for every weapon with a meta"""
+    sources = []
+    for entry in sorted(registry.by_name.values(), key=lambda e: (e.batch, e.name)):
+        rel_path = index.by_folder.get(entry.folder or "") or index.by_name.get(entry.name.upper())
+        if rel_path:
+            sources.append((entry.name, entry, rel_path))
+
+    # Weapons with a meta but no registry entry still get a row
+    registered = {entry.name.upper() for entry in registry.by_name.values()}
+    for name in sorted(set(index.by_name) - registered):
+        sources.append((name, None, index.by_name[name]))
+    return sources
+
+
+def key_values(name: str, entry: Optional[weapon_registry.WeaponEntry], index: meta_index.MetaIndex,
+               rel_path: str) -> dict:
+    meta_entry = index.entries[rel_path]
+    return {
+        "name": name,
+        "key": entry.key if entry else None,
+        "display": entry.display if entry else None,
+        "batch": entry.batch if entry else None,
+        "weapon_class": entry.weapon_class if entry else None,
+        "caliber": entry.caliber if entry else None,
+        "tier": entry.tier if entry else None,
+        "fire_mode": entry.fire_mode if entry else None,
+        "folder": entry.folder if entry and entry.folder else meta_entry.folder,
+        "path": rel_path,
+        "sha1": meta_entry.sha1,
+    }
+
+
+# =============================================================================
+# SNAPSHOT FILE
+# =============================================================================
+def read_rows(path: str) -> tuple:
+    """(column types, rows as dicts) of a snapshot file; empty if missing or stale format"""
+    if not os.path.exists(path):
+        return {}, []
+    try:
+        conn = sqlite3.connect(path)
+        try:
+            version = conn.execute("SELECT value FROM info WHERE key = 'version'").fetchone()
+            if not version or int(version[0]) != SNAPSHOT_VERSION:
+                return {}, []
+            types = {row[1]: row[2] for row in conn.execute(f"PRAGMA table_info({TABLE})")}
+            cursor = conn.execute(f"SELECT * FROM {TABLE} ORDER BY rowid")
+            names = [d[0] for d in cursor.description]
+            return types, [dict(zip(names, row)) for row in cursor]
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return {}, []
+
+
+def write_rows(path: str, rows: list, stat_types: dict):
+    """Write a snapshot file atomically (built beside it, then renamed)"""
+    temp_path = path + ".tmp"
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+
+    columns = KEY_COLUMNS + list(stat_types.items())
+    conn = sqlite3.connect(temp_path)
+    try:
+        conn.execute("CREATE TABLE info (key TEXT PRIMARY KEY, value TEXT)")
+        conn.execute("INSERT INTO info VALUES ('version', ?)", (str(SNAPSHOT_VERSION),))
+        conn.execute(f"CREATE TABLE {TABLE} ({', '.join(f'{quote(n)} {t}' for n, t in columns)}, "
+                     f"PRIMARY KEY (name))")
+        for column in INDEXED_COLUMNS:
+            conn.execute(f"CREATE INDEX idx_{column} ON {TABLE} ({column})")
+        placeholders = ", ".join("?" for _ in columns)
+        conn.executemany(f"INSERT INTO {TABLE} VALUES ({placeholders})",
+                         [[row.get(n) for n, _ in columns] for row in rows])
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(temp_path, path)
+
+
+def quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def refresh(root: str = BASE_PATH, path: Optional[str] = None) -> dict:
+    """
+    Bring a snapshot file up to date with the tree. Only metas whose hash
+    changed are parsed; the file is rewritten only if a row changed.
+    Returns counts of parsed/reused/removed rows and whether it was written.
+    """
+    root = os.path.abspath(root)
+    path = path or os.path.join(root, SNAPSHOT_FILENAME)
+    index = meta_index.get_index(root)
+    registry = weapon_registry.load()
+
+    old_types, old_rows = read_rows(path)
+    cached = {(row["path"], row["sha1"]): row for row in old_rows}
+    stats = {"parsed": 0, "reused": 0, "removed": 0, "written": False}
+
+    rows = []
+    stat_types = {}
+    spellings = {}      # Lower-case tag -> column name
+    contents = {}
+    for name, entry, rel_path in weapon_sources(index, registry):
+        row = key_values(name, entry, index, rel_path)
+        old = cached.get((rel_path, row["sha1"]))
+        if old is not None and old["name"] == name:
+            weapon_stats = {k: v for k, v in old.items() if k not in KEY_NAMES and v is not None}
+            types = {k: old_types[k] for k in weapon_stats}
+            stats["reused"] += 1
+        else:
+            if rel_path not in contents:
+                with open(index.abspath(rel_path), 'r', encoding='utf-8', errors='replace') as f:
+                    contents[rel_path] = f.read()
+            weapon_stats = parse_weapon_stats(contents[rel_path], name)
+            types = {k: "INTEGER" if isinstance(v, int) else "REAL" for k, v in weapon_stats.items()}
+            stats["parsed"] += 1
+        for tag, value in weapon_stats.items():
+            column = spellings.setdefault(tag.lower(), tag)
+            row.setdefault(column, value)
+            stat_types.setdefault(column, types[tag])
+        rows.append(row)
+
+    stats["removed"] = len({row["name"] for row in old_rows} - {row["name"] for row in rows})
+    old_columns = [n for n in old_types if n not in KEY_NAMES]
+    new_columns = list(stat_types)
+    if (stats["parsed"] or stats["removed"] or old_columns != new_columns
+            or [{k: r.get(k) for k in KEY_NAMES} for r in old_rows] != [{k: r[k] for k in KEY_NAMES} for r in rows]):
+        write_rows(path, rows, stat_types)
+        stats["written"] = True
+    return stats
+
+
+# =============================================================================
+# COLUMNAR VIEW
+# =============================================================================
+class Snapshot:
+    """Snapshot loaded as NumPy columns (NaN for missing stats)"""
+
+    def __init__(self, columns: dict, types: dict, path: Optional[str] = None):
+        self.columns = columns
+        self.types = types
+        self.path = path
+
+    @classmethod
+    def load(cls, path: str) -> "Snapshot":
+        types, rows = read_rows(path)
+        if not types:
+            raise FileNotFoundError(f"No snapshot (version {SNAPSHOT_VERSION}) at {path}")
+        columns = {}
+        for column, sql_type in types.items():
+            values = [row[column] for row in rows]
+            if sql_type == "TEXT":
+                columns[column] = np.array(values, dtype=object)
+            else:
+                columns[column] = np.array([np.nan if v is None else v for v in values], dtype=float)
+        return cls(columns, types, path)
+
+    def __len__(self) -> int:
+        return len(self.columns["name"])
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.columns[column]
+
+    def __contains__(self, column: str) -> bool:
+        return column in self.columns
+
+    @property
+    def stat_columns(self) -> list:
+        return [c for c in self.columns if c not in KEY_NAMES]
+
+    def where(self, mask: np.ndarray) -> "Snapshot":
+        """Rows selected by a boolean mask (e.g. snap["caliber"] == "9mm")"""
+        return Snapshot({c: v[mask] for c, v in self.columns.items()}, self.types, self.path)
+
+    def sort(self, column: str, descending: bool = False) -> "Snapshot":
+        order = np.argsort(self.columns[column], kind="stable")
+        return self.where(order[::-1] if descending else order)
+
+    def lookup(self, column: str, value) -> Optional[dict]:
+        """First row whose column equals value, as a dict (None if absent)"""
+        hits = np.flatnonzero(self.columns[column] == value)
+        if not len(hits):
+            return None
+        return {c: v[hits[0]] for c, v in self.columns.items()}
+
+    def groups(self, column: str) -> dict:
+        """Group value -> sub-snapshot, in sorted group order"""
+        keys = self.columns[column]
+        return {key: self.where(keys == key) for key in sorted({k for k in keys if k is not None}, key=str)}
+
+    def diff(self, other: "Snapshot") -> dict:
+        """
+        Changes from other (older) to self: added/removed weapon names and
+        {name: {column: (old, new)}} for stat columns that differ.
+        """
+        names, new_idx, old_idx = np.intersect1d(self["name"].astype(str), other["name"].astype(str),
+                                                 return_indices=True)
+        changes = {}
+        for column in self.stat_columns:
+            new = self[column][new_idx]
+            old = other[column][old_idx] if column in other else np.full(len(names), np.nan)
+            differs = ~(np.isclose(new, old, rtol=0, atol=1e-9) | (np.isnan(new) & np.isnan(old)))
+            for i in np.flatnonzero(differs):
+                changes.setdefault(names[i], {})[column] = (old[i], new[i])
+        for column in set(other.stat_columns) - set(self.stat_columns):
+            old = other[column][old_idx]
+            for i in np.flatnonzero(~np.isnan(old)):
+                changes.setdefault(names[i], {})[column] = (old[i], np.nan)
+        return {
+            "added": sorted(set(self["name"]) - set(other["name"])),
+            "removed": sorted(set(other["name"]) - set(self["name"])),
+            "changed": dict(sorted(changes.items())),
+        }
+
+
+_SNAPSHOTS: dict[str, Snapshot] = {}
+
+
+def get_snapshot(root: str = BASE_PATH) -> Snapshot:
+    """Refresh (if needed) and load the snapshot for a root, once per process"""
+    root = os.path.abspath(root)
+    snapshot = _SNAPSHOTS.get(root)
+    if snapshot is None:
+        path = os.path.join(root, SNAPSHOT_FILENAME)
+        refresh(root, path)
+        snapshot = Snapshot.load(path)
+        _SNAPSHOTS[root] = snapshot
+    return snapshot
+
+
+def query(path: str, sql: str, params: tuple = ()) -> tuple:
+    """(column names, rows) of a read-only SQL query against a snapshot file"""
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        cursor = conn.execute(sql, params)
+        return [d[0] for d in cursor.description or []], cursor.fetchall()
+    finally:
+        conn.close()
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+def format_cell(value) -> str:
+    if isinstance(value, float):
+        return "-" if np.isnan(value) else f"{value:g}"
+    return "-" if value is None else str(value)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Export and query the weapon stat snapshot")
+    parser.add_argument("--root", default=BASE_PATH, help="Project root")
+    parser.add_argument("--output", help="Also export the snapshot to this file")
+    parser.add_argument("--query", help="SQL to run against the snapshot (table: weapons)")
+    parser.add_argument("--diff", metavar="OLD", help="Per-weapon stat changes since an older snapshot file")
+    parser.add_argument("--group", choices=INDEXED_COLUMNS, help="Group rows by this column")
+    parser.add_argument("--stat", default="Damage", help="Stat summarized per group (default: Damage)")
+    args = parser.parse_args()
+
+    path = os.path.join(os.path.abspath(args.root), SNAPSHOT_FILENAME)
+    stats = refresh(args.root, path)
+    snapshot = Snapshot.load(path)
+
+    if args.output:
+        shutil.copyfile(path, args.output)
+
+    if args.query:
+        names, rows = query(path, args.query)
+        print("  ".join(f"{n:>14}" for n in names))
+        for row in rows:
+            print("  ".join(f"{format_cell(v):>14}" for v in row))
+        return
+
+    if args.diff:
+        changes = snapshot.diff(Snapshot.load(args.diff))
+        for label in ("added", "removed"):
+            if changes[label]:
+                print(f"{label.title()}: {', '.join(changes[label])}")
+        for name, columns in changes["changed"].items():
+            print(f"\n  {name}")
+            for column, (old, new) in columns.items():
+                print(f"    {column:<32} {format_cell(old):>12} -> {format_cell(new)}")
+        print(f"\n{len(changes['changed'])} weapons changed")
+        return
+
+    if args.group:
+        if args.stat not in snapshot:
+            print(f"Unknown stat column: {args.stat}")
+            return
+        print(f"{args.stat} by {args.group}:")
+        print(f"  {args.group:<20} {'n':>4} {'min':>10} {'median':>10} {'max':>10}")
+        for key, rows in snapshot.groups(args.group).items():
+            values = rows[args.stat][~np.isnan(rows[args.stat])]
+            if not len(values):
+                continue
+            print(f"  {format_cell(key):<20} {len(values):>4} {values.min():>10.3f} "
+                  f"{np.median(values):>10.3f} {values.max():>10.3f}")
+        return
+
+    print(f"Snapshot: {path}")
+    print(f"  Weapons:      {len(snapshot)}")
+    print(f"  Stat columns: {len(snapshot.stat_columns)}")
+    print(f"  Parsed: {stats['parsed']} | Reused: {stats['reused']} | Removed: {stats['removed']}"
+          f"{' | written' if stats['written'] else ''}")
+
+
+if __name__ == "__main__":
+    main()